@@ -4,6 +4,40 @@ import plotly.graph_objects as go
 import os
 import math
 import streamlit.components.v1 as components
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from engine.bearings import load_bearing_catalogue, calculate_bearing_loads, CABIN_SERIES, SPINDLE_SERIES
+from engine.bearing_life import SERIES_FACTORS, build_spindle_load_spectrum, lightest_for_life
+from engine.wind import basic_to_gust, structural_factor, wheel_wind_loads
+from engine.geometry import (CABIN_GEOMETRIES, SPHERICAL, cabin_count_base, cabin_surface_area, force_coefficient,
+                             geometry_code)
+from engine.mass import cost_estimate, wheel_masses
+from engine.structure import GROUPS
+from engine.i18n import get_text, translate
+from engine.memo import cache_stats, memoize
+from engine.store import persistent
+from engine.scheduler import BATCH, INTERACTIVE, default_scheduler
+from engine.jobs import CANCELLED, DONE, FAILED, INTERRUPTED, default_jobs, report
+from engine.reference import (CITIES_DATA, SOIL_TYPES, TERRAIN_CATEGORIES, city_location, city_name, province_name,
+                              seismic_hazard)
+from engine.geolocate import nearest_cities, nearest_city, read_sites
+from engine.hazard_maps import HAZARD_LAYERS, site_hazards
+from engine.screening import province_summary, screen_sites
+from engine.wind_rose import SPEED_UNITS, compression_from_name, wind_rose_from_csv
+from engine.extreme_wind import design_wind_speed
+from engine.seismic import empirical_period, seismic_forces
+from engine.modal import modes_from_breakdown
+from engine.frame import basis_loads, frame_from_breakdown, group_envelope, passenger_loads
+from engine.combinations import (combine, generate_combinations, governing_summary, load_partial_factors,
+                                 wheel_action_effects, wheel_outputs)
+from engine.foundation import (SOIL_PROPERTIES, foundation_load_sets, leg_footprint, overturning_check,
+                               size_footing)
+from engine.vortex import cabin_cylinder, merge_rows, screen, wheel_members
+from engine.orientation import (AXIS_BEARINGS, axis_vector, distribution_from_rose, optimise_orientation,
+                                single_direction_distribution)
+from engine.fatigue import (en1993_sn_curve, fatigue_assessment, operating_history_chunks,
+                            rim_member_stress, spindle_bending_stress)
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -13,323 +47,6 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# --- Language Support ---
-def get_text(key, persian=False):
-    """Get text in selected language"""
-    texts = {
-        # Navigation
-        'welcome_title': {'en': "Welcome to Ferris Wheel Designer", 'fa': "به طراح چرخ و فلک خوش آمدید"},
-        'step': {'en': "Step", 'fa': "مرحله"},
-        'of': {'en': "of", 'fa': "از"},
-        'back': {'en': "Back", 'fa': "بازگشت"},
-        'next': {'en': "Next", 'fa': "بعدی"},
-        'calculate': {'en': "Calculate", 'fa': "محاسبه"},
-        'confirm': {'en': "Confirm", 'fa': "تایید"},
-        'select': {'en': "Select", 'fa': "انتخاب"},
-        
-        # Step 0 - Welcome Page
-        'welcome_header': {'en': "Welcome to Ferris Wheel Designer", 'fa': "خوش آمدید به طراح چرخ و فلک"},
-        'about_title': {'en': "🎯 About This Application", 'fa': "🎯 درباره این نرم‌افزار"},
-        'about_intro': {'en': "This comprehensive Ferris Wheel Design Tool assists engineers and designers in creating safe, efficient, and compliant ferris wheel installations. The application guides you through:", 
-                       'fa': "این ابزار جامع طراحی چرخ و فلک به مهندسان و طراحان در ایجاد نصب‌های ایمن، کارآمد و مطابق با استانداردهای چرخ و فلک کمک می‌کند. این برنامه شما را در موارد زیر راهنمایی می‌کند"},
-        
-        'feature_generation': {'en': "**Generation Selection**: Choose from various ferris wheel generations and structural types",
-                              'fa': "**انتخاب نسل**: انتخاب از نسل‌ها و انواع سازه‌ای مختلف چرخ و فلک"},
-        'feature_cabin': {'en': "**Cabin Configuration**: Design cabin geometry, capacity, and VIP arrangements",
-                         'fa': "**پیکربندی کابین**: طراحی هندسه، ظرفیت و آرایش کابین های وی آی پی"},
-        'feature_performance': {'en': "**Performance Analysis**: Calculate rotation times, speeds, and passenger capacity",
-                               'fa': "**تحلیل عملکرد**: محاسبه زمان چرخش، سرعت‌ها و ظرفیت مسافری"},
-        'feature_environment': {'en': "**Environmental Assessment**: Analyze site conditions, wind loads, and terrain parameters",
-                               'fa': "**ارزیابی محیطی**: تحلیل شرایط سایت، بارهای باد و پارامترهای زمین"},
-        'feature_safety': {'en': "**Safety Classification**: Determine device class and restraint requirements",
-                          'fa': "**طبقه‌بندی ایمنی**: تعیین کلاس دستگاه و الزامات مهاربند"},
-        'feature_structural': {'en': "**Structural Design**: Generate comprehensive design specifications",
-                              'fa': "**طراحی سازه**: تولید مشخصات کامل طراحی"},
-        
-        'standards_title': {'en': "📋 Design Standards & References", 'fa': "📋 استانداردها و مراجع طراحی"},
-        'standards_intro': {'en': "This application implements calculations and requirements based on the following international and national standards:",
-                           'fa': "این نرم‌افزار محاسبات و الزامات را بر اساس استانداردهای بین‌المللی و ملی زیر پیاده‌سازی می‌کند"},
-        
-        # Standards Headers
-        'standards_current': {'en': "#### Current Standards for Amusement Devices:", 'fa': "#### استانداردهای فعلی برای وسایل تفریحی"},
-        'standards_legacy': {'en': "#### Legacy Standards (Reference):", 'fa': "#### استانداردهای قدیمی (مرجع)"},
-        'standards_loads': {'en': "#### Standards for Load Analysis:", 'fa': "#### استانداردهای تحلیل بار"},
-        'standards_applications': {'en': "#### Key Application Areas:", 'fa': "#### حوزه‌های کاربردی کلیدی"},
-        
-        # Application Areas
-        'app_wind': {'en': "**Wind Load Analysis**: AS 1170.4, EN 1991-1-4, ISIRI 2800",
-                    'fa': "**تحلیل بار باد**: AS 1170.4، EN 1991-1-4، ISIRI 2800"},
-        'app_seismic': {'en': "**Seismic Analysis**: ISIRI 2800",
-                       'fa': "**تحلیل لرزه‌ای**: ISIRI 2800"},
-        'app_structural': {'en': "**Structural Design**: DIN 18800, EN 1993",
-                          'fa': "**طراحی سازه**: DIN 18800، EN 1993"},
-        'app_safety': {'en': "**Safety Classification**: INSO 8987, ISO 17842",
-                      'fa': "**طبقه‌بندی ایمنی**: INSO 8987، ISO 17842"},
-        
-        # Warning
-        'warning_title': {'en': "⚠️ **Important Notice:**", 'fa': "⚠️ **اطلاعیه مهم:**"},
-        'warning_intro': {'en': "By proceeding, you acknowledge that:", 'fa': "با ادامه، شما تأیید می‌کنید که"},
-        'warning_1': {'en': "This tool provides preliminary design calculations based on the referenced standards",
-                     'fa': "این ابزار محاسبات طراحی اولیه را بر اساس استانداردهای ذکر شده ارائه می‌دهد"},
-        'warning_2': {'en': "Final designs must be reviewed and approved by licensed professional engineers",
-                     'fa': "طرح‌های نهایی باید توسط مهندسان حرفه‌ای دارای مجوز بررسی و تأیید شوند"},
-        'warning_3': {'en': "Local building codes and regulations must be consulted and followed",
-                     'fa': "آیین‌نامه‌ها و مقررات ساختمانی محلی باید مشورت و رعایت شوند"},
-        'warning_4': {'en': "Site-specific conditions may require additional analysis beyond this tool's scope",
-                     'fa': "شرایط خاص سایت ممکن است نیاز به تحلیل اضافی فراتر از محدوده این ابزار داشته باشد"},
-        'warning_5': {'en': "The designer assumes responsibility for verifying all calculations and compliance",
-                     'fa': "طراح مسئولیت تأیید تمام محاسبات و انطباق را بر عهده دارد"},
-        
-        # Confirmation
-        'confirm_checkbox': {'en': "✅ I understand and accept that all calculations are based on the standards listed above, and I will ensure compliance with local regulations and professional engineering review.",
-                            'fa': "✅ من درک می‌کنم و می‌پذیرم که تمام محاسبات بر اساس استانداردهای فهرست شده در بالا هستند و من انطباق با مقررات محلی و بررسی مهندسی حرفه‌ای را تضمین خواهم کرد."},
-        'confirm_success': {'en': "✅ Standards confirmed. You may proceed to the design process.",
-                           'fa': "✅ استانداردها تأیید شدند. می‌توانید به فرآیند طراحی ادامه دهید."},
-        'confirm_info': {'en': "Please confirm your understanding of the standards to continue.",
-                        'fa': "لطفاً درک خود از استانداردها را برای ادامه تأیید کنید."},
-        'start_button': {'en': "🚀 Start Design Process", 'fa': "🚀 شروع فرآیند طراحی"},
-        
-        # Step 1 - Generation Selection
-                'generation_instruction': {
-            'en': "Click the button under the image to select a generation and proceed.",
-            'fa': "برای انتخاب نسل و ادامه، دکمه زیر تصویر را کلیک کنید."
-        },
-        'generation_selected': {'en': "Generation", 'fa': "نسل"},
-        'select_generation': {'en': "Select Ferris Wheel Generation", 'fa': "انتخاب نسل چرخ و فلک"},
-        'gen_1_truss': {'en': "1st Generation (Truss type)", 'fa': "نسل اول (نوع خرپایی)"},
-        'gen_2_cable': {'en': "2nd Generation_1st type (Cable type)", 'fa': "نسل دوم - نوع اول (کابلی)"},
-        'gen_2_pure_cable': {'en': "2nd Generation_2nd type (Pure cable type)", 'fa': "نسل دوم - نوع دوم (کاملاً کابلی)"},
-        'gen_4_hubless': {'en': "4th Generation (Hubless centerless)", 'fa': "نسل چهارم (بدون مرکز)"},
-        
-        # Step 2 - Cabin Geometry
-        'cabin_geometry_header': {'en': "Choose a cabin shape.", 'fa': "یک شکل کابین انتخاب کنید."},
-        'select_cabin_geometry': {'en': "Select Cabin Geometry", 'fa': "انتخاب هندسه کابین"},
-        'cabin_geometry_instruction': {'en': "Choose a cabin shape.", 'fa': "یک شکل کابین انتخاب کنید."},
-        'geom_square': {'en': "Square", 'fa': "مربعی"},
-        'geom_vert_cyl': {'en': "Vertical Cylinder", 'fa': "استوانه عمودی"},
-        'geom_horiz_cyl': {'en': "Horizontal Cylinder", 'fa': "استوانه افقی"},
-        'geom_spherical': {'en': "Spherical", 'fa': "کروی"},
-        'geom_spherical_caption': {'en': "This option is more expensive but has a better appearance.", 
-                                  'fa': "این گزینه گران‌تر است اما جلوه‌ی ظاهری بهتری دارد"},
-        
-        # Step 3 - Primary Parameters
-        'generation_label': {'en': "Generation", 'fa': "نسل"},
-        'calc_capacities_btn': {'en': "🔄 Calculate Capacities", 'fa': "🔄 محاسبه ظرفیت‌ها"},
-
-        # Back/Next buttons (shared)
-        'back_btn': {'en': "⬅️ Back", 'fa': "⬅️ بازگشت"},
-        'next_btn': {'en': "Next ➡️", 'fa': "➡️ بعدی"},
-
-        # Validation errors
-        'err_confirm_standards': {
-            'en': "Please confirm your understanding of the standards.",
-            'fa': "لطفاً درک خود از استانداردها را تأیید کنید."
-        },
-        'err_select_generation': {
-            'en': "Please select a generation.",
-            'fa': "لطفاً یک نسل انتخاب کنید."
-        },
-        'err_select_geometry': {
-            'en': "Please select a cabin geometry.",
-            'fa': "لطفاً شکل کابین را انتخاب کنید."
-        },
-        'err_diameter': {
-            'en': "Diameter must be between 30 and 80 meters.",
-            'fa': "قطر باید بین ۳۰ تا ۸۰ متر باشد."
-        },
-        'err_num_cabins': {
-            'en': "Set a valid number of cabins.",
-            'fa': "تعداد معتبری از کابین‌ها وارد کنید."
-        },
-        'err_cabin_capacity': {
-            'en': "Cabin capacity must be between 4 and 8.",
-            'fa': "ظرفیت کابین باید بین ۴ تا ۸ نفر باشد."
-        },
-        'err_vip_cabins': {
-            'en': "Number of VIP cabins must be between 0 and total cabins.",
-            'fa': "تعداد کابین‌های VIP باید بین ۰ و کل کابین‌ها باشد."
-        },
-        'err_calc_capacities': {
-            'en': "Please click 'Calculate Capacities' before continuing.",
-            'fa': "لطفاً قبل از ادامه روی 'محاسبه ظرفیت‌ها' کلیک کنید."
-        },
-        'err_rotation_time': {
-            'en': "Enter valid rotation time (minutes per rotation).",
-            'fa': "زمان چرخش معتبر وارد کنید (دقیقه در هر دور)."
-        },
-        'err_province': {'en': "Select a province.", 'fa': "یک استان انتخاب کنید."},
-        'err_city': {'en': "Select a city.", 'fa': "یک شهر انتخاب کنید."},
-        'err_region': {'en': "Enter region name.", 'fa': "نام منطقه را وارد کنید."},
-        'err_land_length': {
-            'en': "Land length must be between 10 and 150 meters.",
-            'fa': "طول زمین باید بین ۱۰ تا ۱۵۰ متر باشد."
-        },
-        'err_land_width': {
-            'en': "Land width must be between 10 and 150 meters.",
-            'fa': "عرض زمین باید بین ۱۰ تا ۱۵۰ متر باشد."
-        },
-        'err_altitude': {'en': "Enter altitude.", 'fa': "ارتفاع را وارد کنید."},
-        'err_wind_max': {
-            'en': "Enter maximum wind speed (km/h).",
-            'fa': "حداکثر سرعت باد (km/h) را وارد کنید."
-        },
-        'err_terrain': {
-            'en': "Please click 'Calculate Terrain Parameters' before continuing.",
-            'fa': "لطفاً قبل از ادامه روی 'محاسبه پارامترهای زمین' کلیک کنید."
-        },
-        'err_soil': {
-            'en': "Please select a soil type.",
-            'fa': "لطفاً نوع خاک را انتخاب کنید."
-        },
-        'err_orientation': {
-            'en': "Please confirm the carousel orientation or select a custom direction.",
-            'fa': "لطفاً جهت‌گیری چرخ و فلک را تأیید یا یک جهت سفارشی انتخاب کنید."
-        },
-        'cabin_specification': {'en': "Cabin Specification", 'fa': "مشخصات کابین"},
-        'diameter_label': {'en': "Ferris Wheel Diameter (m)", 'fa': "قطر چرخ و فلک (متر)"},
-        'num_cabins_label': {'en': "Number of Cabins", 'fa': "تعداد کابین‌ها"},
-        'cabin_cap_label': {'en': "Cabin Capacity (passengers per cabin)", 'fa': "ظرفیت کابین (مسافر به ازای هر کابین)"},
-        'num_vip_label': {'en': "Number of VIP Cabins", 'fa': "تعداد کابین‌های VIP"},
-        'calc_capacities': {'en': "🔄 Calculate Capacities", 'fa': "🔄 محاسبه ظرفیت‌ها"},
-        'per_rotation_capacity': {'en': "Per-rotation capacity", 'fa': "ظرفیت به ازای هر دور"},
-        'vip_capacity': {'en': "VIP capacity (per rotation)", 'fa': "ظرفیت VIP (به ازای هر دور)"},
-        'passengers': {'en': "passengers", 'fa': "مسافر"},
-        'each_vip': {'en': "each VIP:", 'fa': " VIPهر:"},
-        'capacities_calculated': {'en': "Capacities calculated.", 'fa': "ظرفیت‌ها محاسبه شدند."},
-        
-        # Step 4 - Rotation Time
-        'rotation_time': {'en': "Rotation Time & Derived Speeds", 'fa': "زمان چرخش و سرعت‌های مشتق شده"},
-        'rotation_time_instruction': {'en': "Enter the rotation time or select target capacity per hour",
-                                     'fa': "زمان چرخش را وارد کنید یا ظرفیت هدف در ساعت را انتخاب کنید"},
-        'rotation_time_label': {'en': "Rotation Time (minutes)", 'fa': "زمان چرخش (دقیقه)"},
-        'capacity_per_hour': {'en': "Capacity per Hour (pax/hr)", 'fa': "ظرفیت در ساعت (ساعت/مسافر)"},
-        'angular_velocity': {'en': "Angular Velocity", 'fa': "سرعت زاویه‌ای"},
-        'linear_velocity': {'en': "Linear Velocity at Rim", 'fa': "سرعت خطی در لبه"},
-        'rotation_speed': {'en': "Rotation Speed", 'fa': "سرعت چرخش"},
-        
-        # Step 5 - Environment
-        'environment_conditions': {'en': "Environment Conditions", 'fa': "شرایط محیطی"},
-        'select_province': {'en': "Select Province", 'fa': "انتخاب استان"},
-        'select_city': {'en': "Select City", 'fa': "انتخاب شهر"},
-        'region_name': {'en': "Region / Area name", 'fa': "نام منطقه / ناحیه"},
-        'land_dimensions': {'en': "Land Dimensions", 'fa': "ابعاد زمین"},
-        'land_length': {'en': "Land Length (m)", 'fa': "طول زمین (متر)"},
-        'land_width': {'en': "Land Width (m)", 'fa': "عرض زمین (متر)"},
-        'altitude': {'en': "Altitude (m above sea level)", 'fa': "ارتفاع (متر از سطح دریا)"},
-        'temp_range': {'en': "Temperature Range", 'fa': "محدوده دما"},
-        'min_temp': {'en': "Minimum Temperature (°C)", 'fa': "حداقل دما (°C)"},
-        'max_temp': {'en': "Maximum Temperature (°C)", 'fa': "حداکثر دما (°C)"},
-                'design_ref_step5': {
-            'en': "**Design per AS 1170.4-2007(A1), EN 1991-1-4:2005, ISIRI 2800**",
-            'fa': "**طراحی طبق AS 1170.4-2007(A1)، EN 1991-1-4:2005، ISIRI 2800**"
-        },
-        'land_surface_area': {'en': "Land Surface Area (meters)", 'fa': "مساحت زمین (متر)"},
-        'total_land_area': {'en': "Total Land Area", 'fa': "مساحت کل زمین"},
-        'altitude_temp': {'en': "Altitude and Temperature", 'fa': "ارتفاع و دما"},
-        'wind_information': {'en': "Wind Information", 'fa': "اطلاعات باد"},
-        'wind_direction_label': {'en': "Wind Direction", 'fa': "جهت باد"},
-        'wind_speed_second': {'en': "Second interval wind speed (km/h)", 'fa': "سرعت باد لحظه‌ای (km/h)"},
-        'wind_speed_minute': {'en': "Minute interval wind speed (km/h)", 'fa': "سرعت باد میانگین (km/h)"},
-        'speed_label': {'en': "speed", 'fa': "سرعت"},
-        'load_wind_rose': {'en': "Load wind rose (upload jpg/pdf)", 'fa': "بارگذاری گلباد (آپلود jpg/pdf)"},
-        'wind_rose_file': {'en': "Wind rose file (jpg/pdf)", 'fa': "فایل گلباد (jpg/pdf)"},
-        'wind_dir_north': {'en': "North", 'fa': "شمال"},
-        'wind_dir_south': {'en': "South", 'fa': "جنوب"},
-        'wind_dir_east': {'en': "East", 'fa': "شرق"},
-        'wind_dir_west': {'en': "West", 'fa': "غرب"},
-        'wind_dir_northeast': {'en': "Northeast", 'fa': "شمال‌شرق"},
-        'wind_dir_northwest': {'en': "Northwest", 'fa': "شمال‌غرب"},
-        'wind_dir_southeast': {'en': "Southeast", 'fa': "جنوب‌شرق"},
-        'wind_dir_southwest': {'en': "Southwest", 'fa': "جنوب‌غرب"},
-        
-        # Step 6 - Provincial
-        'provincial_characteristics': {'en': "Provincial Characteristics & Terrain Parameters", 'fa': "ویژگی‌های استانی و پارامترهای زمین"},
-        'zone': {'en': "Zone", 'fa': "منطقه"},
-        'terrain_category': {'en': "Terrain Category", 'fa': "دسته‌بندی زمین"},
-        'wind_direction': {'en': "Prevailing Wind Direction", 'fa': "جهت غالب باد"},
-        'avg_wind_speed': {'en': "Average Wind Speed (km/h)", 'fa': "سرعت متوسط باد (کیلومتر در ساعت)"},
-        'max_wind_speed': {'en': "Maximum Wind Speed (km/h)", 'fa': "حداکثر سرعت باد (کیلومتر در ساعت)"},
-        'seismic_hazard': {'en': "Seismic Hazard Level", 'fa': "سطح خطر لرزه‌ای"},
-        
-        # Step 7 - Soil Type
-        'soil_type': {'en': "Soil Type & Importance Classification", 'fa': "نوع خاک و طبقه‌بندی اهمیت"},
-        'select_soil': {'en': "Select Soil Type", 'fa': "انتخاب نوع خاک"},
-        'select_importance': {'en': "Select Importance Group", 'fa': "انتخاب گروه اهمیت"},
-        
-        # Step 8 - Orientation
-        'carousel_orientation': {'en': "Carousel Orientation Selection", 'fa': "انتخاب جهت‌گیری چرخ و فلک"},
-        'suggested_orientation': {'en': "Suggested Orientation (perpendicular to wind)", 'fa': "جهت پیشنهادی (عمود بر باد)"},
-        'confirm_orientation': {'en': "Confirm Suggested Orientation", 'fa': "تایید جهت پیشنهادی"},
-        'custom_direction': {'en': "Custom Direction", 'fa': "جهت سفارشی"},
-        'north_south': {'en': "North-South", 'fa': "شمال-جنوب"},
-        'east_west': {'en': "East-West", 'fa': "شرق-غرب"},
-        'northeast_southwest': {'en': "Northeast-Southwest", 'fa': "شمال شرقی-جنوب غربی"},
-        'southeast_northwest': {'en': "Southeast-Northwest", 'fa': "جنوب شرقی-شمال غربی"},
-        
-        # Step 9 - Classification
-        'device_classification': {'en': "Device Classification", 'fa': "طبقه‌بندی دستگاه"},
-        'calc_per_standard': {'en': "**Calculation per INSO 8987-1-2023**", 'fa': "**محاسبه طبق INSO 8987-1-2023**"},
-        'braking_accel_param': {'en': "Braking Acceleration Parameter", 'fa': "پارامتر شتاب ترمز"},
-        'braking_accel': {'en': "Braking Acceleration (m/s²)", 'fa': "شتاب ترمز (m/s²)"},
-        'braking_accel_actual': {'en': "Braking Acceleration (m/s²) - Actual Operation", 'fa': "شتاب ترمز (m/s²) - عملیات واقعی"},
-        'additional_loads': {'en': "Additional Load Factors", 'fa': "بارهای اضافی"},
-        'snow_load': {'en': "Snow Load", 'fa': "بار برف"},
-        'wind_load': {'en': "Wind Load", 'fa': "بار باد"},
-        'earthquake_load': {'en': "Earthquake Load", 'fa': "بار زلزله"},
-        'design_case': {'en': "Design Case Analysis", 'fa': "تحلیل حالت طراحی"},
-        'actual_operation': {'en': "Actual Operation Analysis", 'fa': "تحلیل عملیات واقعی"},
-        'max_acceleration': {'en': "Max Acceleration", 'fa': "حداکثر شتاب"},
-        'dynamic_product': {'en': "Dynamic Product (p)", 'fa': "حاصل‌ضرب دینامیکی (p)"},
-        'device_class': {'en': "Device Class", 'fa': "کلاس دستگاه"},
-        'load_contributions': {'en': "Additional Load Contributions", 'fa': "مشارکت بارهای اضافی"},
-        
-        # Step 10 - Restraint
-        'restraint_type': {'en': "Restraint Type Determination", 'fa': "تعیین نوع مهاربند"},
-        
-        # Step 11 - Summary
-        'design_summary': {'en': "Complete Design Summary", 'fa': "خلاصه کامل طراحی"},
-        'basic_params': {'en': "🎡 Basic Design Parameters", 'fa': "🎡 پارامترهای پایه طراحی"},
-        'generation': {'en': "Generation", 'fa': "نسل"},
-        'diameter': {'en': "Diameter", 'fa': "قطر"},
-        'height': {'en': "Height", 'fa': "ارتفاع"},
-        'total_cabins': {'en': "Total Cabins", 'fa': "کل کابین‌ها"},
-        'vip_cabins': {'en': "VIP Cabins", 'fa': "کابین‌های VIP"},
-        'cabin_capacity': {'en': "Cabin Capacity", 'fa': "ظرفیت کابین"},
-        'cabin_geometry': {'en': "Cabin Geometry", 'fa': "هندسه کابین"},
-        'rotation_time_min': {'en': "Rotation Time", 'fa': "زمان چرخش"},
-        'capacity_hour': {'en': "Capacity/Hour", 'fa': "ظرفیت/ساعت"},
-        'env_site_conditions': {'en': "🌍 Environment & Site Conditions", 'fa': "🌍 شرایط محیطی و سایت"},
-        'province': {'en': "Province", 'fa': "استان"},
-        'city': {'en': "City", 'fa': "شهر"},
-        'region': {'en': "Region", 'fa': "منطقه"},
-        'land_area': {'en': "Land Area", 'fa': "مساحت زمین"},
-        'temp_range_display': {'en': "Temperature Range", 'fa': "محدوده دما"},
-        'soil_importance': {'en': "🏗️ Soil & Structural Importance", 'fa': "🏗️ خاک و اهمیت سازه"},
-        'orientation_title': {'en': "🧭 Carousel Orientation", 'fa': "🧭 جهت‌گیری چرخ و فلک"},
-        'selected_orientation': {'en': "Selected Orientation", 'fa': "جهت‌گیری انتخاب شده"},
-        'safety_classification': {'en': "⚠️ Safety Classification", 'fa': "⚠️ طبقه‌بندی ایمنی"},
-        'design_class': {'en': "Design Class", 'fa': "کلاس طراحی"},
-        'actual_class': {'en': "Actual Class", 'fa': "کلاس واقعی"},
-        'restraint_requirements': {'en': "🔒 Restraint System Requirements", 'fa': "🔒 الزامات سیستم مهاربند"},
-        'motor_drive': {'en': "⚙️ Motor & Drive System", 'fa': "⚙️ سیستم موتور و درایو"},
-        'rated_power': {'en': "Rated Power", 'fa': "توان نامی"},
-        'peak_power': {'en': "Peak Power", 'fa': "توان پیک"},
-        'operational_power': {'en': "Operational", 'fa': "توان عملیاتی"},
-        'total_mass': {'en': "Total Mass", 'fa': "جرم کل"},
-        'design_viz': {'en': "📊 Design Visualization", 'fa': "📊 تصویرسازی طراحی"},
-        'design_report': {'en': "📄 Design Summary Report", 'fa': "📄 گزارش خلاصه طراحی"},
-        'view_report': {'en': "📋 View Complete Design Report", 'fa': "📋 مشاهده گزارش کامل طراحی"},
-        'new_design': {'en': "🔄 New Design", 'fa': "🔄 طراحی جدید"},
-        'export_report': {'en': "📥 Export Report", 'fa': "📥 خروجی گزارش"},
-        'design_complete': {'en': "✅ Design Complete! All parameters have been configured.", 
-                           'fa': "✅ طراحی کامل شد! تمام پارامترها تنظیم شده‌اند."},
-        'export_coming_soon': {'en': "Report export functionality - Coming soon!", 
-                              'fa': "قابلیت خروجی گزارش - به زودی!"},
-        'professional_note': {'en': "🚧 **Note:** Detailed structural, electrical, and safety analyses require professional engineering consultation.",
-                             'fa': "🚧 **توجه:** تحلیل‌های دقیق سازه‌ای، الکتریکی و ایمنی نیازمند مشاوره مهندسی حرفه‌ای هستند."},
-    }
-    return texts.get(key, {}).get('fa' if persian else 'en', key)
-
 # --- Session State Initialization ---
 if 'step' not in st.session_state:
     st.session_state.step = 0
@@ -380,654 +97,25 @@ if 'language_set' not in st.session_state:
 if 'first_visit' not in st.session_state:
     st.session_state.first_visit = True
 
-# --- Province Data ---
-TERRAIN_CATEGORIES = {
-    "Gilan":                      {"category": "0",   "z0": 0.003, "zmin": 1,  "desc": "Sea or coastal area exposed to the open sea",                         "desc_fa": "دریا یا منطقه ساحلی در معرض دریای آزاد"},
-    "Mazandaran":                 {"category": "0",   "z0": 0.003, "zmin": 1,  "desc": "Sea or coastal area exposed to the open sea",                         "desc_fa": "دریا یا منطقه ساحلی در معرض دریای آزاد"},
-    "Golestan":                   {"category": "0",   "z0": 0.003, "zmin": 1,  "desc": "Sea or coastal area exposed to the open sea",                         "desc_fa": "دریا یا منطقه ساحلی در معرض دریای آزاد"},
-    "Bushehr":                    {"category": "0",   "z0": 0.003, "zmin": 1,  "desc": "Sea or coastal area exposed to the open sea",                         "desc_fa": "دریا یا منطقه ساحلی در معرض دریای آزاد"},
-    "Hormozgan":                  {"category": "0",   "z0": 0.003, "zmin": 1,  "desc": "Sea or coastal area exposed to the open sea",                         "desc_fa": "دریا یا منطقه ساحلی در معرض دریای آزاد"},
-    "Khuzestan":                  {"category": "0",   "z0": 0.003, "zmin": 1,  "desc": "Sea or coastal area exposed to the open sea",                         "desc_fa": "دریا یا منطقه ساحلی در معرض دریای آزاد"},
-    "Sistan and Baluchestan":     {"category": "0",   "z0": 0.003, "zmin": 1,  "desc": "Sea or coastal area exposed to the open sea (coastal parts)",         "desc_fa": "دریا یا منطقه ساحلی در معرض دریای آزاد (بخش‌های ساحلی)"},
-    "Yazd":                       {"category": "I",   "z0": 0.01,  "zmin": 1,  "desc": "Flat or desert area with negligible vegetation",                      "desc_fa": "منطقه مسطح یا بیابانی با پوشش گیاهی ناچیز"},
-    "Semnan":                     {"category": "I",   "z0": 0.01,  "zmin": 1,  "desc": "Flat or desert area with negligible vegetation",                      "desc_fa": "منطقه مسطح یا بیابانی با پوشش گیاهی ناچیز"},
-    "Qom":                        {"category": "I",   "z0": 0.01,  "zmin": 1,  "desc": "Flat or desert area with negligible vegetation",                      "desc_fa": "منطقه مسطح یا بیابانی با پوشش گیاهی ناچیز"},
-    "South Khorasan":             {"category": "I",   "z0": 0.01,  "zmin": 1,  "desc": "Flat or desert area with negligible vegetation",                      "desc_fa": "منطقه مسطح یا بیابانی با پوشش گیاهی ناچیز"},
-    "Kerman":                     {"category": "I",   "z0": 0.01,  "zmin": 1,  "desc": "Flat or desert area with negligible vegetation",                      "desc_fa": "منطقه مسطح یا بیابانی با پوشش گیاهی ناچیز"},
-    "Qazvin":                     {"category": "II",  "z0": 0.05,  "zmin": 2,  "desc": "Low vegetation, scattered trees or buildings",                        "desc_fa": "پوشش گیاهی کم، درختان یا ساختمان‌های پراکنده"},
-    "Zanjan":                     {"category": "II",  "z0": 0.05,  "zmin": 2,  "desc": "Low vegetation, scattered trees or buildings",                        "desc_fa": "پوشش گیاهی کم، درختان یا ساختمان‌های پراکنده"},
-    "Hamedan":                    {"category": "II",  "z0": 0.05,  "zmin": 2,  "desc": "Low vegetation, scattered trees or buildings",                        "desc_fa": "پوشش گیاهی کم، درختان یا ساختمان‌های پراکنده"},
-    "Markazi":                    {"category": "II",  "z0": 0.05,  "zmin": 2,  "desc": "Low vegetation, scattered trees or buildings",                        "desc_fa": "پوشش گیاهی کم، درختان یا ساختمان‌های پراکنده"},
-    "North Khorasan":             {"category": "II",  "z0": 0.05,  "zmin": 2,  "desc": "Low vegetation, scattered trees or buildings",                        "desc_fa": "پوشش گیاهی کم، درختان یا ساختمان‌های پراکنده"},
-    "Khorasan Razavi":            {"category": "II",  "z0": 0.05,  "zmin": 2,  "desc": "Semi-arid plains, mixed low vegetation",                             "desc_fa": "دشت‌های نیمه‌خشک، پوشش گیاهی کم و مختلط"},
-    "East Azerbaijan":            {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "West Azerbaijan":            {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "Ardabil":                    {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "Kurdistan":                  {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "Kermanshah":                 {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "Ilam":                       {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "Lorestan":                   {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "Chaharmahal and Bakhtiari":  {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "Kohgiluyeh and Boyer-Ahmad": {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "Fars":                       {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "Isfahan":                    {"category": "III", "z0": 0.3,   "zmin": 5,  "desc": "Regular vegetation or rural/forested terrain",                       "desc_fa": "پوشش گیاهی معمولی یا زمین روستایی/جنگلی"},
-    "Tehran":                     {"category": "IV",  "z0": 1.0,   "zmin": 10, "desc": "Densely built-up urban area",                                        "desc_fa": "منطقه شهری با تراکم ساختمانی بالا"},
-    "Alborz":                     {"category": "IV",  "z0": 1.0,   "zmin": 10, "desc": "Densely built-up urban area",                                        "desc_fa": "منطقه شهری با تراکم ساختمانی بالا"},
-}
-
-# City data with seismic hazard levels
-CITIES_DATA = {
-    "Khuzestan": [
-        {"city": "Abadan", "city_fa": "آبادان", "hazard": "Low"},
-        {"city": "Aghajari", "city_fa": "آغاجاری", "hazard": "High"},
-        {"city": "Omidiyeh", "city_fa": "امیدیه", "hazard": "Moderate"},
-        {"city": "Andimeshk", "city_fa": "اندیمشک", "hazard": "High"},
-        {"city": "Izeh", "city_fa": "ایذه", "hazard": "High"},
-        {"city": "Ahvaz", "city_fa": "اهواز", "hazard": "Moderate"},
-        {"city": "Arvankenar", "city_fa": "اروندکنار", "hazard": "Low"},
-        {"city": "Baghmalk", "city_fa": "باغملک", "hazard": "High"},
-        {"city": "Bandar Imam Khomeini", "city_fa": "بندر امام خمینی", "hazard": "Low"},
-        {"city": "Bandar Mahshahr", "city_fa": "بندر ماهشهر", "hazard": "Low"},
-        {"city": "Bastan", "city_fa": "بستان", "hazard": "Moderate"},
-        {"city": "Behbahan", "city_fa": "بهبهان", "hazard": "High"},
-        {"city": "Khorramshahr", "city_fa": "خرمشهر", "hazard": "Low"},
-        {"city": "Dezful", "city_fa": "دزفول", "hazard": "High"},
-        {"city": "Dehdez", "city_fa": "دهدز", "hazard": "High"},
-        {"city": "Ramshir", "city_fa": "رامشیر", "hazard": "Moderate"},
-        {"city": "Ramhormoz", "city_fa": "رامهرمز", "hazard": "High"},
-        {"city": "Sarbandar", "city_fa": "سربندر", "hazard": "Low"},
-        {"city": "Shadegan", "city_fa": "شادگان", "hazard": "Low"},
-        {"city": "Shush", "city_fa": "شوش", "hazard": "Moderate"},
-        {"city": "Shushtar", "city_fa": "شوشتر", "hazard": "High"},
-        {"city": "Sosangerd", "city_fa": "سوسنگرد", "hazard": "Moderate"},
-        {"city": "Hamidiyeh", "city_fa": "حمیدیه", "hazard": "Moderate"},
-        {"city": "Haftgel", "city_fa": "هفتگل", "hazard": "High"},
-        {"city": "Hendijan", "city_fa": "هندیجان", "hazard": "Moderate"},
-        {"city": "Hovizeh", "city_fa": "هویزه", "hazard": "Moderate"},
-        {"city": "Masjed Soleyman", "city_fa": "مسجد سلیمان", "hazard": "High"},
-        {"city": "Mollasani", "city_fa": "ملاثانی", "hazard": "Moderate"},
-        {"city": "Lali", "city_fa": "لالی", "hazard": "High"},
-    ],
-    "Ilam": [
-        {"city": "Abdanan", "city_fa": "آبدانان", "hazard": "Moderate"},
-        {"city": "Ilam", "city_fa": "ایلام", "hazard": "Moderate"},
-        {"city": "Ivan", "city_fa": "ایوان", "hazard": "Moderate"},
-        {"city": "Darreh Shahr", "city_fa": "دره شهر", "hazard": "Moderate"},
-        {"city": "Dashte Abbas", "city_fa": "دشت عباس", "hazard": "Moderate"},
-        {"city": "Dehloran", "city_fa": "دهلران", "hazard": "Moderate"},
-        {"city": "Mehran", "city_fa": "مهران", "hazard": "Moderate"},
-        {"city": "Musian", "city_fa": "موسیان", "hazard": "Moderate"},
-    ],
-    "Fars": [
-        {"city": "Abadeh", "city_fa": "آباده", "hazard": "High"},
-        {"city": "Arsanjan", "city_fa": "ارسنجان", "hazard": "Moderate"},
-        {"city": "Eqlid", "city_fa": "اقلید", "hazard": "High"},
-        {"city": "Estahban", "city_fa": "استهبان", "hazard": "High"},
-        {"city": "Behrestān", "city_fa": "بهرستان", "hazard": "High"},
-        {"city": "Khavaran", "city_fa": "خاوران", "hazard": "High"},
-        {"city": "Kharameh", "city_fa": "خرامه", "hazard": "High"},
-        {"city": "Khonj", "city_fa": "خنج", "hazard": "High"},
-        {"city": "Darab", "city_fa": "داراب", "hazard": "High"},
-        {"city": "Dehbid", "city_fa": "دهبید", "hazard": "High"},
-        {"city": "Zarqan", "city_fa": "زرقان", "hazard": "High"},
-        {"city": "Safashahr", "city_fa": "صفاشهر", "hazard": "Moderate"},
-        {"city": "Sepidan", "city_fa": "سپیدان", "hazard": "High"},
-        {"city": "Surian", "city_fa": "سوریان", "hazard": "High"},
-        {"city": "Shiraz", "city_fa": "شیراز", "hazard": "High"},
-        {"city": "Farashband", "city_fa": "فراشبند", "hazard": "High"},
-        {"city": "Fasa", "city_fa": "فسا", "hazard": "High"},
-        {"city": "Firuzabad", "city_fa": "فیروزآباد", "hazard": "High"},
-        {"city": "Qaderabad", "city_fa": "قادرآباد", "hazard": "Moderate"},
-        {"city": "Qir", "city_fa": "قیر", "hazard": "High"},
-        {"city": "Kazerun", "city_fa": "کازرون", "hazard": "High"},
-        {"city": "Kavar", "city_fa": "کوار", "hazard": "High"},
-        {"city": "Gerash", "city_fa": "گراش", "hazard": "High"},
-        {"city": "Lar", "city_fa": "لار", "hazard": "High"},
-        {"city": "Lamerd", "city_fa": "لامرد", "hazard": "High"},
-        {"city": "Marvdasht", "city_fa": "مرودشت", "hazard": "High"},
-        {"city": "Mehr", "city_fa": "مهر", "hazard": "High"},
-        {"city": "Neyriz", "city_fa": "نیریز", "hazard": "High"},
-        {"city": "Nourabad", "city_fa": "نورآباد", "hazard": "High"},
-        {"city": "Jahrom", "city_fa": "جهرم", "hazard": "High"},
-    ],
-    "Qazvin": [
-        {"city": "Ab-e Garm", "city_fa": "آب‌گرم", "hazard": "High"},
-        {"city": "Abyek", "city_fa": "آبیک", "hazard": "Very High"},
-        {"city": "Avaj", "city_fa": "آوج", "hazard": "High"},
-        {"city": "Buin Zahra", "city_fa": "بوئین زهرا", "hazard": "Very High"},
-        {"city": "Takestan", "city_fa": "تاکستان", "hazard": "High"},
-        {"city": "Qazvin", "city_fa": "قزوین", "hazard": "Very High"},
-        {"city": "Moalem Kalayeh", "city_fa": "معلم کلایه", "hazard": "Very High"},
-    ],
-    "Zanjan": [
-        {"city": "Ab Bar", "city_fa": "آب‌بر", "hazard": "Very High"},
-        {"city": "Abhar", "city_fa": "ابهر", "hazard": "High"},
-        {"city": "Khorramdarreh", "city_fa": "خرمدره", "hazard": "High"},
-        {"city": "Zanjan", "city_fa": "زنجان", "hazard": "High"},
-        {"city": "Soltaniyeh", "city_fa": "سلطانیه", "hazard": "High"},
-        {"city": "Soltanabad", "city_fa": "سلطان‌آباد", "hazard": "High"},
-        {"city": "Sayin Qaleh", "city_fa": "صائین قلعه", "hazard": "High"},
-        {"city": "Qaydar", "city_fa": "قیدار", "hazard": "High"},
-        {"city": "Giluwan", "city_fa": "گیلوان", "hazard": "Very High"},
-        {"city": "Mahneshan", "city_fa": "ماهنشان", "hazard": "High"},
-    ],
-    "Hamedan": [
-        {"city": "Asadabad", "city_fa": "اسدآباد", "hazard": "High"},
-        {"city": "Bahar", "city_fa": "بهار", "hazard": "Moderate"},
-        {"city": "Tuyserkan", "city_fa": "تویسرکان", "hazard": "High"},
-        {"city": "Razan", "city_fa": "رزن", "hazard": "High"},
-        {"city": "Kabutarāhang", "city_fa": "کبودرآهنگ", "hazard": "Moderate"},
-        {"city": "Malayer", "city_fa": "ملایر", "hazard": "High"},
-        {"city": "Nahavand", "city_fa": "نهاوند", "hazard": "Very High"},
-        {"city": "Hamedan", "city_fa": "همدان", "hazard": "High"},
-        {"city": "Famenin", "city_fa": "فامنین", "hazard": "Moderate"},
-    ],
-    "Markazi": [
-        {"city": "Ashtian", "city_fa": "آشتیان", "hazard": "High"},
-        {"city": "Arak", "city_fa": "اراک", "hazard": "Moderate"},
-        {"city": "Astaneh", "city_fa": "آستانه", "hazard": "Moderate"},
-        {"city": "Tafresh", "city_fa": "تفرش", "hazard": "High"},
-        {"city": "Khondab", "city_fa": "خنداب", "hazard": "Moderate"},
-        {"city": "Khomein", "city_fa": "خمین", "hazard": "Moderate"},
-        {"city": "Delijan", "city_fa": "دلیجان", "hazard": "High"},
-        {"city": "Zarandieh", "city_fa": "زرندیه", "hazard": "High"},
-        {"city": "Sarband", "city_fa": "سربند", "hazard": "High"},
-        {"city": "Shazand", "city_fa": "شازند", "hazard": "High"},
-        {"city": "Saveh", "city_fa": "ساوه", "hazard": "High"},
-        {"city": "Farmahin", "city_fa": "فرمهین", "hazard": "Moderate"},
-        {"city": "Komijan", "city_fa": "کمیجان", "hazard": "Moderate"},
-        {"city": "Mahallat", "city_fa": "محلات", "hazard": "Moderate"},
-        {"city": "Nobaran", "city_fa": "نوبران", "hazard": "High"},
-    ],
-    "Yazd": [
-        {"city": "Abarkuh", "city_fa": "ابرکوه", "hazard": "Moderate"},
-        {"city": "Ardakan", "city_fa": "اردکان", "hazard": "Moderate"},
-        {"city": "Bafq", "city_fa": "بافق", "hazard": "High"},
-        {"city": "Behābād", "city_fa": "بهاباد", "hazard": "High"},
-        {"city": "Taft", "city_fa": "تفت", "hazard": "Moderate"},
-        {"city": "Khor", "city_fa": "خور", "hazard": "Moderate"},
-        {"city": "Dihuk", "city_fa": "دیهوک", "hazard": "Very High"},
-        {"city": "Rābat Posht-e Bādām", "city_fa": "رباط پشت‌بادام", "hazard": "High"},
-        {"city": "Zarch", "city_fa": "زارچ", "hazard": "Moderate"},
-        {"city": "Saqand", "city_fa": "سقند", "hazard": "High"},
-        {"city": "Mehriz", "city_fa": "مهریز", "hazard": "Moderate"},
-        {"city": "Meybod", "city_fa": "میبد", "hazard": "Moderate"},
-        {"city": "Herat", "city_fa": "هرات", "hazard": "High"},
-        {"city": "Yazd", "city_fa": "یزد", "hazard": "Moderate"},
-        {"city": "Tabas", "city_fa": "طبس", "hazard": "Very High"},
-        {"city": "Naybandan", "city_fa": "نایبندان", "hazard": "Very High"},
-        {"city": "Dehshir", "city_fa": "دهشیر", "hazard": "High"},
-    ],
-    "Semnan": [
-        {"city": "Aradan", "city_fa": "آرادان", "hazard": "High"},
-        {"city": "Astaneh", "city_fa": "آستانه", "hazard": "High"},
-        {"city": "Damghan", "city_fa": "دامغان", "hazard": "High"},
-        {"city": "Sorkheh", "city_fa": "سرخه", "hazard": "High"},
-        {"city": "Semnan", "city_fa": "سمنان", "hazard": "High"},
-        {"city": "Shahrud", "city_fa": "شاهرود", "hazard": "High"},
-        {"city": "Absarabad", "city_fa": "آبسرآباد", "hazard": "High"},
-        {"city": "Garmsar", "city_fa": "گرمسار", "hazard": "High"},
-        {"city": "Mehdishahr", "city_fa": "مهدیشهر", "hazard": "Very High"},
-        {"city": "Meyamey", "city_fa": "میامی", "hazard": "High"},
-        {"city": "Shahmirzad", "city_fa": "شهمیرزاد", "hazard": "Very High"},
-        {"city": "Ivānkī", "city_fa": "ایوانکی", "hazard": "High"},
-        {"city": "Jām", "city_fa": "جام", "hazard": "High"},
-        {"city": "Biarjmand", "city_fa": "بیارجمند", "hazard": "Moderate"},
-        {"city": "Bastam", "city_fa": "بسطام", "hazard": "High"},
-        {"city": "Tazareh", "city_fa": "تزره", "hazard": "High"},
-        {"city": "Torud", "city_fa": "طرود", "hazard": "High"},
-        {"city": "Forumad", "city_fa": "فرومد", "hazard": "High"},
-        {"city": "Mojen", "city_fa": "مجن", "hazard": "High"},
-        {"city": "Moalleman", "city_fa": "معلمان", "hazard": "High"},
-        {"city": "Amir Abad", "city_fa": "امیرآباد", "hazard": "High"},
-    ],
-    "Qom": [
-        {"city": "Qom", "city_fa": "قم", "hazard": "High"},
-        {"city": "Solfchegan", "city_fa": "سلفچگان", "hazard": "High"},
-        {"city": "Gazaran", "city_fa": "گازران", "hazard": "High"},
-        {"city": "Kahak", "city_fa": "کهک", "hazard": "High"},
-        {"city": "Kooshk Nosrat", "city_fa": "کوشک نصرت", "hazard": "High"},
-    ],
-    "South Khorasan": [
-        {"city": "Birjand", "city_fa": "بیرجند", "hazard": "High"},
-        {"city": "Tabas Masina", "city_fa": "طبس مسینا", "hazard": "High"},
-        {"city": "Khosvaf", "city_fa": "خوسف", "hazard": "Moderate"},
-        {"city": "Khezri", "city_fa": "خضری", "hazard": "Very High"},
-        {"city": "Dasht Beyaz", "city_fa": "دشت بیاض", "hazard": "Very High"},
-        {"city": "Sarayan", "city_fa": "سرایان", "hazard": "Very High"},
-        {"city": "Sarbisheh", "city_fa": "سربیشه", "hazard": "High"},
-        {"city": "Sade", "city_fa": "سده", "hazard": "High"},
-        {"city": "Shahrukht", "city_fa": "شاهرخت", "hazard": "Very High"},
-        {"city": "Qaen", "city_fa": "قاین", "hazard": "Very High"},
-        {"city": "Kooli", "city_fa": "کولی", "hazard": "Very High"},
-        {"city": "Nehbandan", "city_fa": "نهبندان", "hazard": "High"},
-        {"city": "Boshruyeh", "city_fa": "بشرویه", "hazard": "High"},
-    ],
-    "Kerman": [
-        {"city": "Anār", "city_fa": "انار", "hazard": "High"},
-        {"city": "Baft", "city_fa": "بافت", "hazard": "High"},
-        {"city": "Bārdsar", "city_fa": "بردسیر", "hazard": "High"},
-        {"city": "Bam", "city_fa": "بم", "hazard": "High"},
-        {"city": "Jiroft", "city_fa": "جیرفت", "hazard": "High"},
-        {"city": "Rafsanjan", "city_fa": "رفسنجان", "hazard": "High"},
-        {"city": "Ravar", "city_fa": "راور", "hazard": "High"},
-        {"city": "Rayen", "city_fa": "راین", "hazard": "High"},
-        {"city": "Zarand", "city_fa": "زرند", "hazard": "High"},
-        {"city": "Sīrjān", "city_fa": "سیرجان", "hazard": "Moderate"},
-        {"city": "Sirch", "city_fa": "سیرچ", "hazard": "Very High"},
-        {"city": "Sabz Abad", "city_fa": "سبزآباد", "hazard": "High"},
-        {"city": "Sarcheshmeh", "city_fa": "سرچشمه", "hazard": "High"},
-        {"city": "Shahdad", "city_fa": "شهداد", "hazard": "Very High"},
-        {"city": "Shahrbabak", "city_fa": "شهربابک", "hazard": "High"},
-        {"city": "Kerman", "city_fa": "کرمان", "hazard": "High"},
-        {"city": "Golbaf", "city_fa": "گلباف", "hazard": "Very High"},
-        {"city": "Kahnuj", "city_fa": "کهنوج", "hazard": "High"},
-        {"city": "Kohbanān", "city_fa": "کوهبنان", "hazard": "High"},
-        {"city": "Kianshahr", "city_fa": "کیانشهر", "hazard": "High"},
-        {"city": "Mahan", "city_fa": "ماهان", "hazard": "High"},
-        {"city": "Manujan", "city_fa": "منوجان", "hazard": "High"},
-    ],
-    "East Azerbaijan": [
-        {"city": "Ahar", "city_fa": "اهر", "hazard": "High"},
-        {"city": "Azhdarshur", "city_fa": "آذرشهر", "hazard": "High"},
-        {"city": "Osku", "city_fa": "اسکو", "hazard": "Very High"},
-        {"city": "Bonab", "city_fa": "بناب", "hazard": "Moderate"},
-        {"city": "Bostanābād", "city_fa": "بستان‌آباد", "hazard": "Very High"},
-        {"city": "Tabriz", "city_fa": "تبریز", "hazard": "Very High"},
-        {"city": "Tasuj", "city_fa": "تسوج", "hazard": "Very High"},
-        {"city": "Jolfa", "city_fa": "جلفا", "hazard": "High"},
-        {"city": "Khajeh", "city_fa": "خاجه", "hazard": "High"},
-        {"city": "Sarab", "city_fa": "سراب", "hazard": "High"},
-        {"city": "Shabestar", "city_fa": "شبستر", "hazard": "Very High"},
-        {"city": "Sharafkhaneh", "city_fa": "شرفخانه", "hazard": "Very High"},
-        {"city": "Sofian", "city_fa": "صوفیان", "hazard": "Very High"},
-        {"city": "Ajab Shir", "city_fa": "عجب‌شیر", "hazard": "Moderate"},
-        {"city": "Qareh Aghaj", "city_fa": "قره‌آغاج", "hazard": "High"},
-        {"city": "Kaleybar", "city_fa": "کلیبر", "hazard": "High"},
-        {"city": "Maragheh", "city_fa": "مراغه", "hazard": "Moderate"},
-        {"city": "Marand", "city_fa": "مرند", "hazard": "High"},
-        {"city": "Mianeh", "city_fa": "میانه", "hazard": "Very High"},
-        {"city": "Haris", "city_fa": "هریس", "hazard": "High"},
-        {"city": "Heris", "city_fa": "هریس", "hazard": "High"},
-        {"city": "Hashtrud", "city_fa": "هشترود", "hazard": "High"},
-        {"city": "Varzaqān", "city_fa": "ورزقان", "hazard": "High"},
-        {"city": "Zonūz", "city_fa": "زنوز", "hazard": "High"},
-    ],
-    "West Azerbaijan": [
-        {"city": "Oshnaviyeh", "city_fa": "اشنویه", "hazard": "High"},
-        {"city": "Urmia", "city_fa": "ارومیه", "hazard": "Moderate"},
-        {"city": "Bukan", "city_fa": "بوکان", "hazard": "Moderate"},
-        {"city": "Piranshahr", "city_fa": "پیرانشهر", "hazard": "High"},
-        {"city": "Takab", "city_fa": "تکاب", "hazard": "Moderate"},
-        {"city": "Chaypareh", "city_fa": "چایپاره", "hazard": "High"},
-        {"city": "Khoy", "city_fa": "خوی", "hazard": "High"},
-        {"city": "Salmas", "city_fa": "سلماس", "hazard": "Very High"},
-        {"city": "Sarv", "city_fa": "سرو", "hazard": "Moderate"},
-        {"city": "Sardasht", "city_fa": "سردشت", "hazard": "High"},
-        {"city": "Shahin Dezh", "city_fa": "شاهین‌دژ", "hazard": "Moderate"},
-        {"city": "Siyah Cheshmeh", "city_fa": "سیه‌چشمه", "hazard": "High"},
-        {"city": "Showt", "city_fa": "شوط", "hazard": "High"},
-        {"city": "Qarah Zīā od Dīn", "city_fa": "قره‌ضیاءالدین", "hazard": "High"},
-        {"city": "Qotur", "city_fa": "قطور", "hazard": "Very High"},
-        {"city": "Kelisa Kandi", "city_fa": "کلیساکندی", "hazard": "High"},
-        {"city": "Maku", "city_fa": "ماکو", "hazard": "High"},
-        {"city": "Mahābād", "city_fa": "مهاباد", "hazard": "Moderate"},
-        {"city": "Miandoab", "city_fa": "میاندوآب", "hazard": "Moderate"},
-        {"city": "Naqadeh", "city_fa": "نقده", "hazard": "High"},
-        {"city": "Poldasht", "city_fa": "پلدشت", "hazard": "High"},
-    ],
-    "Ardabil": [
-        {"city": "Aslanduz", "city_fa": "اصلاندوز", "hazard": "High"},
-        {"city": "Ardabil", "city_fa": "اردبیل", "hazard": "High"},
-        {"city": "Parsābād", "city_fa": "پارس‌آباد", "hazard": "High"},
-        {"city": "Beleh Savar", "city_fa": "بیله‌سوار", "hazard": "High"},
-        {"city": "Khalkhal", "city_fa": "خلخال", "hazard": "High"},
-        {"city": "Sarein", "city_fa": "سرعین", "hazard": "High"},
-        {"city": "Zaviyeh", "city_fa": "زاویه", "hazard": "Very High"},
-        {"city": "Germi", "city_fa": "گرمی", "hazard": "High"},
-        {"city": "Giveh", "city_fa": "گیوی", "hazard": "High"},
-        {"city": "Kolur", "city_fa": "کلور", "hazard": "Very High"},
-        {"city": "Meshginshahr", "city_fa": "مشگین‌شهر", "hazard": "High"},
-        {"city": "Namin", "city_fa": "نمین", "hazard": "High"},
-        {"city": "Nir", "city_fa": "نیر", "hazard": "High"},
-        {"city": "Hashtjin", "city_fa": "هشتجین", "hazard": "Very High"},
-        {"city": "Lahrood", "city_fa": "لاهرود", "hazard": "High"},
-    ],
-    "Kurdistan": [
-        {"city": "Baneh", "city_fa": "بانه", "hazard": "High"},
-        {"city": "Bijar", "city_fa": "بیجار", "hazard": "Moderate"},
-        {"city": "Qorveh", "city_fa": "قروه", "hazard": "High"},
-        {"city": "Kamyaran", "city_fa": "کامیاران", "hazard": "Very High"},
-        {"city": "Marivan", "city_fa": "مریوان", "hazard": "Very High"},
-        {"city": "Sanandaj", "city_fa": "سنندج", "hazard": "High"},
-        {"city": "Saqez", "city_fa": "سقز", "hazard": "High"},
-        {"city": "Divandarreh", "city_fa": "دیواندره", "hazard": "Moderate"},
-    ],
-    "Kermanshah": [
-        {"city": "Eslamābād-e Gharb", "city_fa": "اسلام‌آباد غرب", "hazard": "High"},
-        {"city": "Paveh", "city_fa": "پاوه", "hazard": "High"},
-        {"city": "Sarab-e Neelofar", "city_fa": "سراب نیلوفر", "hazard": "High"},
-        {"city": "Bisetun", "city_fa": "بیستون", "hazard": "High"},
-        {"city": "Javanrud", "city_fa": "جوانرود", "hazard": "High"},
-        {"city": "Harsin", "city_fa": "هرسین", "hazard": "High"},
-        {"city": "Ravansar", "city_fa": "روانسر", "hazard": "High"},
-        {"city": "Sar-e Pol-e Zahab", "city_fa": "سرپل ذهاب", "hazard": "High"},
-        {"city": "Songhor", "city_fa": "سنقر", "hazard": "High"},
-        {"city": "Sahneh", "city_fa": "صحنه", "hazard": "Very High"},
-        {"city": "Somar", "city_fa": "سومار", "hazard": "Moderate"},
-        {"city": "Qasr-e Shirin", "city_fa": "قصر شیرین", "hazard": "High"},
-        {"city": "Kangavar", "city_fa": "کنگاور", "hazard": "Very High"},
-        {"city": "Kermanshah", "city_fa": "کرمانشاه", "hazard": "High"},
-        {"city": "Kerend", "city_fa": "کرند", "hazard": "High"},
-        {"city": "Gilan-e Gharb", "city_fa": "گیلان غرب", "hazard": "High"},
-        {"city": "Nosoud", "city_fa": "نوسود", "hazard": "High"},
-    ],
-    "Lorestan": [
-        {"city": "Azna", "city_fa": "ازنا", "hazard": "Very High"},
-        {"city": "Aleshtar", "city_fa": "الشتر", "hazard": "High"},
-        {"city": "Aligudarz", "city_fa": "الیگودرز", "hazard": "High"},
-        {"city": "Borujerd", "city_fa": "بروجرد", "hazard": "Very High"},
-        {"city": "Poldokhtar", "city_fa": "پلدختر", "hazard": "Moderate"},
-        {"city": "Khorramabad", "city_fa": "خرم‌آباد", "hazard": "High"},
-        {"city": "Dorud", "city_fa": "دورود", "hazard": "Very High"},
-        {"city": "Kuhdasht", "city_fa": "کوهدشت", "hazard": "High"},
-        {"city": "Mamoun", "city_fa": "ممون", "hazard": "High"},
-    ],
-    "Chaharmahal and Bakhtiari": [
-        {"city": "Ardal", "city_fa": "اردل", "hazard": "High"},
-        {"city": "Borūjen", "city_fa": "بروجن", "hazard": "High"},
-        {"city": "Boldaji", "city_fa": "بلداجی", "hazard": "High"},
-        {"city": "Dogoombadan", "city_fa": "دوگنبدان", "hazard": "High"},
-        {"city": "Saman", "city_fa": "سامان", "hazard": "High"},
-        {"city": "Sarkhoon", "city_fa": "سرخون", "hazard": "High"},
-        {"city": "Shalmazar", "city_fa": "شلمزار", "hazard": "High"},
-        {"city": "Shahrekord", "city_fa": "شهرکرد", "hazard": "High"},
-        {"city": "Farsan", "city_fa": "فارسان", "hazard": "Very High"},
-        {"city": "Koohrang", "city_fa": "کوهرنگ", "hazard": "Very High"},
-        {"city": "Gandoman", "city_fa": "گندمان", "hazard": "High"},
-        {"city": "Lordegan", "city_fa": "لردگان", "hazard": "High"},
-        {"city": "Naghan", "city_fa": "ناغان", "hazard": "High"},
-    ],
-    "Kohgiluyeh and Boyer-Ahmad": [
-        {"city": "Dehdasht", "city_fa": "دهدشت", "hazard": "High"},
-        {"city": "Dishmuk", "city_fa": "دیشموک", "hazard": "High"},
-        {"city": "Yasuj", "city_fa": "یاسوج", "hazard": "High"},
-        {"city": "Gachsaran", "city_fa": "گچساران", "hazard": "High"},
-        {"city": "Si Sakhti", "city_fa": "سی‌سخت", "hazard": "High"},
-    ],
-    "Isfahan": [
-        {"city": "Abyaneh", "city_fa": "ابیانه", "hazard": "High"},
-        {"city": "Ardestan", "city_fa": "اردستان", "hazard": "High"},
-        {"city": "Aran", "city_fa": "آران", "hazard": "High"},
-        {"city": "Isfahan", "city_fa": "اصفهان", "hazard": "Moderate"},
-        {"city": "Anarak", "city_fa": "انارک", "hazard": "Moderate"},
-        {"city": "Badrud", "city_fa": "بادرود", "hazard": "Moderate"},
-        {"city": "Tiran", "city_fa": "تیران", "hazard": "Moderate"},
-        {"city": "Charmhin", "city_fa": "چرمهین", "hazard": "High"},
-        {"city": "Chadegan", "city_fa": "چادگان", "hazard": "High"},
-        {"city": "Dehaqan", "city_fa": "دهاقان", "hazard": "High"},
-        {"city": "Daran", "city_fa": "داران", "hazard": "High"},
-        {"city": "Dorche", "city_fa": "درچه", "hazard": "High"},
-        {"city": "Jondoq", "city_fa": "جندق", "hazard": "High"},
-        {"city": "Khur", "city_fa": "خور", "hazard": "Moderate"},
-        {"city": "Khansar", "city_fa": "خوانسار", "hazard": "Moderate"},
-        {"city": "Zarrinshahr", "city_fa": "زرین‌شهر", "hazard": "High"},
-        {"city": "Zvareh", "city_fa": "زواره", "hazard": "Moderate"},
-        {"city": "Zafreh", "city_fa": "زفره", "hazard": "High"},
-        {"city": "Semīrom", "city_fa": "سمیرم", "hazard": "High"},
-        {"city": "Shahreza", "city_fa": "شهرضا", "hazard": "High"},
-        {"city": "Shahin Shahr", "city_fa": "شاهین‌شهر", "hazard": "Moderate"},
-        {"city": "Golpayegan", "city_fa": "گلپایگان", "hazard": "Moderate"},
-        {"city": "Kashan", "city_fa": "کاشان", "hazard": "High"},
-        {"city": "Kuhpayeh", "city_fa": "کوهپایه", "hazard": "High"},
-        {"city": "Meimeh", "city_fa": "میمه", "hazard": "Moderate"},
-        {"city": "Mobarakeh", "city_fa": "مبارکه", "hazard": "High"},
-        {"city": "Natanz", "city_fa": "نطنز", "hazard": "High"},
-        {"city": "Najaf Abad", "city_fa": "نجف‌آباد", "hazard": "Moderate"},
-        {"city": "Nain", "city_fa": "نائین", "hazard": "High"},
-        {"city": "Alvandeh", "city_fa": "الوانده", "hazard": "Moderate"},
-        {"city": "Fin", "city_fa": "فین", "hazard": "High"},
-        {"city": "Qomsar", "city_fa": "قمصر", "hazard": "High"},
-        {"city": "Freydunshahr", "city_fa": "فریدونشهر", "hazard": "High"},
-    ],
-    "Tehran": [
-        {"city": "Eshtahard", "city_fa": "اشتهارد", "hazard": "Very High"},
-        {"city": "Bumehen", "city_fa": "بومهن", "hazard": "Very High"},
-        {"city": "Pishva", "city_fa": "پیشوا", "hazard": "High"},
-        {"city": "Tehran", "city_fa": "تهران", "hazard": "Very High"},
-        {"city": "Damavand", "city_fa": "دماوند", "hazard": "Very High"},
-        {"city": "Rabat Karim", "city_fa": "رباط کریم", "hazard": "Very High"},
-        {"city": "Rey", "city_fa": "ری", "hazard": "Very High"},
-        {"city": "Rudehen", "city_fa": "رودهن", "hazard": "Very High"},
-        {"city": "Sarbandan", "city_fa": "سربندان", "hazard": "Very High"},
-        {"city": "Solegān", "city_fa": "سولقان", "hazard": "Very High"},
-        {"city": "Shahriar", "city_fa": "شهریار", "hazard": "Very High"},
-        {"city": "Shahr-e Qods", "city_fa": "شهر قدس", "hazard": "High"},
-        {"city": "Shahr-e Jadid-e Parand", "city_fa": "شهر جدید پرند", "hazard": "High"},
-        {"city": "Taleqān", "city_fa": "طالقان", "hazard": "Very High"},
-        {"city": "Fasham", "city_fa": "فشم", "hazard": "Very High"},
-        {"city": "Firuzkooh", "city_fa": "فیروزکوه", "hazard": "Very High"},
-        {"city": "Gejr", "city_fa": "گجر", "hazard": "Very High"},
-        {"city": "Kilan", "city_fa": "کیلان", "hazard": "Very High"},
-        {"city": "Lavasan", "city_fa": "لواسان", "hazard": "Very High"},
-        {"city": "Masha", "city_fa": "ماشا", "hazard": "Very High"},
-        {"city": "Mardabad", "city_fa": "مارداباد", "hazard": "Very High"},
-        {"city": "Hasanābād", "city_fa": "حسن‌آباد", "hazard": "High"},
-        {"city": "Erjmand", "city_fa": "ارجمند", "hazard": "Very High"},
-        {"city": "Dizin", "city_fa": "دیزین", "hazard": "Very High"},
-        {"city": "Varamin", "city_fa": "ورامین", "hazard": "High"},
-    ],
-    "Alborz": [
-        {"city": "Karaj", "city_fa": "کرج", "hazard": "Very High"},
-        {"city": "Hashtgerd", "city_fa": "هشتگرد", "hazard": "Very High"},
-        {"city": "Savojbolagh", "city_fa": "ساوجبلاغ", "hazard": "High"},
-        {"city": "Nazarābād", "city_fa": "نظرآباد", "hazard": "High"},
-    ],
-    "Gilan": [
-        {"city": "Astara", "city_fa": "آستارا", "hazard": "High"},
-        {"city": "Astaneh", "city_fa": "آستانه", "hazard": "High"},
-        {"city": "Bandar Anzali", "city_fa": "بندر انزلی", "hazard": "High"},
-        {"city": "Jirandeh", "city_fa": "جیرنده", "hazard": "Very High"},
-        {"city": "Chaboksar", "city_fa": "چابکسر", "hazard": "High"},
-        {"city": "Rudsar", "city_fa": "رودسر", "hazard": "High"},
-        {"city": "Rudbar", "city_fa": "رودبار", "hazard": "Very High"},
-        {"city": "Rezvanshahr", "city_fa": "رضوانشهر", "hazard": "High"},
-        {"city": "Rasht", "city_fa": "رشت", "hazard": "High"},
-        {"city": "Siahkal", "city_fa": "سیاهکل", "hazard": "High"},
-        {"city": "Sowme'eh Sara", "city_fa": "صومعه‌سرا", "hazard": "High"},
-        {"city": "Shaft", "city_fa": "شفت", "hazard": "High"},
-        {"city": "Fuman", "city_fa": "فومن", "hazard": "High"},
-        {"city": "Kelachay", "city_fa": "کلاچای", "hazard": "High"},
-        {"city": "Langerud", "city_fa": "لنگرود", "hazard": "High"},
-        {"city": "Lahijan", "city_fa": "لاهیجان", "hazard": "High"},
-        {"city": "Manjil", "city_fa": "منجیل", "hazard": "Very High"},
-        {"city": "Masal", "city_fa": "ماسال", "hazard": "Very High"},
-        {"city": "Masuleh", "city_fa": "ماسوله", "hazard": "Very High"},
-        {"city": "Hashtpar", "city_fa": "هشتپر", "hazard": "High"},
-        {"city": "Deylaman", "city_fa": "دیلمان", "hazard": "High"},
-        {"city": "Talesh", "city_fa": "تالش", "hazard": "High"},
-    ],
-    "Mazandaran": [
-        {"city": "Alasht", "city_fa": "الاشت", "hazard": "High"},
-        {"city": "Amol", "city_fa": "آمل", "hazard": "High"},
-        {"city": "Azmaaldaoleh", "city_fa": "آزمالدوله", "hazard": "High"},
-        {"city": "Babolsar", "city_fa": "بابلسر", "hazard": "High"},
-        {"city": "Babol", "city_fa": "بابل", "hazard": "High"},
-        {"city": "Behshahr", "city_fa": "بهشهر", "hazard": "High"},
-        {"city": "Beldeh", "city_fa": "بلده", "hazard": "High"},
-        {"city": "Tonekabon", "city_fa": "تنکابن", "hazard": "High"},
-        {"city": "Chalus", "city_fa": "چالوس", "hazard": "High"},
-        {"city": "Hasan Kif", "city_fa": "حسن‌کیف", "hazard": "High"},
-        {"city": "Ramsar", "city_fa": "رامسر", "hazard": "High"},
-        {"city": "Savadkuh", "city_fa": "سوادکوه", "hazard": "High"},
-        {"city": "Sari", "city_fa": "ساری", "hazard": "High"},
-        {"city": "Polur", "city_fa": "پلور", "hazard": "Very High"},
-        {"city": "Pol-e Sefid", "city_fa": "پل‌سفید", "hazard": "High"},
-        {"city": "Qarakhil", "city_fa": "قراخیل", "hazard": "High"},
-        {"city": "Qaemshahr", "city_fa": "قائمشهر", "hazard": "High"},
-        {"city": "Kelardasht", "city_fa": "کلاردشت", "hazard": "Very High"},
-        {"city": "Galugah", "city_fa": "گلوگاه", "hazard": "High"},
-        {"city": "Mahmoudabad", "city_fa": "محمودآباد", "hazard": "High"},
-        {"city": "Marzanābād", "city_fa": "مرزن‌آباد", "hazard": "High"},
-        {"city": "Neka", "city_fa": "نکا", "hazard": "High"},
-        {"city": "Nur", "city_fa": "نور", "hazard": "High"},
-        {"city": "Noshahr", "city_fa": "نوشهر", "hazard": "High"},
-        {"city": "Kiāsar", "city_fa": "کیاسر", "hazard": "High"},
-        {"city": "Freydunkenar", "city_fa": "فریدونکنار", "hazard": "High"},
-    ],
-    "Golestan": [
-        {"city": "Aq Qala", "city_fa": "آق‌قلا", "hazard": "High"},
-        {"city": "Ali Abad", "city_fa": "علی‌آباد", "hazard": "High"},
-        {"city": "Azadshahr", "city_fa": "آزادشهر", "hazard": "High"},
-        {"city": "Bandar Gaz", "city_fa": "بندر گز", "hazard": "High"},
-        {"city": "Bandar Torkaman", "city_fa": "بندر ترکمن", "hazard": "High"},
-        {"city": "Ramian", "city_fa": "رامیان", "hazard": "High"},
-        {"city": "Kalaleh", "city_fa": "کلاله", "hazard": "High"},
-        {"city": "Kordkuy", "city_fa": "کردکوی", "hazard": "High"},
-        {"city": "Gorgan", "city_fa": "گرگان", "hazard": "High"},
-        {"city": "Gonbad Kavus", "city_fa": "گنبد کاووس", "hazard": "High"},
-        {"city": "Marave Tappeh", "city_fa": "مراوه‌تپه", "hazard": "High"},
-        {"city": "Minoodasht", "city_fa": "مینودشت", "hazard": "High"},
-    ],
-    "North Khorasan": [
-        {"city": "Esfarayen", "city_fa": "اسفراین", "hazard": "High"},
-        {"city": "Ashkhaneh", "city_fa": "آشخانه", "hazard": "High"},
-        {"city": "Bojnurd", "city_fa": "بجنورد", "hazard": "High"},
-        {"city": "Jajarm", "city_fa": "جاجرم", "hazard": "High"},
-        {"city": "Chaman Bid", "city_fa": "چمن‌بید", "hazard": "High"},
-        {"city": "Rābat", "city_fa": "رباط", "hazard": "Very High"},
-        {"city": "Garmkhan", "city_fa": "گرمخان", "hazard": "High"},
-        {"city": "Gifan", "city_fa": "گیفان", "hazard": "Very High"},
-        {"city": "Maneh", "city_fa": "مانه", "hazard": "High"},
-        {"city": "Shirvan", "city_fa": "شیروان", "hazard": "Very High"},
-        {"city": "Farouj", "city_fa": "فاروج", "hazard": "Very High"},
-    ],
-    "Khorasan Razavi": [
-        {"city": "Bajestan", "city_fa": "بجستان", "hazard": "High"},
-        {"city": "Bajgiran", "city_fa": "باجگیران", "hazard": "High"},
-        {"city": "Bardaskan", "city_fa": "بردسکن", "hazard": "High"},
-        {"city": "Taybad", "city_fa": "تایباد", "hazard": "High"},
-        {"city": "Torbat-e Jam", "city_fa": "تربت جام", "hazard": "High"},
-        {"city": "Torbat-e Heydarieh", "city_fa": "تربت حیدریه", "hazard": "High"},
-        {"city": "Joghatay", "city_fa": "جغتای", "hazard": "High"},
-        {"city": "Chenaran", "city_fa": "چناران", "hazard": "High"},
-        {"city": "Khaf", "city_fa": "خواف", "hazard": "High"},
-        {"city": "Dargaz", "city_fa": "درگز", "hazard": "High"},
-        {"city": "Daruneh", "city_fa": "درونه", "hazard": "High"},
-        {"city": "Rivand", "city_fa": "ریوند", "hazard": "High"},
-        {"city": "Roshtkhar", "city_fa": "رشتخوار", "hazard": "High"},
-        {"city": "Sabzevar", "city_fa": "سبزوار", "hazard": "High"},
-        {"city": "Sangān", "city_fa": "سنگان", "hazard": "High"},
-        {"city": "Sarakhs", "city_fa": "سرخس", "hazard": "High"},
-        {"city": "Salehabād", "city_fa": "صالح‌آباد", "hazard": "High"},
-        {"city": "Shandiz", "city_fa": "شاندیز", "hazard": "High"},
-        {"city": "Fariman", "city_fa": "فریمان", "hazard": "High"},
-        {"city": "Ferdows", "city_fa": "فردوس", "hazard": "Very High"},
-        {"city": "Qalandarābād", "city_fa": "قلندرآباد", "hazard": "High"},
-        {"city": "Quchan", "city_fa": "قوچان", "hazard": "Very High"},
-        {"city": "Kalat", "city_fa": "کلات", "hazard": "High"},
-        {"city": "Kakhk", "city_fa": "کاخک", "hazard": "Very High"},
-        {"city": "Kashmar", "city_fa": "کاشمر", "hazard": "High"},
-        {"city": "Gonabad", "city_fa": "گناباد", "hazard": "High"},
-        {"city": "Golbahār", "city_fa": "گلبهار", "hazard": "High"},
-        {"city": "Marzadaran", "city_fa": "مرزداران", "hazard": "High"},
-        {"city": "Mashhad", "city_fa": "مشهد", "hazard": "High"},
-        {"city": "Neyshabur", "city_fa": "نیشابور", "hazard": "High"},
-        {"city": "Kamberz", "city_fa": "کامبرز", "hazard": "High"},
-    ],
-    "Sistan and Baluchestan": [
-        {"city": "Iranshahr", "city_fa": "ایرانشهر", "hazard": "High"},
-        {"city": "Bampur", "city_fa": "بمپور", "hazard": "Moderate"},
-        {"city": "Bezman", "city_fa": "بزمان", "hazard": "Moderate"},
-        {"city": "Chabahar", "city_fa": "چابهار", "hazard": "High"},
-        {"city": "Dehak", "city_fa": "دهاک", "hazard": "High"},
-        {"city": "Zabol", "city_fa": "زابل", "hazard": "High"},
-        {"city": "Zaboli", "city_fa": "زابلی", "hazard": "High"},
-        {"city": "Zahak", "city_fa": "زهک", "hazard": "High"},
-        {"city": "Zahedan", "city_fa": "زاهدان", "hazard": "High"},
-        {"city": "Saravan", "city_fa": "سراوان", "hazard": "High"},
-        {"city": "Sarbaz", "city_fa": "سرباز", "hazard": "High"},
-        {"city": "Sib va Suran", "city_fa": "سیب و سوران", "hazard": "High"},
-        {"city": "Fanuj", "city_fa": "فنوج", "hazard": "High"},
-        {"city": "Qasr-e Qand", "city_fa": "قصرقند", "hazard": "High"},
-        {"city": "Koochak", "city_fa": "کوچک", "hazard": "High"},
-        {"city": "Konarak", "city_fa": "کنارک", "hazard": "High"},
-        {"city": "Gowater", "city_fa": "گواتر", "hazard": "High"},
-        {"city": "Khash", "city_fa": "خاش", "hazard": "High"},
-        {"city": "Jalq", "city_fa": "جالق", "hazard": "High"},
-        {"city": "Mirjaveh", "city_fa": "میرجاوه", "hazard": "High"},
-        {"city": "Nasrat Abad", "city_fa": "نصرت‌آباد", "hazard": "High"},
-        {"city": "Nikshahr", "city_fa": "نیکشهر", "hazard": "High"},
-    ],
-    "Bushehr": [
-        {"city": "Ahram", "city_fa": "اهرم", "hazard": "Moderate"},
-        {"city": "Asaluyeh", "city_fa": "عسلویه", "hazard": "High"},
-        {"city": "Bandar Dayyer", "city_fa": "بندر دیر", "hazard": "High"},
-        {"city": "Bandar Deylam", "city_fa": "بندر دیلم", "hazard": "Moderate"},
-        {"city": "Bandar Taheri", "city_fa": "بندر طاهری", "hazard": "High"},
-        {"city": "Bandar Genaveh", "city_fa": "بندر گناوه", "hazard": "Moderate"},
-        {"city": "Bandar-e Kangan", "city_fa": "بندر کنگان", "hazard": "High"},
-        {"city": "Bandar-e Maqām", "city_fa": "بندر مقام", "hazard": "High"},
-        {"city": "Borazjan", "city_fa": "برازجان", "hazard": "High"},
-        {"city": "Bushehr", "city_fa": "بوشهر", "hazard": "Moderate"},
-        {"city": "Jam", "city_fa": "جم", "hazard": "High"},
-        {"city": "Khark", "city_fa": "خارک", "hazard": "Moderate"},
-        {"city": "Khormoj", "city_fa": "خورموج", "hazard": "Moderate"},
-        {"city": "Dalaki", "city_fa": "دالکی", "hazard": "High"},
-        {"city": "Deylvar", "city_fa": "دیلوار", "hazard": "Moderate"},
-        {"city": "Riz", "city_fa": "ریز", "hazard": "High"},
-        {"city": "Shabānkāreh", "city_fa": "شبانکاره", "hazard": "Moderate"},
-        {"city": "Taheri", "city_fa": "طاهری", "hazard": "High"},
-        {"city": "Gāvbandi", "city_fa": "گاوبندی", "hazard": "High"},
-        {"city": "Genaveh", "city_fa": "گناوه", "hazard": "Moderate"},
-    ],
-    "Hormozgan": [
-        {"city": "Bandar Abbas", "city_fa": "بندرعباس", "hazard": "High"},
-        {"city": "Bandar Khamir", "city_fa": "بندر خمیر", "hazard": "High"},
-        {"city": "Bandar Lengeh", "city_fa": "بندر لنگه", "hazard": "High"},
-        {"city": "Bastak", "city_fa": "بستک", "hazard": "High"},
-        {"city": "Jask", "city_fa": "جاسک", "hazard": "High"},
-        {"city": "Charak", "city_fa": "چارک", "hazard": "High"},
-        {"city": "Hajiabad", "city_fa": "حاجی‌آباد", "hazard": "High"},
-        {"city": "Rudān", "city_fa": "رودان", "hazard": "High"},
-        {"city": "Qeshm", "city_fa": "قشم", "hazard": "High"},
-        {"city": "Kish", "city_fa": "کیش", "hazard": "High"},
-        {"city": "Gavbandi", "city_fa": "گاوبندی", "hazard": "High"},
-        {"city": "Lavan", "city_fa": "لاوان", "hazard": "High"},
-        {"city": "Minab", "city_fa": "میناب", "hazard": "High"},
-    ],
-}
-
-
-# Map seismic hazard from city data
-def get_seismic_hazard_from_city(province, city_name):
-    """Get seismic hazard level for a specific city"""
-    if province in CITIES_DATA:
-        for city in CITIES_DATA[province]:
-            if city["city"] == city_name:
-                return city["hazard"]
-    # Fallback to province-level hazard
-    hazard_map = {
-        "Tehran": "High", "Alborz": "High", "Kermanshah": "High",
-        "Kohgiluyeh and Boyer-Ahmad": "High", "Lorestan": "High",
-        "West Azerbaijan": "High", "East Azerbaijan": "High",
-        "Fars": "High", "Hormozgan": "High", "Kurdistan": "Moderate",
-        "Ilam": "Moderate", "Chaharmahal and Bakhtiari": "Moderate", 
-        "Bushehr": "Moderate", "Mazandaran": "Moderate", "Gilan": "Moderate", 
-        "Khorasan Razavi": "Moderate", "South Khorasan": "Moderate", 
-        "Qazvin": "Moderate", "Zanjan": "Moderate", "Semnan": "Moderate", 
-        "Markazi": "Moderate", "Isfahan": "Moderate", "Kerman": "Moderate", 
-        "Qom": "Low", "Yazd": "Low", "Khuzestan": "Low",
-        "Golestan": "Low", "North Khorasan": "Low", "Sistan and Baluchestan": "Low"
-    }
-    return hazard_map.get(province, "Moderate")
+# --- Shared compute pool ---
+def session_is_active(session):
+    """False once the browser session has ended, so its queued work is dropped"""
+    return not runtime.exists() or runtime.get_instance().is_active_session(session)
+
+ctx = get_script_run_ctx()
+session_id = ctx.session_id if ctx is not None else None
+scheduler = default_scheduler()
+scheduler.session_alive = session_is_active
+# Work this session queued for another step is no longer wanted
+scheduler.cancel_session(session_id, keep_step=st.session_state.step)
+
+def compute(func, *args, priority=INTERACTIVE, **kwargs):
+    """Run an engine calculation on the shared worker pool for this session and step"""
+    return scheduler.run(func, *args, session=session_id, priority=priority, step=st.session_state.step, **kwargs)
 
 # --- Helper functions ---
 def base_for_geometry(diameter, geometry):
-    if geometry == "Spherical":
-        return np.pi * diameter / 5.0
-    else:
-        return np.pi * diameter / 4.0
+    return float(cabin_count_base(geometry_code(geometry), diameter))
 
 def calc_min_max_from_base(base):
     min_c = int(np.floor(base * 0.7))
@@ -1054,6 +142,7 @@ def calc_ang_rpm_linear_from_rotation_time(rotation_time_min, diameter):
         return ang, rpm, linear
     return 0.0, 0.0, 0.0
 
+@memoize(maxsize=32)
 def create_component_diagram(diameter, height, capacity, motor_power, num_cabins=32 , cabin_geometry="Square"):
     """Enhanced carousel diagram with properly scaled cabins"""
     # Draw wheel as a perfect circle
@@ -1076,53 +165,26 @@ def create_component_diagram(diameter, height, capacity, motor_power, num_cabins
     
     # Draw cabins based on geometry
     cabin_scale = diameter * 0.04  # Scale cabins relative to wheel size
+    geometry = CABIN_GEOMETRIES[geometry_code(cabin_geometry)]
+    if geometry['outline'] is None:
+        # Circle for spherical cabins
+        cabin_theta = np.linspace(0, 2*np.pi, 30)
+        shape_x = cabin_scale * 0.5 * np.cos(cabin_theta)
+        shape_y = cabin_scale * 0.5 * np.sin(cabin_theta)
+    else:
+        w = cabin_scale * geometry['outline'][0]
+        h = cabin_scale * geometry['outline'][1]
+        shape_x = np.array([-w/2, w/2, w/2, -w/2, -w/2])
+        shape_y = np.array([-h/2, -h/2, h/2, h/2, -h/2])
     
     for i in range(num_cabins):
         angle = 2 * np.pi * i / num_cabins
         cabin_x = radius * np.cos(angle)
         cabin_y = radius * np.sin(angle) + height/2
-        
-        if cabin_geometry == "Spherical":
-            # Draw circle for spherical cabin
-            cabin_theta = np.linspace(0, 2*np.pi, 30)
-            cx = cabin_x + cabin_scale * 0.5 * np.cos(cabin_theta)
-            cy = cabin_y + cabin_scale * 0.5 * np.sin(cabin_theta)
-            fig.add_trace(go.Scatter(x=cx, y=cy, mode='lines', 
-                                    fill='toself', fillcolor='rgba(255, 193, 7, 0.6)',
-                                    line=dict(color='#FFC107', width=1.5),
-                                    showlegend=False, hoverinfo='skip'))
-        
-        elif cabin_geometry == "Vertical Cylinder":
-            # Draw vertical rectangle
-            w = cabin_scale * 0.4
-            h = cabin_scale * 0.8
-            rect_x = [cabin_x - w/2, cabin_x + w/2, cabin_x + w/2, cabin_x - w/2, cabin_x - w/2]
-            rect_y = [cabin_y - h/2, cabin_y - h/2, cabin_y + h/2, cabin_y + h/2, cabin_y - h/2]
-            fig.add_trace(go.Scatter(x=rect_x, y=rect_y, mode='lines', 
-                                    fill='toself', fillcolor='rgba(76, 175, 80, 0.6)',
-                                    line=dict(color='#4CAF50', width=1.5),
-                                    showlegend=False, hoverinfo='skip'))
-        
-        elif cabin_geometry == "Horizontal Cylinder":
-            # Draw horizontal rectangle
-            w = cabin_scale * 0.8
-            h = cabin_scale * 0.4
-            rect_x = [cabin_x - w/2, cabin_x + w/2, cabin_x + w/2, cabin_x - w/2, cabin_x - w/2]
-            rect_y = [cabin_y - h/2, cabin_y - h/2, cabin_y + h/2, cabin_y + h/2, cabin_y - h/2]
-            fig.add_trace(go.Scatter(x=rect_x, y=rect_y, mode='lines', 
-                                    fill='toself', fillcolor='rgba(156, 39, 176, 0.6)',
-                                    line=dict(color='#9C27B0', width=1.5),
-                                    showlegend=False, hoverinfo='skip'))
-        
-        else:  # Square
-            # Draw square
-            s = cabin_scale * 0.6
-            square_x = [cabin_x - s/2, cabin_x + s/2, cabin_x + s/2, cabin_x - s/2, cabin_x - s/2]
-            square_y = [cabin_y - s/2, cabin_y - s/2, cabin_y + s/2, cabin_y + s/2, cabin_y - s/2]
-            fig.add_trace(go.Scatter(x=square_x, y=square_y, mode='lines', 
-                                    fill='toself', fillcolor='rgba(244, 67, 54, 0.6)',
-                                    line=dict(color='#F44336', width=1.5),
-                                    showlegend=False, hoverinfo='skip'))
+        fig.add_trace(go.Scatter(x=cabin_x + shape_x, y=cabin_y + shape_y, mode='lines', 
+                                fill='toself', fillcolor=geometry['fill'],
+                                line=dict(color=geometry['line'], width=1.5),
+                                showlegend=False, hoverinfo='skip'))
 
     annotations = [
         dict(x=0, y=height + diameter*0.05 + 2, text=f"Height: {height:.1f} m", 
@@ -1150,6 +212,7 @@ def create_component_diagram(diameter, height, capacity, motor_power, num_cabins
     )
     return fig
 
+@memoize(maxsize=256)
 def calculate_motor_power(diameter, num_cabins, cabin_capacity, num_vip_cabins, 
                          rotation_time_min, cabin_geometry):
     """
@@ -1187,34 +250,16 @@ def calculate_motor_power(diameter, num_cabins, cabin_capacity, num_vip_cabins,
                        (num_cabins - num_vip_cabins) * cabin_capacity)
     mass_passengers = total_passengers * 80.0  # kg
     
-    # 2. جرم کابین‌ها (بر اساس شکل و ظرفیت)
-    cabin_mass_per_unit = {
-        'Square': 450,      # kg per cabin
-        'Vertical': 400,    # Cylinder vertical
-        'Horizontal': 500,  # Cylinder horizontal
-        'Spherical': 350    # Sphere (lighter)
-    }
-    
-    # تشخیص شکل کابین
-    cabin_type = 'Square'  # default
-    for key in cabin_mass_per_unit.keys():
-        if key in cabin_geometry or key.lower() in cabin_geometry.lower():
-            cabin_type = key
-            break
-    
-    mass_per_cabin = cabin_mass_per_unit[cabin_type] + (cabin_capacity * 20)  # 20 kg per seat
-    mass_cabins = num_cabins * mass_per_cabin  # kg
-    
-    # 3. جرم سازه فلزی (تخمین بر اساس قطر)
-    # فرمول تجربی: mass_structure = diameter^1.5 × factor
-    structure_factor = 800  # kg/m^1.5
-    mass_structure = diameter ** 1.5 * structure_factor  # kg
+    # 2-4. جرم کابین‌ها، سازه فلزی (عضو به عضو از جدول مقاطع) و محور و تجهیزات
+    masses = wheel_masses(diameter, num_cabins, cabin_capacity, geometry_code(cabin_geometry))
+    mass_per_cabin = float(masses['mass_per_cabin'])  # kg
+    mass_cabins = float(masses['mass_cabins'])  # kg
+    mass_structure = float(masses['mass_structure'])  # kg (طوقه، پره‌ها، اعضای عرضی و برج)
+    mass_axis = float(masses['mass_axis'])  # kg
     
-    # 4. جرم محور و تجهیزات
-    mass_axis = diameter * 150  # kg
-    
-    # جرم کل
+    # جرم کل و جرم دوار (بدون برج)
     total_mass = mass_passengers + mass_cabins + mass_structure + mass_axis  # kg
+    rotating_mass = mass_passengers + mass_cabins + float(masses['mass_wheel'])  # kg
     
     # محاسبه پارامترهای حرکتی
     radius = diameter / 2.0  # m
@@ -1225,7 +270,7 @@ def calculate_motor_power(diameter, num_cabins, cabin_capacity, num_vip_cabins,
     # محاسبه گشتاور لازم برای غلبه بر اصطکاک
     # اصطکاک در یاتاقان‌ها و مقاومت هوا
     friction_coefficient = 0.03  # ضریب اصطکاک معادل
-    torque_friction = friction_coefficient * total_mass * 9.81 * radius  # N⋅m
+    torque_friction = friction_coefficient * rotating_mass * 9.81 * radius  # N⋅m
     
     # توان عملیاتی (steady state)
     power_operational = torque_friction * angular_velocity / 1000.0  # kW
@@ -1236,8 +281,8 @@ def calculate_motor_power(diameter, num_cabins, cabin_capacity, num_vip_cabins,
     angular_acceleration = angular_velocity / startup_time  # rad/s²
     
     # moment of inertia
-    # ساده‌سازی: تمام جرم در فاصله r
-    moment_of_inertia = total_mass * radius ** 2  # kg⋅m²
+    # ساده‌سازی: تمام جرم دوار در فاصله r
+    moment_of_inertia = rotating_mass * radius ** 2  # kg⋅m²
     
     # گشتاور برای شتاب
     torque_acceleration = moment_of_inertia * angular_acceleration  # N⋅m
@@ -1271,6 +316,9 @@ def calculate_motor_power(diameter, num_cabins, cabin_capacity, num_vip_cabins,
         'mass_cabins': mass_cabins,
         'mass_structure': mass_structure,
         'mass_axis': mass_axis,
+        'mass_per_cabin': mass_per_cabin,
+        'mass_rotating': rotating_mass,
+        'mass_groups': {g: float(m) for g, m in masses['groups'].items()},
         'angular_velocity': angular_velocity,
         'linear_velocity': linear_velocity,
         'moment_of_inertia': moment_of_inertia,
@@ -1301,7 +349,7 @@ def format_power_breakdown(power_data):
 - Cabins: {breakdown['mass_cabins']:.0f} kg
 - Structure: {breakdown['mass_structure']:.0f} kg
 - Axis & Equipment: {breakdown['mass_axis']:.0f} kg
-- **Total Mass: {breakdown['total_mass']:.0f} kg**
+- **Total Mass: {breakdown['total_mass']:.0f} kg** (rotating: {breakdown['mass_rotating']:.0f} kg)
 
 **Kinematics:**
 - Angular Velocity: {breakdown['angular_velocity']:.6f} rad/s
@@ -1320,8 +368,55 @@ def format_power_breakdown(power_data):
 """
     return text
 
+@memoize(maxsize=32)
+def size_leg_pads(pad_loads, footprint):
+    """Minimum-volume leg pad for every soil type (Step 10 comparison table)"""
+    return {soil: size_footing(pad_loads, footprint, soil) for soil in SOIL_PROPERTIES}
+
+@persistent()
+def run_fatigue_analysis(sim_years, rpm, base_mass, passenger_mass, wind_mean_ms, diameter, lever_arm,
+                         shaft_diameter, rim_area, rim_influence, detail_category, design_years):
+    """
+    Spindle and rim fatigue damage from a simulated operating history (EN 1993-1-9)
+    
+    Results are kept in the on-disk store, so a rerun with the same
+    settings after a server restart does not count the cycles again. Run
+    as a background job, it reports progress and the running Miner sums
+    (extrapolated to the design life) after every chunk.
+    
+    Returns:
+    --------
+    dict : {'spindle' | 'rim': {'damage': Miner sum, 'cycles', 'max_range' (MPa)}}
+    """
+    total_samples = sim_years * 365.0 * 12.0 * 3600.0  # 12 h/day at 1 s steps (generator defaults)
+
+    def progress(samples, damage):
+        done = min(samples / total_samples, 1.0)
+        scale = design_years / (sim_years * max(done, 1e-9))
+        report(done, {name: d['detail'] * scale for name, d in damage.items()},
+               f"{samples:,.0f} / {total_samples:,.0f}")
+
+    history = operating_history_chunks(
+        years=sim_years, rpm=rpm, base_mass=base_mass, passenger_mass=passenger_mass,
+        occupancy=[(0.0, 0.2), (0.5, 0.5), (1.0, 0.3)],
+        wind_mean_ms=wind_mean_ms, wind_area=0.1 * np.pi * diameter ** 2 / 4.0
+    )
+    results = fatigue_assessment(
+        history,
+        {
+            'spindle': lambda ch: spindle_bending_stress(ch, lever_arm, shaft_diameter, rotating=True),
+            'rim': lambda ch: rim_member_stress(ch, 0.0, rim_area, rim_influence, rim_influence),
+        },
+        {'detail': en1993_sn_curve(detail_category)},
+        design_years=design_years, simulated_years=sim_years, resolution=0.5, progress=progress
+    )
+    return {
+        name: {'damage': res['damage']['detail'], 'cycles': res['cycles'], 'max_range': res['max_range']}
+        for name, res in results.items()
+    }
+
 def calculate_accelerations_at_angle(theta, diameter, angular_velocity, braking_accel, 
-                                    snow_load=0.0, wind_load=0.0, earthquake_load=0.0, g=9.81):
+                                    snow_load=0.0, wind_load=0.0, earthquake_load=0.0, g=9.81, mass=None):
     """
     Calculate accelerations at a given angle with additional loads
     
@@ -1343,6 +438,9 @@ def calculate_accelerations_at_angle(theta, diameter, angular_velocity, braking_
         Earthquake load in kN (default 0.0)
     g : float
         Gravitational acceleration (default 9.81 m/s²)
+    mass : float
+        Rotating wheel mass the additional loads act on in kg
+        (``calculate_motor_power`` breakdown); required with additional loads
     
     Returns:
     --------
@@ -1368,15 +466,15 @@ def calculate_accelerations_at_angle(theta, diameter, angular_velocity, braking_
     a_x_braking = braking_accel * np.sin(theta)
     a_z_braking = -braking_accel * np.cos(theta)
     
-    # Additional loads converted to accelerations
-    # Assuming approximate cabin mass of 500 kg per meter of diameter
-    approx_mass = diameter * 500  # kg
+    # Additional loads converted to accelerations of the rotating wheel mass
+    if mass is None and (snow_load > 0 or wind_load > 0 or earthquake_load > 0):
+        raise ValueError("mass is required to convert additional loads to accelerations")
     
     # Snow load effect (vertical, downward)
     a_snow = 0.0
     if snow_load > 0:
         # Convert kN to N and divide by mass to get acceleration
-        a_snow = (snow_load * 1000) / approx_mass  # m/s²
+        a_snow = (snow_load * 1000) / mass  # m/s²
     
     # Wind load effect (horizontal, varies with position)
     a_wind_x = 0.0
@@ -1384,7 +482,7 @@ def calculate_accelerations_at_angle(theta, diameter, angular_velocity, braking_
     if wind_load > 0:
         # Wind acts horizontally, but its effect varies with cabin position
         # Maximum effect when cabin is at the side (theta = π/2 or 3π/2)
-        wind_accel = (wind_load * 1000) / approx_mass  # m/s²
+        wind_accel = (wind_load * 1000) / mass  # m/s²
         # Horizontal component (more effect when cabin is on the side)
         a_wind_x = wind_accel * np.abs(np.sin(theta))
         # Small vertical component due to drag
@@ -1394,7 +492,7 @@ def calculate_accelerations_at_angle(theta, diameter, angular_velocity, braking_
     a_eq_x = 0.0
     a_eq_z = 0.0
     if earthquake_load > 0:
-        eq_accel = (earthquake_load * 1000) / approx_mass  # m/s²
+        eq_accel = (earthquake_load * 1000) / mass  # m/s²
         # Horizontal component (primary)
         a_eq_x = eq_accel
         # Vertical component (typically 50% of horizontal)
@@ -1409,7 +507,7 @@ def calculate_accelerations_at_angle(theta, diameter, angular_velocity, braking_
     return a_x_total, a_z_total, a_total
 
 def calculate_dynamic_product(diameter, height, angular_velocity, braking_accel, 
-                              snow_load=0.0, wind_load=0.0, earthquake_load=0.0, g=9.81):
+                              snow_load=0.0, wind_load=0.0, earthquake_load=0.0, g=9.81, mass=None):
     """
     Calculate dynamic product with additional loads
     
@@ -1431,6 +529,8 @@ def calculate_dynamic_product(diameter, height, angular_velocity, braking_accel,
         Earthquake load in kN (default 0.0)
     g : float
         Gravitational acceleration (default 9.81 m/s²)
+    mass : float
+        Rotating wheel mass in kg (see ``calculate_accelerations_at_angle``)
     
     Returns:
     --------
@@ -1447,7 +547,7 @@ def calculate_dynamic_product(diameter, height, angular_velocity, braking_accel,
     for theta in theta_vals:
         _, _, a_total = calculate_accelerations_at_angle(
             theta, diameter, angular_velocity, braking_accel, 
-            snow_load, wind_load, earthquake_load, g
+            snow_load, wind_load, earthquake_load, g, mass
         )
         if a_total > max_accel:
             max_accel = a_total
@@ -1521,14 +621,15 @@ def determine_restraint_area_iso(ax, az):
     
     return 2  # Default
 
+@memoize(maxsize=256)
 def estimate_cabin_surface_area(cabin_geometry, cabin_capacity, diameter):
     """
     تخمین مساحت سطح کابین بر اساس شکل، ظرفیت و قطر چرخ
     
     Parameters:
     -----------
-    cabin_geometry : str
-        شکل کابین (Square, Vertical Cylinder, Horizontal Cylinder, Spherical)
+    cabin_geometry : str or int
+        شکل کابین (برچسب انگلیسی/فارسی یا کد engine.geometry)
     cabin_capacity : int
         ظرفیت مسافری کابین
     diameter : float
@@ -1540,59 +641,8 @@ def estimate_cabin_surface_area(cabin_geometry, cabin_capacity, diameter):
         مساحت سطح تقریبی کابین (متر مربع)
     """
     
-    # تخمین ابعاد کابین بر اساس ظرفیت
-    # فرض: هر مسافر نیاز به ~0.6 m² فضای کف دارد
-    floor_area_per_person = 0.6  # m²
-    floor_area = cabin_capacity * floor_area_per_person
-    
-    # ارتفاع استاندارد کابین
-    cabin_height = 2.2  # meters
-    
-    # محدودیت اندازه کابین بر اساس قطر چرخ
-    # کابین نباید بیشتر از 1/8 قطر چرخ باشد
-    max_cabin_dimension = diameter / 8.0
-    
-    if "Square" in cabin_geometry or "مربع" in cabin_geometry or "مکعب" in cabin_geometry:
-        # کابین مربعی/مکعبی
-        side_length = min(np.sqrt(floor_area), max_cabin_dimension)
-        # مساحت سطح = 2×(طول×عرض) + 4×(طول×ارتفاع)
-        surface_area = 2 * (side_length ** 2) + 4 * (side_length * cabin_height)
-        
-    elif "Vertical" in cabin_geometry or "عمودی" in cabin_geometry:
-        # استوانه عمودی (ایستاده)
-        radius = min(np.sqrt(floor_area / np.pi), max_cabin_dimension / 2.0)
-        # مساحت سطح = 2×π×r² + 2×π×r×h
-        surface_area = 2 * np.pi * (radius ** 2) + 2 * np.pi * radius * cabin_height
-        
-    elif "Horizontal" in cabin_geometry or "افقی" in cabin_geometry:
-        # استوانه افقی (خوابیده)
-        # طول استوانه بر اساس فضای کف
-        length = min(floor_area / 2.0, max_cabin_dimension)
-        radius = min(1.0, max_cabin_dimension / 4.0)  # شعاع ثابت ~1m
-        # مساحت سطح = 2×π×r² + 2×π×r×L
-        surface_area = 2 * np.pi * (radius ** 2) + 2 * np.pi * radius * length
-        
-    elif "Spherical" in cabin_geometry or "کروی" in cabin_geometry or "sphere" in cabin_geometry.lower():
-        # کابین کروی
-        # حجم مورد نیاز بر اساس ظرفیت
-        volume_per_person = 1.5  # m³ per person
-        required_volume = cabin_capacity * volume_per_person
-        # شعاع کره: V = (4/3)πr³
-        radius = min((3 * required_volume / (4 * np.pi)) ** (1/3), max_cabin_dimension / 2.0)
-        # مساحت سطح کره = 4πr²
-        surface_area = 4 * np.pi * (radius ** 2)
-        
-    else:
-        # پیش‌فرض: مربع
-        side_length = min(np.sqrt(floor_area), max_cabin_dimension)
-        surface_area = 2 * (side_length ** 2) + 4 * (side_length * cabin_height)
-    
-    # محدود کردن مساحت به محدوده منطقی
-    # حداقل: 8 m² (کابین خیلی کوچک)
-    # حداکثر: 25 m² (کابین بزرگ)
-    surface_area = max(8.0, min(surface_area, 25.0))
-    
-    return round(surface_area, 2)
+    # ابعاد و قانون مساحت هر شکل در engine.geometry تعریف شده است
+    return float(cabin_surface_area(geometry_code(cabin_geometry), cabin_capacity, diameter))
 
 def determine_restraint_area_as(ax, az):
     """Determine restraint area based on AS 3533.1-2009+A1-2011 (ax and az in units of g)"""
@@ -1632,8 +682,9 @@ def determine_restraint_area_as(ax, az):
     
     return 2  # Default
 
+@memoize(maxsize=32)
 def plot_acceleration_envelope_iso(diameter, angular_velocity, braking_accel, 
-                                  snow_load=0.0, wind_load=0.0, earthquake_load=0.0, g=9.81):
+                                  snow_load=0.0, wind_load=0.0, earthquake_load=0.0, g=9.81, mass=None):
     """Plot the ax vs az acceleration envelope with ISO 17842 zones and actual acceleration points"""
     theta_vals = np.linspace(0, 2*np.pi, 360)
     ax_vals = []
@@ -1642,7 +693,7 @@ def plot_acceleration_envelope_iso(diameter, angular_velocity, braking_accel,
     for theta in theta_vals:
         a_x, a_z, _ = calculate_accelerations_at_angle(
             theta, diameter, angular_velocity, braking_accel,
-            snow_load, wind_load, earthquake_load, g
+            snow_load, wind_load, earthquake_load, g, mass
         )
         ax_vals.append(a_x / g)
         az_vals.append(-a_z / g)
@@ -1723,8 +774,9 @@ def plot_acceleration_envelope_iso(diameter, angular_velocity, braking_accel,
                       yaxis=dict(range=[-2.2, 2.2], zeroline=True, zerolinewidth=2, zerolinecolor='black'))
     return fig
 
+@memoize(maxsize=32)
 def plot_acceleration_envelope_as(diameter, angular_velocity, braking_accel, 
-                                 snow_load=0.0, wind_load=0.0, earthquake_load=0.0, g=9.81):
+                                 snow_load=0.0, wind_load=0.0, earthquake_load=0.0, g=9.81, mass=None):
     """Plot the ax vs az acceleration envelope with AS 3533.1 zones and actual acceleration points"""
     theta_vals = np.linspace(0, 2*np.pi, 360)
     ax_vals = []
@@ -1733,7 +785,7 @@ def plot_acceleration_envelope_as(diameter, angular_velocity, braking_accel,
     for theta in theta_vals:
         a_x, a_z, _ = calculate_accelerations_at_angle(
             theta, diameter, angular_velocity, braking_accel,
-            snow_load, wind_load, earthquake_load, g
+            snow_load, wind_load, earthquake_load, g, mass
         )
         ax_vals.append(a_x / g)
         az_vals.append(-a_z / g)
@@ -1915,6 +967,26 @@ def create_orientation_diagram(selected_direction, land_length=None, land_width=
                       legend=dict(x=0.02, y=0.98, bgcolor='rgba(255,255,255,0.8)'))
     return fig
 
+@memoize(maxsize=32)
+def create_wind_rose_chart(rose, persian=False):
+    """Stacked polar bar chart of a direction × speed wind rose histogram"""
+    fig = go.Figure()
+    edges = rose['speed_edges']
+    colors = ['#E3F2FD', '#BBDEFB', '#90CAF9', '#64B5F6', '#42A5F5', '#2196F3',
+              '#1E88E5', '#1976D2', '#1565C0', '#0D47A1']
+    for k in range(rose['frequency'].shape[1]):
+        upper = f"{edges[k + 1]:.0f}" if np.isfinite(edges[k + 1]) else "+"
+        fig.add_trace(go.Barpolar(
+            r=rose['frequency'][:, k] * 100, theta=rose['direction_centers'],
+            name=f"{edges[k]:.0f}-{upper} m/s", marker_color=colors[k % len(colors)]
+        ))
+    fig.update_layout(
+        title=translate("Wind Rose (frequency %)", persian),
+        polar=dict(angularaxis=dict(rotation=90, direction='clockwise')),
+        height=500, template="plotly_white", legend=dict(title=translate("Speed", persian))
+    )
+    return fig
+
 # --- Navigation & validation ---
 def select_generation(gen):
     st.session_state.generation_type = gen
@@ -1923,6 +995,17 @@ def select_generation(gen):
 def go_back():
     st.session_state.step = max(0, st.session_state.step - 1)
 
+def use_located_city(located):
+    """Select the nearest city found from coordinates in the Step 5 dropdowns"""
+    st.session_state.province_select = located['province']
+    st.session_state.city_select = located['city']
+    st.session_state.site_location = located
+
+def use_mapped_wind(wind_max):
+    """Take the wind-map gust (km/h) as the Step 5 maximum wind speed"""
+    st.session_state.environment_data['wind_max'] = wind_max
+    st.session_state.pending_wind_max = wind_max
+
 def reset_design():
     for key in list(st.session_state.keys()):
         del st.session_state[key]
@@ -1992,32 +1075,32 @@ def map_direction_to_axis_and_vector(dir_str, persian=False):
     s = 1 / math.sqrt(2)
 
     if d in ('north-south', 'north–south', 'north south'):
-        return 'NS', 'شمال–جنوب' if persian else 'North–South', (0, 1)
+        return 'NS', translate("North–South", persian), (0, 1)
     if d in ('east-west', 'east–west', 'east west'):
-        return 'EW', 'شرق–غرب' if persian else 'East–West', (1, 0)
+        return 'EW', translate("East–West", persian), (1, 0)
     if d in ('northeast-southwest', 'northeast–southwest', 'northeast southwest'):
-        return 'NE_SW', 'شمال‌شرقی–جنوب‌غربی' if persian else 'Northeast–Southwest', (s, s)
+        return 'NE_SW', translate("Northeast–Southwest", persian), (s, s)
     if d in ('northwest-southeast', 'northwest–southeast', 'northwest southeast'):
-        return 'SE_NW', 'شمال‌غربی–جنوب‌شرقی' if persian else 'Northwest–Southeast', (-s, s)
+        return 'SE_NW', translate("Northwest–Southeast", persian), (-s, s)
 
     if d in ('north', 'n'):
-        return 'NS', 'شمال' if persian else 'North', (0, 1)
+        return 'NS', translate("North", persian), (0, 1)
     if d in ('south', 's'):
-        return 'NS', 'جنوب' if persian else 'South', (0, -1)
+        return 'NS', translate("South", persian), (0, -1)
     if d in ('east', 'e'):
-        return 'EW', 'شرق' if persian else 'East', (1, 0)
+        return 'EW', translate("East", persian), (1, 0)
     if d in ('west', 'w'):
-        return 'EW', 'غرب' if persian else 'West', (-1, 0)
+        return 'EW', translate("West", persian), (-1, 0)
     if d in ('northeast', 'ne'):
-        return 'NE_SW', 'شمال‌شرقی' if persian else 'Northeast', (s, s)
+        return 'NE_SW', translate("Northeast", persian), (s, s)
     if d in ('southwest', 'sw'):
-        return 'NE_SW', 'جنوب‌غربی' if persian else 'Southwest', (-s, -s)
+        return 'NE_SW', translate("Southwest", persian), (-s, -s)
     if d in ('southeast', 'se'):
-        return 'SE_NW', 'جنوب‌شرقی' if persian else 'Southeast', (s, -s)
+        return 'SE_NW', translate("Southeast", persian), (s, -s)
     if d in ('northwest', 'nw'):
-        return 'SE_NW', 'شمال‌غربی' if persian else 'Northwest', (-s, s)
+        return 'SE_NW', translate("Northwest", persian), (-s, s)
 
-    return 'NS', 'شمال–جنوب' if persian else 'North–South', (0, 1)
+    return 'NS', translate("North–South", persian), (0, 1)
 
 
 def axis_label(axis, persian=False):
@@ -2031,7 +1114,8 @@ def axis_label(axis, persian=False):
     return fa if persian else en
 
 
-def create_orientation_diagram(axis_key, land_length, land_width, arrow_vec):
+@memoize(maxsize=32)
+def create_orientation_diagram(axis_key, land_length, land_width, arrow_vec, cost_curve=None):
     """
     Creates a diagram with a fixed rectangle and a double-headed arrow showing wind direction.
     
@@ -2040,6 +1124,8 @@ def create_orientation_diagram(axis_key, land_length, land_width, arrow_vec):
         land_length: Length of the land (horizontal dimension)
         land_width: Width of the land (vertical dimension)
         arrow_vec: Vector tuple (x, y) indicating arrow direction
+        cost_curve: Optional optimise_orientation result; its relative wind
+            response is drawn as a polar line around the plot centre
     """
     w = float(land_length)
     h = float(land_width)
@@ -2063,6 +1149,20 @@ def create_orientation_diagram(axis_key, land_length, land_width, arrow_vec):
     
     # Calculate arrow length (70% of the smaller dimension)
     arrow_length = min(w, h) * 0.7
+
+    if cost_curve is not None:
+        # Polar trace of relative response: further out = more wind load for that plane bearing
+        ang = np.concatenate([cost_curve['angles_deg'], cost_curve['angles_deg'] + 180.0, cost_curve['angles_deg'][:1]])
+        cost = np.concatenate([cost_curve['cost'], cost_curve['cost'], cost_curve['cost'][:1]])
+        r = arrow_length / 2 * (0.3 + 0.7 * cost / max(cost.max(), 1e-9))
+        fig.add_trace(go.Scatter(
+            x=r * np.sin(np.radians(ang)), y=r * np.cos(np.radians(ang)),
+            mode='lines',
+            line=dict(color='rgb(230,140,20)', width=2, dash='dot'),
+            showlegend=False,
+            hovertext=[f"{a % 180:.1f}°: {c:.2f}" for a, c in zip(ang, cost)],
+            hoverinfo='text'
+        ))
     
     # Calculate arrow endpoints based on direction vector
     dx = arrow_vec[0] * arrow_length / 2
@@ -2141,6 +1241,17 @@ with st.sidebar:
         reset_design()
         st.rerun()
 
+    with st.expander(translate("🖥️ Compute Pool", persian)):
+        pool = scheduler.metrics()
+        pool_col1, pool_col2 = st.columns(2)
+        with pool_col1:
+            st.metric(translate("Running", persian), f"{pool['running']} / {pool['workers']}")
+            st.metric(translate("Queued (interactive)", persian), pool['queued']['interactive'])
+        with pool_col2:
+            st.metric(translate("Queued (batch)", persian), pool['queued']['batch'])
+            st.metric(translate("Wait p95 (s)", persian), f"{pool['wait_s']['interactive']['p95']:.2f}")
+        st.json({'pool': pool, 'memo': cache_stats()}, expanded=False)
+
 total_steps = 14
 st.progress(st.session_state.get('step', 0) / (total_steps - 1))
 st.markdown(f"**{get_text('step', persian)} {st.session_state.get('step', 0) + 1} {get_text('of', persian)} {total_steps}**")
@@ -2297,28 +1408,25 @@ if st.session_state.get('step', 0) == 1:
 
     st.markdown("---")
     st.write(
-        "Click the button under the image to select a generation and proceed." if not persian else
-        "برای انتخاب نسل و ادامه، دکمه زیر تصویر را کلیک کنید."
+        translate("Click the button under the image to select a generation and proceed.", persian)
     )
     st.markdown("---")
 
     left_col = st.container()
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", key="back_btn_step1", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), key="back_btn_step1", on_click=go_back)
 
 
 # === STEP 2: Cabin Geometry ===
 if st.session_state.get("step", 0) == 2:
     st.header(get_text('select_cabin_geometry', persian))
     st.markdown(
-        "Choose a cabin shape." if not persian else "یک شکل کابین انتخاب کنید."
+        translate("Choose a cabin shape.", persian)
     )
 
     geom_images = [
-        (get_text('geom_square', persian), "./git/assets/square.jpg"),
-        (get_text('geom_vert_cyl', persian), "./git/assets/vertical.jpg"),
-        (get_text('geom_horiz_cyl', persian), "./git/assets/horizontal.jpg"),
-        (get_text('geom_spherical', persian), "./git/assets/sphere.jpg"),
+        (code, get_text(geometry['text_key'], persian), geometry['image'])
+        for code, geometry in CABIN_GEOMETRIES.items()
     ]
     cols = st.columns(4, gap="small")
 
@@ -2334,14 +1442,14 @@ if st.session_state.get("step", 0) == 2:
         st.session_state.capacities_calculated = False
         st.session_state.step = 3
 
-    for i, (label, img_path) in enumerate(geom_images):
+    for i, (code, label, img_path) in enumerate(geom_images):
         with cols[i]:
             try:
                 st.image(img_path, use_column_width=True)
             except Exception as e:
                 st.error(f"Could not load image: {img_path}")
             st.caption(label)
-            if label == get_text('geom_spherical', persian):
+            if code == SPHERICAL:
                 st.markdown(
                     f"<p style='font-size:12px; color:gray; text-align:center;'>"
                     f"{get_text('geom_spherical_caption', persian)}</p>",
@@ -2356,7 +1464,7 @@ if st.session_state.get("step", 0) == 2:
 
     left_col = st.container()
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", key="geom_back_btn", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), key="geom_back_btn", on_click=go_back)
 
 
 # === STEP 3: Primary parameters ===
@@ -2373,7 +1481,7 @@ elif st.session_state.step == 3:
 
     st.header(get_text('cabin_specification', persian))
     st.subheader(
-        f"{'نسل' if persian else 'Generation'}: {st.session_state.generation_type}"
+        f"{translate('Generation', persian)}: {st.session_state.generation_type}"
     )
 
     if st.session_state.get('validation_errors'):
@@ -2425,7 +1533,7 @@ elif st.session_state.step == 3:
 
     st.markdown("---")
     if st.button(
-        "🔄 Calculate Capacities" if not persian else "🔄 محاسبه ظرفیت‌ها"
+        translate("🔄 Calculate Capacities", persian)
     ):
         vip_cap = max(0, st.session_state.cabin_capacity - 2)
         vip_total = st.session_state.num_vip_cabins * vip_cap
@@ -2433,25 +1541,25 @@ elif st.session_state.step == 3:
         per_rotation = vip_total + regular_total
         c1, c2 = st.columns(2)
         c1.metric(
-            "Per-rotation capacity" if not persian else "ظرفیت به ازای هر دور",
-            f"{per_rotation} {'passengers' if not persian else 'مسافر'}"
+            translate("Per-rotation capacity", persian),
+            f"{per_rotation} {translate('passengers', persian)}"
         )
         c2.metric(
-            "VIP capacity (per rotation)" if not persian else "ظرفیت ویژه (به ازای هر دور)",
-            f"{vip_total} {'passengers' if not persian else 'مسافر'} "
-            f"({'each VIP' if not persian else 'هر ظرفیت ویژه'}: {vip_cap})"
+            translate("VIP capacity (per rotation)", persian),
+            f"{vip_total} {translate('passengers', persian)} "
+            f"({translate('each VIP', persian)}: {vip_cap})"
         )
         st.success(
-            "Capacities calculated." if not persian else "ظرفیت‌ها محاسبه شدند."
+            translate("Capacities calculated.", persian)
         )
         st.session_state.capacities_calculated = True
 
     st.markdown("---")
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with right_col:
-        st.button("Next ➡️" if not persian else "بعدی ➡️", on_click=validate_current_step_and_next)
+        st.button(translate("Next ➡️", persian), on_click=validate_current_step_and_next)
 
 # === STEP 4: Rotation Time ===
 elif st.session_state.step == 4:
@@ -2463,7 +1571,7 @@ elif st.session_state.step == 4:
     default_rotation_time_min = (circumference / 0.2) / 60.0 if diameter > 0 else 1.0
 
     rotation_time_min = st.number_input(
-        "Rotation time (minutes per full rotation)" if not persian else "زمان چرخش (دقیقه به ازای یک دور کامل)",
+        translate("Rotation time (minutes per full rotation)", persian),
         min_value=0.01, max_value=60.0,
         value=st.session_state.rotation_time_min if st.session_state.rotation_time_min else float(default_rotation_time_min),
         step=0.01, format="%.2f", key="rotation_time_input"
@@ -2473,30 +1581,30 @@ elif st.session_state.step == 4:
     ang, rpm, linear = calc_ang_rpm_linear_from_rotation_time(rotation_time_min, diameter)
 
     st.text_input(
-        "Rotational speed (rpm)" if not persian else "سرعت چرخش (دور در دقیقه)",
+        translate("Rotational speed (rpm)", persian),
         value=f"{rpm:.6f}", disabled=True
     )
     st.caption(
-        f"Angular speed (rad/s): {ang:.6f}" if not persian else f"سرعت زاویه‌ای (رادیان بر ثانیه): {ang:.6f}"
+        translate("Angular speed (rad/s): {ang:.6f}", persian).format(ang=ang)
     )
     st.text_input(
-        "Linear speed at rim (m/s)" if not persian else "سرعت خطی در لبه چرخ (متر بر ثانیه)",
+        translate("Linear speed at rim (m/s)", persian),
         value=f"{linear:.6f}", disabled=True
     )
 
     cap_per_hour = calculate_capacity_per_hour_from_time(st.session_state.num_cabins, st.session_state.cabin_capacity,
                                                           st.session_state.num_vip_cabins, rotation_time_min)
     st.metric(
-        "Estimated Capacity per Hour" if not persian else "ظرفیت تخمینی در ساعت",
-        f"{cap_per_hour:.0f} {'passengers/hour' if not persian else 'مسافر/ساعت'}"
+        translate("Estimated Capacity per Hour", persian),
+        f"{cap_per_hour:.0f} {translate('passengers/hour', persian)}"
     )
 
     st.markdown("---")
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with right_col:
-        st.button("Next ➡️" if not persian else "بعدی ➡️", on_click=validate_current_step_and_next)
+        st.button(translate("Next ➡️", persian), on_click=validate_current_step_and_next)
 
 
 
@@ -2524,42 +1632,69 @@ elif st.session_state.step == 5:
     st.markdown(get_text('design_ref_step5', persian))
     st.markdown("---")
 
-    PROVINCE_FA = {
-        "Khuzestan": "خوزستان", "Ilam": "ایلام", "Fars": "فارس",
-        "Qazvin": "قزوین", "Zanjan": "زنجان", "Hamedan": "همدان",
-        "Markazi": "مرکزی", "Yazd": "یزد", "Semnan": "سمنان",
-        "Qom": "قم", "South Khorasan": "خراسان جنوبی", "Kerman": "کرمان",
-        "East Azerbaijan": "آذربایجان شرقی", "West Azerbaijan": "آذربایجان غربی",
-        "Ardabil": "اردبیل", "Kurdistan": "کردستان", "Kermanshah": "کرمانشاه",
-        "Lorestan": "لرستان", "Chaharmahal and Bakhtiari": "چهارمحال و بختیاری",
-        "Kohgiluyeh and Boyer-Ahmad": "کهگیلویه و بویراحمد", "Isfahan": "اصفهان",
-        "Tehran": "تهران", "Alborz": "البرز", "Gilan": "گیلان",
-        "Mazandaran": "مازندران", "Golestan": "گلستان",
-        "North Khorasan": "خراسان شمالی", "Khorasan Razavi": "خراسان رضوی",
-        "Sistan and Baluchestan": "سیستان و بلوچستان", "Bushehr": "بوشهر",
-        "Hormozgan": "هرمزگان",
-    }
-
     iran_provinces = list(TERRAIN_CATEGORIES.keys())
 
+    with st.expander(translate("📍 Locate site by coordinates", persian)):
+        g1, g2 = st.columns(2)
+        with g1:
+            site_lat = st.number_input(translate("Latitude (°N)", persian), min_value=24.0, max_value=40.0,
+                                       value=35.6892, step=0.01, format="%.4f", key="site_lat")
+        with g2:
+            site_lon = st.number_input(translate("Longitude (°E)", persian), min_value=44.0, max_value=64.0,
+                                       value=51.3890, step=0.01, format="%.4f", key="site_lon")
+        located = nearest_city(site_lat, site_lon)
+        st.info(
+            translate("Nearest city: {city}, {province} ({distance:.0f} km away). Seismic hazard: {hazard}; "
+                      "terrain category {category}", persian).format(
+                city=located['city_fa'] if persian else located['city'],
+                province=province_name(located['province'], persian), distance=located['distance_km'],
+                hazard=located['hazard'], category=located['terrain_category'])
+        )
+        st.button(translate("Use this city", persian), on_click=use_located_city,
+                  args=(dict(located, lat=site_lat, lon=site_lon),), key="use_located_city")
+
+        sites_file = st.file_uploader(
+            translate("Batch of sites (CSV with latitude/longitude columns)", persian),
+            type=['csv'],
+            key="sites_uploader"
+        )
+        if sites_file is not None:
+            try:
+                sites = read_sites(sites_file)
+                found = nearest_cities(sites['lat'], sites['lon'])
+            except ValueError as e:
+                st.error(translate("Could not read sites file: {e}", persian).format(e=e))
+            else:
+                if sites['skipped']:
+                    st.warning(
+                        translate("{0} rows without valid latitude/longitude were skipped.", persian).format(sites['skipped'])
+                    )
+                st.dataframe({
+                    (translate("Site", persian)): sites['name'],
+                    (translate("Province", persian)): [province_name(p, persian) for p in found['province']],
+                    (translate("City", persian)): found['city_fa'] if persian else found['city'],
+                    (translate("Distance (km)", persian)): found['distance_km'].round(1),
+                    (translate("Seismic Hazard", persian)): found['hazard'],
+                    (translate("Terrain Category", persian)): found['terrain_category'],
+                }, hide_index=True, use_container_width=True)
+
     c1, c2 = st.columns(2)
     with c1:
         province = st.selectbox(
             get_text('select_province', persian),
             options=iran_provinces,
             index=0,
-            format_func=lambda x: PROVINCE_FA.get(x, x) if persian else x,
+            format_func=lambda x: province_name(x, persian),
             key="province_select"
         )
 
-        city_data = CITIES_DATA.get(province, [])
+        city_data = CITIES_DATA.get(province, ())
         if city_data:
-            city_fa_map = {c["city"]: c.get("city_fa", c["city"]) for c in city_data}
             city_options = [c["city"] for c in city_data]
             city = st.selectbox(
                 get_text('select_city', persian),
                 options=city_options,
-                format_func=lambda x: city_fa_map.get(x, x) if persian else x,
+                format_func=lambda x: city_name(province, x, persian),
                 key="city_select"
             )
         else:
@@ -2617,17 +1752,19 @@ elif st.session_state.step == 5:
     w1, w2 = st.columns(2)
 
     wind_directions_en = ["North", "South", "East", "West", "Northeast", "Northwest", "Southeast", "Southwest"]
-    wind_directions_fa = ["شمال", "جنوب", "شرق", "غرب", "شمال‌شرق", "شمال‌غرب", "جنوب‌شرق", "جنوب‌غرب"]
 
     with w1:
         wind_dir = st.selectbox(
             get_text('wind_direction_label', persian),
             options=wind_directions_en,
-            format_func=lambda x: wind_directions_fa[wind_directions_en.index(x)] if persian else x,
+            format_func=lambda x: translate(x, persian),
             key="wind_dir_input"
         )
 
     with w2:
+        if 'pending_wind_max' in st.session_state:
+            # Set by the extreme-value fit below; widget state can only change before it is drawn
+            st.session_state.wind_max_input = st.session_state.pop('pending_wind_max')
         wind_max = st.number_input(
             get_text('wind_speed_second', persian),
             min_value=0,
@@ -2661,15 +1798,114 @@ elif st.session_state.step == 5:
         )
         st.session_state.wind_rose_file = wind_file
 
+        r1, r2 = st.columns([3, 1])
+        with r1:
+            station_file = st.file_uploader(
+                get_text('wind_records_file', persian),
+                type=['csv', 'gz', 'bz2', 'zip', 'xz', 'npy'],
+                key="wind_records_uploader"
+            )
+        with r2:
+            speed_unit = st.selectbox(
+                get_text('wind_speed_unit', persian),
+                options=list(SPEED_UNITS.keys()),
+                key="wind_records_unit"
+            )
+        if station_file is not None:
+            rose_key = (station_file.name, station_file.size, speed_unit)
+            if st.session_state.get('wind_rose_key') != rose_key:
+                try:
+                    with st.spinner(translate("Reading station records...", persian)):
+                        st.session_state.wind_rose_data = wind_rose_from_csv(
+                            station_file, speed_unit=speed_unit,
+                            compression=compression_from_name(station_file.name)
+                        )
+                    st.session_state.wind_rose_key = rose_key
+                except ValueError as e:
+                    st.error(translate("Could not read station records: {e}", persian).format(e=e))
+                    st.session_state.wind_rose_data = None
+
+            with st.expander(translate("📈 Design wind speed from records (extreme-value fit)", persian)):
+                e1, e2, e3 = st.columns(3)
+                with e1:
+                    ev_method = st.radio(
+                        translate("Extremes", persian),
+                        options=['annual', 'pot'],
+                        format_func=lambda x: translate({'annual': "Annual maxima", 'pot': "Peaks over threshold"}[x], persian),
+                        key="extreme_method"
+                    )
+                with e2:
+                    ev_dist = st.radio(
+                        translate("Distribution", persian),
+                        options=['gumbel', 'gev'],
+                        format_func=lambda x: {'gumbel': "Gumbel", 'gev': "GEV / GPD"}[x],
+                        key="extreme_distribution"
+                    )
+                with e3:
+                    ev_period = st.number_input(
+                        translate("Return period (years)", persian),
+                        min_value=2, max_value=1000, value=50, step=1, key="extreme_return_period"
+                    )
+                    ev_boot = st.number_input(
+                        translate("Bootstrap resamples", persian),
+                        min_value=100, max_value=5000, value=1000, step=100, key="extreme_n_boot"
+                    )
+                if st.button(translate("Fit design wind speed", persian), key="extreme_fit_btn"):
+                    try:
+                        station_file.seek(0)
+                        with st.spinner(translate("Fitting extremes...", persian)):
+                            # Bootstrap resamples run on the shared pool behind interactive work
+                            st.session_state.wind_extreme = compute(
+                                design_wind_speed, station_file, speed_unit=speed_unit, method=ev_method,
+                                distribution=ev_dist, return_period=ev_period, n_boot=int(ev_boot),
+                                compression=compression_from_name(station_file.name), priority=BATCH
+                            )
+                        st.session_state.pending_wind_max = int(round(st.session_state.wind_extreme['return_level'] * 3.6))
+                        st.rerun()
+                    except ValueError as e:
+                        st.error(translate("Extreme-value fit failed: {e}", persian).format(e=e))
+
+                extreme = st.session_state.get('wind_extreme')
+                if extreme:
+                    low, high = extreme['ci']
+                    st.success(
+                        translate("**{0:.0f}-year wind speed: {1:.1f} m/s ({2:.0f} km/h)**", persian).format(extreme['return_period'], extreme['return_level'], extreme['return_level'] * 3.6)
+                    )
+                    st.caption(
+                        translate("{0:.0f}% bootstrap interval {low:.1f}-{high:.1f} m/s ({1} resamples); {2} extremes over "
+                                  "{3:.1f} years ({4} to {5}). Applied to the maximum wind speed above.", persian).format(extreme['confidence'] * 100, extreme['n_boot'], extreme['sample'].size, extreme['years'], extreme['period'][0], extreme['period'][1], low=low, high=high)
+                    )
+    else:
+        st.session_state.wind_rose_data = None
+        st.session_state.wind_rose_key = None
+        st.session_state.wind_extreme = None
+
+    wind_rose_data = st.session_state.get('wind_rose_data')
+    if wind_rose_data:
+        st.plotly_chart(create_wind_rose_chart(wind_rose_data, persian), use_container_width=True)
+        wind_dir = wind_rose_data['dominant_load_direction']
+        wind_dir_label = translate(wind_dir, persian)
+        st.info(
+            translate("{0:,} records, calm {1:.1f}%. Load-weighted prevailing direction: {direction}", persian).format(
+                wind_rose_data['records'], wind_rose_data['calm_frequency'] * 100, direction=wind_dir_label)
+        )
+
     if province in TERRAIN_CATEGORIES:
         terrain = TERRAIN_CATEGORIES[province]
-        seismic = get_seismic_hazard_from_city(province, city)
+        seismic = seismic_hazard(province, city)
     else:
         terrain = {"category": "II", "z0": 0.05, "zmin": 2, "desc": ""}
         seismic = "Unknown"
 
+    located = st.session_state.get('site_location')
+    if located and (located['province'], located['city']) == (province, city):
+        site = (located['lat'], located['lon'])
+    else:
+        site = city_location(province, city) or (None, None)
+
     st.session_state.environment_data = {
         'province': province, 'city': city, 'region_name': region_name,
+        'lat': site[0], 'lon': site[1],
         'land_length': land_length, 'land_width': land_width,
         'land_area': land_length * land_width, 'altitude': altitude,
         'temp_min': temp_min, 'temp_max': temp_max,
@@ -2681,9 +1917,9 @@ elif st.session_state.step == 5:
     st.markdown("---")
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with right_col:
-        st.button("Next ➡️" if not persian else "بعدی ➡️", on_click=validate_current_step_and_next)
+        st.button(translate("Next ➡️", persian), on_click=validate_current_step_and_next)
 
 
 # === STEP 6: Provincial Characteristics (Terrain Calculation) ===
@@ -2708,8 +1944,7 @@ elif st.session_state.step == 6:
         st.session_state.validation_errors = []
 
     st.markdown(
-        "**Terrain classification per AS 1170.4-2007(A1), ISIRI 2800**" if not persian else
-        "**طبقه‌بندی زمین طبق AS 1170.4-2007(A1)، ISIRI 2800**"
+        translate("**Terrain classification per AS 1170.4-2007(A1), ISIRI 2800**", persian)
     )
     st.markdown("---")
 
@@ -2717,150 +1952,126 @@ elif st.session_state.step == 6:
     province = env.get('province', 'Tehran')
     city = env.get('city', '')
 
-    PROVINCE_FA = {
-        "Khuzestan": "خوزستان", "Ilam": "ایلام", "Fars": "فارس",
-        "Qazvin": "قزوین", "Zanjan": "زنجان", "Hamedan": "همدان",
-        "Markazi": "مرکزی", "Yazd": "یزد", "Semnan": "سمنان",
-        "Qom": "قم", "South Khorasan": "خراسان جنوبی", "Kerman": "کرمان",
-        "East Azerbaijan": "آذربایجان شرقی", "West Azerbaijan": "آذربایجان غربی",
-        "Ardabil": "اردبیل", "Kurdistan": "کردستان", "Kermanshah": "کرمانشاه",
-        "Lorestan": "لرستان", "Chaharmahal and Bakhtiari": "چهارمحال و بختیاری",
-        "Kohgiluyeh and Boyer-Ahmad": "کهگیلویه و بویراحمد", "Isfahan": "اصفهان",
-        "Tehran": "تهران", "Alborz": "البرز", "Gilan": "گیلان",
-        "Mazandaran": "مازندران", "Golestan": "گلستان",
-        "North Khorasan": "خراسان شمالی", "Khorasan Razavi": "خراسان رضوی",
-        "Sistan and Baluchestan": "سیستان و بلوچستان", "Bushehr": "بوشهر",
-        "Hormozgan": "هرمزگان",
-    }
-    city_data = CITIES_DATA.get(province, [])
-    city_fa_map = {c["city"]: c.get("city_fa", c["city"]) for c in city_data}
-    province_display = PROVINCE_FA.get(province, province) if persian else province
-    city_display = city_fa_map.get(city, city) if persian else city
-
-    st.subheader(f"{'استان انتخاب شده' if persian else 'Selected Province'}: {province_display}")
-    st.subheader(f"{'شهر انتخاب شده' if persian else 'Selected City'}: {city_display}")
-    st.info(f"**{'منطقه' if persian else 'Region'}:** {env.get('region_name', 'N/A')}")
+    province_display = province_name(province, persian)
+    city_display = city_name(province, city, persian)
+
+    st.subheader(f"{translate('Selected Province', persian)}: {province_display}")
+    st.subheader(f"{translate('Selected City', persian)}: {city_display}")
+    st.info(f"**{translate('Region', persian)}:** {env.get('region_name', 'N/A')}")
+
+    # Gridded hazard maps at the site, for the layers whose rasters are installed
+    mapped = site_hazards(env['lat'], env['lon']) if env.get('lat') is not None else {}
+    st.session_state.site_hazards = {k: float(v) for k, v in mapped.items() if np.isfinite(v)}
+    if st.session_state.site_hazards:
+        map_cols = st.columns(len(st.session_state.site_hazards))
+        for col, (layer, value) in zip(map_cols, st.session_state.site_hazards.items()):
+            info = HAZARD_LAYERS[layer]
+            col.metric(get_text(info['text_key'], persian), f"{value:.2f} {info['units']}")
+        st.caption(translate("Sampled from the national hazard maps at {0:.4f}°N, {1:.4f}°E", persian).format(
+            env['lat'], env['lon']))
+        if 'wind' in st.session_state.site_hazards:
+            # The map holds the basic wind speed v_b; the wind checks take a 10 m peak gust (Step 5 maximum)
+            v_b = st.session_state.site_hazards['wind']
+            mapped_terrain = TERRAIN_CATEGORIES.get(province, {"category": "II", "z0": 0.05, "zmin": 2})
+            mapped_gust = int(round(float(basic_to_gust(v_b, mapped_terrain)) * 3.6))
+            st.caption(
+                translate("Wind map: v_b = {0:.1f} m/s, a {1} km/h peak gust at 10 m on this terrain. "
+                          "Design maximum wind speed: {2} km/h.", persian).format(v_b, mapped_gust, env.get('wind_max', 108))
+            )
+            if mapped_gust != env.get('wind_max'):
+                st.button(translate("Use mapped wind speed", persian), on_click=use_mapped_wind,
+                          args=(mapped_gust,), key="use_mapped_wind")
 
     if province in TERRAIN_CATEGORIES:
         terrain = TERRAIN_CATEGORIES[province]
-        seismic = get_seismic_hazard_from_city(province, city)
+        seismic = seismic_hazard(province, city)
 
         st.markdown("---")
-        st.subheader("Terrain Information" if not persian else "اطلاعات زمین")
+        st.subheader(translate("Terrain Information", persian))
         if st.button(
-            "🔄 Calculate Terrain Parameters" if not persian else "🔄 محاسبه پارامترهای زمین",
+            translate("🔄 Calculate Terrain Parameters", persian),
             type="primary"
         ):
             st.session_state.terrain_calculated = True
 
             col1, col2 = st.columns(2)
             with col1:
-                st.markdown(f"**{'Terrain Category' if not persian else 'دسته‌بندی زمین'}:** {terrain['category']}")
-                st.markdown(f"**{'Description' if not persian else 'توضیحات'}:** {terrain.get('desc_fa', terrain.get('desc', 'N/A')) if persian else terrain.get('desc', 'N/A')}")
+                st.markdown(f"**{translate('Terrain Category', persian)}:** {terrain['category']}")
+                st.markdown(f"**{translate('Description', persian)}:** {terrain.get('desc_fa', terrain.get('desc', 'N/A')) if persian else terrain.get('desc', 'N/A')}")
             with col2:
                 seismic_color = {"Very High": "🔴", "High": "🟠", "Moderate": "🟡", "Low": "🟢", "Very Low": "🟢"}
-                seismic_label = "Seismic Hazard (ISIRI 2800)" if not persian else "خطر لرزه‌ای (ISIRI 2800)"
+                seismic_label = translate("Seismic Hazard (ISIRI 2800)", persian)
                 st.markdown(f"{seismic_color.get(seismic, '')} **{seismic_label}:** {seismic}")
 
             if st.session_state.terrain_calculated:
                 st.markdown("---")
                 st.success(
-                    "✅ Terrain parameters have been calculated. You can proceed to the next step." if not persian else
-                    "✅ پارامترهای زمین محاسبه شدند. می‌توانید به مرحله بعد بروید."
+                    translate("✅ Terrain parameters have been calculated. You can proceed to the next step.", persian)
                 )
 
     st.markdown("---")
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with right_col:
-        st.button("Next ➡️" if not persian else "بعدی ➡️", on_click=validate_current_step_and_next)
+        st.button(translate("Next ➡️", persian), on_click=validate_current_step_and_next)
 
 
 # === STEP 7: Soil Type (auto-calculate Importance Group) ===
 elif st.session_state.step == 7:
     st.header(get_text('soil_type', persian))
     st.markdown(
-        "**Soil classification per ISIRI 2800 (4th Edition)**" if not persian else
-        "**طبقه‌بندی خاک طبق ISIRI 2800 (ویرایش چهارم)**"
+        translate("**Soil classification per ISIRI 2800 (4th Edition)**", persian)
     )
     st.markdown("---")
 
-    st.subheader("Soil Type Selection" if not persian else "انتخاب نوع خاک")
-
-    soil_types = {
-        "Type I": {
-            "desc_en": "a. Coarse- and fine-grained igneous rocks, very hard and strong sedimentary rocks, and other hard conglomerate and silicate sedimentary rocks.\nb. Hard soils (dense sand and very stiff clay) with a total thickness of less than 30 meters above bedrock.",
-            "desc_fa": "الف. سنگ‌های آذرین درشت‌دانه و ریزدانه، سنگ‌های رسوبی بسیار سخت و محکم و سایر سنگ‌های رسوبی سخت.\nب. خاک‌های سخت (شن متراکم و رس بسیار سفت) با ضخامت کل کمتر از ۳۰ متر.",
-            "group_factor": 1.4,
-            "importance_group": "Group 1"
-        },
-        "Type II": {
-            "desc_en": "a. Weak igneous rocks (such as tuff), moderately cemented sedimentary rocks, and rocks that have been partially weathered.\nb. Hard soils (dense sand and very stiff clay) with a total thickness greater than 30 meters.",
-            "desc_fa": "الف. سنگ‌های آذرین ضعیف (مانند توف)، سنگ‌های رسوبی با سیمانه‌شدگی متوسط و سنگ‌هایی که تا حدی هوازده شده‌اند.\nب. خاک‌های سخت با ضخامت کل بیشتر از ۳۰ متر.",
-            "group_factor": 1.2,
-            "importance_group": "Group 2"
-        },
-        "Type III": {
-            "desc_en": "a. Weathered or decomposed metamorphic rocks.\nb. Medium dense soils, layers of sand and clay with moderate cohesion and medium stiffness.",
-            "desc_fa": "الف. سنگ‌های دگرگونی هوازده یا تجزیه‌شده.\nب. خاک‌های با تراکم متوسط، لایه‌های شن و رس با چسبندگی و سختی متوسط.",
-            "group_factor": 1.0,
-            "importance_group": "Group 3"
-        },
-        "Type IV": {
-            "desc_en": "a. Soft soils with high moisture content due to a shallow groundwater level.\nb. Any soil profile that includes at least 7 meters of clayey soil with a plasticity index greater than 20 or a moisture content higher than 40 percent.",
-            "desc_fa": "الف. خاک‌های نرم با رطوبت بالا به دلیل سطح آب‌های زیرزمینی کم‌عمق.\nب. هر پروفیل خاکی که حداقل ۷ متر خاک رسی با شاخص خمیرایی بیشتر از ۲۰ یا رطوبت بیشتر از ۴۰ درصد داشته باشد.",
-            "group_factor": 0.8,
-            "importance_group": "Group 4"
-        }
-    }
+    st.subheader(translate("Soil Type Selection", persian))
 
-    for soil_type, data in soil_types.items():
+    for soil_type, data in SOIL_TYPES.items():
         desc = data['desc_fa'] if persian else data['desc_en']
-        with st.expander(f"{soil_type} ({'ضریب' if persian else 'Factor'}: {data['group_factor']})"):
+        with st.expander(f"{soil_type} ({translate('Factor', persian)}: {data['group_factor']})"):
             st.write(desc)
 
     selected_soil = st.selectbox(
-        "Select Soil Type" if not persian else "انتخاب نوع خاک",
-        options=list(soil_types.keys()),
+        translate("Select Soil Type", persian),
+        options=list(SOIL_TYPES.keys()),
         key="soil_type_select"
     )
     st.session_state.soil_type = selected_soil
 
-    auto_importance_group = soil_types[selected_soil]['importance_group']
-    auto_importance_factor = soil_types[selected_soil]['group_factor']
+    auto_importance_group = SOIL_TYPES[selected_soil]['importance_group']
+    auto_importance_factor = SOIL_TYPES[selected_soil]['group_factor']
     st.session_state.importance_group = auto_importance_group
+    st.session_state.importance_factor = auto_importance_factor
 
     st.markdown("---")
     st.subheader(
-        "Automatically Calculated Importance Group" if not persian else
-        "گروه اهمیت محاسبه‌شده به‌صورت خودکار"
+        translate("Automatically Calculated Importance Group", persian)
     )
 
     st.success(
-        f"**{'Importance Group' if not persian else 'گروه اهمیت'}:** {auto_importance_group} "
-        f"({'Factor' if not persian else 'ضریب'}: {auto_importance_factor})"
+        f"**{translate('Importance Group', persian)}:** {auto_importance_group} "
+        f"({translate('Factor', persian)}: {auto_importance_factor})"
     )
     st.info(
-        "The importance group is automatically determined based on the selected soil type per ISIRI 2800." if not persian else
-        "گروه اهمیت به‌صورت خودکار بر اساس نوع خاک انتخاب‌شده طبق ISIRI 2800 تعیین می‌شود."
+        translate("The importance group is automatically determined based on the selected soil type per ISIRI 2800.", persian)
     )
 
     st.markdown("---")
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Soil Type" if not persian else "نوع خاک", selected_soil)
+        st.metric(translate("Soil Type", persian), selected_soil)
     with col2:
-        st.metric("Soil Factor" if not persian else "ضریب خاک", soil_types[selected_soil]['group_factor'])
+        st.metric(translate("Soil Factor", persian), SOIL_TYPES[selected_soil]['group_factor'])
     with col3:
-        st.metric("Importance Factor" if not persian else "ضریب اهمیت", auto_importance_factor)
+        st.metric(translate("Importance Factor", persian), auto_importance_factor)
 
     st.markdown("---")
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with right_col:
-        st.button("Next ➡️" if not persian else "بعدی ➡️", on_click=validate_current_step_and_next)
+        st.button(translate("Next ➡️", persian), on_click=validate_current_step_and_next)
 
 
 # === STEP 8: Carousel Orientation ===
@@ -2885,43 +2096,93 @@ if st.session_state.step == 8:
         st.session_state.validation_errors = []
 
     st.markdown(
-        "**Wind direction analysis per AS 1170.4-2007(A1), EN 1991-1-4:2005**" if not persian else
-        "**تحلیل جهت باد طبق AS 1170.4-2007(A1)، EN 1991-1-4:2005**"
+        translate("**Wind direction analysis per AS 1170.4-2007(A1), EN 1991-1-4:2005**", persian)
     )
     st.markdown("---")
 
     env = st.session_state.get('environment_data', {})
     wind_direction = env.get('wind_direction', 'North')
+    wind_rose_data = st.session_state.get('wind_rose_data')
+    if wind_rose_data:
+        wind_direction = wind_rose_data['dominant_load_direction']
     land_length = env.get('land_length', 100)
     land_width = env.get('land_width', 100)
 
-    axis_key, suggested_label, arrow_vec = map_direction_to_axis_and_vector(wind_direction)
-
-    st.subheader(f"{'جهت پیشنهادی' if persian else 'Suggested Orientation'}: {suggested_label}")
-    st.markdown(f"**{'ابعاد زمین' if persian else 'Land dimensions'}:** {land_length} m × {land_width} m")
-    st.info(f"{'بر اساس جهت غالب باد' if persian else 'Based on prevailing wind direction'}: {wind_direction}")
+    # Continuous orientation: expected out-of-plane wind response over the direction × speed distribution
+    diameter = st.session_state.diameter
+    cabin_geometry = st.session_state.get('cabin_geometry', 'Square')
+    cabin_surface_area = estimate_cabin_surface_area(cabin_geometry, st.session_state.get('cabin_capacity', 6), diameter)
+    terrain = TERRAIN_CATEGORIES.get(env.get('province'), {"category": "II", "z0": 0.05, "zmin": 2})
+    response = wheel_wind_loads(
+        diameter=diameter, hub_height=diameter * 1.1 - diameter / 2.0,
+        num_cabins=st.session_state.num_cabins, cabin_area=cabin_surface_area / 4.0,
+        terrain=terrain, speed=float(env.get('wind_max', 108)) / 3.6,
+        altitude=float(env.get('altitude', 0)),
+        cabin_cf=float(force_coefficient(geometry_code(cabin_geometry)))
+    )
+    if wind_rose_data:
+        distribution = distribution_from_rose(wind_rose_data)
+    else:
+        distribution = single_direction_distribution(wind_direction, float(env.get('wind_max', 108)) / 3.6)
+    orientation = optimise_orientation(
+        *distribution, response['orientation_deg'], response['out_of_plane'].max(axis=1),
+        land_length, land_width, diameter
+    )
+    optimal_angle = orientation['optimal_angle']
+    axis_key, arrow_vec = orientation['axis_key'], orientation['arrow_vec']
+    suggested_label = f"{optimal_angle:.1f}° ({axis_label(axis_key, persian)})"
+
+    st.subheader(f"{translate('Suggested Orientation', persian)}: {suggested_label}")
+    st.markdown(f"**{translate('Land dimensions', persian)}:** {land_length} m × {land_width} m")
+    st.info(f"{translate('Based on prevailing wind direction', persian)}: {translate(wind_direction, persian)}")
+    if wind_rose_data:
+        st.caption(
+            translate("From {0:,} station records (load-weighted Σ f·v²)", persian).format(wind_rose_data['records'])
+        )
+        st.plotly_chart(create_wind_rose_chart(wind_rose_data, persian), use_container_width=True)
+    st.caption(
+        translate("Wheel-plane bearing from north, clockwise. Dotted line: expected out-of-plane wind "
+                  "response for each bearing (1.00 = optimum).", persian)
+    )
+    if not orientation['any_feasible']:
+        st.warning(
+            translate("The wheel footprint does not fit the plot at any bearing; the least-loaded bearing is shown.", persian)
+        )
 
-    fig = create_orientation_diagram(axis_key, land_length, land_width, arrow_vec)
+    fig = create_orientation_diagram(axis_key, land_length, land_width, arrow_vec, cost_curve=orientation)
     st.plotly_chart(fig, use_container_width=True)
 
+    fig_cost = go.Figure(go.Scatter(
+        x=orientation['angles_deg'], y=np.where(orientation['feasible'], orientation['cost'], np.nan),
+        mode='lines', line=dict(color='rgb(230,140,20)', width=2)
+    ))
+    fig_cost.add_vline(x=optimal_angle, line_dash='dash', line_color='red')
+    fig_cost.update_layout(
+        xaxis_title=translate("Wheel-plane bearing (°)", persian),
+        yaxis_title=translate("Relative wind response", persian),
+        height=300, margin=dict(l=40, r=20, t=20, b=40)
+    )
+    st.plotly_chart(fig_cost, use_container_width=True)
+
     st.markdown("---")
 
     col1, col2 = st.columns(2)
     with col1:
         if st.button(
-            "✅ Confirm Suggested Orientation" if not persian else "✅ تأیید جهت پیشنهادی"
+            translate("✅ Confirm Suggested Orientation", persian)
         ):
             st.session_state.carousel_orientation = axis_key
+            st.session_state.carousel_orientation_angle = optimal_angle
             st.session_state.orientation_confirmed = True
-            st.success(f"{'جهت تأیید شد' if persian else 'Orientation confirmed'}: {suggested_label}")
+            st.success(f"{translate('Orientation confirmed', persian)}: {suggested_label}")
 
     with col2:
         st.markdown(
-            "**Or select custom orientation:**" if not persian else "**یا یک جهت سفارشی انتخاب کنید:**"
+            translate("**Or select custom orientation:**", persian)
         )
 
     directions_en = ['North-South', 'East-West', 'Northeast-Southwest', 'Northwest-Southeast']
-    directions_fa = ['شمال-جنوب', 'شرق-غرب', 'شمال‌شرقی-جنوب‌غربی', 'جنوب‌شرقی-شمال‌غربی']
+    direction_keys = dict(zip(directions_en, ('north_south', 'east_west', 'northeast_southwest', 'southeast_northwest')))
 
     direction_map = {
         'NS': 'North-South', 'EW': 'East-West',
@@ -2934,18 +2195,19 @@ if st.session_state.step == 8:
         get_text('custom_direction', persian),
         options=directions_en,
         index=init_index,
-        format_func=lambda x: directions_fa[directions_en.index(x)] if persian else x,
+        format_func=lambda x: get_text(direction_keys[x], persian),
         key="custom_orientation_select"
     )
 
     if st.button(
-        "Set Custom Orientation" if not persian else "تنظیم جهت سفارشی",
+        translate("Set Custom Orientation", persian),
         key="set_custom_orientation_btn"
     ):
         axis_key_custom, label_custom, arrow_vec_custom = map_direction_to_axis_and_vector(custom_direction)
         st.session_state.carousel_orientation = axis_key_custom
+        st.session_state.carousel_orientation_angle = AXIS_BEARINGS[axis_key_custom]
         st.session_state.orientation_confirmed = True
-        st.success(f"{'جهت سفارشی تنظیم شد' if persian else 'Custom orientation set'}: {label_custom}")
+        st.success(f"{translate('Custom orientation set', persian)}: {label_custom}")
 
         fig_custom = create_orientation_diagram(axis_key_custom, land_length, land_width, arrow_vec_custom)
         st.plotly_chart(fig_custom, use_container_width=True)
@@ -2953,9 +2215,9 @@ if st.session_state.step == 8:
     st.markdown("---")
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with right_col:
-        st.button("Next ➡️" if not persian else "بعدی ➡️", on_click=validate_current_step_and_next)
+        st.button(translate("Next ➡️", persian), on_click=validate_current_step_and_next)
 
 
 # === STEP 9: Device Classification ===
@@ -2963,8 +2225,7 @@ elif st.session_state.step == 9:
     st.header(get_text('device_classification', persian))
 
     st.markdown(
-        "**Calculation per INSO 8987-1-2023**" if not persian else
-        "**محاسبه طبق INSO 8987-1-2023**"
+        translate("**Calculation per INSO 8987-1-2023**", persian)
     )
     st.markdown("---")
 
@@ -2980,37 +2241,35 @@ elif st.session_state.step == 9:
         angular_velocity = 0.0
         rpm = 0.0
 
-    st.subheader("Braking Acceleration Parameter" if not persian else "پارامتر شتاب ترمز")
+    st.subheader(translate("Braking Acceleration Parameter", persian))
     st.info(
-        "⚠️ **Note:** Enter your actual braking acceleration for the design analysis" if not persian else
-        "⚠️ **توجه:** شتاب ترمز واقعی خود را برای تحلیل طراحی وارد کنید"
+        translate("⚠️ **Note:** Enter your actual braking acceleration for the design analysis", persian)
     )
 
     braking_accel = st.number_input(
-        "Braking Acceleration (m/s²)" if not persian else "شتاب ترمز (متر بر مجذور ثانیه)",
+        translate("Braking Acceleration (m/s²)", persian),
         min_value=0.01, max_value=2.0,
         value=st.session_state.braking_acceleration,
         step=0.01, format="%.2f",
         key="braking_accel_input",
-        help="Actual braking acceleration for your design" if not persian else "شتاب ترمز واقعی برای طراحی شما"
+        help=translate("Actual braking acceleration for your design", persian)
     )
     st.session_state.braking_acceleration = braking_accel
 
     st.markdown("---")
 
-    st.subheader("⚙️ Device Classification Analysis" if not persian else "⚙️ تحلیل طبقه‌بندی دستگاه")
+    st.subheader(translate("⚙️ Device Classification Analysis", persian))
     st.markdown(
-        "**Based on Gravity and Braking Acceleration Only:**" if not persian else
-        "**بر اساس گرانش و شتاب ترمز:**"
+        translate("**Based on Gravity and Braking Acceleration Only:**", persian)
     )
 
     param_col1, param_col2, param_col3 = st.columns(3)
     with param_col1:
-        st.metric("Rotation Speed" if not persian else "سرعت چرخش", f"{rpm:.4f} rpm")
+        st.metric(translate("Rotation Speed", persian), f"{rpm:.4f} rpm")
     with param_col2:
-        st.metric("Braking Acceleration" if not persian else "شتاب ترمز", f"{braking_accel:.2f} m/s²")
+        st.metric(translate("Braking Acceleration", persian), f"{braking_accel:.2f} m/s²")
     with param_col3:
-        st.metric("Diameter" if not persian else "قطر", f"{diameter} m")
+        st.metric(translate("Diameter", persian), f"{diameter} m")
 
     def calculate_accelerations_clean(theta, diameter, angular_velocity, braking_accel, g=9.81):
         """
@@ -3030,6 +2289,7 @@ elif st.session_state.step == 9:
         a_total = np.sqrt(a_x_total**2 + a_z_total**2)
         return a_x_total, a_z_total, a_total
 
+    @memoize(maxsize=64)
     def calculate_dynamic_product_clean(diameter, height, angular_velocity, braking_accel, g=9.81):
         """
         Calculate dynamic product (only operational accelerations, no environmental loads)
@@ -3069,27 +2329,26 @@ elif st.session_state.step == 9:
     class_not_secured = classify_intrinsic_not_secured(p_actual)
 
     st.markdown("---")
-    st.markdown("**Calculated Values:**" if not persian else "**مقادیر محاسبه شده:**")
+    st.markdown(translate("**Calculated Values:**", persian))
 
     result_col1, result_col2, result_col3 = st.columns(3)
     with result_col1:
-        st.metric("Max Acceleration" if not persian else "حداکثر شتاب", f"{max_accel_actual:.3f} m/s²")
+        st.metric(translate("Max Acceleration", persian), f"{max_accel_actual:.3f} m/s²")
         st.caption(f"({n_actual:.3f}g)")
     with result_col2:
-        st.metric("Dynamic Product (p)" if not persian else "حاصل‌ضرب دینامیکی", f"{p_actual:.2f}")
+        st.metric(translate("Dynamic Product (p)", persian), f"{p_actual:.2f}")
     with result_col3:
-        st.metric("Linear Velocity" if not persian else "سرعت خطی", f"{(diameter/2.0) * angular_velocity:.3f} m/s")
+        st.metric(translate("Linear Velocity", persian), f"{(diameter/2.0) * angular_velocity:.3f} m/s")
 
     st.markdown("---")
     st.subheader(
-        "📋 Device Classification per INSO 8987-1-2023" if not persian else
-        "📋 طبقه‌بندی دستگاه طبق INSO 8987-1-2023"
+        translate("📋 Device Classification per INSO 8987-1-2023", persian)
     )
 
     class_col1, class_col2 = st.columns(2)
 
     with class_col1:
-        st.markdown("#### **Intrinsic Safety Secured**" if not persian else "#### **ایمنی ذاتی تأمین شده**")
+        st.markdown(translate("#### **Intrinsic Safety Secured**", persian))
         st.success(f"**Class {class_secured}**")
         st.markdown("""
 | Class | Dynamic Product (P) |
@@ -3100,20 +2359,16 @@ elif st.session_state.step == 9:
 | 4     | 200 < P             |
 """)
         if class_secured == 1:
-            st.info("✅ Lowest classification - Minimal restraint requirements" if not persian else
-                    "✅ پایین‌ترین طبقه - حداقل الزامات مهاربند")
+            st.info(translate("✅ Lowest classification - Minimal restraint requirements", persian))
         elif class_secured == 2:
-            st.info("✅ Low to moderate classification - Standard restraint" if not persian else
-                    "✅ طبقه پایین تا متوسط - مهاربند استاندارد")
+            st.info(translate("✅ Low to moderate classification - Standard restraint", persian))
         elif class_secured == 3:
-            st.warning("⚠️ Moderate to high classification - Enhanced restraint required" if not persian else
-                       "⚠️ طبقه متوسط تا بالا - مهاربند تقویت‌شده لازم است")
+            st.warning(translate("⚠️ Moderate to high classification - Enhanced restraint required", persian))
         elif class_secured == 4:
-            st.error("⚠️ Highest classification - Maximum restraint required" if not persian else
-                     "⚠️ بالاترین طبقه - حداکثر مهاربند لازم است")
+            st.error(translate("⚠️ Highest classification - Maximum restraint required", persian))
 
     with class_col2:
-        st.markdown("#### **Intrinsic Safety NOT Secured**" if not persian else "#### **ایمنی ذاتی تأمین نشده**")
+        st.markdown(translate("#### **Intrinsic Safety NOT Secured**", persian))
         st.warning(f"**Class {class_not_secured}**")
         st.markdown("""
 | Class | Dynamic Product (P) |
@@ -3124,17 +2379,13 @@ elif st.session_state.step == 9:
 | 5     | 200 < P             |
 """)
         if class_not_secured == 2:
-            st.info("⚠️ Requires additional safety measures" if not persian else
-                    "⚠️ نیازمند اقدامات ایمنی اضافی")
+            st.info(translate("⚠️ Requires additional safety measures", persian))
         elif class_not_secured == 3:
-            st.warning("⚠️ Enhanced safety measures required" if not persian else
-                       "⚠️ اقدامات ایمنی تقویت‌شده لازم است")
+            st.warning(translate("⚠️ Enhanced safety measures required", persian))
         elif class_not_secured == 4:
-            st.error("⚠️ Comprehensive safety system required" if not persian else
-                     "⚠️ سیستم ایمنی جامع لازم است")
+            st.error(translate("⚠️ Comprehensive safety system required", persian))
         elif class_not_secured == 5:
-            st.error("🚨 Maximum safety classification - Special precautions mandatory" if not persian else
-                     "🚨 بالاترین طبقه ایمنی - احتیاط‌های ویژه اجباری است")
+            st.error(translate("🚨 Maximum safety classification - Special precautions mandatory", persian))
 
     st.session_state.classification_data = {
         'p_actual': p_actual,
@@ -3148,22 +2399,21 @@ elif st.session_state.step == 9:
     }
 
     st.info(
-        "ℹ️ **Note:** Environmental loads (wind, snow, earthquake) will be calculated separately in the next step and are not included in the device classification." if not persian else
-        "ℹ️ **توجه:** بارهای محیطی (باد، برف، زلزله) در مرحله بعد به‌صورت جداگانه محاسبه می‌شوند و در طبقه‌بندی دستگاه لحاظ نشده‌اند."
+        translate("ℹ️ **Note:** Environmental loads (wind, snow, earthquake) will be calculated separately in the next step and are not included in the device classification.", persian)
     )
 
     st.markdown("---")
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with right_col:
-        st.button("Next ➡️" if not persian else "بعدی ➡️", on_click=validate_current_step_and_next)
+        st.button(translate("Next ➡️", persian), on_click=validate_current_step_and_next)
 
 
 
 # === STEP 10: environmental loads ===
 elif st.session_state.step == 10:
-    st.header("🌦️ Environmental Loads Analysis" if not persian else "🌦️ تحلیل بارهای محیطی")
+    st.header(translate("🌦️ Environmental Loads Analysis", persian))
     st.caption("Per ISO 17842-2023, AS 3533.1-2009, ISIRI 2800, ISIRI 519")
     st.markdown("---")
     
@@ -3177,22 +2427,47 @@ elif st.session_state.step == 10:
     if 'enable_earthquake' not in st.session_state:
         st.session_state.enable_earthquake = False
     if 'snow_coefficient' not in st.session_state:
-        st.session_state.snow_coefficient = 0.2
+        # Mapped ground snow load at the site when the snow raster is installed
+        mapped_snow = st.session_state.get('site_hazards', {}).get('snow', 0.2)
+        st.session_state.snow_coefficient = round(float(mapped_snow), 2)
     if 'terror_factor' not in st.session_state:
         st.session_state.terror_factor = 1.0
     if 'height_factor' not in st.session_state:
         st.session_state.height_factor = 1.0
     if 'seismic_coefficient' not in st.session_state:
         st.session_state.seismic_coefficient = 0.15
+    if 'behaviour_factor' not in st.session_state:
+        st.session_state.behaviour_factor = 3.0
     
     cabin_geometry = st.session_state.get('cabin_geometry', 'Square')
     cabin_capacity = st.session_state.get('cabin_capacity', 6)
     cabin_surface_area = estimate_cabin_surface_area(cabin_geometry, cabin_capacity, diameter)
     
     st.info(
-        f"**Estimated Cabin Surface Area:** {cabin_surface_area} m² (based on {cabin_geometry}, {cabin_capacity} passengers)" if not persian else
-        f"**مساحت تخمینی سطح کابین:** {cabin_surface_area} m² (بر اساس {cabin_geometry}، {cabin_capacity} مسافر)"
+        translate("**Estimated Cabin Surface Area:** {cabin_surface_area} m² (based on {cabin_geometry}, {cabin_capacity} passengers)", persian).format(cabin_surface_area=cabin_surface_area, cabin_geometry=cabin_geometry, cabin_capacity=cabin_capacity)
+    )
+
+    # Natural periods for the seismic spectrum and the wind structural factor
+    power_data = calculate_motor_power(
+        diameter, st.session_state.num_cabins, cabin_capacity, st.session_state.num_vip_cabins,
+        st.session_state.rotation_time_min, cabin_geometry
     )
+    modes = compute(modes_from_breakdown, diameter, st.session_state.num_cabins, height - diameter / 2.0, power_data['breakdown'])
+    st.session_state.modal_periods = [modes['dominant']['x'], modes['dominant']['y']]
+    with st.expander(translate("🎼 Structural Modes", persian)):
+        significant = np.flatnonzero(modes['mass_fraction'].max(axis=1) >= 0.01)
+        st.dataframe({
+            (translate("Mode", persian)): significant + 1,
+            (translate("Period (s)", persian)): np.round(modes['periods'][significant], 3),
+            (translate("Frequency (Hz)", persian)): np.round(modes['frequencies'][significant], 3),
+            "M_x (%)": np.round(modes['mass_fraction'][significant, 0] * 100, 1),
+            "M_y (%)": np.round(modes['mass_fraction'][significant, 1] * 100, 1),
+            "M_z (%)": np.round(modes['mass_fraction'][significant, 2] * 100, 1),
+        }, hide_index=True, use_container_width=True)
+        st.caption(
+            translate("Lumped-mass frame model, {0:,} DOFs, {1:,.0f} t. In-plane T_x = {2:.2f} s, out-of-plane "
+                      "T_y = {3:.2f} s", persian).format(modes['n_dof'], modes['total_mass'] / 1000, modes['dominant']['x'], modes['dominant']['y'])
+        )
     
     st.markdown("---")
     
@@ -3201,7 +2476,7 @@ elif st.session_state.step == 10:
     # SNOW LOAD
     with col1:
         enable_snow = st.checkbox(
-            "🌨️ Snow Load" if not persian else "🌨️ بار برف",
+            translate("🌨️ Snow Load", persian),
             value=st.session_state.enable_snow, key="snow_checkbox"
         )
         st.session_state.enable_snow = enable_snow
@@ -3209,121 +2484,181 @@ elif st.session_state.step == 10:
         if enable_snow:
             st.markdown("**Per ISO 17842-2023 §4.3.3.5**")
             snow_coef = st.number_input(
-                "Snow Pressure (kN/m²)" if not persian else "فشار برف (کیلونیوتن بر متر مربع)",
-                min_value=0.1, max_value=1.0,
+                translate("Snow Pressure (kN/m²)", persian),
+                min_value=0.0, max_value=10.0,
                 value=st.session_state.snow_coefficient,
                 step=0.05, format="%.2f", key="snow_coef_input",
-                help="Standard value: 0.2 kN/m² per ISO 17842-2023" if not persian else "مقدار استاندارد: 0.2 kN/m² طبق ISO 17842-2023"
+                help=translate("Standard value: 0.2 kN/m² per ISO 17842-2023", persian)
             )
             st.session_state.snow_coefficient = snow_coef
+            if 'snow' in st.session_state.get('site_hazards', {}):
+                st.caption(translate("Mapped ground snow load at the site: {0:.2f} kN/m²", persian).format(
+                    st.session_state.site_hazards['snow']))
             snow_load_calc = snow_coef * cabin_surface_area
             st.success(
-                f"**Snow Force: {snow_load_calc:.2f} kN**" if not persian else
-                f"**نیروی برف: {snow_load_calc:.2f} kN**"
+                translate("**Snow Force: {snow_load_calc:.2f} kN**", persian).format(snow_load_calc=snow_load_calc)
             )
             st.caption(
-                f"Calculation: {snow_coef} × {cabin_surface_area} m²" if not persian else
-                f"محاسبه: {snow_coef} × {cabin_surface_area} m²"
+                translate("Calculation: {snow_coef} × {cabin_surface_area} m²", persian).format(snow_coef=snow_coef, cabin_surface_area=cabin_surface_area)
             )
     
     # WIND LOAD
     with col2:
         enable_wind = st.checkbox(
-            "💨 Wind Load" if not persian else "💨 بار باد",
+            translate("💨 Wind Load", persian),
             value=st.session_state.enable_wind, key="wind_checkbox"
         )
         st.session_state.enable_wind = enable_wind
         
         if enable_wind:
             st.markdown("**Per ISO 17842-2023 §4.3.3.4**")
+            wind_method = st.radio(
+                translate("Wind pressure method", persian),
+                options=["ISO 17842 height bands", "EN 1991-1-4 terrain profile"],
+                index=0 if st.session_state.get('wind_method', "ISO 17842 height bands") == "ISO 17842 height bands" else 1,
+                format_func=lambda x: translate(x, persian),
+                key="wind_method_radio"
+            )
+            st.session_state.wind_method = wind_method
+
+            if wind_method == "EN 1991-1-4 terrain profile":
+                env = st.session_state.environment_data
+                terrain = TERRAIN_CATEGORIES.get(env.get('province'), {"category": "II", "z0": 0.05, "zmin": 2})
+                wind_result = wheel_wind_loads(
+                    diameter=diameter, hub_height=height - diameter / 2.0,
+                    num_cabins=st.session_state.num_cabins,
+                    cabin_area=cabin_surface_area / 4.0,
+                    terrain=terrain, speed=float(env.get('wind_max', 108)) / 3.6,
+                    altitude=float(env.get('altitude', 0)),
+                    cabin_cf=float(force_coefficient(geometry_code(cabin_geometry)))
+                )
+                worst = wind_result['worst']
+                dynamic = structural_factor(
+                    1.0 / modes['dominant']['y'], height, diameter, terrain,
+                    float(env.get('wind_max', 108)) / 3.6, float(env.get('altitude', 0))
+                )
+                st.session_state.wind_force_en = worst['force'] * dynamic['cs_cd'] / 1000.0
+                st.session_state.wind_pressure = float(wind_result['profile']['q_p'].max()) / 1000.0
+                st.caption(
+                    translate("Terrain {0}: z₀ = {1} m, z_min = {2} m, ρ = {3:.3f} kg/m³", persian).format(terrain['category'], terrain['z0'], terrain['zmin'], wind_result['profile']['rho'])
+                )
+                st.caption(
+                    translate("Peak pressure at top q_p: {0:.3f} kN/m²", persian).format(st.session_state.wind_pressure)
+                )
+                st.success(
+                    translate("**Wind Force: {0:.2f} kN**", persian).format(st.session_state.wind_force_en)
+                )
+                st.caption(
+                    translate("Structural factor c_s·c_d = {0:.3f} at n₁ = {1:.2f} Hz", persian).format(dynamic['cs_cd'], 1.0 / modes['dominant']['y'])
+                )
+                st.caption(
+                    translate("Worst case: wind {0:.0f}° from wheel normal, wheel angle {1:.0f}°, overturning moment "
+                              "{2:,.0f} kN·m", persian).format(worst['orientation_deg'], worst['wheel_angle_deg'], worst['moment'] / 1000.0)
+                )
+            else:
             
-            if 'height_category_index' not in st.session_state:
-                st.session_state.height_category_index = 0
+                if 'height_category_index' not in st.session_state:
+                    st.session_state.height_category_index = 0
             
-            height_category = st.selectbox(
-                "Height Category (m)" if not persian else "دسته‌بندی ارتفاع (متر)",
-                options=["0 < H ≤ 8", "8 < H ≤ 20", "20 < H ≤ 35", "35 < H ≤ 50"],
-                index=st.session_state.height_category_index,
-                key="height_category"
-            )
+                height_category = st.selectbox(
+                    translate("Height Category (m)", persian),
+                    options=["0 < H ≤ 8", "8 < H ≤ 20", "20 < H ≤ 35", "35 < H ≤ 50"],
+                    index=st.session_state.height_category_index,
+                    key="height_category"
+                )
             
-            if 'height_category_value' not in st.session_state or st.session_state.height_category_value != height_category:
-                st.session_state.height_category_value = height_category
+                if 'height_category_value' not in st.session_state or st.session_state.height_category_value != height_category:
+                    st.session_state.height_category_value = height_category
             
-            wind_pressure_map = {
-                "0 < H ≤ 8": 0.20, "8 < H ≤ 20": 0.30,
-                "20 < H ≤ 35": 0.35, "35 < H ≤ 50": 0.40
-            }
-            wind_pressure = wind_pressure_map[height_category]
-            st.session_state.wind_pressure = wind_pressure
-            st.caption(
-                f"Base wind pressure q: {wind_pressure} kN/m²" if not persian else
-                f"فشار پایه باد q: {wind_pressure} kN/m²"
-            )
+                wind_pressure_map = {
+                    "0 < H ≤ 8": 0.20, "8 < H ≤ 20": 0.30,
+                    "20 < H ≤ 35": 0.35, "35 < H ≤ 50": 0.40
+                }
+                wind_pressure = wind_pressure_map[height_category]
+                st.session_state.wind_pressure = wind_pressure
+                st.caption(
+                    translate("Base wind pressure q: {wind_pressure} kN/m²", persian).format(wind_pressure=wind_pressure)
+                )
             
-            st.markdown("**Design Factors:**" if not persian else "**ضرایب طراحی:**")
-            terror_factor = st.slider(
-                "Terror Factor" if not persian else "فاکتور وحشت",
-                min_value=1.0, max_value=5.0,
-                value=st.session_state.terror_factor, step=0.5,
-                key="terror_factor_slider"
-            )
-            st.session_state.terror_factor = terror_factor
+                st.markdown(translate("**Design Factors:**", persian))
+                terror_factor = st.slider(
+                    translate("Terror Factor", persian),
+                    min_value=1.0, max_value=5.0,
+                    value=st.session_state.terror_factor, step=0.5,
+                    key="terror_factor_slider"
+                )
+                st.session_state.terror_factor = terror_factor
             
-            height_factor = st.slider(
-                "Height Factor" if not persian else "فاکتور ارتفاع",
-                min_value=1.0, max_value=5.0,
-                value=st.session_state.height_factor, step=0.5,
-                key="height_factor_slider"
-            )
-            st.session_state.height_factor = height_factor
+                height_factor = st.slider(
+                    translate("Height Factor", persian),
+                    min_value=1.0, max_value=5.0,
+                    value=st.session_state.height_factor, step=0.5,
+                    key="height_factor_slider"
+                )
+                st.session_state.height_factor = height_factor
             
-            wind_load_calc = wind_pressure * cabin_surface_area * terror_factor * height_factor
-            st.success(
-                f"**Wind Force: {wind_load_calc:.2f} kN**" if not persian else
-                f"**نیروی باد: {wind_load_calc:.2f} kN**"
-            )
-            st.caption(
-                f"Calculation: {wind_pressure} × {cabin_surface_area} × {terror_factor} × {height_factor}" if not persian else
-                f"محاسبه: {wind_pressure} × {cabin_surface_area} × {terror_factor} × {height_factor}"
-            )
+                wind_load_calc = wind_pressure * cabin_surface_area * terror_factor * height_factor
+                st.success(
+                    translate("**Wind Force: {wind_load_calc:.2f} kN**", persian).format(wind_load_calc=wind_load_calc)
+                )
+                st.caption(
+                    translate("Calculation: {wind_pressure} × {cabin_surface_area} × {terror_factor} × {height_factor}", persian).format(wind_pressure=wind_pressure, cabin_surface_area=cabin_surface_area, terror_factor=terror_factor, height_factor=height_factor)
+                )
     
     # EARTHQUAKE LOAD
     with col3:
         enable_earthquake = st.checkbox(
-            "🌍 Earthquake Load" if not persian else "🌍 بار زلزله",
+            translate("🌍 Earthquake Load", persian),
             value=st.session_state.enable_earthquake, key="earthquake_checkbox"
         )
         st.session_state.enable_earthquake = enable_earthquake
         
         if enable_earthquake:
             st.markdown("**Per ISO 17842-2023 §4.3.4 & ISIRI 2800**")
-            seismic_coef = st.number_input(
-                "Seismic Coefficient" if not persian else "ضریب زلزله",
-                min_value=0.0, max_value=0.5,
-                value=st.session_state.seismic_coefficient,
-                step=0.01, format="%.3f", key="seismic_coef_input",
-                help="Typical range per ISIRI 2800: 0.10 - 0.35" if not persian else "محدوده معمول طبق ISIRI 2800: 0.10 تا 0.35"
+            behaviour_factor = st.number_input(
+                translate("Behaviour Factor R_u", persian),
+                min_value=1.0, max_value=8.0,
+                value=float(st.session_state.behaviour_factor),
+                step=0.5, format="%.1f", key="behaviour_factor_input",
+                help=translate("1.0 keeps the structure elastic", persian)
             )
-            st.session_state.seismic_coefficient = seismic_coef
-            approx_mass = diameter * 500
-            earthquake_load_calc = seismic_coef * (approx_mass * 9.81 / 1000)
+            st.session_state.behaviour_factor = behaviour_factor
+            env = st.session_state.environment_data
+            seismic_mass = power_data['breakdown']['total_mass']
+            periods = st.session_state.get('modal_periods') or [empirical_period(height)]
+            seismic = seismic_forces(
+                seismic_mass, periods,
+                soil_type=st.session_state.get('soil_type') or 'Type II',
+                hazard=env.get('seismic_hazard', 'Moderate'),
+                importance=st.session_state.get('importance_factor', 1.0),
+                behaviour_factor=behaviour_factor,
+                # Mapped PGA at the site when the raster is installed, else the hazard-level table
+                A=st.session_state.get('site_hazards', {}).get('pga')
+            )
+            st.session_state.seismic_coefficient = seismic['C']
+            st.session_state.seismic_result = seismic
+            spec = seismic['spectrum']
             st.success(
-                f"**Horizontal Force: {earthquake_load_calc:.2f} kN**" if not persian else
-                f"**نیروی افقی: {earthquake_load_calc:.2f} kN**"
+                translate("**Horizontal Force: {0:.2f} kN**", persian).format(seismic['horizontal'])
             )
             st.success(
-                f"**Vertical Force: {earthquake_load_calc * 0.5:.2f} kN**" if not persian else
-                f"**نیروی عمودی: {earthquake_load_calc * 0.5:.2f} kN**"
+                translate("**Vertical Force: {0:.2f} kN**", persian).format(seismic['vertical'])
             )
             st.caption(
-                f"Approx. cabin mass: {approx_mass:.0f} kg" if not persian else
-                f"جرم تقریبی کابین: {approx_mass:.0f} kg"
+                translate("A = {0:.2f} ({1}), {2}: T₀ = {3} s, Tₛ = {4} s, I = {5:.1f}", persian).format(spec.A, spec.hazard, spec.soil_type, spec.T0, spec.Ts, spec.importance)
             )
             st.caption(
-                f"Calculation: {seismic_coef} × {approx_mass * 9.81 / 1000:.1f} kN" if not persian else
-                f"محاسبه: {seismic_coef} × {approx_mass * 9.81 / 1000:.1f} kN"
+                translate("C = A·B·I / R_u = {0:.3f} at T = {1:.2f} s; vertical C_v = {2:.3f}; mass "
+                          "{approx_mass:.0f} kg", persian).format(seismic['C'], seismic['period'], seismic['C_v'], approx_mass=seismic_mass)
+            )
+            T_curve, Sa_curve = spec.curve()
+            fig_spec = go.Figure(go.Scatter(x=T_curve, y=Sa_curve, mode='lines', line=dict(color='firebrick')))
+            fig_spec.add_vline(x=seismic['period'], line_dash='dash', line_color='gray')
+            fig_spec.update_layout(
+                xaxis_title="T (s)", yaxis_title="A·B·I (g)",
+                height=220, margin=dict(l=30, r=10, t=10, b=30)
             )
+            st.plotly_chart(fig_spec, use_container_width=True)
     
     st.markdown("---")
     
@@ -3335,48 +2670,51 @@ elif st.session_state.step == 10:
     if st.session_state.enable_snow:
         snow_force = st.session_state.snow_coefficient * cabin_surface_area
     if st.session_state.enable_wind:
-        wind_force = (st.session_state.wind_pressure * cabin_surface_area *
-                     st.session_state.terror_factor * st.session_state.height_factor)
+        if st.session_state.get('wind_method') == "EN 1991-1-4 terrain profile":
+            wind_force = st.session_state.wind_force_en
+        else:
+            wind_force = (st.session_state.wind_pressure * cabin_surface_area *
+                         st.session_state.terror_factor * st.session_state.height_factor)
     if st.session_state.enable_earthquake:
-        approx_mass = diameter * 500
-        earthquake_force_h = st.session_state.seismic_coefficient * (approx_mass * 9.81 / 1000)
-        earthquake_force_v = earthquake_force_h * 0.5
+        earthquake_force_h = st.session_state.seismic_result['horizontal']
+        earthquake_force_v = st.session_state.seismic_result['vertical']
     
-    st.subheader("📊 Total Environmental Forces" if not persian else "📊 مجموع نیروهای محیطی")
+    st.subheader(translate("📊 Total Environmental Forces", persian))
     
     force_col1, force_col2, force_col3 = st.columns(3)
     with force_col1:
         st.metric(
-            "Vertical Forces (Z-axis)" if not persian else "نیروهای عمودی (محور Z)",
+            translate("Vertical Forces (Z-axis)", persian),
             f"{snow_force + earthquake_force_v:.2f} kN"
         )
         if snow_force > 0:
-            st.caption(f"{'Snow' if not persian else 'برف'}: {snow_force:.2f} kN ↓")
+            st.caption(f"{translate('Snow', persian)}: {snow_force:.2f} kN ↓")
         if earthquake_force_v > 0:
-            st.caption(f"{'Earthquake (vertical)' if not persian else 'زلزله (عمودی)'}: {earthquake_force_v:.2f} kN")
+            st.caption(f"{translate('Earthquake (vertical)', persian)}: {earthquake_force_v:.2f} kN")
     
     with force_col2:
         st.metric(
-            "Horizontal Forces (X-axis)" if not persian else "نیروهای افقی (محور X)",
+            translate("Horizontal Forces (X-axis)", persian),
             f"{wind_force + earthquake_force_h:.2f} kN"
         )
         if wind_force > 0:
-            st.caption(f"{'Wind' if not persian else 'باد'}: {wind_force:.2f} kN →")
+            st.caption(f"{translate('Wind', persian)}: {wind_force:.2f} kN →")
         if earthquake_force_h > 0:
-            st.caption(f"{'Earthquake (horizontal)' if not persian else 'زلزله (افقی)'}: {earthquake_force_h:.2f} kN")
+            st.caption(f"{translate('Earthquake (horizontal)', persian)}: {earthquake_force_h:.2f} kN")
     
     with force_col3:
         total_force = np.sqrt((wind_force + earthquake_force_h)**2 + (snow_force + earthquake_force_v)**2)
         st.metric(
-            "Resultant Force" if not persian else "نیروی محصول",
+            translate("Resultant Force", persian),
             f"{total_force:.2f} kN"
         )
-        st.caption("Vector sum of all forces" if not persian else "حاصل برداری تمام نیروها")
+        st.caption(translate("Vector sum of all forces", persian))
     
     st.markdown("---")
-    st.subheader("🎯 3D Force Visualization" if not persian else "🎯 تصویرسازی سه‌بعدی نیروها")
+    st.subheader(translate("🎯 3D Force Visualization", persian))
     
-    def create_force_diagram(diameter, height, snow_f, wind_f, eq_h, eq_v):
+    @memoize(maxsize=32)
+    def create_force_diagram(diameter, height, snow_f, wind_f, eq_h, eq_v, persian=False):
         import plotly.graph_objects as go
         theta = np.linspace(0, 2*np.pi, 100)
         radius = diameter / 2
@@ -3433,19 +2771,191 @@ elif st.session_state.step == 10:
             scene=dict(xaxis=dict(title='X (m)', range=[-diameter, diameter]),
                       yaxis=dict(title='Y (m)', range=[-diameter/2, diameter/2]),
                       zaxis=dict(title='Z (m)', range=[0, height*1.2]), aspectmode='data'),
-            title='Environmental Forces on Ferris Wheel Structure' if not persian else 'نیروهای محیطی بر سازه چرخ و فلک',
+            title=translate("Environmental Forces on Ferris Wheel Structure", persian),
             showlegend=True, height=700
         )
         return fig
     
-    fig_forces = create_force_diagram(diameter, height, snow_force, wind_force, earthquake_force_h, earthquake_force_v)
+    fig_forces = create_force_diagram(diameter, height, snow_force, wind_force, earthquake_force_h, earthquake_force_v, persian)
     st.plotly_chart(fig_forces, use_container_width=True)
     
     st.info(
-        "**Legend:** Blue = Snow (downward), Green = Wind (horizontal), Red/Orange = Earthquake (horizontal/vertical)" if not persian else
-        "**راهنما:** آبی = برف (رو به پایین)، سبز = باد (افقی)، قرمز/نارنجی = زلزله (افقی/عمودی)"
+        translate("**Legend:** Blue = Snow (downward), Green = Wind (horizontal), Red/Orange = Earthquake (horizontal/vertical)", persian)
     )
-    
+
+    st.markdown("---")
+    st.subheader(translate("🔩 Rim & Spoke Member Forces", persian))
+    st.caption(
+        translate("Linear 3-D frame analysis at every cabin position for full, empty and half-loaded wheels", persian)
+    )
+    frame = compute(frame_from_breakdown, diameter, st.session_state.num_cabins, height - diameter / 2.0, power_data['breakdown'])
+    n_cab = st.session_state.num_cabins
+    passenger_mass = power_data['breakdown']['mass_passengers'] / n_cab
+    basis = basis_loads(frame.model, passenger_mass)
+    steps = np.arange(n_cab)
+    seismic_res = st.session_state.get('seismic_result') if st.session_state.enable_earthquake else None
+    permanent = (basis['self_weight'] + basis['cabins'] + snow_force * 1000.0 * basis['snow']
+                 + wind_force * 1000.0 * basis['wind_y'])
+    if seismic_res:
+        permanent = permanent + seismic_res['C'] * basis['seismic_x'] - seismic_res['C_v'] * basis['seismic_z']
+    patterns = {
+        'Full': np.ones(n_cab),
+        'Empty': np.zeros(n_cab),
+        'Half-loaded': (np.arange(n_cab) < n_cab // 2).astype(float),
+    }
+    loads = np.hstack([passenger_loads(frame.model, occ, steps, passenger_mass)
+                       for occ in patterns.values()]) + permanent[:, None]
+    case_labels = [f"{name} @ {step * 360.0 / n_cab:.0f}°" for name in patterns for step in steps]
+    member_forces = frame.member_forces(frame.solve(loads))
+    envelope = group_envelope(frame.model, member_forces, case_labels)
+    st.dataframe({
+        (translate("Member", persian)): [get_text(f'member_{g}', persian) for g in envelope],
+        (translate("Max tension (kN)", persian)): [round(max(v['axial_max'], 0.0) / 1000.0, 1) for v in envelope.values()],
+        (translate("Max compression (kN)", persian)): [round(max(-v['axial_min'], 0.0) / 1000.0, 1) for v in envelope.values()],
+        (translate("Max moment (kN·m)", persian)): [round(v['moment'] / 1000.0, 1) for v in envelope.values()],
+        (translate("Max stress (MPa)", persian)): [round(v['stress'], 1) for v in envelope.values()],
+        (translate("Governing case", persian)): [v['case'] for v in envelope.values()],
+    }, hide_index=True, use_container_width=True)
+    st.caption(
+        translate("{0} load cases, {1:,} DOFs; unfactored characteristic loads", persian).format(loads.shape[1], frame.n_dof)
+    )
+    st.session_state.member_envelope = envelope
+
+    st.markdown("---")
+    st.subheader(translate("🧮 Factored Load Combinations", persian))
+    st.caption(
+        translate("ISO 17842 / EN 1990 ULS and seismic combinations over every cabin position and wind/seismic direction", persian)
+    )
+    combos = generate_combinations(load_partial_factors(), seismic=seismic_res is not None, sls=False)
+    wheel_effects = compute(wheel_action_effects, frame, {
+        'snow': snow_force * 1000.0,
+        'wind': wind_force * 1000.0,
+        'seismic_C': seismic_res['C'] if seismic_res else 0.0,
+        'seismic_Cv': seismic_res['C_v'] if seismic_res else 0.0,
+    }, patterns, passenger_mass)
+    combined = compute(combine, combos['factors'], wheel_effects['effects'],
+                       wheel_outputs(wheel_effects['outputs'], Y0=SERIES_FACTORS[SPINDLE_SERIES]['Y0']))
+    governing = governing_summary(combined, combos, wheel_effects['cases'], wheel_effects['directions_deg'])
+    quantities = ('bearing_radial', 'bearing_axial', 'bearing_static', 'foundation_V', 'foundation_H',
+                  'foundation_M', 'leg_reaction', 'leg_uplift')
+    shown = [q for q in quantities if q in governing] + \
+        [q for q in governing if q.endswith(('_tension', '_compression'))]
+
+    def _quantity_label(q):
+        if q in quantities:
+            return get_text(f'quantity_{q}', persian)
+        group, kind = q.rsplit('_', 1)
+        return get_text(f'member_{kind}', persian).format(member=get_text(f'member_{group}', persian))
+
+    st.dataframe({
+        (translate("Quantity", persian)): [_quantity_label(q) for q in shown],
+        (translate("Design value (kN)", persian)): [round(governing[q]['value'] / 1000.0, 1) for q in shown],
+        (translate("Governing combination", persian)): [governing[q]['combination'] for q in shown],
+        (translate("Wheel case", persian)): [governing[q]['case'] for q in shown],
+        (translate("Direction (°)", persian)): [governing[q]['direction_deg'] for q in shown],
+    }, hide_index=True, use_container_width=True)
+    st.caption(
+        translate("{0} combinations × {1} wheel cases × {2} directions; direction measured from the "
+                  "wheel-plane normal", persian).format(len(combos['names']), len(wheel_effects['cases']), len(wheel_effects['directions_deg']))
+    )
+    st.session_state.load_combinations = governing
+
+    st.markdown("---")
+    st.subheader(translate("🏗️ Foundation Checks", persian))
+    st.caption(
+        translate("Overturning, sliding and bearing pressure under every factored combination, wheel position and direction", persian)
+    )
+    selected_soil = st.session_state.get('soil_type') or 'Type II'
+    footprint = leg_footprint(frame.model)
+    overturning = overturning_check(foundation_load_sets(combos, wheel_effects), footprint)
+    pad_loads = foundation_load_sets(combos, wheel_effects, per_leg=True)
+    pads = compute(size_leg_pads, pad_loads, (2.0, 2.0))
+    pad = pads[selected_soil]
+
+    fcol1, fcol2, fcol3 = st.columns(3)
+    with fcol1:
+        st.metric(
+            translate("Overturning safety factor", persian),
+            f"{overturning['factor']:.2f}",
+            delta="OK" if overturning['passes'] else (translate("Fail", persian)),
+            delta_color="normal" if overturning['passes'] else "inverse"
+        )
+        st.caption(
+            f"{translate('Overturning', persian)}: {overturning['moment'] / 1000.0:,.0f} kN·m / "
+            f"{translate('stabilising', persian)}: {overturning['stabilising'] / 1000.0:,.0f} kN·m"
+        )
+    with fcol2:
+        st.metric(
+            translate("Leg pad (L × B × D)", persian),
+            f"{pad['length']:.2f} × {pad['width']:.2f} × {pad['depth']:.2f} m"
+        )
+    with fcol3:
+        st.metric(
+            translate("Concrete volume (4 pads)", persian),
+            f"{4 * pad['volume']:.1f} m³"
+        )
+    if not pad['feasible']:
+        st.error(
+            translate("No pad size within the search range passes all checks; consider a mat or piled foundation.", persian)
+        )
+    st.dataframe({
+        (translate("Soil type", persian)): list(pads),
+        (translate("Allowable bearing (kPa)", persian)): [SOIL_PROPERTIES[s]['bearing'] for s in pads],
+        (translate("L × B × D (m)", persian)): [f"{p['length']:.2f} × {p['width']:.2f} × {p['depth']:.2f}" for p in pads.values()],
+        (translate("Volume per pad (m³)", persian)): [round(p['volume'], 1) for p in pads.values()],
+        (translate("Overturning", persian)): [round(p['utilisation']['overturning'], 2) for p in pads.values()],
+        (translate("Sliding", persian)): [round(p['utilisation']['sliding'], 2) for p in pads.values()],
+        (translate("Bearing", persian)): [round(p['utilisation']['bearing'], 2) for p in pads.values()],
+    }, hide_index=True, use_container_width=True)
+    st.caption(
+        translate("Minimum-volume pad per soil type (utilisation ≤ 1 passes); selected soil: "
+                  "{selected_soil}. Safety factors 1.5 on overturning and sliding, effective-area bearing "
+                  "pressure.", persian).format(selected_soil=selected_soil)
+    )
+    st.session_state.foundation_design = {'overturning': overturning, 'pad': pad, 'soil_type': selected_soil}
+
+    st.markdown("---")
+    st.subheader(translate("🌀 Vortex-Shedding Screening", persian))
+    st.caption(
+        translate("Strouhal lock-in of tubular members (own bending mode) and cylindrical cabins (global wheel modes) up to 1.25 × maximum wind speed", persian)
+    )
+    max_wind_ms = float(st.session_state.environment_data.get('wind_max', 108)) / 3.6
+    global_freqs = modes['frequencies'][modes['mass_fraction'].max(axis=1) >= 0.01]
+    breakdown = power_data['breakdown']
+    vortex = screen(merge_rows(
+        wheel_members(frame.model),
+        cabin_cylinder(st.session_state.get('cabin_geometry') or 'Square', st.session_state.cabin_capacity, diameter,
+                       (breakdown['mass_cabins'] + breakdown['mass_passengers']) / n_cab, global_freqs),
+    ), max_wind_ms)
+    vortex_labels = [get_text(f'member_{n}', persian) for n in vortex['names']]
+    st.dataframe({
+        (translate("Member", persian)): vortex_labels,
+        (translate("Diameter (m)", persian)): np.round(vortex['diameter'], 2),
+        (translate("Frequency (Hz)", persian)): np.round(vortex['frequency'], 2),
+        (translate("Critical speed (m/s)", persian)): np.round(vortex['critical_speed'], 1),
+        (translate("Scruton number", persian)): np.round(vortex['scruton'], 1),
+        (translate("Lock-in ranges (m/s)", persian)): [
+            ", ".join(f"{a:.1f}-{b:.1f}" for a, b in r) or "-" for r in vortex['ranges']
+        ],
+        (translate("Status", persian)): [get_text(f'lockin_{x}', persian) for x in vortex['status']],
+    }, hide_index=True, use_container_width=True)
+    fig_vortex = go.Figure(go.Heatmap(
+        z=vortex['lock_in'].astype(int), x=vortex['speeds'], y=vortex_labels,
+        colorscale=[[0, '#e8f5e9'], [1, '#e53935']], showscale=False,
+        hovertemplate="%{y}: %{x:.1f} m/s<extra></extra>"
+    ))
+    fig_vortex.add_vline(x=max_wind_ms, line_dash="dash",
+                         annotation_text=translate("v_max", persian))
+    fig_vortex.update_layout(
+        xaxis_title=translate("Wind speed (m/s)", persian),
+        height=120 + 40 * len(vortex_labels), margin=dict(l=20, r=20, t=30, b=40)
+    )
+    st.plotly_chart(fig_vortex, use_container_width=True)
+    st.session_state.vortex_screening = {
+        n: {'critical_speed': float(v), 'status': str(x)}
+        for n, v, x in zip(vortex['names'], vortex['critical_speed'], vortex['status'])
+    }
+
     st.session_state.environmental_loads = {
         'snow_force': snow_force, 'wind_force': wind_force,
         'earthquake_force_h': earthquake_force_h, 'earthquake_force_v': earthquake_force_v,
@@ -3459,21 +2969,20 @@ elif st.session_state.step == 10:
     
     st.markdown("---")
     st.success(
-        "✅ Environmental loads calculated. These will be used for bearing selection in the next step." if not persian else
-        "✅ بارهای محیطی محاسبه شدند. این مقادیر در مرحله بعد برای انتخاب یاتاقان استفاده می‌شوند."
+        translate("✅ Environmental loads calculated. These will be used for bearing selection in the next step.", persian)
     )
     
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with right_col:
-        st.button("Next ➡️" if not persian else "بعدی ➡️", on_click=validate_current_step_and_next)
+        st.button(translate("Next ➡️", persian), on_click=validate_current_step_and_next)
 
 
 # === STEP 11: bearing selection ===
 elif st.session_state.step == 11:
-    st.header("⚙️ Bearing Selection" if not persian else "⚙️ انتخاب یاتاقان")
-    st.caption("Based on SKF Spherical Roller Bearings Catalog" if not persian else "بر اساس کاتالوگ یاتاقان‌های غلتکی کروی SKF")
+    st.header(translate("⚙️ Bearing Selection", persian))
+    st.caption(translate("Based on SKF Spherical Roller Bearings Catalog", persian))
     st.markdown("---")
     
     diameter = st.session_state.diameter
@@ -3481,166 +2990,298 @@ elif st.session_state.step == 11:
     env_loads = st.session_state.get('environmental_loads', {})
     num_cabins = st.session_state.num_cabins
     cabin_capacity = st.session_state.cabin_capacity
-    cabin_mass = cabin_capacity * 75
+    mass_breakdown = calculate_motor_power(
+        diameter, num_cabins, cabin_capacity, st.session_state.num_vip_cabins,
+        st.session_state.rotation_time_min, st.session_state.cabin_geometry
+    )['breakdown']
+    cabin_mass = round(mass_breakdown['mass_per_cabin'] + cabin_capacity * 80.0)  # loaded cabin, kg
     
     snow_force = env_loads.get('snow_force', 0) * 1000
     wind_force = env_loads.get('wind_force', 0) * 1000
     eq_force_h = env_loads.get('earthquake_force_h', 0) * 1000
     eq_force_v = env_loads.get('earthquake_force_v', 0) * 1000
     
-    st.subheader("📊 Load Summary" if not persian else "📊 خلاصه بارها")
+    st.subheader(translate("📊 Load Summary", persian))
     
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Wheel Diameter" if not persian else "قطر چرخ", f"{diameter} m")
-        st.metric("Number of Cabins" if not persian else "تعداد کابین‌ها", num_cabins)
+        st.metric(translate("Wheel Diameter", persian), f"{diameter} m")
+        st.metric(translate("Number of Cabins", persian), num_cabins)
     with col2:
-        st.metric("Cabin Mass" if not persian else "جرم کابین", f"{cabin_mass} kg")
-        st.metric("Total Cabin Mass" if not persian else "جرم کل کابین‌ها", f"{cabin_mass * num_cabins / 1000:.1f} tons")
+        st.metric(translate("Cabin Mass", persian), f"{cabin_mass} kg")
+        st.metric(translate("Total Cabin Mass", persian), f"{cabin_mass * num_cabins / 1000:.1f} tons")
     with col3:
         total_env_force = np.sqrt((wind_force + eq_force_h)**2 + (snow_force + eq_force_v)**2)
-        st.metric("Total Env. Force" if not persian else "نیروی محیطی کل", f"{total_env_force/1000:.2f} kN")
+        st.metric(translate("Total Env. Force", persian), f"{total_env_force/1000:.2f} kN")
     
     st.markdown("---")
     
-    st.subheader("🔄 Cabin Swing Axle Bearings" if not persian else "🔄 یاتاقان محور چرخش کابین")
+    st.subheader(translate("🔄 Cabin Swing Axle Bearings", persian))
     st.caption("Spherical Plain Bearings (Maintenance-Free) - Angular Contact Type")
     
-    st.markdown("""
+    st.markdown(translate("""
     **Application:** Cabin pivot points allowing free rotation
     - **Type:** Maintenance-free spherical plain bearings (GAC..F series)
     - **Material:** Steel/PTFE composite sliding surface
     - **Lubrication:** Maintenance-free (lifetime lubrication)
     - **Function:** Allows cabin to remain upright during wheel rotation
-    """ if not persian else """
-    **کاربرد:** نقاط محوری کابین برای چرخش آزاد
-    - **نوع:** یاتاقان‌های ساده کروی بدون نیاز به نگهداری (سری GAC..F)
-    - **جنس:** سطح لغزنده مرکب فولاد/PTFE
-    - **روغنکاری:** بدون نیاز به نگهداری (روغنکاری مادام‌العمر)
-    - **عملکرد:** اجازه می‌دهد کابین در حین چرخش چرخ عمودی بماند
-    """)
+    """, persian))
     
-    cabin_bearing_load = cabin_mass * 9.81 * 1.5
+    bearing_loads = calculate_bearing_loads(
+        mass_breakdown['mass_rotating'], cabin_mass, snow_force, wind_force, eq_force_h, eq_force_v
+    )
+    cabin_bearing_load = bearing_loads['cabin_bearing_load']
     st.info(
-        f"**Required Load Capacity per Cabin Bearing:** {cabin_bearing_load/1000:.2f} kN" if not persian else
-        f"**ظرفیت بار لازم برای هر یاتاقان کابین:** {cabin_bearing_load/1000:.2f} kN"
+        translate("**Required Load Capacity per Cabin Bearing:** {0:.2f} kN", persian).format(cabin_bearing_load / 1000)
     )
     
-    cabin_bearing_options = [
-        {"designation": "GAC 25 F", "d": 25, "D": 47, "C": 21.6, "C0": 34.5},
-        {"designation": "GAC 30 F", "d": 30, "D": 55, "C": 27, "C0": 43},
-        {"designation": "GAC 35 F", "d": 35, "D": 62, "C": 32.5, "C0": 52},
-        {"designation": "GAC 40 F", "d": 40, "D": 68, "C": 39, "C0": 62},
-        {"designation": "GAC 45 F", "d": 45, "D": 75, "C": 45.5, "C0": 73.5},
-        {"designation": "GAC 50 F", "d": 50, "D": 80, "C": 53, "C0": 85},
-        {"designation": "GAC 55 F", "d": 55, "D": 90, "C": 53, "C0": 85},
-        {"designation": "GAC 60 F", "d": 60, "D": 95, "C": 63, "C0": 100},
-    ]
-    
+    bearing_catalogue = load_bearing_catalogue()
     required_C0 = cabin_bearing_load / 1000
-    suitable_cabin_bearings = [b for b in cabin_bearing_options if b['C0'] > required_C0 * 1.2]
+    selected_cabin_bearing = bearing_catalogue.record(
+        bearing_catalogue.select('C0', bearing_loads['required_C0'], series=CABIN_SERIES)
+    )
     
-    if suitable_cabin_bearings:
-        selected_cabin_bearing = suitable_cabin_bearings[0]
+    if selected_cabin_bearing:
         st.success(f"""
-        **{'Selected Cabin Bearing' if not persian else 'یاتاقان کابین انتخاب‌شده'}:** {selected_cabin_bearing['designation']}
-        - {'Bore diameter (d)' if not persian else 'قطر داخلی (d)'}: {selected_cabin_bearing['d']} mm
-        - {'Outer diameter (D)' if not persian else 'قطر خارجی (D)'}: {selected_cabin_bearing['D']} mm
-        - {'Static load rating (C₀)' if not persian else 'ظرفیت بار استاتیکی (C₀)'}: {selected_cabin_bearing['C0']} kN
-        - {'Safety factor' if not persian else 'ضریب اطمینان'}: {selected_cabin_bearing['C0'] / required_C0:.2f}
+        **{translate('Selected Cabin Bearing', persian)}:** {selected_cabin_bearing['designation']}
+        - {translate('Bore diameter (d)', persian)}: {selected_cabin_bearing['d']} mm
+        - {translate('Outer diameter (D)', persian)}: {selected_cabin_bearing['D']} mm
+        - {translate('Static load rating (C₀)', persian)}: {selected_cabin_bearing['C0']} kN
+        - {translate('Safety factor', persian)}: {selected_cabin_bearing['C0'] / required_C0:.2f}
         """)
         st.session_state.cabin_bearing = selected_cabin_bearing
     else:
-        st.error("No suitable bearing found in standard range. Custom bearing required." if not persian else
-                 "یاتاقان مناسبی در محدوده استاندارد یافت نشد. یاتاقان سفارشی لازم است.")
+        st.error(translate("No suitable bearing found in standard range. Custom bearing required.", persian))
         st.session_state.cabin_bearing = None
     
     st.markdown("---")
     
-    st.subheader("🎯 Main Spindle Bearings" if not persian else "🎯 یاتاقان محور اصلی")
+    st.subheader(translate("🎯 Main Spindle Bearings", persian))
     st.caption("Spherical Roller Bearings (Tapered Bore) - Heavy Duty")
     
-    st.markdown("""
+    st.markdown(translate("""
     **Application:** Main wheel rotation axis
     - **Type:** Spherical roller bearings with tapered bore (for easy mounting)
     - **Series:** 222xx, 223xx, 230xx, 231xx (depending on load)
     - **Features:** Self-aligning, high load capacity, suitable for heavy radial and axial loads
     - **Mounting:** On tapered shaft/adapter sleeve
-    """ if not persian else """
-    **کاربرد:** محور چرخش اصلی چرخ
-    - **نوع:** یاتاقان‌های غلتکی کروی با سوراخ مخروطی (برای نصب آسان)
-    - **سری:** 222xx، 223xx، 230xx، 231xx (بسته به بار)
-    - **ویژگی‌ها:** خودتنظیم، ظرفیت بار بالا، مناسب برای بارهای شعاعی و محوری سنگین
-    - **نصب:** روی شفت مخروطی یا آستین آداپتور
-    """)
+    """, persian))
     
-    total_wheel_mass = (diameter * 1000 + cabin_mass * num_cabins + diameter * 500)
-    radial_load = total_wheel_mass * 9.81
-    total_radial_load = np.sqrt(radial_load**2 + (wind_force + eq_force_h)**2)
-    axial_load = snow_force + eq_force_v + radial_load * 0.1
-    equivalent_load = total_radial_load + 1.5 * axial_load
+    total_wheel_mass = mass_breakdown['mass_rotating']
+    total_radial_load = bearing_loads['total_radial_load']
+    axial_load = bearing_loads['axial_load']
+    equivalent_load = bearing_loads['equivalent_load']
     
     st.info(f"""
-    **{'Main Bearing Load Analysis' if not persian else 'تحلیل بار یاتاقان اصلی'}:**
-    - {'Total Wheel Mass' if not persian else 'جرم کل چرخ'}: {total_wheel_mass/1000:.1f} tons
-    - {'Radial Load' if not persian else 'بار شعاعی'}: {total_radial_load/1000:.2f} kN
-    - {'Axial Load' if not persian else 'بار محوری'}: {axial_load/1000:.2f} kN
-    - {'Equivalent Dynamic Load' if not persian else 'بار دینامیکی معادل'}: {equivalent_load/1000:.2f} kN
+    **{translate('Main Bearing Load Analysis', persian)}:**
+    - {translate('Total Wheel Mass', persian)}: {total_wheel_mass/1000:.1f} tons
+    - {translate('Radial Load', persian)}: {total_radial_load/1000:.2f} kN
+    - {translate('Axial Load', persian)}: {axial_load/1000:.2f} kN
+    - {translate('Equivalent Dynamic Load', persian)}: {equivalent_load/1000:.2f} kN
     """)
     
-    spindle_bearing_options = [
-        {"designation": "23030 CCK/W33", "d": 150, "D": 225, "C": 531, "C0": 750},
-        {"designation": "23032 CCK/W33", "d": 160, "D": 240, "C": 614, "C0": 880},
-        {"designation": "23034 CCK/W33", "d": 170, "D": 260, "C": 745, "C0": 1060},
-        {"designation": "23036 CCK/W33", "d": 180, "D": 280, "C": 883, "C0": 1250},
-        {"designation": "23038 CC/W33", "d": 190, "D": 290, "C": 916, "C0": 1340},
-        {"designation": "23040 CC/W33", "d": 200, "D": 310, "C": 1058, "C0": 1530},
-        {"designation": "23044 CC/W33", "d": 220, "D": 340, "C": 1261, "C0": 1860},
-        {"designation": "23048 CC/W33", "d": 240, "D": 360, "C": 1340, "C0": 2080},
-        {"designation": "23052 CC/W33", "d": 260, "D": 400, "C": 1675, "C0": 2550},
-        {"designation": "23056 CC/W33", "d": 280, "D": 420, "C": 1797, "C0": 2850},
-        {"designation": "23060 CC/W33", "d": 300, "D": 460, "C": 2219, "C0": 3450},
-    ]
-    
-    required_C = (equivalent_load / 1000) * 1.5
-    suitable_spindle_bearings = [b for b in spindle_bearing_options if b['C'] > required_C]
+    required_C = bearing_loads['required_C']
+    selected_spindle_bearing = bearing_catalogue.record(
+        bearing_catalogue.select('C', required_C, series=SPINDLE_SERIES)
+    )
+
+    # Static check against the governing factored combination from Step 10 (C₀ ≥ P₀)
+    governing = st.session_state.get('load_combinations')
+    if governing and 'bearing_static' in governing and selected_spindle_bearing:
+        static_load = governing['bearing_static']['value'] / 1000.0
+        if selected_spindle_bearing['C0'] < static_load:
+            upgraded = bearing_catalogue.record(bearing_catalogue.select('C0', static_load, series=SPINDLE_SERIES))
+            if upgraded:
+                selected_spindle_bearing = upgraded
+            else:
+                st.warning(
+                    translate("No bearing in the series reaches the governing static load; keeping the dynamic selection.", persian)
+                )
+        st.caption(
+            translate("Governing static load P₀ = {static_load:.1f} kN ({0}, {1})", persian).format(governing['bearing_static']['combination'], governing['bearing_static']['case'], static_load=static_load)
+        )
     
-    if suitable_spindle_bearings:
-        selected_spindle_bearing = suitable_spindle_bearings[0]
+    if selected_spindle_bearing:
         st.success(f"""
-        **{'Selected Main Spindle Bearing' if not persian else 'یاتاقان محور اصلی انتخاب‌شده'}:** {selected_spindle_bearing['designation']}
-        - {'Bore diameter (d)' if not persian else 'قطر داخلی (d)'}: {selected_spindle_bearing['d']} mm
-        - {'Outer diameter (D)' if not persian else 'قطر خارجی (D)'}: {selected_spindle_bearing['D']} mm
-        - {'Dynamic load rating (C)' if not persian else 'ظرفیت بار دینامیکی (C)'}: {selected_spindle_bearing['C']} kN
-        - {'Static load rating (C₀)' if not persian else 'ظرفیت بار استاتیکی (C₀)'}: {selected_spindle_bearing['C0']} kN
-        - {'Safety factor' if not persian else 'ضریب اطمینان'}: {selected_spindle_bearing['C'] / (equivalent_load/1000):.2f}
-        - **{'Recommended Quantity' if not persian else 'تعداد پیشنهادی'}:** {'2 bearings (one on each side of spindle)' if not persian else '۲ یاتاقان (یکی در هر طرف محور)'}
+        **{translate('Selected Main Spindle Bearing', persian)}:** {selected_spindle_bearing['designation']}
+        - {translate('Bore diameter (d)', persian)}: {selected_spindle_bearing['d']} mm
+        - {translate('Outer diameter (D)', persian)}: {selected_spindle_bearing['D']} mm
+        - {translate('Dynamic load rating (C)', persian)}: {selected_spindle_bearing['C']} kN
+        - {translate('Static load rating (C₀)', persian)}: {selected_spindle_bearing['C0']} kN
+        - {translate('Safety factor', persian)}: {selected_spindle_bearing['C'] / (equivalent_load/1000):.2f}
+        - **{translate('Recommended Quantity', persian)}:** {translate('2 bearings (one on each side of spindle)', persian)}
         """)
-        st.info("""
+        st.info(translate("""
         **Mounting Recommendations:**
         - Use tapered adapter sleeve for easy mounting/dismounting
         - Apply proper preload to prevent bearing slip
         - Use shaft tolerance h6 or h7
         - Housing tolerance H7 or H8
         - Ensure proper alignment during installation
-        """ if not persian else """
-        **توصیه‌های نصب:**
-        - از آستین آداپتور مخروطی برای نصب/جداسازی آسان استفاده کنید
-        - پیش‌بار مناسب برای جلوگیری از لغزش یاتاقان اعمال کنید
-        - تلرانس شفت h6 یا h7
-        - تلرانس مجاری H7 یا H8
-        - از تراز بودن صحیح در هنگام نصب اطمینان حاصل کنید
-        """)
+        """, persian))
         st.session_state.spindle_bearing = selected_spindle_bearing
     else:
-        st.error("No suitable bearing found in standard range. Consult SKF for custom solution." if not persian else
-                 "یاتاقان مناسبی در محدوده استاندارد یافت نشد. برای راه‌حل سفارشی با SKF مشورت کنید.")
+        st.error(translate("No suitable bearing found in standard range. Consult SKF for custom solution.", persian))
         st.session_state.spindle_bearing = None
-    
+
     st.markdown("---")
-    st.subheader("📐 Bearing Arrangement Diagram" if not persian else "📐 نمودار چیدمان یاتاقان")
+    st.subheader(translate("⏱️ Main Bearing Rating Life (ISO 281)", persian))
+    st.caption(
+        translate("Load spectrum from occupancy, Step 10 wind/seismic cases and Step 4 rotation speed", persian)
+    )
+
+    life_col1, life_col2, life_col3 = st.columns(3)
+    with life_col1:
+        target_life_h = st.number_input(
+            translate("Target Life L10h (hours)", persian),
+            min_value=1000, max_value=500000,
+            value=int(st.session_state.get('target_bearing_life', 50000)),
+            step=5000, key="target_life_input"
+        )
+        st.session_state.target_bearing_life = target_life_h
+    with life_col2:
+        reliability = st.selectbox(
+            translate("Reliability (%)", persian),
+            options=[90, 95, 96, 97, 98, 99], index=0, key="bearing_reliability_select"
+        )
+    with life_col3:
+        wind_time_share = st.number_input(
+            translate("Operating time in design wind (%)", persian),
+            min_value=0.0, max_value=99.0, value=10.0, step=1.0, key="wind_time_share_input"
+        )
+
+    rotation_time_min = st.session_state.rotation_time_min or 0
+    _, spindle_rpm, _ = calc_ang_rpm_linear_from_rotation_time(rotation_time_min, diameter)
+    env_cases = []
+    if wind_force > 0:
+        env_cases.append({'horizontal': wind_force, 'vertical': snow_force, 'fraction': wind_time_share / 100.0})
+    if eq_force_h > 0 or eq_force_v > 0:
+        env_cases.append({'horizontal': eq_force_h, 'vertical': snow_force + eq_force_v, 'fraction': 1e-4})
+    load_spectrum = build_spindle_load_spectrum(
+        base_mass=mass_breakdown['mass_rotating'] - mass_breakdown['mass_passengers'],
+        passenger_mass=mass_breakdown['mass_passengers'],
+        occupancy=[(0.0, 0.2), (0.5, 0.5), (1.0, 0.3)],
+        env_cases=env_cases, rpm=spindle_rpm
+    )
+    life_row, life_table = lightest_for_life(load_spectrum, target_life_h, catalogue=bearing_catalogue,
+                                             reliability=reliability)
+
+    life_df = bearing_catalogue.frame.iloc[life_table['rows']][['designation', 'd', 'D', 'C']].copy()
+    life_df['L10h'] = np.round(life_table['L10h'], 0)
+    life_df['Lnmh'] = np.round(life_table['Lnmh'], 0)
+    st.dataframe(life_df, hide_index=True, use_container_width=True)
+
+    life_bearing = bearing_catalogue.record(life_row)
+    if life_bearing:
+        st.success(
+            translate("**Lightest bearing meeting {target_life_h:,} h:** {0}", persian).format(life_bearing['designation'], target_life_h=target_life_h)
+        )
+        current = st.session_state.get('spindle_bearing')
+        # Only upgrade a selection that passed the static/dynamic margin check above
+        if current is not None and life_bearing['C'] > current['C']:
+            st.session_state.spindle_bearing = life_bearing
+            st.warning(
+                translate("Rating life governs: main spindle bearing upgraded to {0}", persian).format(life_bearing['designation'])
+            )
+    else:
+        st.error(translate("No catalogue bearing reaches the target life.", persian))
+
+    st.markdown("---")
+    st.subheader(translate("🔁 Spindle & Rim Fatigue (EN 1993-1-9)", persian))
+    st.caption(
+        translate("Rainflow counting of simulated load-time histories with Miner's rule", persian)
+    )
+    with st.expander(translate("Fatigue analysis settings", persian)):
+        fat_col1, fat_col2, fat_col3 = st.columns(3)
+        with fat_col1:
+            sim_years = st.number_input(translate("Simulated years", persian),
+                                        min_value=0.1, max_value=10.0, value=1.0, step=0.1, key="fatigue_sim_years")
+            design_years = st.number_input(translate("Design life (years)", persian),
+                                           min_value=1, max_value=100, value=25, step=1, key="fatigue_design_years")
+        with fat_col2:
+            detail_category = st.selectbox(translate("Detail category Δσc (MPa)", persian),
+                                           options=[36, 40, 45, 50, 56, 63, 71, 80, 90, 100, 112, 125, 140, 160],
+                                           index=6, key="fatigue_detail_category")
+            site_mean_wind = st.number_input(translate("Annual mean wind speed (m/s)", persian),
+                                             min_value=0.5, max_value=20.0, value=4.0, step=0.5, key="fatigue_mean_wind")
+        with fat_col3:
+            lever_arm = st.number_input(translate("Spindle lever arm (m)", persian),
+                                        min_value=0.05, max_value=3.0, value=0.5, step=0.05, key="fatigue_lever_arm")
+            rim_area_cm2 = st.number_input(translate("Rim member area (cm²)", persian),
+                                           min_value=5.0, max_value=500.0, value=40.0, step=5.0, key="fatigue_rim_area")
+
+    if st.button(translate("▶️ Run Fatigue Analysis", persian), key="run_fatigue_btn"):
+        # One fatigue job per session: a new run replaces the pending one instead of orphaning it
+        previous_job = st.session_state.get('fatigue_job') or st.query_params.get('fatigue_job')
+        if previous_job and default_jobs().cancel(previous_job):
+            st.session_state.fatigue_message = translate("The previous fatigue analysis was cancelled and replaced.", persian)
+        spindle_for_fatigue = st.session_state.get('spindle_bearing') or {'d': 200}
+        shaft_diameter = spindle_for_fatigue['d'] / 1000.0
+        rim_influence = 2.0 / max(num_cabins, 1)
+        job_id = default_jobs().submit(
+            run_fatigue_analysis, sim_years, spindle_rpm,
+            mass_breakdown['mass_rotating'] - mass_breakdown['mass_passengers'],
+            mass_breakdown['mass_passengers'], site_mean_wind, diameter, lever_arm,
+            shaft_diameter, rim_area_cm2 / 1e4, rim_influence, detail_category, design_years,
+            kind='fatigue', owner=session_id
+        )
+        # The id is also kept in the URL, so a reloaded page finds the running job again
+        st.session_state.fatigue_job = job_id
+        st.query_params['fatigue_job'] = job_id
+
+    pending_job = st.session_state.get('fatigue_job') or st.query_params.get('fatigue_job')
+
+    # Polls once a second only while a job is pending
+    @st.experimental_fragment(run_every=1.0 if pending_job else None)
+    def fatigue_job_panel():
+        job_id = st.session_state.get('fatigue_job') or st.query_params.get('fatigue_job')
+        job = default_jobs().status(job_id) if job_id else None
+        if job is None:
+            return
+        if job['state'] in (DONE, FAILED, CANCELLED, INTERRUPTED):
+            st.session_state.pop('fatigue_job', None)
+            if 'fatigue_job' in st.query_params:
+                del st.query_params['fatigue_job']
+            if job['state'] == DONE:
+                st.session_state.fatigue_results = job['result']
+            elif job['state'] == FAILED:
+                st.session_state.fatigue_message = translate("Fatigue analysis failed: {0}", persian).format(job.get('error', ''))
+            elif job['state'] == CANCELLED:
+                st.session_state.fatigue_message = translate("Fatigue analysis cancelled.", persian)
+            else:
+                st.session_state.fatigue_message = translate("Fatigue analysis was interrupted by a server restart; run it again.", persian)
+            st.rerun()
+        st.progress(job['progress'], text=translate("Counting cycles... {0}", persian).format(job.get('message', '')))
+        if job['partial']:
+            st.caption(
+                translate("Running estimate: spindle D ≈ {spindle:.3f}, rim D ≈ {rim:.3f}", persian).format(**job['partial'])
+            )
+        if st.button(translate("⏹️ Cancel", persian), key="cancel_fatigue_btn"):
+            default_jobs().cancel(job_id)
+
+    fatigue_job_panel()
+    if st.session_state.get('fatigue_message'):
+        st.warning(st.session_state.pop('fatigue_message'))
+
+    if st.session_state.get('fatigue_results'):
+        fat_res = st.session_state.fatigue_results
+        res_col1, res_col2 = st.columns(2)
+        for col, name, label in [(res_col1, 'spindle', translate("Main Spindle", persian)),
+                                 (res_col2, 'rim', translate("Rim Member", persian))]:
+            with col:
+                damage = fat_res[name]['damage']
+                st.metric(translate("{label} - Miner D", persian).format(label=label), f"{damage:.3f}")
+                st.caption(f"Δσ max: {fat_res[name]['max_range']:.1f} MPa · {fat_res[name]['cycles']:,.0f} cycles")
+                if damage <= 1.0:
+                    st.success("✅ D ≤ 1.0")
+                else:
+                    st.error("❌ D > 1.0")
+
+    st.markdown("---")
+    st.subheader(translate("📐 Bearing Arrangement Diagram", persian))
     
-    def create_bearing_diagram(diameter):
+    @memoize(maxsize=32)
+    def create_bearing_diagram(diameter, num_cabins, persian=False):
         import plotly.graph_objects as go
         fig = go.Figure()
         theta = np.linspace(0, 2*np.pi, 100)
@@ -3657,7 +3298,7 @@ elif st.session_state.step == 11:
                                      text=[f'Main Bearing\n({side})'],
                                      textposition='top center',
                                      name=f'Main Bearing {side}'))
-        num_cabins_show = min(8, st.session_state.num_cabins)
+        num_cabins_show = min(8, num_cabins)
         cabin_angles = np.linspace(0, 2*np.pi, num_cabins_show, endpoint=False)
         for i, angle in enumerate(cabin_angles):
             cabin_x = radius * np.cos(angle)
@@ -3673,51 +3314,39 @@ elif st.session_state.step == 11:
                          line=dict(color='lightblue', width=2),
                          fillcolor='rgba(173, 216, 230, 0.3)')
         fig.update_layout(
-            title='Bearing Locations on Ferris Wheel' if not persian else 'محل یاتاقان‌ها روی چرخ و فلک',
+            title=translate("Bearing Locations on Ferris Wheel", persian),
             xaxis=dict(scaleanchor='y', scaleratio=1, range=[-diameter*0.6, diameter*0.6], title='X (m)'),
             yaxis=dict(range=[-diameter*0.6, diameter*0.6], title='Y (m)'),
             height=600, showlegend=True
         )
         return fig
     
-    fig_bearings = create_bearing_diagram(diameter)
+    fig_bearings = create_bearing_diagram(diameter, num_cabins, persian)
     st.plotly_chart(fig_bearings, use_container_width=True)
     
-    st.caption("""
+    st.caption(translate("""
     **Legend:**
     - Red squares: Main spindle bearings (Spherical Roller, Tapered Bore)
     - Blue circles: Cabin swing bearings (Spherical Plain, Maintenance-Free)
     - Light blue boxes: Passenger cabins
-    """ if not persian else """
-    **راهنما:**
-    - مربع‌های قرمز: یاتاقان‌های محور اصلی (غلتکی کروی، سوراخ مخروطی)
-    - دایره‌های آبی: یاتاقان‌های چرخش کابین (ساده کروی، بدون نگهداری)
-    - جعبه‌های آبی روشن: کابین‌های مسافری
-    """)
+    """, persian))
     
     st.markdown("---")
-    st.subheader("🔧 Maintenance Recommendations" if not persian else "🔧 توصیه‌های نگهداری")
+    st.subheader(translate("🔧 Maintenance Recommendations", persian))
     
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown("""
+        st.markdown(translate("""
         **Cabin Bearings (Maintenance-Free):**
         - ✅ No relubrication required
         - ✅ Sealed design protects against contamination
         - 🔍 Visual inspection: Every 6 months
         - 🔍 Check for wear/play: Annually
         - 🔄 Typical service life: 10-15 years
-        """ if not persian else """
-        **یاتاقان‌های کابین (بدون نگهداری):**
-        - ✅ نیازی به روغنکاری مجدد نیست
-        - ✅ طراحی مهر و موم‌شده در برابر آلودگی محافظت می‌کند
-        - 🔍 بازرسی بصری: هر ۶ ماه یک‌بار
-        - 🔍 بررسی سایش/لقی: سالانه
-        - 🔄 عمر سرویس معمول: ۱۰ تا ۱۵ سال
-        """)
+        """, persian))
     
     with col2:
-        st.markdown("""
+        st.markdown(translate("""
         **Main Spindle Bearings:**
         - 🔧 Relubrication: Every 500-1000 operating hours
         - 🔧 Use lithium-based grease (NLGI Grade 2)
@@ -3725,50 +3354,34 @@ elif st.session_state.step == 11:
         - 🔍 Temperature monitoring: Continuous
         - 🔍 Detailed inspection: Annually
         - 🔄 Typical service life: 30,000-50,000 hours
-        """ if not persian else """
-        **یاتاقان‌های محور اصلی:**
-        - 🔧 روغنکاری مجدد: هر ۵۰۰ تا ۱۰۰۰ ساعت کارکرد
-        - 🔧 از گریس پایه لیتیوم (درجه NLGI 2) استفاده کنید
-        - 🔍 پایش ارتعاش: ماهانه
-        - 🔍 پایش دما: مداوم
-        - 🔍 بازرسی دقیق: سالانه
-        - 🔄 عمر سرویس معمول: ۳۰٬۰۰۰ تا ۵۰٬۰۰۰ ساعت
-        """)
+        """, persian))
     
-    st.info("""
+    st.info(translate("""
     **Critical Safety Note:**
     - All bearing replacements must be performed by qualified personnel
     - Follow SKF installation procedures exactly
     - Verify proper alignment and preload after installation
     - Document all maintenance activities
     - Replace bearings showing any signs of wear, damage, or excessive play
-    """ if not persian else """
-    **نکته ایمنی مهم:**
-    - تمام تعویض‌های یاتاقان باید توسط پرسنل واجد شرایط انجام شود
-    - دستورالعمل‌های نصب SKF را دقیقاً رعایت کنید
-    - پس از نصب، تراز بودن و پیش‌بار صحیح را تأیید کنید
-    - تمام فعالیت‌های نگهداری را مستند کنید
-    - یاتاقان‌هایی که هرگونه علائم سایش، آسیب یا لقی بیش از حد دارند را تعویض کنید
-    """)
+    """, persian))
     
     st.markdown("---")
     st.success(
-        "✅ Bearing selection complete. Proceed to restraint system requirements." if not persian else
-        "✅ انتخاب یاتاقان کامل شد. به مرحله الزامات سیستم مهاربند بروید."
+        translate("✅ Bearing selection complete. Proceed to restraint system requirements.", persian)
     )
     
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with right_col:
-        st.button("Next ➡️" if not persian else "بعدی ➡️", on_click=validate_current_step_and_next)
+        st.button(translate("Next ➡️", persian), on_click=validate_current_step_and_next)
 
 
 # === STEP 12: Restraint Type ===
 elif st.session_state.step == 12:
     st.header(get_text('restraint_type', persian))
     st.image("assets/Axis_Guide.jpg",
-            caption="Axis Guide" if not persian else "راهنمای محورها",
+            caption=translate("Axis Guide", persian),
             width=500)
     st.markdown("**ISO 17842-2023 & AS 3533.1-2009+A1-2011**")
     st.markdown("---")
@@ -3781,27 +3394,27 @@ elif st.session_state.step == 12:
     snow_load = classification_data.get('snow_load', 0.0)
     wind_load = classification_data.get('wind_load', 0.0)
     earthquake_load = classification_data.get('earthquake_load', 0.0)
+    wheel_mass = calculate_motor_power(
+        diameter, st.session_state.num_cabins, st.session_state.cabin_capacity, st.session_state.num_vip_cabins,
+        st.session_state.rotation_time_min, st.session_state.cabin_geometry
+    )['breakdown']['mass_rotating']
     
-    st.subheader("Passenger Acceleration Analysis" if not persian else "تحلیل شتاب مسافران")
+    st.subheader(translate("Passenger Acceleration Analysis", persian))
     
-    st.info(f"""**Design Parameters:**
+    st.info(translate("""**Design Parameters:**
 - Rotation Speed: {rpm_actual:.4f} rpm
 - Braking Acceleration: {braking_accel:.2f} m/s²
-- Diameter: {diameter} m""" if not persian else
-f"""**پارامترهای طراحی:**
-- سرعت چرخش: {rpm_actual:.4f} دور در دقیقه
-- شتاب ترمز: {braking_accel:.2f} m/s²
-- قطر: {diameter} متر""")
+- Diameter: {diameter} m""", persian).format(rpm_actual=rpm_actual, braking_accel=braking_accel, diameter=diameter))
     
     if any([snow_load > 0, wind_load > 0, earthquake_load > 0]):
-        st.info("**Active Additional Loads:**" if not persian else "**بارهای اضافی فعال:**")
+        st.info(translate("**Active Additional Loads:**", persian))
         load_info = []
         if snow_load > 0:
-            load_info.append(f"🌨️ {'Snow' if not persian else 'برف'}: {snow_load:.2f} kN")
+            load_info.append(f"🌨️ {translate('Snow', persian)}: {snow_load:.2f} kN")
         if wind_load > 0:
-            load_info.append(f"💨 {'Wind' if not persian else 'باد'}: {wind_load:.2f} kN")
+            load_info.append(f"💨 {translate('Wind', persian)}: {wind_load:.2f} kN")
         if earthquake_load > 0:
-            load_info.append(f"🌍 {'Earthquake' if not persian else 'زلزله'}: {earthquake_load:.2f} kN")
+            load_info.append(f"🌍 {translate('Earthquake', persian)}: {earthquake_load:.2f} kN")
         st.write(" | ".join(load_info))
         st.markdown("---")
     
@@ -3815,7 +3428,8 @@ f"""**پارامترهای طراحی:**
     
     for theta in theta_vals:
         a_x, a_z, _ = calculate_accelerations_at_angle(
-            theta, diameter, angular_velocity, braking_accel, snow_load, wind_load, earthquake_load
+            theta, diameter, angular_velocity, braking_accel, snow_load, wind_load, earthquake_load,
+            mass=wheel_mass
         )
         a_x_g = a_x / 9.81
         a_z_g = a_z / 9.81
@@ -3833,7 +3447,7 @@ f"""**پارامترهای طراحی:**
     zone_counts_as = Counter(restraint_zones_as)
     predominant_zone_as = zone_counts_as.most_common(1)[0][0]
     
-    st.markdown("**Acceleration Ranges:**" if not persian else "**محدوده شتاب‌ها:**")
+    st.markdown(translate("**Acceleration Ranges:**", persian))
     col1, col2, col3, col4 = st.columns(4)
     with col1: st.metric("Max ax", f"{max_ax:.3f}g")
     with col2: st.metric("Min ax", f"{min_ax:.3f}g")
@@ -3844,95 +3458,71 @@ f"""**پارامترهای طراحی:**
     
     st.subheader("📋 ISO 17842-2023 Analysis")
     restraint_descriptions_iso = {
-        1: "Zone 1 - Upper region: Maximum restraint required (full body harness)",
-        2: "Zone 2 - Upper-central: Enhanced restraint (over-shoulder restraint)",
-        3: "Zone 3 - Central edges: Standard restraint (lap bar or seat belt)",
-        4: "Zone 4 - Lower-central: Moderate restraint (seat belt with lap bar)",
-        5: "Zone 5 - Lower region: Special consideration required (enhanced harness system)"
-    } if not persian else {
-        1: "ناحیه ۱ - بالا: حداکثر مهاربند لازم است (بند کمربند تمام‌بدن)",
-        2: "ناحیه ۲ - بالا-مرکز: مهاربند تقویت‌شده (مهاربند روی شانه)",
-        3: "ناحیه ۳ - لبه‌های مرکزی: مهاربند استاندارد (میله جلوی پا یا کمربند ایمنی)",
-        4: "ناحیه ۴ - پایین-مرکز: مهاربند متوسط (کمربند ایمنی با میله جلوی پا)",
-        5: "ناحیه ۵ - پایین: نیاز به بررسی ویژه (سیستم بند تقویت‌شده)"
+        1: translate("Zone 1 - Upper region: Maximum restraint required (full body harness)", persian),
+        2: translate("Zone 2 - Upper-central: Enhanced restraint (over-shoulder restraint)", persian),
+        3: translate("Zone 3 - Central edges: Standard restraint (lap bar or seat belt)", persian),
+        4: translate("Zone 4 - Lower-central: Moderate restraint (seat belt with lap bar)", persian),
+        5: translate("Zone 5 - Lower region: Special consideration required (enhanced harness system)", persian)
     }
     
-    st.success(f"**{'Predominant Zone (ISO)' if not persian else 'ناحیه غالب (ISO)'}:** {predominant_zone_iso}")
-    st.info(f"**{'Recommended Restraint (ISO)' if not persian else 'مهاربند پیشنهادی (ISO)'}:** {restraint_descriptions_iso.get(predominant_zone_iso, 'Standard restraint')}")
+    st.success(f"**{translate('Predominant Zone (ISO)', persian)}:** {predominant_zone_iso}")
+    st.info(f"**{translate('Recommended Restraint (ISO)', persian)}:** {restraint_descriptions_iso.get(predominant_zone_iso, 'Standard restraint')}")
     
     st.markdown("---")
     st.subheader("📋 AS 3533.1-2009+A1-2011 Analysis")
     restraint_descriptions_as = {
-        1: "Zone 1 - Upper region: Maximum restraint required (full body harness)",
-        2: "Zone 2 - Upper-central: Enhanced restraint (over-shoulder restraint)",
-        3: "Zone 3 - Central region: Standard restraint (lap bar or seat belt)",
-        4: "Zone 4 - Lower-central: Moderate restraint (seat belt with lap bar)",
-        5: "Zone 5 - Lower region: Special consideration required (enhanced harness system)"
-    } if not persian else {
-        1: "ناحیه ۱ - بالا: حداکثر مهاربند لازم است (بند کمربند تمام‌بدن)",
-        2: "ناحیه ۲ - بالا-مرکز: مهاربند تقویت‌شده (مهاربند روی شانه)",
-        3: "ناحیه ۳ - مرکز: مهاربند استاندارد (میله جلوی پا یا کمربند ایمنی)",
-        4: "ناحیه ۴ - پایین-مرکز: مهاربند متوسط (کمربند ایمنی با میله جلوی پا)",
-        5: "ناحیه ۵ - پایین: نیاز به بررسی ویژه (سیستم بند تقویت‌شده)"
+        1: translate("Zone 1 - Upper region: Maximum restraint required (full body harness)", persian),
+        2: translate("Zone 2 - Upper-central: Enhanced restraint (over-shoulder restraint)", persian),
+        3: translate("Zone 3 - Central region: Standard restraint (lap bar or seat belt)", persian),
+        4: translate("Zone 4 - Lower-central: Moderate restraint (seat belt with lap bar)", persian),
+        5: translate("Zone 5 - Lower region: Special consideration required (enhanced harness system)", persian)
     }
     
-    st.success(f"**{'Predominant Zone (AS)' if not persian else 'ناحیه غالب (AS)'}:** {predominant_zone_as}")
-    st.info(f"**{'Recommended Restraint (AS)' if not persian else 'مهاربند پیشنهادی (AS)'}:** {restraint_descriptions_as.get(predominant_zone_as, 'Standard restraint')}")
+    st.success(f"**{translate('Predominant Zone (AS)', persian)}:** {predominant_zone_as}")
+    st.info(f"**{translate('Recommended Restraint (AS)', persian)}:** {restraint_descriptions_as.get(predominant_zone_as, 'Standard restraint')}")
     
     st.markdown("---")
     col_iso, col_as = st.columns(2)
     
     with col_iso:
         st.subheader("ISO 17842 Acceleration Envelope")
-        fig_accel_iso = plot_acceleration_envelope_iso(diameter, angular_velocity, braking_accel, snow_load, wind_load, earthquake_load)
+        fig_accel_iso = plot_acceleration_envelope_iso(diameter, angular_velocity, braking_accel, snow_load, wind_load, earthquake_load,
+                                                       mass=wheel_mass)
         st.plotly_chart(fig_accel_iso, use_container_width=True)
-        st.markdown("""
+        st.markdown(translate("""
         **ISO Zone Classifications:**
         - **Zone 1** (Purple): Maximum restraint
         - **Zone 2** (Orange): Enhanced restraint
         - **Zone 3** (Yellow): Standard restraint
         - **Zone 4** (Green): Moderate restraint
         - **Zone 5** (Red): Special consideration
-        """ if not persian else """
-        **طبقه‌بندی نواحی ISO:**
-        - **ناحیه ۱** (بنفش): حداکثر مهاربند
-        - **ناحیه ۲** (نارنجی): مهاربند تقویت‌شده
-        - **ناحیه ۳** (زرد): مهاربند استاندارد
-        - **ناحیه ۴** (سبز): مهاربند متوسط
-        - **ناحیه ۵** (قرمز): بررسی ویژه
-        """)
-        st.markdown("**📊 Points Distribution in Zones (ISO):**" if not persian else "**📊 توزیع نقاط در نواحی (ISO):**")
+        """, persian))
+        st.markdown(translate("**📊 Points Distribution in Zones (ISO):**", persian))
         total_points = len(restraint_zones_iso)
         for zone in sorted(zone_counts_iso.keys()):
             count = zone_counts_iso[zone]
             percentage = (count / total_points) * 100
-            st.write(f"- {'Zone' if not persian else 'ناحیه'} {zone}: {count} {'points' if not persian else 'نقطه'} ({percentage:.1f}%)")
+            st.write(f"- {translate('Zone', persian)} {zone}: {count} {translate('points', persian)} ({percentage:.1f}%)")
     
     with col_as:
         st.subheader("AS 3533.1 Acceleration Envelope")
-        fig_accel_as = plot_acceleration_envelope_as(diameter, angular_velocity, braking_accel, snow_load, wind_load, earthquake_load)
+        fig_accel_as = plot_acceleration_envelope_as(diameter, angular_velocity, braking_accel, snow_load, wind_load, earthquake_load,
+                                                     mass=wheel_mass)
         st.plotly_chart(fig_accel_as, use_container_width=True)
-        st.markdown("""
+        st.markdown(translate("""
         **AS Zone Classifications:**
         - **Zone 1** (Purple): Maximum restraint
         - **Zone 2** (Orange): Enhanced restraint
         - **Zone 3** (Yellow): Standard restraint
         - **Zone 4** (Green): Moderate restraint
         - **Zone 5** (Red): Special consideration
-        """ if not persian else """
-        **طبقه‌بندی نواحی AS:**
-        - **ناحیه ۱** (بنفش): حداکثر مهاربند
-        - **ناحیه ۲** (نارنجی): مهاربند تقویت‌شده
-        - **ناحیه ۳** (زرد): مهاربند استاندارد
-        - **ناحیه ۴** (سبز): مهاربند متوسط
-        - **ناحیه ۵** (قرمز): بررسی ویژه
-        """)
-        st.markdown("**📊 Points Distribution in Zones (AS):**" if not persian else "**📊 توزیع نقاط در نواحی (AS):**")
+        """, persian))
+        st.markdown(translate("**📊 Points Distribution in Zones (AS):**", persian))
         total_points = len(restraint_zones_as)
         for zone in sorted(zone_counts_as.keys()):
             count = zone_counts_as[zone]
             percentage = (count / total_points) * 100
-            st.write(f"- {'Zone' if not persian else 'ناحیه'} {zone}: {count} {'points' if not persian else 'نقطه'} ({percentage:.1f}%)")
+            st.write(f"- {translate('Zone', persian)} {zone}: {count} {translate('points', persian)} ({percentage:.1f}%)")
     
     st.session_state.classification_data.update({
         'restraint_zone_iso': predominant_zone_iso, 'restraint_zone_as': predominant_zone_as,
@@ -3945,9 +3535,9 @@ f"""**پارامترهای طراحی:**
     st.markdown("---")
     left_col, right_col = st.columns([1, 1])
     with left_col:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with right_col:
-        st.button("Next ➡️" if not persian else "بعدی ➡️", on_click=validate_current_step_and_next)
+        st.button(translate("Next ➡️", persian), on_click=validate_current_step_and_next)
 
 
 # === STEP 13: Final Design Overview ===
@@ -3955,173 +3545,136 @@ elif st.session_state.step == 13:
     st.header(get_text('design_summary', persian))
     st.markdown("---")
     
-    st.subheader("🎡 Basic Design Parameters" if not persian else "🎡 پارامترهای پایه طراحی")
+    st.subheader(translate("🎡 Basic Design Parameters", persian))
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.write(f"**{'Generation' if not persian else 'نسل'}:** {st.session_state.generation_type}")
-        st.write(f"**{'Diameter' if not persian else 'قطر'}:** {st.session_state.diameter} m")
-        st.write(f"**{'Height' if not persian else 'ارتفاع'}:** {st.session_state.diameter * 1.1:.1f} m")
+        st.write(f"**{translate('Generation', persian)}:** {st.session_state.generation_type}")
+        st.write(f"**{translate('Diameter', persian)}:** {st.session_state.diameter} m")
+        st.write(f"**{translate('Height', persian)}:** {st.session_state.diameter * 1.1:.1f} m")
     with col2:
-        st.write(f"**{'Total Cabins' if not persian else 'کل کابین‌ها'}:** {st.session_state.num_cabins}")
-        st.write(f"**{'VIP Cabins' if not persian else 'کابین‌های VIP'}:** {st.session_state.num_vip_cabins}")
-        st.write(f"**{'Cabin Capacity' if not persian else 'ظرفیت کابین'}:** {st.session_state.cabin_capacity} {'passengers' if not persian else 'مسافر'}")
+        st.write(f"**{translate('Total Cabins', persian)}:** {st.session_state.num_cabins}")
+        st.write(f"**{translate('VIP Cabins', persian)}:** {st.session_state.num_vip_cabins}")
+        st.write(f"**{translate('Cabin Capacity', persian)}:** {st.session_state.cabin_capacity} {translate('passengers', persian)}")
     with col3:
         if st.session_state.cabin_geometry:
-            st.write(f"**{'Cabin Geometry' if not persian else 'هندسه کابین'}:** {st.session_state.cabin_geometry}")
-        st.write(f"**{'Rotation Time' if not persian else 'زمان چرخش'}:** {st.session_state.rotation_time_min:.2f} min")
+            st.write(f"**{translate('Cabin Geometry', persian)}:** {st.session_state.cabin_geometry}")
+        st.write(f"**{translate('Rotation Time', persian)}:** {st.session_state.rotation_time_min:.2f} min")
         cap_hour = calculate_capacity_per_hour_from_time(
             st.session_state.num_cabins, st.session_state.cabin_capacity,
             st.session_state.num_vip_cabins, st.session_state.rotation_time_min
         )
-        st.write(f"**{'Capacity/Hour' if not persian else 'ظرفیت/ساعت'}:** {cap_hour:.0f} pax/hr")
+        st.write(f"**{translate('Capacity/Hour', persian)}:** {cap_hour:.0f} pax/hr")
     
     st.markdown("---")
-    st.subheader("🌍 Environment & Site Conditions" if not persian else "🌍 شرایط محیطی و سایت")
+    st.subheader(translate("🌍 Environment & Site Conditions", persian))
     st.caption("Per AS 1170.4-2007(A1), EN 1991-1-4:2005, ISIRI 2800")
     env = st.session_state.environment_data
 
-    PROVINCE_FA = {
-        "Khuzestan": "خوزستان", "Ilam": "ایلام", "Fars": "فارس",
-        "Qazvin": "قزوین", "Zanjan": "زنجان", "Hamedan": "همدان",
-        "Markazi": "مرکزی", "Yazd": "یزد", "Semnan": "سمنان",
-        "Qom": "قم", "South Khorasan": "خراسان جنوبی", "Kerman": "کرمان",
-        "East Azerbaijan": "آذربایجان شرقی", "West Azerbaijan": "آذربایجان غربی",
-        "Ardabil": "اردبیل", "Kurdistan": "کردستان", "Kermanshah": "کرمانشاه",
-        "Lorestan": "لرستان", "Chaharmahal and Bakhtiari": "چهارمحال و بختیاری",
-        "Kohgiluyeh and Boyer-Ahmad": "کهگیلویه و بویراحمد", "Isfahan": "اصفهان",
-        "Tehran": "تهران", "Alborz": "البرز", "Gilan": "گیلان",
-        "Mazandaran": "مازندران", "Golestan": "گلستان",
-        "North Khorasan": "خراسان شمالی", "Khorasan Razavi": "خراسان رضوی",
-        "Sistan and Baluchestan": "سیستان و بلوچستان", "Bushehr": "بوشهر",
-        "Hormozgan": "هرمزگان",
-    }
     province_val = env.get('province', 'N/A')
     city_val = env.get('city', 'N/A')
-    city_data = CITIES_DATA.get(province_val, [])
-    city_fa_map = {c["city"]: c.get("city_fa", c["city"]) for c in city_data}
-    province_display = PROVINCE_FA.get(province_val, province_val) if persian else province_val
-    city_display = city_fa_map.get(city_val, city_val) if persian else city_val
-
-    wind_directions_fa_map = {
-        "North": "شمال", "South": "جنوب", "East": "شرق", "West": "غرب",
-        "Northeast": "شمال‌شرق", "Northwest": "شمال‌غرب",
-        "Southeast": "جنوب‌شرق", "Southwest": "جنوب‌غرب"
-    }
-    wind_dir_display = wind_directions_fa_map.get(env.get('wind_direction', 'N/A'), env.get('wind_direction', 'N/A')) if persian else env.get('wind_direction', 'N/A')
+    province_display = province_name(province_val, persian)
+    city_display = city_name(province_val, city_val, persian)
+
+    wind_dir_display = translate(env.get('wind_direction', 'N/A'), persian)
 
     col1, col2 = st.columns(2)
     with col1:
-        st.write(f"**{'Province' if not persian else 'استان'}:** {province_display}")
-        st.write(f"**{'City' if not persian else 'شهر'}:** {city_display}")
-        st.write(f"**{'Region' if not persian else 'منطقه'}:** {env.get('region_name', 'N/A')}")
-        st.write(f"**{'Land Area' if not persian else 'مساحت زمین'}:** {env.get('land_area', 0):.2f} m²")
-        st.write(f"**{'Altitude' if not persian else 'ارتفاع'}:** {env.get('altitude', 0)} m")
-        st.write(f"**{'Temperature Range' if not persian else 'محدوده دما'}:** {env.get('temp_min', 0)}°C {'to' if not persian else 'تا'} {env.get('temp_max', 0)}°C")
+        st.write(f"**{translate('Province', persian)}:** {province_display}")
+        st.write(f"**{translate('City', persian)}:** {city_display}")
+        st.write(f"**{translate('Region', persian)}:** {env.get('region_name', 'N/A')}")
+        st.write(f"**{translate('Land Area', persian)}:** {env.get('land_area', 0):.2f} m²")
+        st.write(f"**{translate('Altitude', persian)}:** {env.get('altitude', 0)} m")
+        st.write(f"**{translate('Temperature Range', persian)}:** {env.get('temp_min', 0)}°C {translate('to', persian)} {env.get('temp_max', 0)}°C")
     with col2:
-        st.write(f"**{'Terrain Category' if not persian else 'دسته‌بندی زمین'}:** {env.get('terrain_category', 'N/A')}")
-        st.write(f"**{'Seismic Hazard (ISIRI 2800)' if not persian else 'خطر لرزه‌ای (ISIRI 2800)'}:** {env.get('seismic_hazard', 'N/A')}")
-        st.write(f"**{'Wind Direction' if not persian else 'جهت باد'}:** {wind_dir_display}")
-        st.write(f"**{'Max Wind Speed' if not persian else 'حداکثر سرعت باد'}:** {env.get('wind_max', 0)} km/h")
+        st.write(f"**{translate('Terrain Category', persian)}:** {env.get('terrain_category', 'N/A')}")
+        st.write(f"**{translate('Seismic Hazard (ISIRI 2800)', persian)}:** {env.get('seismic_hazard', 'N/A')}")
+        st.write(f"**{translate('Wind Direction', persian)}:** {wind_dir_display}")
+        st.write(f"**{translate('Max Wind Speed', persian)}:** {env.get('wind_max', 0)} km/h")
     
     st.markdown("---")
-    st.subheader("🏗️ Soil & Structural Importance" if not persian else "🏗️ خاک و اهمیت سازه")
+    st.subheader(translate("🏗️ Soil & Structural Importance", persian))
     st.caption("Per ISIRI 2800 (4th Edition)")
     col1, col2 = st.columns(2)
     with col1:
-        st.write(f"**{'Soil Type' if not persian else 'نوع خاک'}:** {st.session_state.soil_type}")
+        st.write(f"**{translate('Soil Type', persian)}:** {st.session_state.soil_type}")
     with col2:
-        st.write(f"**{'Importance Group' if not persian else 'گروه اهمیت'}:** {st.session_state.importance_group}")
+        st.write(f"**{translate('Importance Group', persian)}:** {st.session_state.importance_group}")
     
     st.markdown("---")
-    st.subheader("🧭 Carousel Orientation" if not persian else "🧭 جهت‌گیری چرخ و فلک")
+    st.subheader(translate("🧭 Carousel Orientation", persian))
     st.caption("Per AS 1170.4-2007(A1), EN 1991-1-4:2005")
     axis_key = st.session_state.get('carousel_orientation', None)
     if axis_key:
-        st.write(f"**{'Selected Orientation' if not persian else 'جهت‌گیری انتخاب‌شده'}:** {axis_label(axis_key)}")
-        arrow_map = {
-            'NS': (0, 1), 'EW': (1, 0),
-            'NE_SW': (1/math.sqrt(2), 1/math.sqrt(2)),
-            'SE_NW': (-1/math.sqrt(2), 1/math.sqrt(2))
-        }
-        arrow_vec = arrow_map.get(axis_key, (0, 1))
+        orientation_angle = st.session_state.get('carousel_orientation_angle', AXIS_BEARINGS.get(axis_key, 0.0))
+        st.write(f"**{translate('Selected Orientation', persian)}:** "
+                 f"{orientation_angle:.1f}° ({axis_label(axis_key)})")
+        arrow_vec = axis_vector(orientation_angle)
         fig_final_orientation = create_orientation_diagram(axis_key, env.get('land_length', 100), env.get('land_width', 100), arrow_vec)
         st.plotly_chart(fig_final_orientation, use_container_width=True)
     else:
-        st.write(f"**{'Selected Orientation' if not persian else 'جهت‌گیری انتخاب‌شده'}:** N/A")
+        st.write(f"**{translate('Selected Orientation', persian)}:** N/A")
     
     st.markdown("---")
-    st.subheader("⚠️ Safety Classification" if not persian else "⚠️ طبقه‌بندی ایمنی")
+    st.subheader(translate("⚠️ Safety Classification", persian))
     st.caption("Per INSO 8987-1-2023")
     
     if st.session_state.classification_data:
         class_data = st.session_state.classification_data
-        st.markdown("**Operational Parameters:**" if not persian else "**پارامترهای عملیاتی:**")
+        st.markdown(translate("**Operational Parameters:**", persian))
         param_col1, param_col2, param_col3 = st.columns(3)
         with param_col1:
             rpm_actual = class_data.get('rpm_actual', 0)
-            st.metric("Rotation Speed" if not persian else "سرعت چرخش", f"{rpm_actual:.4f} rpm")
+            st.metric(translate("Rotation Speed", persian), f"{rpm_actual:.4f} rpm")
         with param_col2:
             braking_accel = class_data.get('braking_accel', st.session_state.braking_acceleration)
-            st.metric("Braking Acceleration" if not persian else "شتاب ترمز", f"{braking_accel:.2f} m/s²")
+            st.metric(translate("Braking Acceleration", persian), f"{braking_accel:.2f} m/s²")
         with param_col3:
-            st.metric("Max Acceleration" if not persian else "حداکثر شتاب", f"{class_data.get('n_actual', 0):.3f}g")
+            st.metric(translate("Max Acceleration", persian), f"{class_data.get('n_actual', 0):.3f}g")
         
         st.markdown("---")
-        st.markdown("**Device Classification (INSO 8987-1-2023):**" if not persian else "**طبقه‌بندی دستگاه (INSO 8987-1-2023):**")
+        st.markdown(translate("**Device Classification (INSO 8987-1-2023):**", persian))
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown("#### Intrinsic Safety **SECURED**" if not persian else "#### ایمنی ذاتی **تأمین شده**")
+            st.markdown(translate("#### Intrinsic Safety **SECURED**", persian))
             class_secured = class_data.get('class_secured', 'N/A')
             p_actual = class_data.get('p_actual', 0)
             if class_secured != 'N/A':
                 st.success(f"**Class {class_secured}**")
                 st.caption(f"Dynamic Product (p): {p_actual:.2f}")
                 secured_desc = {
-                    1: "Lowest classification - Minimal restraint requirements" if not persian else "پایین‌ترین طبقه - حداقل الزامات مهاربند",
-                    2: "Low to moderate classification - Standard restraint" if not persian else "طبقه پایین تا متوسط - مهاربند استاندارد",
-                    3: "Moderate to high classification - Enhanced restraint required" if not persian else "طبقه متوسط تا بالا - مهاربند تقویت‌شده لازم است",
-                    4: "Highest classification - Maximum restraint required" if not persian else "بالاترین طبقه - حداکثر مهاربند لازم است"
+                    1: translate("Lowest classification - Minimal restraint requirements", persian),
+                    2: translate("Low to moderate classification - Standard restraint", persian),
+                    3: translate("Moderate to high classification - Enhanced restraint required", persian),
+                    4: translate("Highest classification - Maximum restraint required", persian)
                 }
                 st.info(secured_desc.get(class_secured, "Standard restraint"))
-                st.markdown("""
+                st.markdown(translate("""
 **Classification Ranges:**
 - Class 1: 0.1 < P ≤ 25
 - Class 2: 25 < P ≤ 100
 - Class 3: 100 < P ≤ 200
 - Class 4: 200 < P
-""" if not persian else """
-**محدوده طبقه‌بندی:**
-- کلاس ۱: 0.1 < P ≤ 25
-- کلاس ۲: 25 < P ≤ 100
-- کلاس ۳: 100 < P ≤ 200
-- کلاس ۴: 200 < P
-""")
+""", persian))
         with col2:
-            st.markdown("#### Intrinsic Safety **NOT Secured**" if not persian else "#### ایمنی ذاتی **تأمین نشده**")
+            st.markdown(translate("#### Intrinsic Safety **NOT Secured**", persian))
             class_not_secured = class_data.get('class_not_secured', 'N/A')
             if class_not_secured != 'N/A':
                 st.warning(f"**Class {class_not_secured}**")
                 st.caption(f"Dynamic Product (p): {p_actual:.2f}")
                 not_secured_desc = {
-                    2: "Requires additional safety measures" if not persian else "نیازمند اقدامات ایمنی اضافی",
-                    3: "Enhanced safety measures required" if not persian else "اقدامات ایمنی تقویت‌شده لازم است",
-                    4: "Comprehensive safety system required" if not persian else "سیستم ایمنی جامع لازم است",
-                    5: "Maximum safety classification - Special precautions mandatory" if not persian else "بالاترین طبقه ایمنی - احتیاط‌های ویژه اجباری است"
+                    2: translate("Requires additional safety measures", persian),
+                    3: translate("Enhanced safety measures required", persian),
+                    4: translate("Comprehensive safety system required", persian),
+                    5: translate("Maximum safety classification - Special precautions mandatory", persian)
                 }
                 st.info(not_secured_desc.get(class_not_secured, "Additional safety measures required"))
-                st.markdown("""
+                st.markdown(translate("""
 **Classification Ranges:**
 - Class 2: 0.1 < P ≤ 25
 - Class 3: 25 < P ≤ 100
 - Class 4: 100 < P ≤ 200
 - Class 5: 200 < P
-""" if not persian else """
-**محدوده طبقه‌بندی:**
-- کلاس ۲: 0.1 < P ≤ 25
-- کلاس ۳: 25 < P ≤ 100
-- کلاس ۴: 100 < P ≤ 200
-- کلاس ۵: 200 < P
-""")
+""", persian))
         
         snow_load = class_data.get('snow_load', 0.0)
         wind_load = class_data.get('wind_load', 0.0)
@@ -4129,77 +3682,77 @@ elif st.session_state.step == 13:
         
         if any([snow_load > 0, wind_load > 0, earthquake_load > 0]):
             st.markdown("---")
-            st.subheader("🌦️ Additional Load Factors" if not persian else "🌦️ عوامل بار اضافی")
-            st.caption("Environmental and seismic loads included in analysis" if not persian else "بارهای محیطی و لرزه‌ای در تحلیل لحاظ شده‌اند")
+            st.subheader(translate("🌦️ Additional Load Factors", persian))
+            st.caption(translate("Environmental and seismic loads included in analysis", persian))
             load_col1, load_col2, load_col3 = st.columns(3)
             with load_col1:
                 if snow_load > 0:
                     cabin_area = class_data.get('cabin_surface_area', 0)
                     snow_coef = class_data.get('snow_coefficient', 0.2)
-                    st.metric("🌨️ Snow Load" if not persian else "🌨️ بار برف", f"{snow_load:.2f} kN")
-                    st.caption(f"{'Pressure' if not persian else 'فشار'}: {snow_coef:.2f} kN/m²")
-                    st.caption(f"{'Area' if not persian else 'مساحت'}: {cabin_area:.2f} m²")
+                    st.metric(translate("🌨️ Snow Load", persian), f"{snow_load:.2f} kN")
+                    st.caption(f"{translate('Pressure', persian)}: {snow_coef:.2f} kN/m²")
+                    st.caption(f"{translate('Area', persian)}: {cabin_area:.2f} m²")
                 else:
-                    st.write("🌨️ Snow Load: Not applied" if not persian else "🌨️ بار برف: اعمال نشده")
+                    st.write(translate("🌨️ Snow Load: Not applied", persian))
             with load_col2:
                 if wind_load > 0:
-                    st.metric("💨 Wind Load" if not persian else "💨 بار باد", f"{wind_load:.2f} kN")
+                    st.metric(translate("💨 Wind Load", persian), f"{wind_load:.2f} kN")
                     if st.session_state.get('enable_wind', False):
                         st.caption(f"Terror Factor: {st.session_state.get('terror_factor', 1.0):.1f}")
                         st.caption(f"Height Factor: {st.session_state.get('height_factor', 1.0):.1f}")
                 else:
-                    st.write("💨 Wind Load: Not applied" if not persian else "💨 بار باد: اعمال نشده")
+                    st.write(translate("💨 Wind Load: Not applied", persian))
             with load_col3:
                 if earthquake_load > 0:
-                    st.metric("🌍 Earthquake Load" if not persian else "🌍 بار زلزله", f"{earthquake_load:.2f} kN")
+                    st.metric(translate("🌍 Earthquake Load", persian), f"{earthquake_load:.2f} kN")
                     if st.session_state.get('enable_earthquake', False):
                         st.caption(f"Seismic Coef: {st.session_state.get('seismic_coefficient', 0.15):.3f}")
                 else:
-                    st.write("🌍 Earthquake Load: Not applied" if not persian else "🌍 بار زلزله: اعمال نشده")
+                    st.write(translate("🌍 Earthquake Load: Not applied", persian))
         
         cabin_bearing = st.session_state.get('cabin_bearing')
         spindle_bearing = st.session_state.get('spindle_bearing')
         
         if cabin_bearing or spindle_bearing:
             st.markdown("---")
-            st.subheader("⚙️ Bearing Selection" if not persian else "⚙️ انتخاب یاتاقان")
-            st.caption("Selected from SKF Catalog (Step 11)" if not persian else "انتخاب‌شده از کاتالوگ SKF (مرحله ۱۱)")
+            st.subheader(translate("⚙️ Bearing Selection", persian))
+            st.caption(translate("Selected from SKF Catalog (Step 11)", persian))
             col_bear1, col_bear2 = st.columns(2)
             with col_bear1:
                 if cabin_bearing:
                     st.markdown(f"""
-**{'Cabin Swing Bearings' if not persian else 'یاتاقان‌های چرخش کابین'}:**
-- **{'Type' if not persian else 'نوع'}:** {'Spherical Plain (Maintenance-Free)' if not persian else 'ساده کروی (بدون نگهداری)'}
-- **{'Series' if not persian else 'سری'}:** GAC..F
-- **{'Designation' if not persian else 'نام‌گذاری'}:** {cabin_bearing['designation']}
-- **{'Bore' if not persian else 'قطر داخلی'}:** {cabin_bearing['d']} mm
-- **{'Outer Diameter' if not persian else 'قطر خارجی'}:** {cabin_bearing['D']} mm
-- **{'Static Load Rating (C₀)' if not persian else 'ظرفیت بار استاتیکی (C₀)'}:** {cabin_bearing['C0']} kN
-- **{'Quantity' if not persian else 'تعداد'}:** {st.session_state.num_cabins} ({'one per cabin' if not persian else 'یکی برای هر کابین'})
-- **{'Maintenance' if not persian else 'نگهداری'}:** {'Maintenance-free, lifetime lubrication' if not persian else 'بدون نگهداری، روغنکاری مادام‌العمر'}
+**{translate('Cabin Swing Bearings', persian)}:**
+- **{translate('Type', persian)}:** {translate('Spherical Plain (Maintenance-Free)', persian)}
+- **{translate('Series', persian)}:** {cabin_bearing.get('series', 'GAC..F')}
+- **{translate('Designation', persian)}:** {cabin_bearing['designation']}
+- **{translate('Bore', persian)}:** {cabin_bearing['d']} mm
+- **{translate('Outer Diameter', persian)}:** {cabin_bearing['D']} mm
+- **{translate('Static Load Rating (C₀)', persian)}:** {cabin_bearing['C0']} kN
+- **{get_text('quantity_count', persian)}:** {st.session_state.num_cabins} ({translate('one per cabin', persian)})
+- **{translate('Maintenance', persian)}:** {translate('Maintenance-free, lifetime lubrication', persian)}
                     """)
             with col_bear2:
                 if spindle_bearing:
                     st.markdown(f"""
-**{'Main Spindle Bearings' if not persian else 'یاتاقان‌های محور اصلی'}:**
-- **{'Type' if not persian else 'نوع'}:** {'Spherical Roller (Tapered Bore)' if not persian else 'غلتکی کروی (سوراخ مخروطی)'}
-- **{'Series' if not persian else 'سری'}:** 230xx
-- **{'Designation' if not persian else 'نام‌گذاری'}:** {spindle_bearing['designation']}
-- **{'Bore' if not persian else 'قطر داخلی'}:** {spindle_bearing['d']} mm
-- **{'Outer Diameter' if not persian else 'قطر خارجی'}:** {spindle_bearing['D']} mm
-- **{'Dynamic Load Rating (C)' if not persian else 'ظرفیت بار دینامیکی (C)'}:** {spindle_bearing['C']} kN
-- **{'Static Load Rating (C₀)' if not persian else 'ظرفیت بار استاتیکی (C₀)'}:** {spindle_bearing['C0']} kN
-- **{'Quantity' if not persian else 'تعداد'}:** {'2 (one each side of spindle)' if not persian else '۲ (یکی در هر طرف محور)'}
-- **{'Maintenance' if not persian else 'نگهداری'}:** {'Relubrication every 500-1000 hours' if not persian else 'روغنکاری مجدد هر ۵۰۰ تا ۱۰۰۰ ساعت'}
+**{translate('Main Spindle Bearings', persian)}:**
+- **{translate('Type', persian)}:** {translate('Spherical Roller (Tapered Bore)', persian)}
+- **{translate('Series', persian)}:** {spindle_bearing.get('series', '230xx')}
+- **{translate('Designation', persian)}:** {spindle_bearing['designation']}
+- **{translate('Bore', persian)}:** {spindle_bearing['d']} mm
+- **{translate('Outer Diameter', persian)}:** {spindle_bearing['D']} mm
+- **{translate('Dynamic Load Rating (C)', persian)}:** {spindle_bearing['C']} kN
+- **{translate('Static Load Rating (C₀)', persian)}:** {spindle_bearing['C0']} kN
+- **{get_text('quantity_count', persian)}:** {translate('2 (one each side of spindle)', persian)}
+- **{translate('Maintenance', persian)}:** {translate('Relubrication every 500-1000 hours', persian)}
                     """)
         
         st.markdown("---")
-        st.subheader("🔒 Restraint System Requirements" if not persian else "🔒 الزامات سیستم مهاربند")
+        st.subheader(translate("🔒 Restraint System Requirements", persian))
         col_iso, col_as = st.columns(2)
         with col_iso:
-            st.info(f"**ISO 17842-2023**\n\n{'Zone' if not persian else 'ناحیه'} {class_data.get('restraint_zone_iso', 'N/A')}\n\n{class_data.get('restraint_description_iso', 'N/A')}")
+            st.info(f"**ISO 17842-2023**\n\n{translate('Zone', persian)} {class_data.get('restraint_zone_iso', 'N/A')}\n\n{class_data.get('restraint_description_iso', 'N/A')}")
         with col_as:
-            st.info(f"**AS 3533.1-2009+A1-2011**\n\n{'Zone' if not persian else 'ناحیه'} {class_data.get('restraint_zone_as', 'N/A')}\n\n{class_data.get('restraint_description_as', 'N/A')}")
+            st.info(f"**AS 3533.1-2009+A1-2011**\n\n{translate('Zone', persian)} {class_data.get('restraint_zone_as', 'N/A')}\n\n{class_data.get('restraint_description_as', 'N/A')}")
     
     st.markdown("---")
     
@@ -4209,29 +3762,122 @@ elif st.session_state.step == 13:
         st.session_state.rotation_time_min, st.session_state.cabin_geometry
     )
     
-    st.subheader("⚙️ Motor & Drive System" if not persian else "⚙️ سیستم موتور و درایو")
-    st.caption("Calculated based on total system mass and operational requirements" if not persian else "محاسبه‌شده بر اساس جرم کل سیستم و الزامات عملیاتی")
+    st.subheader(translate("⚙️ Motor & Drive System", persian))
+    st.caption(translate("Calculated based on total system mass and operational requirements", persian))
     
     motor_col1, motor_col2, motor_col3, motor_col4 = st.columns(4)
     with motor_col1:
-        st.metric("Rated Power" if not persian else "توان نامی", f"{power_data['rated_power']:.1f} kW",
-                 help="Rated motor power with safety factor 1.5" if not persian else "توان نامی موتور با ضریب اطمینان ۱.۵")
+        st.metric(translate("Rated Power", persian), f"{power_data['rated_power']:.1f} kW",
+                 help=translate("Rated motor power with safety factor 1.5", persian))
     with motor_col2:
-        st.metric("Peak Power" if not persian else "توان پیک", f"{power_data['peak_power']:.1f} kW",
-                 help="Peak power required during startup" if not persian else "توان پیک مورد نیاز در هنگام راه‌اندازی")
+        st.metric(translate("Peak Power", persian), f"{power_data['peak_power']:.1f} kW",
+                 help=translate("Peak power required during startup", persian))
     with motor_col3:
-        st.metric("Operational" if not persian else "توان عملیاتی", f"{power_data['operational_power']:.1f} kW",
-                 help="Steady-state operational power" if not persian else "توان عملیاتی حالت پایدار")
+        st.metric(translate("Operational", persian), f"{power_data['operational_power']:.1f} kW",
+                 help=translate("Steady-state operational power", persian))
     with motor_col4:
         breakdown = power_data['breakdown']
-        st.metric("Total Mass" if not persian else "جرم کل", f"{breakdown['total_mass']/1000:.1f} ton",
-                 help="Total system mass including structure" if not persian else "جرم کل سیستم شامل سازه")
+        st.metric(translate("Total Mass", persian), f"{breakdown['total_mass']/1000:.1f} ton",
+                 help=translate("Total system mass including structure", persian))
     
-    with st.expander("🔍 View Motor Power Calculation Details" if not persian else "🔍 مشاهده جزئیات محاسبه توان موتور"):
+    with st.expander(translate("🔍 View Motor Power Calculation Details", persian)):
         st.markdown(format_power_breakdown(power_data))
     
     st.markdown("---")
-    st.subheader("📊 Design Visualization" if not persian else "📊 تصویرسازی طراحی")
+    st.subheader(translate("🧾 Material Takeoff & Cost Estimate", persian))
+    geometry = geometry_code(st.session_state.cabin_geometry)
+    takeoff = wheel_masses(st.session_state.diameter, st.session_state.num_cabins,
+                           st.session_state.cabin_capacity, geometry)
+    foundation = st.session_state.get('foundation_design')
+    concrete_volume = 4 * foundation['pad']['volume'] if foundation else 0.0
+    costs = cost_estimate(takeoff, st.session_state.num_cabins, geometry,
+                          rated_power=power_data['rated_power'], concrete_volume=concrete_volume)
+    rows = [(get_text(f'member_{g}', persian), takeoff['groups'][g] / 1000.0, costs['steel'][g])
+            for g in GROUPS]
+    rows += [
+        (translate("Hub & drive equipment", persian), takeoff['mass_equipment'] / 1000.0, costs['equipment']),
+        (f"{translate('Cabins', persian)} ({st.session_state.num_cabins})", takeoff['mass_cabins'] / 1000.0, costs['cabins']),
+        (f"{translate('Drive motor', persian)} ({power_data['rated_power']:.0f} kW)", 0.0, costs['drive']),
+        (f"{translate('Foundation concrete', persian)} ({concrete_volume:.0f} m³)", concrete_volume * 2.4, costs['foundation']),
+    ]
+    st.dataframe({
+        (translate("Item", persian)): [r[0] for r in rows],
+        (translate("Mass (t)", persian)): [round(float(r[1]), 1) for r in rows],
+        (translate("Cost (USD)", persian)): [f"{float(r[2]):,.0f}" for r in rows],
+    }, hide_index=True, use_container_width=True)
+    cost_col1, cost_col2 = st.columns(2)
+    with cost_col1:
+        st.metric(translate("Structural steel", persian), f"{float(takeoff['steel']) / 1000:.1f} ton")
+    with cost_col2:
+        st.metric(translate("Estimated cost", persian), f"{float(costs['total']):,.0f} USD")
+    st.caption(
+        translate("Steel from the member table sections × frame lengths + 15% connections; unit rates in engine/mass.py", persian)
+    )
+    st.session_state.cost_estimate = {'total': float(costs['total']), 'steel_mass': float(takeoff['steel'])}
+
+    with st.expander(translate("🗺️ Nationwide Screening", persian)):
+        st.caption(
+            translate("This design at every city in the reference data: EN 1991-1-4 wind for the province terrain, "
+                      "ISIRI 2800 seismic forces for the mapped PGA (else the city hazard level) and the main spindle "
+                      "bearing by the Step 11 rule", persian)
+        )
+        env = st.session_state.environment_data
+        screen_diameter = st.session_state.diameter
+        screen_area = estimate_cabin_surface_area(st.session_state.cabin_geometry, st.session_state.cabin_capacity, screen_diameter)
+        screen_periods = st.session_state.get('modal_periods') or [empirical_period(screen_diameter * 1.1)]
+        screening = compute(screen_sites, {
+            'diameter': screen_diameter, 'hub_height': screen_diameter * 0.6,
+            'num_cabins': st.session_state.num_cabins, 'cabin_area': screen_area / 4.0,
+            'cabin_cf': float(force_coefficient(geometry)),
+            'wind_speed': float(env.get('wind_max', 108)) / 3.6, 'altitude': float(env.get('altitude', 0)),
+            'snow_pressure': float(st.session_state.get('snow_coefficient', 0.2)),
+            'frequency': 1.0 / screen_periods[-1], 'periods': screen_periods,
+            'seismic_mass': power_data['breakdown']['total_mass'], 'rotating_mass': power_data['breakdown']['mass_rotating'],
+            'soil_type': st.session_state.get('soil_type') or 'Type II',
+            'importance': st.session_state.get('importance_factor', 1.0),
+            'behaviour_factor': float(st.session_state.get('behaviour_factor', 3.0)),
+        })
+        order = np.argsort(screening['rank'])
+        st.dataframe({
+            (translate("Rank", persian)): screening['rank'][order],
+            (translate("Province", persian)): [province_name(p, persian) for p in screening['province'][order]],
+            (translate("City", persian)): screening['city_fa' if persian else 'city'][order],
+            (translate("Terrain", persian)): screening['category'][order],
+            (translate("Seismic Hazard", persian)): screening['hazard'][order],
+            (translate("Wind (kN)", persian)): np.round(screening['wind_force'][order], 1),
+            (translate("Seismic H (kN)", persian)): np.round(screening['seismic_h'][order], 1),
+            (translate("Required C (kN)", persian)): np.round(screening['required_C'][order], 0),
+            (translate("Spindle Bearing", persian)): [b or "—" for b in screening['bearing'][order]],
+        }, hide_index=True, use_container_width=True, height=320)
+
+        provinces = province_summary(screening)
+        located = np.isfinite(provinces['lat'])
+        fig_screen = go.Figure(go.Scattergeo(
+            lat=provinces['lat'][located], lon=provinces['lon'][located],
+            text=[f"{province_name(p, persian)}: {c:.0f} kN ({b or '—'})" for p, c, b in
+                  zip(provinces['province'][located], provinces['required_C'][located], provinces['bearing'][located])],
+            mode='markers',
+            marker=dict(size=14, color=provinces['required_C'][located], colorscale='YlOrRd', showscale=True,
+                        colorbar=dict(title=translate("Required C (kN)", persian)))
+        ))
+        fig_screen.update_geos(fitbounds='locations', showcountries=True, showland=True, landcolor='whitesmoke')
+        fig_screen.update_layout(height=380, margin=dict(l=0, r=0, t=10, b=0))
+        st.plotly_chart(fig_screen, use_container_width=True)
+        st.caption(
+            translate("Province markers at the mean location of each province's cities, coloured by the governing city's required C", persian)
+        )
+        unsized = int(np.count_nonzero(screening['bearing'] == ''))
+        if unsized:
+            st.warning(
+                translate("No catalogue spindle bearing is large enough at {0} of {1} cities", persian).format(unsized, len(screening['city']))
+            )
+        if st.session_state.classification_data:
+            st.caption(
+                translate("Device classification (class {0} secured / {1} not secured) depends on the ride motion only and is the same at every site", persian).format(st.session_state.classification_data.get('class_secured', 'N/A'), st.session_state.classification_data.get('class_not_secured', 'N/A'))
+            )
+
+    st.markdown("---")
+    st.subheader(translate("📊 Design Visualization", persian))
     height = st.session_state.diameter * 1.1
     vip_cap = max(0, st.session_state.cabin_capacity - 2)
     total_capacity_per_rotation = (
@@ -4246,7 +3892,7 @@ elif st.session_state.step == 13:
     st.plotly_chart(fig, use_container_width=True, config={'responsive': True})
     
     st.markdown("---")
-    st.subheader("📄 Design Summary Report" if not persian else "📄 گزارش خلاصه طراحی")
+    st.subheader(translate("📄 Design Summary Report", persian))
     
     class_data = st.session_state.classification_data if st.session_state.classification_data else {}
     snow_load = class_data.get('snow_load', 0.0)
@@ -4292,14 +3938,14 @@ elif st.session_state.step == 13:
 """
         if earthquake_load > 0:
             seismic_coef = st.session_state.get('seismic_coefficient', 0.15)
-            approx_mass = st.session_state.diameter * 500
+            seismic_mass = breakdown['total_mass']
             additional_loads_report += f"""
 #### Earthquake Load
 - **Applied Horizontal Load:** {earthquake_load:.2f} kN
 - **Seismic Coefficient:** {seismic_coef:.3f}
-- **Approximate Cabin Mass:** {approx_mass:.0f} kg
-- **Vertical Component:** {earthquake_load * 0.5:.2f} kN (50% of horizontal)
-- **Calculation:** {seismic_coef} × ({approx_mass} × 9.81 / 1000) = {earthquake_load:.2f} kN
+- **Seismic Mass:** {seismic_mass:.0f} kg
+- **Vertical Component:** {st.session_state.get('environmental_loads', {}).get('earthquake_force_v', 0):.2f} kN (ISIRI 2800 vertical spectrum, 2/3 of horizontal)
+- **Calculation:** C = A·B·I / R_u = {seismic_coef:.3f}; {seismic_coef:.3f} × ({seismic_mass:.0f} × 9.81 / 1000) = {earthquake_load:.2f} kN
 """
     
     bearing_report = ""
@@ -4323,7 +3969,7 @@ elif st.session_state.step == 13:
 - **Quantity:** 2 (one each side of spindle)
 """
     
-    with st.expander("📋 View Complete Design Report" if not persian else "📋 مشاهده گزارش کامل طراحی"):
+    with st.expander(translate("📋 View Complete Design Report", persian)):
         st.markdown(f"""
 ## Ferris Wheel Design Report
 
@@ -4365,7 +4011,7 @@ elif st.session_state.step == 13:
 - **Prevailing Wind Direction:** {env.get('wind_direction', 'N/A')}
 - **Maximum Wind Speed:** {env.get('wind_max', 0)} km/h
 - **Terrain Category:** {env.get('terrain_category', 'N/A')}
-- **Carousel Orientation:** {axis_label(st.session_state.carousel_orientation) if st.session_state.get('carousel_orientation') else 'N/A'}
+- **Carousel Orientation:** {f"{st.session_state.get('carousel_orientation_angle', AXIS_BEARINGS.get(st.session_state.carousel_orientation, 0.0)):.1f}° ({axis_label(st.session_state.carousel_orientation)})" if st.session_state.get('carousel_orientation') else 'N/A'}
 
 ### Geotechnical Data
 - **Soil Type:** {st.session_state.soil_type}
@@ -4394,23 +4040,21 @@ elif st.session_state.step == 13:
         """)
     
     st.info(
-        "🚧 **Note:** Detailed structural, electrical, and safety analyses require professional engineering consultation." if not persian else
-        "🚧 **توجه:** تحلیل‌های دقیق سازه‌ای، الکتریکی و ایمنی نیازمند مشاوره مهندسی حرفه‌ای هستند."
+        translate("🚧 **Note:** Detailed structural, electrical, and safety analyses require professional engineering consultation.", persian)
     )
     
     st.markdown("---")
     l, m, r = st.columns([1, 0.5, 1])
     with l:
-        st.button("⬅️ Back" if not persian else "⬅️ بازگشت", on_click=go_back)
+        st.button(translate("⬅️ Back", persian), on_click=go_back)
     with m:
-        st.button("🔄 New Design" if not persian else "🔄 طراحی جدید", on_click=reset_design)
+        st.button(translate("🔄 New Design", persian), on_click=reset_design)
     with r:
-        if st.button("📥 Export Report" if not persian else "📥 خروجی گزارش"):
-            st.info("Report export functionality - Coming soon!" if not persian else "قابلیت خروجی گزارش - به زودی!")
+        if st.button(translate("📥 Export Report", persian)):
+            st.info(translate("Report export functionality - Coming soon!", persian))
     
     st.success(
-        "✅ Design Complete! All parameters have been configured." if not persian else
-        "✅ طراحی کامل شد! تمام پارامترها تنظیم شده‌اند."
+        translate("✅ Design Complete! All parameters have been configured.", persian)
     )
 
 
@@ -0,0 +1,6 @@
+"""Calculation engines used by the Ferris Wheel Designer UI.
+
+Modules in this package are plain NumPy/SciPy code with no Streamlit
+dependency, so they are imported once per server process and shared by all
+sessions instead of being rebuilt on every script rerun.
+"""
@@ -0,0 +1,225 @@
+"""ISO 281 rating life of rolling bearings over load spectra."""
+import numpy as np
+
+from engine.bearings import load_bearing_catalogue, SPINDLE_SERIES
+
+# Life exponent p in L10 = (C/P)^p
+BALL_EXPONENT = 3.0
+ROLLER_EXPONENT = 10.0 / 3.0
+
+# Calculation factors for equivalent dynamic load P = X*Fr + Y*Fa and static load P0 = Fr + Y0*Fa
+# (typical values for 230 series spherical roller bearings)
+SERIES_FACTORS = {
+    SPINDLE_SERIES: {"exponent": ROLLER_EXPONENT, "e": 0.24, "Y1": 2.8, "Y2": 4.2, "Y0": 2.8, "roller": True},
+}
+
+# Life modification factor a1 for reliability (ISO 281:2007, Table 12)
+RELIABILITY_FACTOR = {90: 1.0, 95: 0.64, 96: 0.55, 97: 0.47, 98: 0.37, 99: 0.25}
+
+
+def equivalent_dynamic_load(radial, axial, e=0.24, Y1=2.8, Y2=4.2):
+    """
+    Equivalent dynamic load of a spherical roller bearing.
+
+    P = Fr + Y1*Fa when Fa/Fr <= e, otherwise P = 0.67*Fr + Y2*Fa.
+    Works element-wise on arrays of any shape.
+    """
+    radial = np.asarray(radial, dtype=float)
+    axial = np.asarray(axial, dtype=float)
+    ratio = np.divide(axial, radial, out=np.full_like(radial * 1.0, np.inf), where=radial > 0)
+    return np.where(ratio <= e, radial + Y1 * axial, 0.67 * radial + Y2 * axial)
+
+
+def life_modification_factor(P, Cu, kappa=1.0, ec=0.5, roller=True):
+    """
+    ISO 281 systems-approach factor a_ISO (limited to 50).
+
+    Parameters:
+    -----------
+    P : array_like
+        Equivalent dynamic load (same unit as Cu)
+    Cu : array_like
+        Fatigue load limit
+    kappa : float
+        Viscosity ratio (clamped to the 0.1 - 4 validity range)
+    ec : float
+        Contamination factor (0.5 = normal cleanliness)
+    roller : bool
+        Roller bearing (True) or ball bearing (False) constants
+    """
+    kappa = float(np.clip(kappa, 0.1, 4.0))
+    if roller:
+        if kappa < 0.4:
+            k = 1.5859 - 1.3993 / kappa ** 0.054381
+        elif kappa < 1.0:
+            k = 1.5859 - 1.2348 / kappa ** 0.19087
+        else:
+            k = 1.5859 - 1.2348 / kappa ** 0.071739
+        x, y = 0.4, -9.185
+    else:
+        if kappa < 0.4:
+            k = 2.5671 - 2.2649 / kappa ** 0.054381
+        elif kappa < 1.0:
+            k = 2.5671 - 1.9987 / kappa ** 0.19087
+        else:
+            k = 2.5671 - 1.9987 / kappa ** 0.071739
+        x, y = 0.83, -1.0 / 3.0
+    P = np.asarray(P, dtype=float)
+    ratio = np.divide(ec * np.asarray(Cu, dtype=float), P, out=np.zeros(np.broadcast(P, Cu).shape), where=P > 0)
+    base = 1.0 - k * ratio ** x
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        a_iso = np.where(base > 0, 0.1 * np.power(np.maximum(base, 1e-12), y), 50.0)
+    return np.minimum(a_iso, 50.0)
+
+
+def build_spindle_load_spectrum(base_mass, passenger_mass, occupancy, env_cases, rpm,
+                                axial_ratio=0.1, load_share=0.5, g=9.81):
+    """
+    Build a main spindle load spectrum from occupancy and environmental cases.
+
+    The radial/axial decomposition follows Step 11: radial load is the
+    vector sum of wheel weight and horizontal environmental force, axial
+    load is vertical environmental force plus ``axial_ratio`` of the weight.
+
+    Parameters:
+    -----------
+    base_mass : float
+        Wheel mass without passengers (kg)
+    passenger_mass : float
+        Passenger mass at full occupancy (kg)
+    occupancy : list of (fraction_of_full, probability)
+        Occupancy distribution; probabilities are normalised
+    env_cases : list of dict
+        Each with 'horizontal' and 'vertical' forces (N) and 'fraction' of
+        operating time; the remaining time is taken as calm
+    rpm : float
+        Wheel rotation speed from Step 4 (rev/min)
+    load_share : float
+        Fraction of the total load carried by one bearing (0.5 for a pair)
+
+    Returns:
+    --------
+    dict : {'radial', 'axial', 'fraction', 'rpm'} arrays of equal length (N, N, -, rev/min)
+    """
+    occ = np.asarray([o[0] for o in occupancy], dtype=float)
+    occ_p = np.asarray([o[1] for o in occupancy], dtype=float)
+    occ_p = occ_p / occ_p.sum()
+
+    cases = [dict(c) for c in env_cases]
+    calm = 1.0 - sum(c.get("fraction", 0.0) for c in cases)
+    if calm < 0:
+        raise ValueError("Environmental case fractions exceed the operating time")
+    cases.insert(0, {"horizontal": 0.0, "vertical": 0.0, "fraction": calm})
+
+    horizontal = np.asarray([c.get("horizontal", 0.0) for c in cases], dtype=float)
+    vertical = np.asarray([c.get("vertical", 0.0) for c in cases], dtype=float)
+    env_p = np.asarray([c.get("fraction", 0.0) for c in cases], dtype=float)
+
+    weight = (base_mass + occ * passenger_mass) * g                    # (no,)
+    radial = np.sqrt(weight[:, None] ** 2 + horizontal[None, :] ** 2)  # (no, ne)
+    axial = vertical[None, :] + axial_ratio * weight[:, None]
+    fraction = occ_p[:, None] * env_p[None, :]
+
+    keep = fraction.ravel() > 0
+    return {
+        "radial": radial.ravel()[keep] * load_share,
+        "axial": axial.ravel()[keep] * load_share,
+        "fraction": fraction.ravel()[keep],
+        "rpm": np.full(int(keep.sum()), float(rpm)),
+    }
+
+
+def spectrum_life(C, C0, radial, axial, fraction, rpm, series=SPINDLE_SERIES,
+                  reliability=90, kappa=1.0, ec=0.5, Cu=None):
+    """
+    Basic and modified rating life of candidate bearings under load spectra.
+
+    Load arrays may carry leading spectrum dimensions: ``radial``, ``axial``,
+    ``fraction`` and ``rpm`` have shape (..., n_cases) and ``C``/``C0`` have
+    shape (n_bearings,). Per-case lives are combined with the Palmgren-Miner
+    rule weighted by revolutions, so the result has shape (..., n_bearings).
+    Loads are in N and ratings in kN as printed in the catalogue.
+
+    Returns:
+    --------
+    dict : {
+        'P': equivalent load per case (..., n_cases) in kN,
+        'L10': basic life (million revolutions),
+        'L10h': basic life (hours),
+        'Lnm': modified life (million revolutions),
+        'Lnmh': modified life (hours)
+    }
+    """
+    factors = SERIES_FACTORS.get(series)
+    if factors is None:
+        raise ValueError(f"Rating life is only defined for rolling bearing series, not '{series}'")
+    if reliability not in RELIABILITY_FACTOR:
+        raise ValueError(f"Reliability must be one of {sorted(RELIABILITY_FACTOR)}")
+
+    C = np.asarray(C, dtype=float)
+    Cu = np.asarray(C0, dtype=float) / 8.2 if Cu is None else np.asarray(Cu, dtype=float)
+    p = factors["exponent"]
+
+    P = equivalent_dynamic_load(radial, axial, factors["e"], factors["Y1"], factors["Y2"]) / 1000.0
+    fraction = np.asarray(fraction, dtype=float)
+    rpm = np.broadcast_to(np.asarray(rpm, dtype=float), P.shape)
+
+    # Revolution share of each case; stationary cases consume no rolling fatigue life
+    revs = fraction * rpm
+    total_revs = revs.sum(axis=-1, keepdims=True)
+    share = np.divide(revs, total_revs, out=np.zeros_like(revs), where=total_revs > 0)
+    mean_rpm = total_revs[..., 0] / np.maximum(fraction.sum(axis=-1), 1e-300)
+
+    Pc = P[..., :, None]                      # (..., n_cases, 1)
+    with np.errstate(divide="ignore"):
+        L_case = np.where(Pc > 0, (C / np.where(Pc > 0, Pc, 1.0)) ** p, np.inf)
+        a_iso = life_modification_factor(Pc, Cu, kappa=kappa, ec=ec, roller=factors["roller"])
+        Lnm_case = RELIABILITY_FACTOR[reliability] * a_iso * L_case
+
+        damage = (share[..., None] / L_case).sum(axis=-2)
+        damage_nm = (share[..., None] / Lnm_case).sum(axis=-2)
+        L10 = np.where(damage > 0, 1.0 / np.where(damage > 0, damage, 1.0), np.inf)
+        Lnm = np.where(damage_nm > 0, 1.0 / np.where(damage_nm > 0, damage_nm, 1.0), np.inf)
+        to_hours = np.where(mean_rpm > 0, 1e6 / (60.0 * np.where(mean_rpm > 0, mean_rpm, 1.0)), np.inf)[..., None]
+
+    return {"P": P, "L10": L10, "L10h": L10 * to_hours, "Lnm": Lnm, "Lnmh": Lnm * to_hours}
+
+
+def bearing_weight_proxy(catalogue, rows):
+    """Catalogue mass when available, otherwise the ring annulus area as a size proxy"""
+    if "mass" in catalogue.frame.columns:
+        return catalogue.frame["mass"].to_numpy(dtype=float)[rows]
+    d = catalogue.column("d")[rows]
+    D = catalogue.column("D")[rows]
+    return np.pi / 4.0 * (D ** 2 - d ** 2)
+
+
+def lightest_for_life(spectrum, target_hours, series=SPINDLE_SERIES, catalogue=None,
+                      modified=True, **life_kwargs):
+    """
+    Pick the lightest catalogue bearing whose life meets ``target_hours``.
+
+    ``spectrum`` is the dict from ``build_spindle_load_spectrum`` (arrays may
+    carry leading sweep dimensions). Returns catalogue row positions with -1
+    where no bearing of the series is adequate, together with the full life
+    table so the UI can show every candidate.
+    """
+    if catalogue is None:
+        catalogue = load_bearing_catalogue()
+    rows = catalogue.rows(series)
+    life = spectrum_life(catalogue.column("C")[rows], catalogue.frame["C0"].to_numpy(dtype=float)[rows],
+                         spectrum["radial"], spectrum["axial"], spectrum["fraction"], spectrum["rpm"],
+                         series=series, **life_kwargs)
+    hours = life["Lnmh"] if modified else life["L10h"]
+    weight = bearing_weight_proxy(catalogue, rows)
+    ok = hours >= np.asarray(target_hours, dtype=float)[..., None]
+    masked = np.where(ok, weight, np.inf)
+    if rows.size == 0:
+        # No bearing of the series in this catalogue
+        chosen = np.full(masked.shape[:-1], -1)
+    else:
+        best = np.argmin(masked, axis=-1)
+        chosen = np.where(np.isfinite(np.take_along_axis(masked, best[..., None], axis=-1)[..., 0]), rows[best], -1)
+    if np.ndim(chosen) == 0:
+        chosen = int(chosen)
+    return chosen, {"rows": rows, **life}
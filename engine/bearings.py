@@ -0,0 +1,181 @@
+"""Bearing catalogue store with sorted indexes for Step 11 bearing selection."""
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+DEFAULT_CATALOGUE = os.path.join(DATA_DIR, "bearings.csv")
+
+REQUIRED_COLUMNS = ("manufacturer", "series", "designation", "d", "D", "C", "C0")
+INDEXED_COLUMNS = ("C", "C0", "d", "D")
+
+CABIN_SERIES = "GAC..F"
+SPINDLE_SERIES = "230xx"
+
+
+def _plain(value):
+    """Convert NumPy scalars to plain Python values for session state and f-strings"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+class BearingCatalogue:
+    """
+    Column store of bearing designations with lazily built sorted indexes.
+
+    Every index is a pair ``(sorted_values, row_positions)`` for one numeric
+    column, optionally restricted to one series, so selecting the smallest
+    bearing that exceeds a required rating is a binary search instead of a
+    scan over the whole table.
+    """
+
+    def __init__(self, frame):
+        missing = [c for c in REQUIRED_COLUMNS if c not in frame.columns]
+        if missing:
+            raise ValueError(f"Bearing catalogue is missing columns: {', '.join(missing)}")
+        self.frame = frame.reset_index(drop=True)
+        self._columns = {c: self.frame[c].to_numpy(dtype=float) for c in INDEXED_COLUMNS}
+        self._series = self.frame["series"].to_numpy(dtype=object)
+        self._indexes = {}
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def series(self):
+        return sorted(set(self._series))
+
+    def rows(self, series=None):
+        """Row positions of one series (all rows when ``series`` is None)"""
+        if series is None:
+            return np.arange(len(self.frame))
+        return np.flatnonzero(self._series == series)
+
+    def column(self, column):
+        return self._columns[column]
+
+    def index(self, column, series=None):
+        """Sorted values and matching row positions for ``column`` within ``series``"""
+        key = (column, series)
+        if key not in self._indexes:
+            if column not in self._columns:
+                raise KeyError(f"Column '{column}' is not indexed")
+            rows = self.rows(series)
+            # Stable sort keeps catalogue order between equal ratings,
+            # so the smaller designation wins a tie as in the printed tables.
+            order = rows[np.argsort(self._columns[column][rows], kind="stable")]
+            self._indexes[key] = (self._columns[column][order], order)
+        return self._indexes[key]
+
+    def select(self, column, required, series=None, strict=True):
+        """
+        Find the bearing with the smallest ``column`` value above ``required``.
+
+        Parameters:
+        -----------
+        column : str
+            Indexed column to search ('C', 'C0', 'd' or 'D')
+        required : float or array_like
+            Required value(s); an array selects for a whole sweep in one call
+        series : str
+            Restrict the search to one series (e.g. 'GAC..F', '230xx')
+        strict : bool
+            Require ``value > required`` (True) or ``value >= required`` (False)
+
+        Returns:
+        --------
+        int or ndarray
+            Row position(s) in ``frame``; -1 where no bearing is large enough
+        """
+        values, order = self.index(column, series)
+        required = np.asarray(required, dtype=float)
+        pos = np.searchsorted(values, required, side="right" if strict else "left")
+        padded = np.append(order, -1)  # pos == len(values) means nothing qualifies
+        rows = padded[pos]
+        if rows.ndim == 0:
+            return int(rows)
+        return rows
+
+    def record(self, row):
+        """Catalogue row as the plain dict used throughout the UI, or None for -1"""
+        if row is None or row < 0:
+            return None
+        data = self.frame.iloc[int(row)].to_dict()
+        return {k: _plain(v) for k, v in data.items()}
+
+    def records(self, series=None):
+        return [self.record(r) for r in self.rows(series)]
+
+
+def read_catalogue_frame(path):
+    """Read a CSV (optionally compressed) or Parquet bearing table"""
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+@lru_cache(maxsize=8)
+def _load_catalogue(path, mtime):
+    return BearingCatalogue(read_catalogue_frame(path))
+
+
+def load_bearing_catalogue(path=None):
+    """
+    Load a bearing catalogue once per process.
+
+    The cache key includes the file modification time, so replacing the
+    catalogue file on a running server is picked up on the next call.
+    """
+    path = os.path.abspath(path or DEFAULT_CATALOGUE)
+    return _load_catalogue(path, os.path.getmtime(path))
+
+
+def select_bearing(required, column, series, catalogue=None, strict=True):
+    """Select one bearing record (or None) for a scalar requirement"""
+    if catalogue is None:
+        catalogue = load_bearing_catalogue()
+    return catalogue.record(catalogue.select(column, required, series=series, strict=strict))
+
+
+def calculate_bearing_loads(rotating_mass, cabin_mass, snow_force=0.0, wind_force=0.0,
+                            eq_force_h=0.0, eq_force_v=0.0, g=9.81):
+    """
+    Step 11 design loads for the cabin and main spindle bearings (arrays broadcast).
+
+    Parameters:
+    -----------
+    rotating_mass : float
+        Rotating wheel mass in kg
+    cabin_mass : float
+        Loaded cabin mass in kg
+    snow_force, wind_force, eq_force_h, eq_force_v : float
+        Environmental forces in N (default 0.0)
+
+    Returns:
+    --------
+    dict : {
+        'cabin_bearing_load': per cabin bearing incl. factor 1.5 (N),
+        'required_C0': cabin bearing static rating with margin 1.2 (kN),
+        'radial_load', 'total_radial_load', 'axial_load', 'equivalent_load': main bearing (N),
+        'required_C': main bearing dynamic rating with factor 1.5 (kN)
+    }
+    """
+    cabin_bearing_load = np.asarray(cabin_mass, dtype=float) * g * 1.5
+    radial_load = np.asarray(rotating_mass, dtype=float) * g
+    total_radial_load = np.hypot(radial_load, np.asarray(wind_force, dtype=float) + eq_force_h)
+    axial_load = snow_force + eq_force_v + radial_load * 0.1
+    equivalent_load = total_radial_load + 1.5 * axial_load
+    return {
+        'cabin_bearing_load': cabin_bearing_load,
+        'required_C0': cabin_bearing_load / 1000 * 1.2,
+        'radial_load': radial_load,
+        'total_radial_load': total_radial_load,
+        'axial_load': axial_load,
+        'equivalent_load': equivalent_load,
+        'required_C': (equivalent_load / 1000) * 1.5,
+    }
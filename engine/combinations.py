@@ -0,0 +1,304 @@
+"""Factored load combinations over wheel angle and wind direction."""
+import os
+from functools import lru_cache
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from engine.bearings import DATA_DIR
+from engine.frame import basis_loads, passenger_loads
+from engine.structure import DOF_PER_NODE, GROUPS
+
+DEFAULT_FACTORS = os.path.join(DATA_DIR, "load_factors.csv")
+
+ACTIONS = ('G', 'Q', 'S', 'W', 'E')
+
+
+@lru_cache(maxsize=4)
+def _read_factors(path, mtime):
+    frame = pd.read_csv(path)
+    return {row['action']: row.to_dict() for _, row in frame.iterrows()}
+
+
+def load_partial_factors(path=None):
+    """Partial and combination factors per action, reloaded when the file changes"""
+    path = os.path.abspath(path or DEFAULT_FACTORS)
+    return _read_factors(path, os.path.getmtime(path))
+
+
+def generate_combinations(factors=None, seismic=True, sls=True):
+    """
+    Expand the combination rules into a factor matrix.
+
+    ULS (EN 1990 6.10): every variable action leads in turn with
+    γ_unfavourable; every subset of the others accompanies it with γ·ψ0;
+    permanent actions take both their unfavourable and favourable factor.
+    Seismic (6.12b): G + E + ψ2·variables. SLS characteristic: G + leading
+    + ψ0·others.
+
+    Returns:
+    --------
+    dict : {'names', 'limit_state', 'factors' (n_comb, len(ACTIONS))}
+    """
+    factors = factors or load_partial_factors()
+    variables = [a for a in ACTIONS if factors[a]['category'] == 'variable']
+    col = {a: i for i, a in enumerate(ACTIONS)}
+    names, states, rows = [], [], []
+
+    def add(name, state, gammas):
+        row = np.zeros(len(ACTIONS))
+        for a, v in gammas.items():
+            row[col[a]] = v
+        names.append(name)
+        states.append(state)
+        rows.append(row)
+
+    G = factors['G']
+    for lead in variables:
+        others = [a for a in variables if a != lead]
+        for mask in product((0, 1), repeat=len(others)):
+            acc = [a for a, on in zip(others, mask) if on]
+            for g_label, g in (('sup', G['gamma_unfavourable']), ('inf', G['gamma_favourable'])):
+                gammas = {'G': g, lead: factors[lead]['gamma_unfavourable']}
+                gammas.update({a: factors[a]['gamma_unfavourable'] * factors[a]['psi0'] for a in acc})
+                add(f"ULS {lead}" + ''.join(f"+{a}" for a in acc) + f" G{g_label}", 'ULS', gammas)
+            if sls:
+                gammas = {'G': 1.0, lead: 1.0}
+                gammas.update({a: factors[a]['psi0'] for a in acc})
+                add(f"SLS {lead}" + ''.join(f"+{a}" for a in acc), 'SLS', gammas)
+    if seismic and 'E' in factors:
+        for mask in product((0, 1), repeat=len(variables)):
+            gammas = {'G': 1.0, 'E': factors['E']['gamma_unfavourable']}
+            gammas.update({a: factors[a]['psi2'] for a, on in zip(variables, mask) if on})
+            add("SEIS E" + ''.join(f"+{a}" for a, on in zip(variables, mask) if on), 'SEIS', gammas)
+    return {'names': names, 'limit_state': np.asarray(states), 'factors': np.vstack(rows)}
+
+
+def combine(factors, effects, derive=None, chunk=32, keep=False):
+    """
+    Evaluate every combination on a characteristic effect tensor.
+
+    Parameters:
+    -----------
+    factors : ndarray
+        (n_comb, n_actions) partial factors
+    effects : ndarray
+        (n_actions, n_angle, n_direction, n_outputs) characteristic effects
+    derive : callable
+        Maps a combined block (c, a, d, q) to {output name: (c, a, d) array};
+        the default reports every linear output as is
+    keep : bool
+        Also return the full (n_comb, n_angle, n_direction, n_outputs) tensor
+
+    Returns:
+    --------
+    dict : {name: {'max', 'min', 'argmax', 'argmin'}} where arg* are
+        (combination, angle, direction) index tuples; plus 'tensor' if kept
+    """
+    factors = np.asarray(factors, dtype=float)
+    k, na, nd, nq = effects.shape
+    flat = effects.reshape(k, -1)
+    if derive is None:
+        def derive(block):
+            return {q: block[..., q] for q in range(nq)}
+    best = {}
+    tensor = np.empty((len(factors), na, nd, nq)) if keep else None
+    for start in range(0, len(factors), chunk):
+        block = (factors[start:start + chunk] @ flat).reshape(-1, na, nd, nq)
+        if keep:
+            tensor[start:start + len(block)] = block
+        for name, values in derive(block).items():
+            hi, lo = int(np.argmax(values)), int(np.argmin(values))
+            vmax, vmin = values.flat[hi], values.flat[lo]
+            cur = best.get(name)
+            if cur is None or vmax > cur['max']:
+                best.setdefault(name, {}).update(max=float(vmax), argmax=_offset(np.unravel_index(hi, values.shape), start))
+            if cur is None or vmin < best[name]['min']:
+                best[name].update(min=float(vmin), argmin=_offset(np.unravel_index(lo, values.shape), start))
+    if keep:
+        best['tensor'] = tensor
+    return best
+
+
+def _offset(index, start):
+    return (int(index[0]) + start, int(index[1]), int(index[2]))
+
+
+# --- Wheel action effects ---
+def _static_operator(model, hub_half):
+    """
+    Linear map from a nodal load vector to bearing and foundation resultants.
+
+    Rows: bearing reactions (+y side x/z, -y side x/z, axial y) from the
+    wheel and axle loads, then foundation V, Hx, Hy, Mx, My from all loads.
+    """
+    nodes = model['nodes']
+    n = len(nodes)
+    tower_nodes = np.unique(model['elements'][model['group'] == GROUPS.index('tower')])
+    wheel = np.ones(n, dtype=bool)
+    wheel[tower_nodes] = False
+    hub = nodes[model['elements'][model['group'] == GROUPS.index('axle')][0, 0]]
+    centre = np.array([0.0, 0.0, hub[2]])
+    r = nodes - centre
+    op = np.zeros((10, n, DOF_PER_NODE))
+    w = wheel.astype(float)
+    # Wheel resultant and moment about the hub centre: Mx = y·Fz - z·Fy, Mz = x·Fy - y·Fx
+    Fx, Fy, Fz = (np.stack([w * (c == j) for j in range(3)], axis=1) for c in range(3))
+    Mx = np.stack([np.zeros(n), -w * r[:, 2], w * r[:, 1]], axis=1)
+    Mz = np.stack([-w * r[:, 1], w * r[:, 0], np.zeros(n)], axis=1)
+    h2 = 2.0 * hub_half
+    op[0, :, :3] = -Fx / 2.0 + Mz / h2      # +y bearing, x
+    op[1, :, :3] = -Fz / 2.0 - Mx / h2      # +y bearing, z
+    op[2, :, :3] = -Fx / 2.0 - Mz / h2      # -y bearing, x
+    op[3, :, :3] = -Fz / 2.0 + Mx / h2      # -y bearing, z
+    op[4, :, :3] = -Fy
+    # Foundation: totals and overturning about the base centre
+    op[5, :, 2] = -1.0
+    op[6, :, 0] = 1.0
+    op[7, :, 1] = 1.0
+    op[8, :, 1] = -nodes[:, 2]
+    op[8, :, 2] = nodes[:, 1]
+    op[9, :, 0] = nodes[:, 2]
+    op[9, :, 2] = -nodes[:, 0]
+    return op.reshape(10, -1)
+
+
+# Horizontal and moment reactions reported per leg besides the vertical one ('leg_<i>')
+LEG_COMPONENTS = ('Rx', 'Ry', 'Mx', 'My')
+
+STATIC_OUTPUTS = ('bearing_p_x', 'bearing_p_z', 'bearing_m_x', 'bearing_m_z', 'bearing_axial_y',
+                  'foundation_V', 'foundation_Hx', 'foundation_Hy', 'foundation_Mx', 'foundation_My')
+
+
+def wheel_action_effects(frame, loads, patterns, passenger_mass, directions_deg=None, in_plane_ratio=0.35,
+                         members_per_group=3):
+    """
+    Characteristic effects of each action for every wheel case and direction.
+
+    Parameters:
+    -----------
+    frame : FrameSolver
+        From ``frame_from_breakdown``
+    loads : dict
+        Characteristic totals: 'snow' (N), 'wind' (N, face-on), 'seismic_C'
+        and 'seismic_Cv' (coefficients)
+    patterns : dict
+        {name: occupancy per cabin}; every pattern is evaluated at every cabin position
+    passenger_mass : float
+        Full-load passenger mass per cabin (kg), also part of the seismic mass
+    directions_deg : array_like
+        Horizontal action direction from the wheel-plane normal (default 16 points)
+    in_plane_ratio : float
+        Wind force along the wheel plane relative to face-on
+
+    Returns:
+    --------
+    dict : {
+        'effects' (len(ACTIONS), n_case, n_direction, n_outputs), 'outputs',
+        'cases': case labels, 'directions_deg', 'members': selected elements
+    }
+    """
+    model = frame.model
+    n_cab = len(model['cabin_nodes']) // 2
+    steps = np.arange(n_cab)
+    directions = np.arange(0.0, 360.0, 22.5) if directions_deg is None else np.asarray(directions_deg, float)
+    beta = np.radians(directions)
+    basis = basis_loads(model, passenger_mass)
+    hub_half = abs(model['nodes'][model['elements'][model['group'] == GROUPS.index('axle')][0, 0], 1])
+
+    names = ['self_weight', 'cabins', 'snow', 'wind_x', 'wind_y', 'seismic_x', 'seismic_y', 'seismic_z']
+    passengers = np.hstack([passenger_loads(model, occ, steps, passenger_mass) for occ in patterns.values()])
+    F = np.column_stack([basis[n] for n in names] + [passengers])
+    U = frame.solve(F)
+
+    # Support reactions R = K·U - F at the leg bases: vertical, then Rx, Ry, Mx, My
+    n_legs = len(model['fixed'])
+    legs = (model['fixed'][None, :] * DOF_PER_NODE + np.array([2, 0, 1, 3, 4])[:, None]).ravel()
+    reactions = frame.K[legs] @ U - F[legs]
+
+    # Members: the most heavily loaded elements of each group under the unit actions
+    axial = frame.member_forces(U)['axial']
+    influence = np.abs(axial).sum(axis=1) / frame.area
+    members = np.concatenate([
+        idx[np.argsort(influence[idx])[-members_per_group:]]
+        for idx in (np.flatnonzero(model['group'] == g) for g in range(len(GROUPS))) if idx.size
+    ])
+
+    static = _static_operator(model, hub_half) @ F
+    out = np.vstack([static, reactions, axial[members]])             # (n_outputs, n_basis)
+    outputs = list(STATIC_OUTPUTS) + [f"leg_{i + 1}" for i in range(n_legs)] + \
+        [f"leg_{i + 1}_{c}" for c in LEG_COMPONENTS for i in range(n_legs)] + \
+        [f"member_{GROUPS[model['group'][m]]}_{m}" for m in members]
+    col = {n: i for i, n in enumerate(names)}
+    unit = out[:, :len(names)]
+    q_cases = out[:, len(names):].T                                   # (n_case, n_outputs)
+
+    n_case, n_dir, n_out = q_cases.shape[0], len(directions), out.shape[0]
+    effects = np.zeros((len(ACTIONS), n_case, n_dir, n_out))
+    effects[ACTIONS.index('G')] = unit[:, col['self_weight']] + unit[:, col['cabins']]
+    effects[ACTIONS.index('Q')] = q_cases[:, None, :]
+    effects[ACTIONS.index('S')] = loads.get('snow', 0.0) * unit[:, col['snow']]
+    wind = loads.get('wind', 0.0) * (np.cos(beta)[:, None] * unit[:, col['wind_y']]
+                                     + in_plane_ratio * np.sin(beta)[:, None] * unit[:, col['wind_x']])
+    effects[ACTIONS.index('W')] = wind[None]
+    seismic = loads.get('seismic_C', 0.0) * (np.sin(beta)[:, None] * unit[:, col['seismic_x']]
+                                             + np.cos(beta)[:, None] * unit[:, col['seismic_y']]) \
+        - loads.get('seismic_Cv', 0.0) * unit[:, col['seismic_z']]
+    effects[ACTIONS.index('E')] = seismic[None]
+
+    cases = [f"{name} @ {s * 360.0 / n_cab:.0f}°" for name in patterns for s in steps]
+    return {'effects': effects, 'outputs': outputs, 'cases': cases, 'directions_deg': directions,
+            'members': members}
+
+
+def wheel_outputs(outputs, Y0=2.8):
+    """
+    ``combine`` derive function for the governing wheel quantities.
+
+    'bearing_static' is the equivalent static load P0 = Fr + Y0·Fa of the
+    more heavily loaded main bearing, evaluated per combination, wheel case
+    and direction so radial and axial peaks are never mixed across cases.
+    """
+    idx = {n: i for i, n in enumerate(outputs)}
+    legs = [i for n, i in idx.items() if n.startswith('leg_') and n.count('_') == 1]
+    member_groups = {}
+    for n, i in idx.items():
+        if n.startswith('member_'):
+            member_groups.setdefault(n.split('_')[1], []).append(i)
+
+    def derive(T):
+        radial = np.maximum(np.hypot(T[..., idx['bearing_p_x']], T[..., idx['bearing_p_z']]),
+                            np.hypot(T[..., idx['bearing_m_x']], T[..., idx['bearing_m_z']]))
+        axial = np.abs(T[..., idx['bearing_axial_y']])
+        res = {
+            'bearing_radial': radial,
+            'bearing_axial': axial,
+            'bearing_static': radial + Y0 * axial,
+            'foundation_V': T[..., idx['foundation_V']],
+            'foundation_H': np.hypot(T[..., idx['foundation_Hx']], T[..., idx['foundation_Hy']]),
+            'foundation_M': np.hypot(T[..., idx['foundation_Mx']], T[..., idx['foundation_My']]),
+            'leg_reaction': T[..., legs].max(axis=-1),
+            'leg_uplift': -T[..., legs].min(axis=-1),
+        }
+        for g, cols in member_groups.items():
+            res[f'{g}_tension'] = T[..., cols].max(axis=-1)
+            res[f'{g}_compression'] = -T[..., cols].min(axis=-1)
+        return res
+    return derive
+
+
+def governing_summary(result, combos, cases, directions_deg):
+    """Governing value per output with its combination, wheel case and direction"""
+    rows = {}
+    for name, r in result.items():
+        if name == 'tensor':
+            continue
+        c, a, d = r['argmax']
+        rows[name] = {
+            'value': r['max'],
+            'combination': combos['names'][c],
+            'case': cases[a],
+            'direction_deg': float(directions_deg[d]),
+        }
+    return rows
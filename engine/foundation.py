@@ -0,0 +1,233 @@
+"""Spread-footing checks (overturning, sliding, bearing) and minimum-volume sizing."""
+import numpy as np
+
+from engine.combinations import LEG_COMPONENTS
+
+# Allowable bearing pressure (kPa) and friction angle (deg) per ISIRI 2800 soil type
+SOIL_PROPERTIES = {
+    'Type I': {'bearing': 600.0, 'friction': 40.0},
+    'Type II': {'bearing': 400.0, 'friction': 36.0},
+    'Type III': {'bearing': 200.0, 'friction': 32.0},
+    'Type IV': {'bearing': 100.0, 'friction': 28.0},
+}
+
+CONCRETE_WEIGHT = 24.0e3   # N/m³
+
+# Required safety factors against overturning and sliding
+SAFETY_FACTORS = {'overturning': 1.5, 'sliding': 1.5}
+
+LOAD_COLUMNS = ('foundation_V', 'foundation_Hx', 'foundation_Hy', 'foundation_Mx', 'foundation_My')
+
+
+def foundation_load_sets(combos, wheel_effects, per_leg=False):
+    """
+    Design foundation loads for every combination × wheel case × direction.
+
+    Only the foundation columns of the effect tensor are combined, so this
+    is one small matrix product however many combinations there are.
+
+    Parameters:
+    -----------
+    per_leg : bool
+        False: resultants on a single base under the whole tower.
+        True: loads on a pad under each leg (the negated support reactions).
+
+    Returns:
+    --------
+    ndarray : (n_comb, n_case, n_direction, 5) or, per leg,
+        (n_comb, n_case, n_direction, n_legs, 5) with V (down), Hx, Hy (N)
+        and Mx, My (N·m) at ground level
+    """
+    outputs = wheel_effects['outputs']
+    if per_leg:
+        n_legs = sum(1 for n in outputs if n.startswith('leg_') and n.count('_') == 1)
+        cols = [outputs.index(f"leg_{i + 1}") for i in range(n_legs)] + \
+            [outputs.index(f"leg_{i + 1}_{c}") for c in LEG_COMPONENTS for i in range(n_legs)]
+        sign = np.repeat([1.0, -1.0, -1.0, -1.0, -1.0], n_legs)
+    else:
+        cols = [outputs.index(c) for c in LOAD_COLUMNS]
+        sign = np.ones(len(cols))
+    effects = wheel_effects['effects'][..., cols] * sign
+    k, na, nd, _ = effects.shape
+    loads = (combos['factors'] @ effects.reshape(k, -1)).reshape(-1, na, nd, len(cols))
+    if per_leg:
+        loads = loads.reshape(-1, na, nd, 5, n_legs).swapaxes(-1, -2)
+    return loads
+
+
+def extreme_load_sets(loads, n_directions=64, seed=0):
+    """
+    Load sets that are extreme along random directions of the (scaled) load space.
+
+    Used to seed the working set of ``size_footing``; the result is a
+    small subset, not a complete description of the worst cases.
+    """
+    P = np.asarray(loads, dtype=float).reshape(-1, 5)
+    scale = np.where(P.std(axis=0) > 0, P.std(axis=0), 1.0)
+    X = (P - P.mean(axis=0)) / scale
+    directions = np.random.default_rng(seed).standard_normal((5, n_directions))
+    directions = np.hstack([directions, np.eye(5), -np.eye(5)])
+    return P[np.unique(np.argmax(X @ directions, axis=0))]
+
+
+def footing_checks(loads, length, width, depth, soil_type='Type II', safety=None):
+    """
+    Utilisation of each check for footings × load sets.
+
+    The footing is a rectangular pad, ``length`` along the wheel plane (x)
+    and ``width`` along the axle (y), with its underside ``depth`` below
+    ground. Bearing uses the effective (Meyerhof) area L'·B'. A utilisation
+    above 1 fails.
+
+    Parameters:
+    -----------
+    loads : ndarray
+        (..., 5) load sets from ``foundation_load_sets``
+    length, width, depth : array_like
+        Footing dimensions (m), broadcast together to shape (f,)
+
+    Returns:
+    --------
+    dict : {'overturning', 'sliding', 'bearing', 'governing'} each (f,) -
+        the worst utilisation over all load sets
+    """
+    checks = _utilisation(loads, length, width, depth, soil_type, safety)
+    result = {name: u.max(axis=1) for name, u in checks.items()}
+    result['governing'] = np.maximum.reduce([result['overturning'], result['sliding'], result['bearing']])
+    return result
+
+
+def _utilisation(loads, length, width, depth, soil_type, safety):
+    """Per footing × load set utilisation of each check (inf on uplift)"""
+    safety = safety or SAFETY_FACTORS
+    soil = SOIL_PROPERTIES[soil_type]
+    L, B, D = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (length, width, depth)))
+    L, B, D = L[:, None], B[:, None], D[:, None]
+    P = np.asarray(loads, dtype=float).reshape(-1, 5)
+    V, Hx, Hy, Mx, My = (P[:, i][None, :] for i in range(5))
+
+    N = V + CONCRETE_WEIGHT * L * B * D
+    safe_N = np.maximum(N, 1e-9)
+    # Moments about the underside of the footing
+    ey = np.abs(Mx - Hy * D) / safe_N
+    ex = np.abs(My + Hx * D) / safe_N
+    overturning = np.maximum(ex / L, ey / B) * 2.0 * safety['overturning']
+    mu = np.tan(np.radians(2.0 / 3.0 * soil['friction']))
+    sliding = safety['sliding'] * np.hypot(Hx, Hy) / (mu * safe_N)
+    area = np.maximum(L - 2.0 * ex, 0.0) * np.maximum(B - 2.0 * ey, 0.0)
+    bearing = np.divide(N / 1000.0, area * soil['bearing'], out=np.full_like(area, np.inf), where=area > 0)
+
+    uplift = N <= 0
+    return {name: np.where(uplift, np.inf, u)
+            for name, u in (('overturning', overturning), ('sliding', sliding), ('bearing', bearing))}
+
+
+def size_footing(loads, footprint, soil_type='Type II', depths=None, aspects=None, max_margin=30.0,
+                 tolerance=0.01, safety=None):
+    """
+    Minimum-volume rectangular footing that passes every check.
+
+    For each trial depth and plan aspect the footing is grown around the
+    tower-leg ``footprint`` (L0, B0) by a margin m: L = L0 + 2m·a, B = B0 + 2m.
+    Every check improves as the plan grows, so m is found by bisection for
+    all (depth, aspect) candidates at once; the smallest volume wins.
+
+    The bisection runs on a small working set of load sets, seeded by
+    ``extreme_load_sets``. The chosen footing is then checked against every
+    load set and any that fail join the working set for another round. A
+    relaxed problem can only under-size the candidates, so once the winner
+    passes all load sets it is also the true minimum.
+
+    Parameters:
+    -----------
+    loads : ndarray
+        (..., 5) design load sets
+    footprint : tuple
+        Minimum plan (L0, B0) (m) covering the tower legs
+    depths : array_like
+        Trial depths (m), default 1.0 - 4.0 m
+    aspects : array_like
+        Plan growth ratio along x relative to y
+
+    Returns:
+    --------
+    dict : {
+        'length', 'width', 'depth' (m), 'volume' (m³), 'utilisation': checks
+        for the chosen footing, 'feasible': False if no candidate passes
+        within ``max_margin``
+    }
+    """
+    depths = np.arange(1.0, 4.01, 0.25) if depths is None else np.asarray(depths, dtype=float)
+    aspects = np.array([0.5, 1.0, 1.5, 2.0]) if aspects is None else np.asarray(aspects, dtype=float)
+    D, A = (g.ravel() for g in np.meshgrid(depths, aspects, indexing='ij'))
+    L0, B0 = footprint
+    P_all = np.asarray(loads, dtype=float).reshape(-1, 5)
+    P = extreme_load_sets(P_all)
+
+    def passes(m):
+        return footing_checks(P, L0 + 2.0 * m * A, B0 + 2.0 * m, D, soil_type, safety)['governing'] <= 1.0
+
+    while True:
+        lo = np.zeros_like(D)
+        hi = np.full_like(D, max_margin)
+        ok_lo, ok_hi = passes(lo), passes(hi)
+        hi[ok_lo] = 0.0
+        while np.any(hi - lo > tolerance):
+            mid = 0.5 * (lo + hi)
+            ok = passes(mid)
+            hi = np.where(ok, mid, hi)
+            lo = np.where(ok, lo, mid)
+
+        L, B = L0 + 2.0 * hi * A, B0 + 2.0 * hi
+        volume = np.where(ok_hi | ok_lo, L * B * D, np.inf)
+        best = int(np.argmin(volume))
+        if not np.isfinite(volume[best]):
+            break
+        governing = np.maximum.reduce(list(_utilisation(P_all, L[best], B[best], D[best], soil_type, safety).values()))[0]
+        failing = governing > 1.0
+        if not failing.any():
+            break
+        P = np.vstack([P, P_all[failing]])
+    checks = footing_checks(P_all, L[best], B[best], D[best], soil_type, safety)
+    return {
+        'length': float(L[best]),
+        'width': float(B[best]),
+        'depth': float(D[best]),
+        'volume': float(volume[best]),
+        'utilisation': {k: float(v[0]) for k, v in checks.items()},
+        'feasible': bool(np.isfinite(volume[best])),
+        'n_load_sets': len(P),
+    }
+
+
+def leg_footprint(model, pedestal=1.0):
+    """Plan (L0, B0) of a single base enclosing the tower legs plus a pedestal allowance each side (m)"""
+    legs = model['nodes'][model['fixed']]
+    return (2.0 * np.abs(legs[:, 0]).max() + 2.0 * pedestal,
+            2.0 * np.abs(legs[:, 1]).max() + 2.0 * pedestal)
+
+
+def overturning_check(loads, footprint, safety=None):
+    """
+    Global overturning of the whole wheel about the edges of the leg footprint.
+
+    Returns:
+    --------
+    dict : {'moment' (N·m): largest overturning moment, 'stabilising' (N·m)
+        at the same load set, 'factor': smallest safety factor, 'passes'}
+    """
+    safety = safety or SAFETY_FACTORS
+    P = np.asarray(loads, dtype=float).reshape(-1, 5)
+    L0, B0 = footprint
+    V = np.maximum(P[:, 0], 0.0)
+    factor_x = np.divide(V * L0 / 2.0, np.abs(P[:, 4]), out=np.full(len(P), np.inf), where=P[:, 4] != 0)
+    factor_y = np.divide(V * B0 / 2.0, np.abs(P[:, 3]), out=np.full(len(P), np.inf), where=P[:, 3] != 0)
+    factor = np.minimum(factor_x, factor_y)
+    i = int(np.argmin(factor))
+    about_x = factor_y[i] <= factor_x[i]
+    return {
+        'moment': float(abs(P[i, 3] if about_x else P[i, 4])),
+        'stabilising': float(V[i] * (B0 if about_x else L0) / 2.0),
+        'factor': float(factor[i]),
+        'passes': bool(factor[i] >= safety['overturning']),
+    }
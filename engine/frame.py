@@ -0,0 +1,207 @@
+"""Static frame analysis of the wheel: one factorisation, many load cases."""
+from functools import lru_cache
+
+import numpy as np
+from scipy.sparse.linalg import splu
+
+from engine.structure import (DOF_PER_NODE, GROUPS, assemble_mass, assemble_stiffness, element_dofs,
+                              element_matrices, free_dofs, section_property, structural_node_mass,
+                              wheel_model)
+
+
+class FrameSolver:
+    """
+    Linear static solver for a ``wheel_model`` frame.
+
+    The reduced stiffness matrix is LU-factorised once on construction;
+    ``solve`` then back-substitutes any number of load vectors in one call
+    and ``member_forces`` recovers element end forces for all cases with a
+    single batched product per chunk.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.free = free_dofs(model)
+        self.n_dof = len(model['nodes']) * DOF_PER_NODE
+        K = assemble_stiffness(model)
+        self.K = K
+        # K is symmetric: minimum-degree ordering on K + Kᵀ keeps the factors sparse
+        self.lu = splu(K[self.free][:, self.free].tocsc(), permc_spec='MMD_AT_PLUS_A',
+                       options={'SymmetricMode': True})
+        k, T = element_matrices(model)
+        self.kT = np.einsum('eij,ejk->eik', k, T)        # local end forces from global displacements
+        self.dofs = element_dofs(model)
+        self.area = section_property(model, 'A')
+        self.modulus = section_property(model, 'W')
+
+    def solve(self, loads):
+        """
+        Displacements for load vectors ``loads`` of shape (n_dof,) or (n_dof, n_cases).
+
+        Loads on restrained DOFs are ignored (taken by the supports).
+        """
+        F = np.asarray(loads, dtype=float)
+        single = F.ndim == 1
+        F = F.reshape(self.n_dof, -1)
+        U = np.zeros_like(F)
+        U[self.free] = self.lu.solve(np.ascontiguousarray(F[self.free]))
+        return U[:, 0] if single else U
+
+    def solve_combinations(self, basis, coefficients):
+        """
+        Displacements for linear combinations of basis load vectors.
+
+        Only the basis columns (n_dof, n_basis) are back-substituted; the
+        (n_basis, n_cases) coefficient matrix is then applied to the
+        displacements, which is far cheaper than solving every case.
+        """
+        return self.solve(basis) @ np.asarray(coefficients, dtype=float)
+
+    def member_forces(self, U, chunk=128):
+        """
+        Element force summary for displacement sets ``U`` (n_dof, n_cases).
+
+        Returns:
+        --------
+        dict : {
+            'axial' (ne, n_cases): N, tension positive,
+            'shear': largest resultant end shear (N),
+            'moment': largest resultant end bending moment (N·m),
+            'torsion': (N·m),
+            'stress': |N|/A + M/W (MPa)
+        }
+        """
+        U = np.asarray(U, dtype=float).reshape(self.n_dof, -1)
+        n_el, n_case = len(self.dofs), U.shape[1]
+        out = {k: np.empty((n_el, n_case)) for k in ('axial', 'shear', 'moment', 'torsion', 'stress')}
+        for start in range(0, n_case, chunk):
+            sl = slice(start, start + chunk)
+            f = np.einsum('eij,ejc->eic', self.kT, U[self.dofs, sl])
+            axial = 0.5 * (f[:, 6] - f[:, 0])
+            shear = np.maximum(np.hypot(f[:, 1], f[:, 2]), np.hypot(f[:, 7], f[:, 8]))
+            moment = np.maximum(np.hypot(f[:, 4], f[:, 5]), np.hypot(f[:, 10], f[:, 11]))
+            out['axial'][:, sl] = axial
+            out['shear'][:, sl] = shear
+            out['moment'][:, sl] = moment
+            out['torsion'][:, sl] = np.abs(f[:, 9])
+            out['stress'][:, sl] = (np.abs(axial) / self.area[:, None] + moment / self.modulus[:, None]) / 1e6
+        return out
+
+
+def _spread(model, nodes, direction, total):
+    F = np.zeros((len(model['nodes']), DOF_PER_NODE))
+    F[nodes, direction] += total / len(nodes)
+    return F.ravel()
+
+
+def basis_loads(model, passenger_mass=0.0, g=9.81):
+    """
+    Unit load vectors for superposition.
+
+    ``passenger_mass`` (kg per cabin, full load) is added to the seismic
+    inertia at the cabin nodes; models built without passengers (the
+    cached ``wheel_frame``) get it here instead.
+
+    Returns:
+    --------
+    dict : {
+        'self_weight': member self-weight,
+        'cabins': empty cabin weight,
+        'snow': 1 N downward spread over the cabins,
+        'wind_x', 'wind_y': 1 N in-plane / out-of-plane over the cabins,
+        'seismic_x', 'seismic_y', 'seismic_z': inertia of the full mass at 1 g
+    }
+    """
+    n = len(model['nodes'])
+    cabins = model['cabin_nodes']
+    loads = {}
+    F = np.zeros((n, DOF_PER_NODE))
+    F[:, 2] = -g * structural_node_mass(model)
+    loads['self_weight'] = F.ravel()
+    loads['cabins'] = _spread(model, cabins, 2, -g * model['cabin_mass'] * len(cabins) / 2.0)
+    loads['snow'] = _spread(model, cabins, 2, -1.0)
+    loads['wind_x'] = _spread(model, cabins, 0, 1.0)
+    loads['wind_y'] = _spread(model, cabins, 1, 1.0)
+    mass = assemble_mass(model).reshape(n, DOF_PER_NODE)[:, 0].copy()
+    mass[cabins] += passenger_mass / 2.0
+    for c, name in enumerate(('seismic_x', 'seismic_y', 'seismic_z')):
+        F = np.zeros((n, DOF_PER_NODE))
+        F[:, c] = g * mass
+        loads[name] = F.ravel()
+    return loads
+
+
+def passenger_loads(model, occupancy, steps, passenger_mass=None, g=9.81):
+    """
+    Passenger weight for the wheel turned by each of ``steps`` cabin pitches.
+
+    ``occupancy`` gives the load fraction of each cabin (cabin order around
+    the rim at step 0) and ``passenger_mass`` the full-load passenger mass
+    per cabin (default: the model's own). Turning the wheel by one pitch
+    moves every cabin to the next position, so the structure is unchanged
+    and only the load pattern rotates.
+
+    Returns:
+    --------
+    ndarray : (n_dof, len(steps))
+    """
+    occupancy = np.asarray(occupancy, dtype=float)
+    n_cab = occupancy.size
+    steps = np.asarray(steps, dtype=np.int64)
+    pos = np.arange(n_cab)
+    occ = occupancy[(pos[None, :] - steps[:, None]) % n_cab]                 # (step, position)
+    F = np.zeros((len(model['nodes']), DOF_PER_NODE, len(steps)))
+    if passenger_mass is None:
+        passenger_mass = model['passenger_mass']
+    weight = -g * passenger_mass / 2.0 * occ.T                        # (position, step)
+    cabins = model['cabin_nodes'].reshape(n_cab, 2)
+    F[cabins[:, 0], 2] += weight
+    F[cabins[:, 1], 2] += weight
+    return F.reshape(-1, len(steps))
+
+
+def group_envelope(model, forces, case_labels=None):
+    """
+    Worst member of each group over all cases.
+
+    Returns:
+    --------
+    dict : {group: {'axial_max', 'axial_min' (N), 'moment' (N·m), 'stress' (MPa),
+                    'element', 'case'}} where element/case locate the peak stress
+    """
+    result = {}
+    for gi, name in enumerate(GROUPS):
+        members = np.flatnonzero(model['group'] == gi)
+        if not members.size:
+            continue
+        stress = forces['stress'][members]
+        e, c = np.unravel_index(np.argmax(stress), stress.shape)
+        result[name] = {
+            'axial_max': float(forces['axial'][members].max()),
+            'axial_min': float(forces['axial'][members].min()),
+            'moment': float(forces['moment'][members].max()),
+            'stress': float(stress[e, c]),
+            'element': int(members[e]),
+            'case': case_labels[c] if case_labels is not None else int(c),
+        }
+    return result
+
+
+@lru_cache(maxsize=8)
+def wheel_frame(diameter, num_cabins, hub_height, mass_structure, mass_axis, mass_cabins, refine=2):
+    """
+    Cached FrameSolver of the empty wheel keyed by geometry and mass breakdown (see ``wheel_modes``).
+
+    Passengers are loads, not part of the key: pass their mass to
+    ``passenger_loads`` and ``basis_loads``, so occupancy changes reuse the
+    factorisation.
+    """
+    masses = {'mass_structure': mass_structure, 'mass_axis': mass_axis, 'mass_cabins': mass_cabins}
+    return FrameSolver(wheel_model(diameter, int(num_cabins), hub_height, masses, refine=refine))
+
+
+def frame_from_breakdown(diameter, num_cabins, hub_height, breakdown, refine=2):
+    """``wheel_frame`` with masses taken from a ``calculate_motor_power`` breakdown"""
+    return wheel_frame(float(diameter), int(num_cabins), float(hub_height),
+                       round(float(breakdown['mass_structure'])), round(float(breakdown['mass_axis'])),
+                       round(float(breakdown['mass_cabins'])), refine)
@@ -0,0 +1,114 @@
+"""Nearest-city lookup by coordinates over the reference gazetteer (cached KD-tree)."""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from engine.reference import DEFAULT_HAZARD, load_reference
+
+EARTH_RADIUS_KM = 6371.0
+
+LATITUDE_COLUMNS = ('lat', 'latitude', 'y')
+LONGITUDE_COLUMNS = ('lon', 'lng', 'long', 'longitude', 'x')
+NAME_COLUMNS = ('site', 'name', 'id')
+
+
+def _pick_column(columns, candidates, explicit=None):
+    if explicit:
+        return explicit
+    lower = {c.strip().lower(): c for c in columns}
+    return next((lower[name] for name in candidates if name in lower), None)
+
+
+def unit_vectors(lat, lon):
+    """Points on the unit sphere (..., 3) so Euclidean KD-tree neighbours are great-circle neighbours"""
+    phi, lam = np.radians(np.asarray(lat, dtype=float)), np.radians(np.asarray(lon, dtype=float))
+    return np.stack([np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)], axis=-1)
+
+
+@lru_cache(maxsize=4)
+def city_tree(data_dir=None):
+    """
+    KD-tree over every gazetteer city with coordinates, built once per data set.
+
+    Returns:
+    --------
+    dict : {'tree': cKDTree, 'province', 'city', 'city_fa', 'hazard' (n,) str arrays,
+            'lat', 'lon' (n,) degrees}
+    """
+    ref = load_reference(data_dir)
+    located = [(province, c) for (province, _), c in ref['city_index'].items() if c['lat'] is not None]
+    if not located:
+        raise ValueError("No city in the gazetteer has coordinates")
+    lat = np.array([c['lat'] for _, c in located])
+    lon = np.array([c['lon'] for _, c in located])
+    return {
+        'tree': cKDTree(unit_vectors(lat, lon)),
+        'province': np.array([p for p, _ in located]),
+        'city': np.array([c['city'] for _, c in located]),
+        'city_fa': np.array([c['city_fa'] for _, c in located]),
+        'hazard': np.array([c['hazard'] or ref['province_hazard'].get(p, DEFAULT_HAZARD) for p, c in located]),
+        'lat': lat,
+        'lon': lon,
+    }
+
+
+def nearest_cities(lat, lon, data_dir=None):
+    """
+    Nearest gazetteer city to each site; ``lat``/``lon`` broadcast (degrees).
+
+    One tree query covers the whole batch, so thousands of sites cost about
+    as much as a single Python-level lookup.
+
+    Returns:
+    --------
+    dict : {'province', 'city', 'city_fa', 'hazard', 'terrain_category' (n,) str,
+            'distance_km' (n,) great-circle distance to the city}
+    """
+    index = city_tree(data_dir)
+    terrain = load_reference(data_dir)['terrain']
+    points = unit_vectors(*np.broadcast_arrays(np.atleast_1d(lat), np.atleast_1d(lon)))
+    chord, i = index['tree'].query(points.reshape(-1, 3))
+    province = index['province'][i]
+    return {
+        'province': province,
+        'city': index['city'][i],
+        'city_fa': index['city_fa'][i],
+        'hazard': index['hazard'][i],
+        'terrain_category': np.array([terrain[p]['category'] if p in terrain else '' for p in province]),
+        'distance_km': 2.0 * EARTH_RADIUS_KM * np.arcsin(np.minimum(chord / 2.0, 1.0)),
+    }
+
+
+def nearest_city(lat, lon, data_dir=None):
+    """``nearest_cities`` for one site as a dict of plain values"""
+    found = nearest_cities(lat, lon, data_dir)
+    return {k: (float(v[0]) if k == 'distance_km' else str(v[0])) for k, v in found.items()}
+
+
+def read_sites(source, lat_col=None, lon_col=None):
+    """
+    Read a CSV of sites with latitude/longitude columns (common names detected).
+
+    Rows with a blank, non-numeric or out-of-range coordinate are dropped
+    and counted in 'skipped'.
+
+    Returns:
+    --------
+    dict : {'name' (n,) str: site name column or row number, 'lat', 'lon' (n,) degrees,
+        'skipped': rows dropped for invalid coordinates}
+    """
+    frame = pd.read_csv(source)
+    lat_col = _pick_column(frame.columns, LATITUDE_COLUMNS, lat_col)
+    lon_col = _pick_column(frame.columns, LONGITUDE_COLUMNS, lon_col)
+    if lat_col is None or lon_col is None:
+        raise ValueError("Could not find latitude and longitude columns in the sites file")
+    name_col = _pick_column(frame.columns, NAME_COLUMNS)
+    names = frame[name_col].astype(str).to_numpy() if name_col else np.arange(1, len(frame) + 1).astype(str)
+    lat = pd.to_numeric(frame[lat_col], errors='coerce').to_numpy(dtype=float)
+    lon = pd.to_numeric(frame[lon_col], errors='coerce').to_numpy(dtype=float)
+    valid = np.isfinite(lat) & np.isfinite(lon) & (np.abs(lat) <= 90.0) & (np.abs(lon) <= 180.0)
+    if not valid.any():
+        raise ValueError("No site in the file has valid latitude and longitude values")
+    return {'name': names[valid], 'lat': lat[valid], 'lon': lon[valid], 'skipped': int((~valid).sum())}
@@ -0,0 +1,127 @@
+"""Cabin geometry registry: integer codes and per-shape properties shared by every calculator."""
+import numpy as np
+
+SQUARE, VERTICAL_CYLINDER, HORIZONTAL_CYLINDER, SPHERICAL = range(4)
+
+# One entry per cabin shape, indexed by its integer code. 'outline' is the
+# diagram footprint (width, height) relative to the cabin scale; None draws a circle.
+CABIN_GEOMETRIES = {
+    SQUARE: {
+        'key': 'Square', 'text_key': 'geom_square', 'names': ("Square", "مربعی"),
+        'mass': 450.0, 'unit_cost': 45000.0, 'force_coefficient': 1.3, 'base_divisor': 4.0,
+        'image': "./git/assets/square.jpg", 'outline': (0.6, 0.6),
+        'fill': 'rgba(244, 67, 54, 0.6)', 'line': '#F44336',
+    },
+    VERTICAL_CYLINDER: {
+        'key': 'Vertical Cylinder', 'text_key': 'geom_vert_cyl', 'names': ("Vertical Cylinder", "استوانه عمودی"),
+        'mass': 400.0, 'unit_cost': 50000.0, 'force_coefficient': 0.9, 'base_divisor': 4.0,
+        'image': "./git/assets/vertical.jpg", 'outline': (0.4, 0.8),
+        'fill': 'rgba(76, 175, 80, 0.6)', 'line': '#4CAF50',
+    },
+    HORIZONTAL_CYLINDER: {
+        'key': 'Horizontal Cylinder', 'text_key': 'geom_horiz_cyl', 'names': ("Horizontal Cylinder", "استوانه افقی"),
+        'mass': 500.0, 'unit_cost': 55000.0, 'force_coefficient': 0.9, 'base_divisor': 4.0,
+        'image': "./git/assets/horizontal.jpg", 'outline': (0.8, 0.4),
+        'fill': 'rgba(156, 39, 176, 0.6)', 'line': '#9C27B0',
+    },
+    SPHERICAL: {
+        'key': 'Spherical', 'text_key': 'geom_spherical', 'names': ("Spherical", "کروی"),
+        'mass': 350.0, 'unit_cost': 80000.0, 'force_coefficient': 0.5, 'base_divisor': 5.0,
+        'image': "./git/assets/sphere.jpg", 'outline': None,
+        'fill': 'rgba(255, 193, 7, 0.6)', 'line': '#FFC107',
+    },
+}
+
+# Column views of the registry for array evaluation: PROPERTY[codes]
+CABIN_MASS = np.array([g['mass'] for g in CABIN_GEOMETRIES.values()])
+CABIN_COST = np.array([g['unit_cost'] for g in CABIN_GEOMETRIES.values()])
+FORCE_COEFFICIENT = np.array([g['force_coefficient'] for g in CABIN_GEOMETRIES.values()])
+BASE_DIVISOR = np.array([g['base_divisor'] for g in CABIN_GEOMETRIES.values()])
+
+SEAT_MASS = 20.0                 # kg per seat
+FLOOR_AREA_PER_PERSON = 0.6      # m²
+VOLUME_PER_PERSON = 1.5          # m³, spherical cabins
+CABIN_HEIGHT = 2.2               # m
+SURFACE_AREA_LIMITS = (8.0, 25.0)
+
+# Every label a geometry may be stored under (English, Persian, registry key) -> code
+_CODES = {}
+for _code, _geometry in CABIN_GEOMETRIES.items():
+    for _label in (_geometry['key'],) + _geometry['names']:
+        _CODES[_label] = _code
+        _CODES[_label.lower()] = _code
+
+
+def geometry_code(geometry, default=SQUARE):
+    """Integer code for a geometry label in either language (or a code); unknown labels give ``default``"""
+    if isinstance(geometry, (int, np.integer)):
+        return int(geometry)
+    if not geometry:
+        return default
+    return _CODES.get(geometry, _CODES.get(str(geometry).strip().lower(), default))
+
+
+def geometry_name(code, persian=False):
+    """Display name of a geometry code"""
+    return CABIN_GEOMETRIES[geometry_code(code)]['names'][1 if persian else 0]
+
+
+def cabin_mass(code, capacity):
+    """Empty cabin mass (kg): shape base mass plus the seats; arrays broadcast"""
+    return CABIN_MASS[np.asarray(code)] + SEAT_MASS * np.asarray(capacity)
+
+
+def force_coefficient(code):
+    """Bluff-body force coefficient c_f of the cabin shape"""
+    return FORCE_COEFFICIENT[np.asarray(code)]
+
+
+def cabin_count_base(code, diameter):
+    """Nominal cabin count π·D / divisor from which the allowed range is derived"""
+    return np.pi * np.asarray(diameter) / BASE_DIVISOR[np.asarray(code)]
+
+
+def cabin_dimensions(code, capacity, diameter):
+    """
+    Principal cabin dimensions for each shape (arrays broadcast).
+
+    Cabins are sized from the floor area (0.6 m² per passenger) or, for
+    spheres, the enclosed volume, and limited to D/8 across.
+
+    Returns:
+    --------
+    dict : {'width' (m): square side or cylinder/sphere diameter,
+            'length' (m): vertical height or horizontal cylinder length}
+    """
+    code, capacity, diameter = np.broadcast_arrays(np.asarray(code), np.asarray(capacity, dtype=float),
+                                                   np.asarray(diameter, dtype=float))
+    floor_area = capacity * FLOOR_AREA_PER_PERSON
+    max_dim = diameter / 8.0
+    sphere_r = np.minimum((3.0 * capacity * VOLUME_PER_PERSON / (4.0 * np.pi)) ** (1.0 / 3.0), max_dim / 2.0)
+    width = np.select(
+        [code == VERTICAL_CYLINDER, code == HORIZONTAL_CYLINDER, code == SPHERICAL],
+        [2.0 * np.minimum(np.sqrt(floor_area / np.pi), max_dim / 2.0),
+         2.0 * np.minimum(1.0, max_dim / 4.0),
+         2.0 * sphere_r],
+        np.minimum(np.sqrt(floor_area), max_dim))
+    length = np.select(
+        [code == HORIZONTAL_CYLINDER, code == SPHERICAL],
+        [np.minimum(floor_area / 2.0, max_dim), 2.0 * sphere_r],
+        np.full(width.shape, CABIN_HEIGHT))
+    return {'width': width, 'length': length}
+
+
+def cabin_surface_area(code, capacity, diameter):
+    """
+    Outer surface area of a cabin (m²), clipped to 8 - 25 m².
+
+    Square: 2s² + 4s·h; cylinders: 2πr² + 2πr·L; sphere: 4πr².
+    """
+    code = np.asarray(code)
+    dims = cabin_dimensions(code, capacity, diameter)
+    w, L = dims['width'], dims['length']
+    r = w / 2.0
+    area = np.where(
+        code == SPHERICAL, 4.0 * np.pi * r ** 2,
+        np.where(code == SQUARE, 2.0 * w ** 2 + 4.0 * w * L, 2.0 * np.pi * r ** 2 + 2.0 * np.pi * r * L))
+    return np.round(np.clip(area, *SURFACE_AREA_LIMITS), 2)
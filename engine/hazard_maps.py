@@ -0,0 +1,92 @@
+"""Gridded hazard maps (PGA, ground snow load, basic wind speed v_b) sampled from memory-mapped rasters."""
+import os
+import struct
+from functools import lru_cache
+
+import numpy as np
+
+from engine.bearings import DATA_DIR
+
+HAZARD_DIR = os.path.join(DATA_DIR, "hazard")
+
+# File layout: 48-byte little-endian header (magic, rows, cols, lat_min, lon_min,
+# dlat, dlon) then rows × cols float32 values, row 0 at lat_min (south), NaN = no data
+MAGIC = b"FWGRID1\0"
+HEADER = struct.Struct("<8s2i4d")
+
+HAZARD_LAYERS = {
+    'pga': {'file': "pga.grid", 'units': "g", 'text_key': "hazard_pga"},
+    'snow': {'file': "snow.grid", 'units': "kN/m²", 'text_key': "hazard_snow"},
+    'wind': {'file': "wind.grid", 'units': "m/s", 'text_key': "hazard_wind"},
+}
+
+
+def write_raster(path, values, lat_min, lon_min, dlat, dlon):
+    """Write a (rows, cols) grid in the raster format; cell centres start at (lat_min, lon_min)"""
+    values = np.asarray(values, dtype='<f4')
+    if values.ndim != 2 or min(values.shape) < 2:
+        raise ValueError("A raster needs at least 2 × 2 cells")
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, values.shape[0], values.shape[1], lat_min, lon_min, dlat, dlon))
+        f.write(values.tobytes())
+
+
+@lru_cache(maxsize=16)
+def _open_raster(path, mtime):
+    with open(path, 'rb') as f:
+        magic, rows, cols, lat_min, lon_min, dlat, dlon = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"'{path}' is not a hazard raster")
+    return {
+        'values': np.memmap(path, dtype='<f4', mode='r', offset=HEADER.size, shape=(rows, cols)),
+        'lat_min': lat_min, 'lon_min': lon_min, 'dlat': dlat, 'dlon': dlon,
+    }
+
+
+def open_raster(path):
+    """Memory-mapped raster, shared per process and reopened when the file changes"""
+    path = os.path.abspath(path)
+    return _open_raster(path, os.path.getmtime(path))
+
+
+def sample(raster, lat, lon):
+    """
+    Bilinear interpolation of a raster at sites; ``lat``/``lon`` broadcast (degrees).
+
+    Only the four cells around each site are read from the memory map, so
+    the grid is never loaded whole. Sites outside the grid, or next to a
+    no-data cell, give NaN.
+    """
+    values = raster['values']
+    rows, cols = values.shape
+    lat, lon = np.broadcast_arrays(np.asarray(lat, dtype=float), np.asarray(lon, dtype=float))
+    fy = (lat - raster['lat_min']) / raster['dlat']
+    fx = (lon - raster['lon_min']) / raster['dlon']
+    inside = (fy >= 0) & (fy <= rows - 1) & (fx >= 0) & (fx <= cols - 1)
+    i = np.clip(np.floor(np.nan_to_num(fy)).astype(np.int64), 0, rows - 2)
+    j = np.clip(np.floor(np.nan_to_num(fx)).astype(np.int64), 0, cols - 2)
+    t, u = fy - i, fx - j
+    v = ((1 - t) * (1 - u) * values[i, j] + (1 - t) * u * values[i, j + 1]
+         + t * (1 - u) * values[i + 1, j] + t * u * values[i + 1, j + 1])
+    return np.where(inside, v, np.nan)
+
+
+def available_layers(hazard_dir=None):
+    """Layers whose raster file is present"""
+    hazard_dir = hazard_dir or HAZARD_DIR
+    return [k for k, layer in HAZARD_LAYERS.items() if os.path.exists(os.path.join(hazard_dir, layer['file']))]
+
+
+def site_hazards(lat, lon, layers=None, hazard_dir=None):
+    """
+    Sample every available hazard layer at the sites.
+
+    Returns:
+    --------
+    dict : {layer: values (broadcast shape of lat/lon)}; layers without a
+        raster file are left out
+    """
+    hazard_dir = hazard_dir or HAZARD_DIR
+    present = available_layers(hazard_dir)
+    return {k: sample(open_raster(os.path.join(hazard_dir, HAZARD_LAYERS[k]['file'])), lat, lon)
+            for k in (layers or present) if k in present}
@@ -0,0 +1,45 @@
+"""English/Persian text catalogue, read once per process and shared by all sessions."""
+import csv
+import os
+from functools import lru_cache
+from types import MappingProxyType
+
+from engine.bearings import DATA_DIR
+
+DEFAULT_CATALOGUE = os.path.join(DATA_DIR, "translations.csv")
+
+
+@lru_cache(maxsize=4)
+def load_catalogue(path=None):
+    """
+    Read the translation file into two frozen lookup tables.
+
+    Rows with a ``key`` are named UI texts; rows without one are messages
+    looked up by their English text, which may carry ``str.format`` fields.
+
+    Returns:
+    --------
+    tuple : (texts {key: (en, fa)}, messages {en: fa}) as read-only mappings
+    """
+    texts, messages = {}, {}
+    with open(os.path.abspath(path or DEFAULT_CATALOGUE), encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            if row['key']:
+                texts[row['key']] = (row['en'], row['fa'])
+            else:
+                messages[row['en']] = row['fa']
+    return MappingProxyType(texts), MappingProxyType(messages)
+
+
+TEXTS, MESSAGES = load_catalogue()
+
+
+def get_text(key, persian=False):
+    """Get text in selected language (the key itself if it is not in the catalogue)"""
+    entry = TEXTS.get(key)
+    return key if entry is None else entry[1 if persian else 0]
+
+
+def translate(message, persian=False):
+    """Persian form of an English message; the message unchanged in English or when untranslated"""
+    return MESSAGES.get(message, message) if persian else message
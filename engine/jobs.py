@@ -0,0 +1,278 @@
+"""Background jobs with progress, partial results and cancellation, kept on disk so they outlive a browser session."""
+import json
+import os
+import pickle
+import shutil
+import threading
+import time
+import uuid
+from functools import lru_cache
+
+from engine.scheduler import BATCH, Cancelled, checkpoint, default_scheduler
+
+JOBS_DIR = os.environ.get(
+    "FERRIS_WHEEL_JOBS", os.path.join(os.path.expanduser("~"), ".cache", "ferris_wheel", "jobs"))
+KEEP_DAYS = 7
+WRITE_INTERVAL = 0.5  # s between progress writes
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+INTERRUPTED = 'interrupted'
+FINISHED = (DONE, FAILED, CANCELLED, INTERRUPTED)
+
+_current = threading.local()
+
+
+def report(fraction=None, partial=None, message=None):
+    """
+    Publish progress from inside a job; a cancellation point as well.
+
+    Outside a job (a plain call from the script) only the cancellation
+    check applies. Writes are throttled to one every WRITE_INTERVAL, so
+    it is cheap to call after every chunk.
+
+    Parameters:
+    -----------
+    fraction : float
+        Completed share of the work, 0–1
+    partial : object
+        Picklable result so far (e.g. running damage sums, a growing front)
+    message : str
+        Short status text
+    """
+    checkpoint()
+    job = getattr(_current, 'job', None)
+    if job is not None:
+        job.update(fraction, partial, message)
+
+
+def _write_atomic(path, data):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _process_token(pid):
+    # Boot id and kernel start time of a process, so a pid reused after a restart
+    # is not taken for the server that wrote the job; None where /proc is missing
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            boot_id = f.read().strip()
+        with open(f"/proc/{int(pid)}/stat") as f:
+            stat = f.read()
+    except (OSError, ValueError):
+        return None
+    # Fields after the parenthesised command name start at field 3; starttime is field 22
+    return f"{boot_id}:{stat.rpartition(')')[2].split()[19]}"
+
+
+def _owner_alive(state):
+    # Whether the process that last wrote a job record is still the one running
+    pid = state.get('pid', 0)
+    if not _pid_alive(pid):
+        return False
+    token = state.get('process')
+    return token is None or _process_token(pid) == token
+
+
+_PROCESS = _process_token(os.getpid())
+
+
+class _Job:
+    """On-disk record of one job: state.json, partial.pkl and result.pkl in its own directory"""
+
+    def __init__(self, path, task=None):
+        self.path = path
+        self.task = task
+        self._last_write = 0.0
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def write_state(self, **fields):
+        state = self.read_state() or {}
+        state.update(fields, updated=time.time())
+        _write_atomic(self._file("state.json"), json.dumps(state).encode())
+
+    def read_state(self):
+        try:
+            with open(self._file("state.json"), 'rb') as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def update(self, fraction, partial, message):
+        now = time.monotonic()
+        if now - self._last_write < WRITE_INTERVAL:
+            return
+        self._last_write = now
+        if partial is not None:
+            _write_atomic(self._file("partial.pkl"), pickle.dumps(partial, protocol=pickle.HIGHEST_PROTOCOL))
+        fields = {'state': RUNNING}
+        if fraction is not None:
+            fields['progress'] = min(max(float(fraction), 0.0), 1.0)
+        if message is not None:
+            fields['message'] = str(message)
+        self.write_state(**fields)
+        # A cancel requested from another server process is a marker file
+        if self.task is not None and os.path.exists(self._file("cancel")):
+            self.task.cancel_requested.set()
+
+    def load(self, name):
+        try:
+            with open(self._file(name), 'rb') as f:
+                return pickle.loads(f.read())
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+
+class JobManager:
+    """
+    Submit long analyses as background jobs and follow them by id.
+
+    A job runs as a detached batch task on the shared scheduler, so it
+    keeps running when the browser disconnects and never delays
+    interactive step calculations. Its state, latest progress, partial
+    result and final result are written under ``jobs_dir/<id>/`` as they
+    arrive, so any session (or any server process on the host) can pick
+    the job up again by id. Jobs left 'running' by a process that no
+    longer exists (checked by pid and process start, so a reused pid does
+    not count) are reported as interrupted.
+
+    Parameters:
+    -----------
+    scheduler : Scheduler
+        Pool the jobs run on (default: the process-wide one)
+    jobs_dir : str
+        Directory for job records (default ``$FERRIS_WHEEL_JOBS`` or
+        ~/.cache/ferris_wheel/jobs)
+    keep_days : float
+        Finished job records older than this are deleted
+    """
+
+    def __init__(self, scheduler=None, jobs_dir=None, keep_days=KEEP_DAYS):
+        self.scheduler = scheduler or default_scheduler()
+        self.jobs_dir = os.path.abspath(jobs_dir or JOBS_DIR)
+        self.keep_days = keep_days
+        self._jobs = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        self.prune()
+
+    def _path(self, job_id):
+        # Ids are uuid4 hex; anything else (e.g. a mangled URL parameter) is not a job
+        if not (isinstance(job_id, str) and len(job_id) == 32 and all(c in '0123456789abcdef' for c in job_id)):
+            raise KeyError(job_id)
+        return os.path.join(self.jobs_dir, job_id)
+
+    def submit(self, func, *args, kind='', owner=None, **kwargs):
+        """
+        Start ``func(*args, **kwargs)`` in the background.
+
+        The function publishes progress with ``report``; long loops should
+        call it (or ``checkpoint``) between chunks so cancellation takes
+        effect promptly.
+
+        Returns:
+        --------
+        str : job id
+        """
+        job_id = uuid.uuid4().hex
+        path = self._path(job_id)
+        os.makedirs(path)
+        job = _Job(path)
+        job.write_state(id=job_id, kind=kind, state=QUEUED, progress=0.0, message='',
+                        submitted=time.time(), pid=os.getpid(), process=_PROCESS)
+        with self._lock:
+            self._jobs[job_id] = job
+        job.task = self.scheduler.submit(self._run, job, func, args, kwargs, session=owner,
+                                         priority=BATCH, label=kind or None, detached=True)
+        return job_id
+
+    def _run(self, job, func, args, kwargs):
+        job.write_state(state=RUNNING, started=time.time(), pid=os.getpid(), process=_PROCESS)
+        _current.job = job
+        try:
+            result = func(*args, **kwargs)
+        except Cancelled:
+            job.write_state(state=CANCELLED)
+            raise
+        except Exception as exc:
+            job.write_state(state=FAILED, error=f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            _current.job = None
+        _write_atomic(job._file("result.pkl"), pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        job.write_state(state=DONE, progress=1.0, finished=time.time())
+        return result
+
+    def status(self, job_id):
+        """
+        Current state of a job, or None if there is no such job.
+
+        Returns:
+        --------
+        dict : {'id', 'kind', 'state', 'progress' (0–1), 'message', 'partial'
+            (latest partial result or None), 'result' (when done), 'error'
+            (when failed), 'submitted', 'updated' (epoch s)}
+        """
+        try:
+            job = _Job(self._path(job_id))
+        except KeyError:
+            return None
+        state = job.read_state()
+        if state is None:
+            return None
+        if state['state'] in (QUEUED, RUNNING) and job_id not in self._jobs and not _owner_alive(state):
+            job.write_state(state=INTERRUPTED)
+            state['state'] = INTERRUPTED
+        state['partial'] = job.load("partial.pkl")
+        state['result'] = job.load("result.pkl") if state['state'] == DONE else None
+        return state
+
+    def cancel(self, job_id):
+        """Ask a job to stop; returns False if it has already finished or does not exist"""
+        state = self.status(job_id)
+        if state is None or state['state'] in FINISHED:
+            return False
+        path = self._path(job_id)
+        _write_atomic(os.path.join(path, "cancel"), b"")
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None and job.task is not None and job.task.cancel():
+            # Still queued: it will never run, so record the outcome here
+            job.write_state(state=CANCELLED)
+        return True
+
+    def prune(self):
+        """Delete records of finished jobs older than ``keep_days``"""
+        cutoff = time.time() - self.keep_days * 86400.0
+        for job_id in os.listdir(self.jobs_dir):
+            path = os.path.join(self.jobs_dir, job_id)
+            state = _Job(path).read_state()
+            if state is not None and state['state'] in FINISHED and state.get('updated', 0) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+        with self._lock:
+            for job_id, job in list(self._jobs.items()):
+                if job.task is not None and job.task.done():
+                    del self._jobs[job_id]
+
+
+@lru_cache(maxsize=1)
+def default_jobs():
+    """The process-wide job manager on the default scheduler"""
+    return JobManager()
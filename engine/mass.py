@@ -0,0 +1,88 @@
+"""Parametric structural mass, material takeoff and cost of the wheel."""
+import numpy as np
+
+from engine.geometry import CABIN_COST, SQUARE, cabin_mass
+from engine.structure import GROUPS, STEEL_DENSITY, default_sections, member_lengths
+
+# Extra steel for connections, stiffeners and secondary members
+CONNECTION_ALLOWANCE = 0.15
+
+# Hub castings, drive and brake equipment carried by the axle (kg per m of diameter)
+EQUIPMENT_PER_METRE = 150.0
+
+# Unit rates (USD): fabricated and erected steel per kg by group, equipment per kg,
+# drive per rated kW, concrete per m³; cabins are priced per unit in the geometry registry
+COST_RATES = {
+    'steel': {'rim': 4.5, 'spoke': 4.0, 'cross': 4.0, 'axle': 8.0, 'tower': 3.5},
+    'equipment': 12.0,
+    'drive': 900.0,
+    'concrete': 250.0,
+}
+
+
+def default_hub_height(diameter):
+    """Hub height used throughout the UI: overall height 1.1·D less the radius"""
+    return 0.6 * np.asarray(diameter, dtype=float)
+
+
+def wheel_masses(diameter, num_cabins, cabin_capacity, geometry=SQUARE, hub_height=None):
+    """
+    Member-by-member mass of the wheel from the MEMBER_TABLE sections.
+
+    Every group's steel is ρ·A·L·(1 + CONNECTION_ALLOWANCE) with the
+    section and total length of the frame model, so the masses match the
+    modal and frame analyses. All inputs broadcast: pass arrays to evaluate
+    a whole design sweep in one call.
+
+    Returns:
+    --------
+    dict : {
+        'groups': {group: steel mass (kg)},
+        'mass_structure': rim + spokes + cross members + tower (kg),
+        'mass_axis': axle steel + hub/drive equipment (kg),
+        'mass_wheel': rotating steel and equipment (kg),
+        'mass_tower', 'mass_equipment', 'mass_per_cabin', 'mass_cabins' (kg),
+        'steel': total steel (kg)
+    }
+    """
+    diameter = np.asarray(diameter, dtype=float)
+    hub_height = default_hub_height(diameter) if hub_height is None else np.asarray(hub_height, dtype=float)
+    sections = default_sections(diameter)
+    lengths = member_lengths(diameter, num_cabins, hub_height)
+    groups = {g: STEEL_DENSITY * sections[g]['A'] * lengths[g] * (1.0 + CONNECTION_ALLOWANCE) for g in GROUPS}
+    equipment = EQUIPMENT_PER_METRE * diameter
+    per_cabin = cabin_mass(geometry, cabin_capacity)
+    structure = groups['rim'] + groups['spoke'] + groups['cross'] + groups['tower']
+    return {
+        'groups': groups,
+        'mass_structure': structure,
+        'mass_axis': groups['axle'] + equipment,
+        'mass_wheel': structure - groups['tower'] + groups['axle'] + equipment,
+        'mass_tower': groups['tower'],
+        'mass_equipment': equipment,
+        'mass_per_cabin': per_cabin,
+        'mass_cabins': per_cabin * np.asarray(num_cabins, dtype=float),
+        'steel': sum(groups.values()),
+    }
+
+
+def cost_estimate(masses, num_cabins, geometry=SQUARE, rated_power=0.0, concrete_volume=0.0, rates=None):
+    """
+    Cost breakdown (USD) for ``wheel_masses`` output; arrays broadcast.
+
+    Returns:
+    --------
+    dict : {'steel': {group: cost}, 'equipment', 'cabins', 'drive',
+            'foundation', 'total'}
+    """
+    rates = rates or COST_RATES
+    steel = {g: masses['groups'][g] * rates['steel'][g] for g in GROUPS}
+    items = {
+        'steel': steel,
+        'equipment': masses['mass_equipment'] * rates['equipment'],
+        'cabins': CABIN_COST[np.asarray(geometry)] * np.asarray(num_cabins, dtype=float),
+        'drive': np.asarray(rated_power, dtype=float) * rates['drive'],
+        'foundation': np.asarray(concrete_volume, dtype=float) * rates['concrete'],
+    }
+    items['total'] = sum(steel.values()) + items['equipment'] + items['cabins'] + items['drive'] + items['foundation']
+    return items
@@ -0,0 +1,166 @@
+"""Keyed LRU memoisation for the pure step computations, shared by every session of the process."""
+import hashlib
+import threading
+import types
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
+
+from engine.singleflight import SingleFlight
+
+_REGISTRY = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def freeze(value):
+    """
+    Hashable form of an argument, so equal inputs give equal keys.
+
+    NumPy scalars become Python numbers, arrays their dtype, shape and
+    bytes, and lists / tuples / dicts nested tuples (dict items sorted).
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return ('dict',) + tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+def _const_text(value):
+    # Stable text of a code constant: nested functions by their own digest, sets sorted
+    # (repr of a code object holds its address, a frozenset's order follows the hash seed)
+    if isinstance(value, types.CodeType):
+        return f"<code {_code_digest(value)}>"
+    if isinstance(value, tuple):
+        return "(" + ", ".join(_const_text(v) for v in value) + ")"
+    if isinstance(value, frozenset):
+        return "frozenset{" + ", ".join(sorted(_const_text(v) for v in value)) + "}"
+    return repr(value)
+
+
+def _code_digest(code):
+    digest = hashlib.sha1(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        digest.update(b"\0" + _const_text(const).encode())
+    return digest.hexdigest()
+
+
+def code_digest(func):
+    """
+    Fingerprint of a function body, so an edited definition starts an empty cache.
+
+    Built from the bytecode, global names and constants with nested code
+    objects replaced by their own digests, so it is the same in every
+    process and across restarts.
+    """
+    return _code_digest(func.__code__)
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe mapping that drops the least recently used entry.
+
+    ``flight`` coalesces concurrent fills of the same key (see ``fill``).
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.flight = SingleFlight()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def fill(self, key, func, *args, **kwargs):
+        """Compute a missing entry once, however many threads ask for it at the same moment"""
+        return self.flight.do(key, self._compute, key, func, args, kwargs)
+
+    def _compute(self, key, func, args, kwargs):
+        result = func(*args, **kwargs)
+        self.put(key, result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        with self._lock:
+            info = {'hits': self.hits, 'misses': self.misses, 'size': len(self._data), 'maxsize': self.maxsize}
+        info['shared'] = self.flight.shared
+        return info
+
+
+_MISSING = object()
+
+
+def memoize(maxsize=128):
+    """
+    Memoise a pure function on its (frozen) arguments with a bounded LRU cache.
+
+    The cache lives in this module, keyed by the function's module and
+    qualified name, so a function defined in the Streamlit script keeps its
+    results when the script reruns and every session reads the same
+    entries. A miss requested by several sessions at once is computed once
+    and the others wait for it. Results are shared between callers and must
+    not be modified.
+
+    Parameters:
+    -----------
+    maxsize : int
+        Entries kept per function before the least recently used is dropped
+    """
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+        digest = code_digest(func)
+        with _REGISTRY_LOCK:
+            entry = _REGISTRY.get(name)
+            if entry is None or entry[0] != digest:
+                entry = _REGISTRY[name] = (digest, LRUCache(maxsize))
+        cache = entry[1]
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (freeze(args), freeze(kwargs))
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = cache.fill(key, func, *args, **kwargs)
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def cache_stats():
+    """Hit/miss/shared counts and sizes of every memoised function, by name"""
+    with _REGISTRY_LOCK:
+        caches = {name: cache for name, (_, cache) in _REGISTRY.items()}
+    return {name: cache.info() for name, cache in caches.items()}
@@ -0,0 +1,133 @@
+"""Modal analysis of the wheel frame with cached eigen solutions."""
+from functools import lru_cache
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import eigsh
+
+from engine.structure import DOF_PER_NODE, assemble_mass, assemble_stiffness, free_dofs, wheel_model
+from engine.store import persistent
+
+DIRECTIONS = ('x', 'y', 'z')
+
+
+def modal_analysis(model, n_modes=30):
+    """
+    Lowest modes of K φ = ω² M φ by shift-invert Lanczos.
+
+    Only the requested modes are extracted (``eigsh`` around σ = 0 with a
+    sparse LU of K), so models with tens of thousands of DOFs solve in
+    seconds.
+
+    Returns:
+    --------
+    dict : {
+        'frequencies' (Hz), 'periods' (s), 'shapes' (free dof, mode),
+        'free': free DOF numbers,
+        'mass_fraction': effective modal mass share (mode, x/y/z),
+        'dominant': {'x', 'y', 'z'}: period of the mode with the largest share,
+        'n_dof', 'total_mass' (kg)
+    }
+    """
+    free = free_dofs(model)
+    K = assemble_stiffness(model)[free][:, free].tocsc()
+    m = assemble_mass(model)[free]
+    M = sparse.diags(m).tocsc()
+    n_modes = min(n_modes, len(free) - 2)
+    w2, phi = eigsh(K, k=n_modes, M=M, sigma=0.0, which='LM')
+    order = np.argsort(w2)
+    return _modal_summary(np.maximum(w2[order], 0.0), phi[:, order], free, m)
+
+
+def _modal_summary(w2, phi, free, m):
+    # Frequencies, periods and effective modal mass shares of eigenpairs (ω², φ) under masses m
+    freq = np.sqrt(w2) / (2.0 * np.pi)
+    periods = np.divide(1.0, freq, out=np.full_like(freq, np.inf), where=freq > 0)
+
+    # Effective modal mass per translation direction
+    comp = free % DOF_PER_NODE
+    total = m[comp == 0].sum()
+    n_modes = phi.shape[1]
+    fraction = np.zeros((n_modes, 3))
+    gen_mass = np.einsum('dm,d,dm->m', phi, m, phi)
+    for c in range(3):
+        r = (comp == c).astype(float)
+        gamma = phi.T @ (m * r) / gen_mass
+        fraction[:, c] = gamma ** 2 * gen_mass / total
+
+    dominant = {d: float(periods[int(np.argmax(fraction[:, c]))]) for c, d in enumerate(DIRECTIONS)}
+    return {
+        'frequencies': freq,
+        'periods': periods,
+        'shapes': phi,
+        'free': free,
+        'mass_fraction': fraction,
+        'dominant': dominant,
+        'n_dof': len(free),
+        'total_mass': float(total),
+    }
+
+
+def add_cabin_mass(modes, mass_added):
+    """
+    Modes with extra mass (passengers) lumped at the cabin attachment points.
+
+    Added mass only changes M, so each frequency is corrected with the
+    Rayleigh quotient of the unchanged mode shape,
+    ω² = φᵀKφ / (φᵀMφ + φᵀΔMφ), and the modal mass shares are recomputed
+    with M + ΔM. This first-order correction is exact for a uniform mass
+    scaling and slightly overestimates frequencies otherwise; for passenger
+    mass (a few percent of the wheel) the error is well below the modelling
+    uncertainty, and occupancy changes never start a new eigen solve.
+
+    Parameters:
+    -----------
+    modes : dict
+        ``wheel_modes`` result (left unchanged)
+    mass_added : float
+        Total added mass shared equally by the cabins (kg)
+    """
+    model = modes['model']
+    free, phi = modes['free'], modes['shapes']
+    m = assemble_mass(model)[free]
+    dm_node = np.zeros(len(model['nodes']))
+    cabins = model['cabin_nodes']
+    dm_node[cabins] = float(mass_added) / len(cabins)
+    dm = np.zeros((len(dm_node), DOF_PER_NODE))
+    dm[:, :3] = dm_node[:, None]
+    dm = dm.ravel()[free]
+    gen_mass = np.einsum('dm,d,dm->m', phi, m, phi)
+    extra = np.einsum('dm,d,dm->m', phi, dm, phi)
+    w2 = (2.0 * np.pi * modes['frequencies']) ** 2 * gen_mass / (gen_mass + extra)
+    result = _modal_summary(w2, phi, free, m + dm)
+    result['model'] = model
+    return result
+
+
+@lru_cache(maxsize=16)
+@persistent()
+def wheel_modes(diameter, num_cabins, hub_height, mass_structure, mass_axis, mass_cabins,
+                refine=2, n_modes=30):
+    """
+    Cached modal analysis of the empty wheel keyed by geometry and mass breakdown.
+
+    Pass plain floats (e.g. from ``calculate_motor_power``'s breakdown,
+    rounded) so Streamlit reruns and parameter sweeps that change only
+    loads or occupancy reuse the same eigenpairs; solved modes are also
+    kept in the on-disk store, so they survive server restarts. Passenger
+    mass is not part of the key: add it with ``add_cabin_mass``. Returned
+    arrays are shared between callers and must not be modified.
+    """
+    masses = {'mass_structure': mass_structure, 'mass_axis': mass_axis, 'mass_cabins': mass_cabins}
+    model = wheel_model(diameter, int(num_cabins), hub_height, masses, refine=refine)
+    result = modal_analysis(model, n_modes)
+    result['model'] = model
+    return result
+
+
+def modes_from_breakdown(diameter, num_cabins, hub_height, breakdown, refine=2, n_modes=30):
+    """``wheel_modes`` with masses from a ``calculate_motor_power`` breakdown, passengers as added mass"""
+    modes = wheel_modes(float(diameter), int(num_cabins), float(hub_height),
+                        round(float(breakdown['mass_structure'])), round(float(breakdown['mass_axis'])),
+                        round(float(breakdown['mass_cabins'])), refine, n_modes)
+    return add_cabin_mass(modes, float(breakdown['mass_passengers']))
@@ -0,0 +1,126 @@
+"""Continuous wheel orientation optimiser over a directional wind distribution."""
+import numpy as np
+
+from engine.wind_rose import COMPASS_8
+
+# Axis keys used by the Step 8 UI and their wheel-plane bearings (degrees from north)
+AXIS_BEARINGS = {'NS': 0.0, 'NE_SW': 45.0, 'EW': 90.0, 'SE_NW': 135.0}
+
+
+def compass_bearing(name):
+    """Bearing in degrees of an 8-point compass name ('North' = 0, clockwise)"""
+    return COMPASS_8.index(name) * 45.0
+
+
+def axis_vector(angle_deg):
+    """Unit (east, north) vector of a wheel-plane bearing"""
+    a = np.radians(angle_deg)
+    return float(np.sin(a)), float(np.cos(a))
+
+
+def nearest_axis(angle_deg):
+    """Closest of the four Step 8 axis keys to a plane bearing in [0, 180)"""
+    a = angle_deg % 180.0
+    return min(AXIS_BEARINGS, key=lambda k: min(abs(a - AXIS_BEARINGS[k]), 180.0 - abs(a - AXIS_BEARINGS[k])))
+
+
+def speed_bin_centers(edges):
+    """Representative speed of each histogram band; the open top band uses its lower edge + half a step"""
+    edges = np.asarray(edges, dtype=float)
+    lower, upper = edges[:-1], edges[1:]
+    step = np.diff(edges[:-1]) if len(edges) > 2 else np.ones(1)
+    top = lower[-1] + 0.5 * step[-1]
+    return np.where(np.isfinite(upper), 0.5 * (lower + upper), top)
+
+
+def distribution_from_rose(rose):
+    """(direction_deg, speed_ms, frequency) arrays from a wind_rose result"""
+    return rose['direction_centers'], speed_bin_centers(rose['speed_edges']), rose['frequency']
+
+
+def single_direction_distribution(direction_name, speed):
+    """Degenerate distribution for a single prevailing direction and speed"""
+    return np.array([compass_bearing(direction_name)]), np.array([float(speed)]), np.ones((1, 1))
+
+
+def footprint_fits(angles_deg, footprint_length, footprint_width, land_length, land_width):
+    """
+    Whether the rotated wheel footprint fits the plot for each bearing.
+
+    The footprint is a ``footprint_length`` × ``footprint_width`` rectangle
+    along the wheel plane; land_length runs east-west and land_width
+    north-south as in the orientation diagram.
+    """
+    a = np.radians(np.asarray(angles_deg, dtype=float))
+    extent_x = footprint_length * np.abs(np.sin(a)) + footprint_width * np.abs(np.cos(a))
+    extent_y = footprint_length * np.abs(np.cos(a)) + footprint_width * np.abs(np.sin(a))
+    return (extent_x <= land_length) & (extent_y <= land_width)
+
+
+def optimise_orientation(direction_deg, speed, frequency, response_deg, response,
+                         land_length, land_width, diameter, base_width=None,
+                         step=0.5, exponent=2.0, speed_ref=None):
+    """
+    Sweep the wheel-plane bearing over 0-180° and find the least-loaded fit.
+
+    The cost of a bearing α is the expected wind response
+
+        cost(α) = Σ_d Σ_s f[d, s] · (v_s / v_ref)^m · R(ψ(α, d))
+
+    where ψ is the angle between wind direction d and the wheel-plane
+    normal and R(ψ) is the load response curve (e.g. out-of-plane force
+    from ``wheel_wind_loads`` at a reference speed). The whole sweep is one
+    (angle × direction) interpolation and a matrix-vector product.
+
+    Parameters:
+    -----------
+    direction_deg, speed, frequency : ndarray
+        Distribution from ``distribution_from_rose`` (nd,), (ns,), (nd, ns)
+    response_deg, response : ndarray
+        Response curve R(ψ) sampled on ψ in [0, 90]
+    land_length, land_width : float
+        Plot dimensions (m), east-west and north-south
+    diameter : float
+        Wheel diameter (m); with ``base_width`` (default 0.25 D) it gives the footprint
+    exponent : float
+        Speed exponent m (2 = pressure-weighted, higher favours strong winds)
+
+    Returns:
+    --------
+    dict : {
+        'angles_deg', 'cost' (normalised to the best feasible bearing),
+        'feasible', 'optimal_angle', 'axis_key', 'arrow_vec'
+    }
+    """
+    angles = np.arange(0.0, 180.0, step)
+    direction_deg = np.asarray(direction_deg, dtype=float)
+    speed = np.asarray(speed, dtype=float)
+    frequency = np.asarray(frequency, dtype=float)
+    speed_ref = speed_ref or max(float(speed.max()), 1e-9)
+
+    # Wind direction weights: Σ_s f[d, s] (v_s / v_ref)^m
+    weights = frequency @ (speed / speed_ref) ** exponent                  # (nd,)
+
+    # Angle between wind and plane normal, folded into [0, 90]
+    rel = (direction_deg[None, :] - angles[:, None] - 90.0) % 180.0        # (na, nd)
+    psi = np.minimum(rel, 180.0 - rel)
+    r = np.interp(psi, response_deg, response)
+    cost = r @ weights
+
+    base_width = 0.25 * diameter if base_width is None else base_width
+    feasible = footprint_fits(angles, diameter, base_width, land_length, land_width)
+    if feasible.any():
+        best = int(np.argmin(np.where(feasible, cost, np.inf)))
+    else:
+        best = int(np.argmin(cost))
+    norm = cost / cost[best] if cost[best] > 0 else cost
+    optimal = float(angles[best])
+    return {
+        'angles_deg': angles,
+        'cost': norm,
+        'feasible': feasible,
+        'any_feasible': bool(feasible.any()),
+        'optimal_angle': optimal,
+        'axis_key': nearest_axis(optimal),
+        'arrow_vec': axis_vector(optimal),
+    }
@@ -0,0 +1,116 @@
+"""Provinces, cities, seismic hazard and soil classes: read-only site reference data shared by all sessions."""
+import csv
+import os
+from functools import lru_cache
+from types import MappingProxyType
+
+from engine.bearings import DATA_DIR
+
+DEFAULT_HAZARD = "Moderate"
+
+
+def _number(text):
+    """int for whole-number fields (zmin = 1), float otherwise"""
+    return int(text) if text.lstrip('-').isdigit() else float(text)
+
+
+def _coordinate(text):
+    """Latitude/longitude in decimal degrees, None where the gazetteer has none"""
+    return float(text) if text else None
+
+
+def _rows(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+@lru_cache(maxsize=4)
+def load_reference(data_dir=None):
+    """
+    Read provinces.csv, cities.csv and soil_types.csv into frozen indexes.
+
+    The files are plain CSV so the full national city list stays a few
+    hundred kB and loads in milliseconds; each table is read once per
+    process and every mapping returned is read-only. Cities may carry
+    lat/lon (decimal degrees) for the nearest-city lookup.
+
+    Returns:
+    --------
+    dict : {
+        'terrain': {province: {'category', 'z0', 'zmin', 'desc', 'desc_fa'}},
+        'province_hazard': {province: hazard},
+        'province_fa': {province: Persian name},
+        'cities': {province: (city dicts in file order)},
+        'city_index': {(province, city): {'city', 'city_fa', 'hazard', 'lat', 'lon'}},
+        'soil_types': {soil type: {'desc_en', 'desc_fa', 'group_factor', 'importance_group'}}
+    }
+    """
+    data_dir = os.path.abspath(data_dir or DATA_DIR)
+    terrain, hazard, province_fa = {}, {}, {}
+    for row in _rows(os.path.join(data_dir, "provinces.csv")):
+        name = row['province']
+        terrain[name] = MappingProxyType({
+            'category': row['category'], 'z0': _number(row['z0']), 'zmin': _number(row['zmin']),
+            'desc': row['desc'], 'desc_fa': row['desc_fa'],
+        })
+        hazard[name] = row['hazard'] or DEFAULT_HAZARD
+        province_fa[name] = row['province_fa']
+
+    cities, city_index = {}, {}
+    for row in _rows(os.path.join(data_dir, "cities.csv")):
+        city = MappingProxyType({
+            'city': row['city'], 'city_fa': row['city_fa'] or row['city'], 'hazard': row['hazard'],
+            'lat': _coordinate(row.get('lat')), 'lon': _coordinate(row.get('lon')),
+        })
+        cities.setdefault(row['province'], []).append(city)
+        city_index[(row['province'], row['city'])] = city
+
+    soil_types = {
+        row['soil_type']: MappingProxyType({
+            'desc_en': row['desc_en'], 'desc_fa': row['desc_fa'],
+            'group_factor': float(row['group_factor']), 'importance_group': row['importance_group'],
+        })
+        for row in _rows(os.path.join(data_dir, "soil_types.csv"))
+    }
+    return {
+        'terrain': MappingProxyType(terrain),
+        'province_hazard': MappingProxyType(hazard),
+        'province_fa': MappingProxyType(province_fa),
+        'cities': MappingProxyType({p: tuple(c) for p, c in cities.items()}),
+        'city_index': MappingProxyType(city_index),
+        'soil_types': MappingProxyType(soil_types),
+    }
+
+
+_REFERENCE = load_reference()
+TERRAIN_CATEGORIES = _REFERENCE['terrain']
+PROVINCE_FA = _REFERENCE['province_fa']
+CITIES_DATA = _REFERENCE['cities']
+SOIL_TYPES = _REFERENCE['soil_types']
+
+
+def seismic_hazard(province, city_name):
+    """Seismic hazard level of a city, falling back to the province level"""
+    city = _REFERENCE['city_index'].get((province, city_name))
+    if city is not None:
+        return city['hazard']
+    return _REFERENCE['province_hazard'].get(province, DEFAULT_HAZARD)
+
+
+def city_location(province, city):
+    """(lat, lon) of a gazetteer city, or None when it has no coordinates"""
+    entry = _REFERENCE['city_index'].get((province, city))
+    if entry is None or entry['lat'] is None:
+        return None
+    return entry['lat'], entry['lon']
+
+
+def province_name(province, persian=False):
+    """Display name of a province"""
+    return PROVINCE_FA.get(province, province) if persian else province
+
+
+def city_name(province, city, persian=False):
+    """Display name of a city; names not in the list are shown as entered"""
+    entry = _REFERENCE['city_index'].get((province, city))
+    return entry['city_fa'] if persian and entry is not None else city
@@ -0,0 +1,275 @@
+"""Process-wide bounded worker pool shared fairly by all sessions."""
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from functools import lru_cache
+
+INTERACTIVE = 0
+BATCH = 1
+PRIORITY_NAMES = {INTERACTIVE: 'interactive', BATCH: 'batch'}
+
+DEFAULT_WORKERS = max(2, min(8, os.cpu_count() or 2))
+DEFAULT_SESSION_QUOTA = 2
+DEFAULT_DETACHED_QUOTA = 1
+LATENCY_WINDOW = 500
+
+_current = threading.local()
+
+
+class Cancelled(CancelledError):
+    """Raised inside a task at a ``checkpoint`` after it was cancelled"""
+
+
+def checkpoint():
+    """
+    Stop the running task here if it has been cancelled.
+
+    Long loops in the engine call this between chunks; outside the pool
+    (plain calls from the script) it does nothing.
+    """
+    task = getattr(_current, 'task', None)
+    if task is not None and task.cancel_requested.is_set():
+        raise Cancelled(task.label)
+
+
+def current_task():
+    """Task running on this worker thread, or None"""
+    return getattr(_current, 'task', None)
+
+
+class Task(Future):
+    """
+    A queued call: a future with its session, priority and step tag.
+
+    ``cancel`` removes a queued task; a running one is asked to stop and
+    ends at its next ``checkpoint``. A ``detached`` task (a background job)
+    is only cancelled explicitly, not when its session moves on or ends.
+    """
+
+    def __init__(self, func, args, kwargs, session, priority, step, label, detached=False):
+        super().__init__()
+        self.func, self.args, self.kwargs = func, args, kwargs
+        self.session, self.priority, self.step = session, priority, step
+        self.detached = detached
+        self.label = label or getattr(func, '__qualname__', repr(func))
+        self.cancel_requested = threading.Event()
+        self.submitted = time.monotonic()
+        self.started = None
+
+    def cancel(self):
+        self.cancel_requested.set()
+        return super().cancel()
+
+
+class Scheduler:
+    """
+    Bounded pool of worker threads with per-session quotas and priorities.
+
+    Queued tasks run interactive-first, then in submission order, but a
+    session never has more than ``session_quota`` step tasks running at
+    once, so one user cannot occupy every worker while other sessions'
+    step calculations wait. Detached tasks (background jobs) are counted
+    separately against ``detached_quota`` per session and
+    ``detached_workers`` over the pool, so a running job neither uses up
+    its session's step quota nor takes the workers interactive work needs.
+    NumPy/SciPy release the GIL in their kernels, so threads give real
+    parallelism for the engine solves.
+
+    Parameters:
+    -----------
+    workers : int
+        Worker threads (default: CPU count clipped to 2–8)
+    session_quota : int
+        Running step (non-detached) tasks allowed per session
+    detached_quota : int
+        Running detached tasks allowed per session
+    detached_workers : int
+        Running detached tasks allowed over the whole pool (default: all
+        workers but one)
+    session_alive : callable, optional
+        session -> bool; tasks of sessions that have ended are cancelled
+        instead of started
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, session_quota=DEFAULT_SESSION_QUOTA,
+                 detached_quota=DEFAULT_DETACHED_QUOTA, detached_workers=None, session_alive=None):
+        self.workers = workers
+        self.session_quota = session_quota
+        self.detached_quota = detached_quota
+        self.detached_workers = max(1, workers - 1) if detached_workers is None else detached_workers
+        self.session_alive = session_alive
+        self._queue = []
+        self._seq = itertools.count()
+        self._running = {}
+        self._detached = 0
+        self._cond = threading.Condition()
+        self._waits = {p: deque(maxlen=LATENCY_WINDOW) for p in PRIORITY_NAMES}
+        self._runs = {p: deque(maxlen=LATENCY_WINDOW) for p in PRIORITY_NAMES}
+        self._done = {'completed': 0, 'failed': 0, 'cancelled': 0}
+        self._threads = [threading.Thread(target=self._work, name=f"fw-worker-{i}", daemon=True)
+                         for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, func, *args, session=None, priority=INTERACTIVE, step=None, label=None, detached=False,
+               **kwargs):
+        """Queue ``func(*args, **kwargs)``; returns its Task (a Future)"""
+        task = Task(func, args, kwargs, session, priority, step, label, detached)
+        with self._cond:
+            heapq.heappush(self._queue, (priority, next(self._seq), task))
+            self._cond.notify()
+        return task
+
+    def run(self, func, *args, session=None, priority=INTERACTIVE, step=None, label=None, **kwargs):
+        """Run ``func`` on the pool and wait for its result; raises Cancelled if it was cancelled"""
+        task = self.submit(func, *args, session=session, priority=priority, step=step, label=label, **kwargs)
+        try:
+            return task.result()
+        except Cancelled:
+            raise
+        except CancelledError:
+            # Cancelled while still queued
+            raise Cancelled(task.label) from None
+
+    def cancel_session(self, session, keep_step=None):
+        """
+        Cancel a session's tasks (queued and running), except detached ones.
+
+        With ``keep_step``, tasks tagged with that step (or untagged) are
+        kept, so moving to another step drops only the work of the old one.
+
+        Returns:
+        --------
+        int : number of tasks cancelled
+        """
+        def doomed(task):
+            return (task.session == session and not task.detached
+                    and (keep_step is None or task.step not in (None, keep_step)))
+
+        with self._cond:
+            tasks = [t for _, _, t in self._queue if doomed(t)]
+            tasks += [t for t in self._running.get(session, ()) if doomed(t)]
+        for task in tasks:
+            task.cancel()
+        return len(tasks)
+
+    def _next_task(self):
+        # Highest-priority queued task whose session is under its quota (caller holds the lock)
+        if self.session_alive is not None:
+            for session, running in self._running.items():
+                if session is not None and not self.session_alive(session):
+                    for task in running:
+                        if not task.detached:
+                            task.cancel_requested.set()
+        skipped = []
+        chosen = None
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            task = entry[2]
+            if task.cancelled():
+                self._done['cancelled'] += 1
+                continue
+            if (self.session_alive is not None and task.session is not None and not task.detached
+                    and not self.session_alive(task.session)):
+                task.cancel()
+                self._done['cancelled'] += 1
+                continue
+            if self._at_quota(task):
+                skipped.append(entry)
+                continue
+            chosen = task
+            break
+        for entry in skipped:
+            heapq.heappush(self._queue, entry)
+        return chosen
+
+    def _at_quota(self, task):
+        # Step tasks and detached jobs of a session have separate quotas (caller holds the lock)
+        same_kind = sum(1 for t in self._running.get(task.session, ()) if t.detached == task.detached)
+        if task.detached:
+            return same_kind >= self.detached_quota or self._detached >= self.detached_workers
+        return same_kind >= self.session_quota
+
+    def _work(self):
+        while True:
+            with self._cond:
+                task = self._next_task()
+                while task is None:
+                    self._cond.wait()
+                    task = self._next_task()
+                if not task.set_running_or_notify_cancel():
+                    self._done['cancelled'] += 1
+                    continue
+                task.started = time.monotonic()
+                self._waits[task.priority].append(task.started - task.submitted)
+                self._running.setdefault(task.session, set()).add(task)
+                self._detached += task.detached
+            _current.task = task
+            try:
+                result = task.func(*task.args, **task.kwargs)
+            except Cancelled as exc:
+                outcome = 'cancelled'
+                task.set_exception(exc)
+            except BaseException as exc:
+                outcome = 'failed'
+                task.set_exception(exc)
+            else:
+                outcome = 'completed'
+                task.set_result(result)
+            finally:
+                _current.task = None
+                with self._cond:
+                    self._runs[task.priority].append(time.monotonic() - task.started)
+                    self._done[outcome] += 1
+                    running = self._running[task.session]
+                    running.discard(task)
+                    self._detached -= task.detached
+                    if not running:
+                        del self._running[task.session]
+                    # A finished task may unblock a session that was at its quota
+                    self._cond.notify_all()
+
+    def metrics(self):
+        """
+        Queue depth and latency for monitoring.
+
+        Returns:
+        --------
+        dict : {'workers', 'running', 'detached' (running detached tasks),
+            'queued' {priority name: n}, 'sessions' {session: running},
+            'completed', 'failed', 'cancelled',
+            'wait_s' / 'run_s' {priority name: {'p50', 'p95', 'max'}} over the
+            last LATENCY_WINDOW tasks}
+        """
+        def summary(samples):
+            if not samples:
+                return {'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+            ordered = sorted(samples)
+            pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+            return {'p50': pick(0.5), 'p95': pick(0.95), 'max': ordered[-1]}
+
+        with self._cond:
+            queued = {name: 0 for name in PRIORITY_NAMES.values()}
+            for priority, _, task in self._queue:
+                if not task.cancelled():
+                    queued[PRIORITY_NAMES[priority]] += 1
+            return {
+                'workers': self.workers,
+                'running': sum(len(t) for t in self._running.values()),
+                'detached': self._detached,
+                'queued': queued,
+                'sessions': {s: len(t) for s, t in self._running.items()},
+                **self._done,
+                'wait_s': {PRIORITY_NAMES[p]: summary(d) for p, d in self._waits.items()},
+                'run_s': {PRIORITY_NAMES[p]: summary(d) for p, d in self._runs.items()},
+            }
+
+
+@lru_cache(maxsize=1)
+def default_scheduler():
+    """The process-wide scheduler, started on first use"""
+    return Scheduler()
@@ -0,0 +1,173 @@
+"""Nationwide screening: one wheel design evaluated at every city of the reference data."""
+import numpy as np
+
+from engine.bearings import SPINDLE_SERIES, calculate_bearing_loads, load_bearing_catalogue
+from engine.hazard_maps import site_hazards
+from engine.reference import load_reference, seismic_hazard
+from engine.seismic import seismic_forces
+from engine.wind import basic_to_gust, structural_factor, wheel_wind_loads
+
+# Wheel orientations and rotation angles for the worst wind case (coarser than Step 10)
+SCREEN_ORIENTATIONS = np.arange(0.0, 90.1, 5.0)
+SCREEN_WHEEL_ANGLES = np.arange(0.0, 360.0, 5.0)
+
+
+def reference_sites(data_dir=None):
+    """
+    Every gazetteer city as screening sites.
+
+    Returns:
+    --------
+    dict : {'province', 'city', 'city_fa', 'hazard', 'category' (n,) str,
+            'lat', 'lon' (n,) degrees, NaN where unknown}
+    """
+    ref = load_reference(data_dir)
+    keys = [k for k in ref['city_index'] if k[0] in ref['terrain']]
+    cities = [ref['city_index'][k] for k in keys]
+    return {
+        'province': np.array([p for p, _ in keys]),
+        'city': np.array([c['city'] for c in cities]),
+        'city_fa': np.array([c['city_fa'] for c in cities]),
+        'hazard': np.array([c['hazard'] or seismic_hazard(p, c['city']) for (p, _), c in zip(keys, cities)]),
+        'category': np.array([ref['terrain'][p]['category'] for p, _ in keys]),
+        'lat': np.array([np.nan if c['lat'] is None else c['lat'] for c in cities]),
+        'lon': np.array([np.nan if c['lon'] is None else c['lon'] for c in cities]),
+    }
+
+
+def _group_by(labels):
+    """Unique labels and, for each site, the index of its label"""
+    unique, inverse = np.unique(labels, return_inverse=True)
+    return unique, inverse
+
+
+def screen_sites(design, sites=None, data_dir=None, hazard_dir=None, catalogue=None):
+    """
+    Site loads and spindle bearing for one design at many sites.
+
+    Wind and seismic response depend on the site only through the terrain
+    category and the hazard level (or mapped PGA), so the wheel is analysed
+    once per distinct category / level (a handful of calls) and every site
+    takes its values by index. The wind force scales with v² at fixed
+    terrain. Where hazard rasters are installed, the city's mapped values
+    are used as in Steps 6-10: the basic wind speed as the equivalent 10 m
+    gust, the ground snow load, and the PGA as the design base acceleration
+    A. Sites without a map value keep the design values and the hazard
+    level.
+
+    Parameters:
+    -----------
+    design : dict
+        {'diameter', 'hub_height' (m), 'num_cabins', 'cabin_area' (m², one
+        cabin), 'cabin_cf', 'wind_speed' (m/s gust), 'altitude' (m),
+        'snow_pressure' (kN/m²), 'frequency' (Hz, out-of-plane),
+        'periods' (s), 'seismic_mass', 'rotating_mass' (kg), 'soil_type',
+        'importance', 'behaviour_factor'}
+    sites : dict
+        From ``reference_sites`` (default: all cities)
+
+    Returns:
+    --------
+    dict : site arrays {'province', 'city', 'city_fa', 'category', 'hazard',
+        'wind_speed' (m/s gust), 'wind_force', 'snow_force', 'seismic_h',
+        'seismic_v', 'required_C' (kN), 'overturning' (kN·m),
+        'bearing' (designation, '' when none is large enough), 'rank'
+        (1 = most demanding)}
+    """
+    sites = reference_sites(data_dir) if sites is None else sites
+    terrain = load_reference(data_dir)['terrain']
+    n = len(sites['city'])
+    surface = design['cabin_area'] * 4.0
+
+    mapped = site_hazards(sites['lat'], sites['lon'], layers=('wind', 'snow', 'pga'), hazard_dir=hazard_dir)
+    if 'wind' in mapped:
+        site_terrain = {k: np.array([terrain[p][k] for p in sites['province']], dtype=float) for k in ('z0', 'zmin')}
+        speed = np.where(np.isfinite(mapped['wind']), basic_to_gust(mapped['wind'], site_terrain), design['wind_speed'])
+    else:
+        speed = np.full(n, float(design['wind_speed']))
+    snow_pressure = np.where(np.isfinite(mapped['snow']), mapped['snow'], design['snow_pressure']) if 'snow' in mapped \
+        else np.full(n, float(design['snow_pressure']))
+
+    # Wind: one analysis per terrain category at the design speed
+    categories, by_category = _group_by(sites['category'])
+    force_ref, moment_ref = np.empty(len(categories)), np.empty(len(categories))
+    for k, category in enumerate(categories):
+        entry = terrain[sites['province'][np.flatnonzero(by_category == k)[0]]]
+        loads = wheel_wind_loads(
+            design['diameter'], design['hub_height'], design['num_cabins'], design['cabin_area'], entry,
+            design['wind_speed'], design['altitude'], cabin_cf=design['cabin_cf'],
+            orientations=SCREEN_ORIENTATIONS, wheel_angles=SCREEN_WHEEL_ANGLES)
+        cs_cd = structural_factor(design['frequency'], design['hub_height'] + design['diameter'] / 2.0,
+                                  design['diameter'], entry, design['wind_speed'], design['altitude'])['cs_cd']
+        force_ref[k] = loads['worst']['force'] * cs_cd / 1000.0
+        moment_ref[k] = loads['worst']['moment'] * cs_cd / 1000.0
+    scale = (speed / design['wind_speed']) ** 2
+    wind_force = force_ref[by_category] * scale
+    overturning = moment_ref[by_category] * scale
+
+    # Seismic: one spectrum evaluation per hazard level and mapped A (rounded as the spectrum cache is)
+    pga = mapped['pga'] if 'pga' in mapped else np.full(n, np.nan)
+    cases = [(level, round(float(a), 4) if np.isfinite(a) else None) for level, a in zip(sites['hazard'], pga)]
+    quake = {}
+    for level, A in cases:
+        if (level, A) not in quake:
+            quake[level, A] = seismic_forces(design['seismic_mass'], design['periods'], design['soil_type'], level,
+                                             design['importance'], design['behaviour_factor'], A=A)
+    seismic_h = np.array([quake[case]['horizontal'] for case in cases])
+    seismic_v = np.array([quake[case]['vertical'] for case in cases])
+    snow_force = snow_pressure * surface
+
+    # Main spindle bearing by the Step 11 rule, selected for all sites in one search
+    required_C = calculate_bearing_loads(design['rotating_mass'], 0.0, snow_force * 1000.0, wind_force * 1000.0,
+                                         seismic_h * 1000.0, seismic_v * 1000.0)['required_C']
+    if catalogue is None:
+        catalogue = load_bearing_catalogue()
+    rows = catalogue.select('C', required_C, series=SPINDLE_SERIES)
+    designations = np.append(catalogue.frame['designation'].to_numpy(dtype=str), '')
+
+    order = np.lexsort((-wind_force, -required_C))
+    rank = np.empty(n, dtype=int)
+    rank[order] = np.arange(1, n + 1)
+    return {
+        'province': sites['province'], 'city': sites['city'], 'city_fa': sites['city_fa'],
+        'category': sites['category'], 'hazard': sites['hazard'],
+        'wind_speed': speed, 'wind_force': wind_force, 'overturning': overturning,
+        'snow_force': snow_force, 'seismic_h': seismic_h, 'seismic_v': seismic_v,
+        'required_C': required_C, 'bearing': designations[rows], 'rank': rank,
+    }
+
+
+def province_summary(result, data_dir=None):
+    """
+    Governing city of each province, placed at the mean location of its cities for a marker map.
+
+    Returns:
+    --------
+    dict : per-province arrays {'province', 'province_fa', 'city', 'required_C',
+        'wind_force', 'seismic_h', 'bearing', 'lat', 'lon' (mean of located
+        cities, NaN if none)}
+    """
+    ref = load_reference(data_dir)
+    provinces, inverse = _group_by(result['province'])
+    # Most demanding city first, then the first row of each province is its governing city
+    order = np.argsort(result['rank'], kind='stable')
+    first = {}
+    for i in order:
+        first.setdefault(inverse[i], i)
+    governing = np.array([first[k] for k in range(len(provinces))])
+    located = {}
+    for (p, _), c in ref['city_index'].items():
+        if c['lat'] is not None:
+            located.setdefault(p, []).append((c['lat'], c['lon']))
+    centre = np.array([np.mean(located[p], axis=0) if p in located else (np.nan, np.nan) for p in provinces])
+    return {
+        'province': provinces,
+        'province_fa': np.array([ref['province_fa'].get(p, p) for p in provinces]),
+        'city': result['city'][governing],
+        'required_C': result['required_C'][governing],
+        'wind_force': result['wind_force'][governing],
+        'seismic_h': result['seismic_h'][governing],
+        'bearing': result['bearing'][governing],
+        'lat': centre[:, 0],
+        'lon': centre[:, 1],
+    }
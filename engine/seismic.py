@@ -0,0 +1,154 @@
+"""ISIRI 2800 (4th edition) design response spectrum."""
+from functools import lru_cache
+
+import numpy as np
+
+# Design base acceleration ratio A per relative seismic hazard
+DESIGN_BASE_ACCELERATION = {
+    'Very High': 0.35,
+    'High': 0.30,
+    'Moderate': 0.25,
+    'Low': 0.20,
+    'Very Low': 0.20,
+}
+
+# Spectrum parameters (T0, Ts, S0, S) per soil type, for A >= 0.30 and for A < 0.30
+SOIL_PARAMETERS = {
+    'high': {
+        'Type I': (0.10, 0.4, 1.0, 1.50),
+        'Type II': (0.10, 0.5, 1.0, 1.50),
+        'Type III': (0.15, 0.7, 1.1, 1.75),
+        'Type IV': (0.15, 1.0, 1.1, 1.75),
+    },
+    'low': {
+        'Type I': (0.10, 0.4, 1.0, 1.50),
+        'Type II': (0.10, 0.5, 1.0, 1.50),
+        'Type III': (0.15, 0.7, 1.1, 2.25),
+        'Type IV': (0.15, 1.0, 1.3, 2.25),
+    },
+}
+
+VERTICAL_RATIO = 2.0 / 3.0
+
+
+def damping_correction(damping):
+    """Spectral correction η = √(0.10 / (0.05 + ξ)) ≥ 0.55 for damping ratios other than 5%"""
+    damping = np.asarray(damping, dtype=float)
+    return np.maximum(np.sqrt(0.10 / (0.05 + damping)), 0.55)
+
+
+class DesignSpectrum:
+    """
+    Design spectrum for one (soil, hazard, importance, behaviour factor) set.
+
+    B1 is the soil reflection coefficient and N the long-period correction;
+    the design base shear coefficient is C = A·B·I / R_u with B = B1·N.
+    ``A`` overrides the hazard-level table, e.g. with the PGA sampled from
+    the hazard map at the site. Build instances through ``design_spectrum``
+    so they are shared between reruns.
+    """
+
+    def __init__(self, soil_type, hazard, importance=1.0, behaviour_factor=1.0, A=None):
+        if soil_type not in SOIL_PARAMETERS['high']:
+            raise ValueError(f"Unknown soil type '{soil_type}'")
+        self.soil_type = soil_type
+        self.hazard = hazard if hazard in DESIGN_BASE_ACCELERATION else 'Moderate'
+        self.A = DESIGN_BASE_ACCELERATION[self.hazard] if A is None else float(A)
+        self.high = self.A >= 0.30
+        self.T0, self.Ts, self.S0, self.S = SOIL_PARAMETERS['high' if self.high else 'low'][soil_type]
+        self.importance = float(importance)
+        self.behaviour_factor = float(behaviour_factor)
+
+    def reflection(self, periods, damping=0.05):
+        """
+        Soil reflection coefficient B1 over periods × damping ratios.
+
+        ``periods`` of shape (n,) and ``damping`` of shape (m,) give an
+        (n, m) array; scalars broadcast as usual.
+        """
+        T = np.asarray(periods, dtype=float)[..., None]
+        eta = damping_correction(damping)
+        peak = eta * (self.S + 1.0)
+        rising = self.S0 + (peak - self.S0) * T / self.T0
+        falling = peak * self.Ts / np.maximum(T, 1e-9)
+        b1 = np.where(T < self.T0, rising, np.where(T < self.Ts, peak, falling))
+        return b1 if np.ndim(damping) else b1[..., 0]
+
+    def long_period_factor(self, periods):
+        """N = 1 up to Ts, rising linearly to 1.7 (high hazard) or 1.4 at 4 s"""
+        T = np.asarray(periods, dtype=float)
+        top = 0.7 if self.high else 0.4
+        return np.where(T <= self.Ts, 1.0,
+                        np.where(T < 4.0, 1.0 + top * (T - self.Ts) / (4.0 - self.Ts), 1.0 + top))
+
+    def spectral_acceleration(self, periods, damping=0.05):
+        """Elastic design spectral acceleration A·B·I in g"""
+        T = np.asarray(periods, dtype=float)
+        N = self.long_period_factor(T)
+        if np.ndim(damping):
+            N = N[..., None]
+        return self.A * self.importance * self.reflection(T, damping) * N
+
+    def base_shear_coefficient(self, periods, damping=0.05):
+        """Design coefficient C = A·B·I / R_u"""
+        return self.spectral_acceleration(periods, damping) / self.behaviour_factor
+
+    def curve(self, t_max=4.0, step=0.01, damping=0.05):
+        """(periods, B·A·I) for plotting"""
+        T = np.arange(0.0, t_max + step, step)
+        return T, self.spectral_acceleration(T, damping)
+
+
+@lru_cache(maxsize=64)
+def design_spectrum(soil_type, hazard, importance=1.0, behaviour_factor=1.0, A=None):
+    """Cached DesignSpectrum per (soil, hazard, importance, R_u, mapped A)"""
+    return DesignSpectrum(soil_type, hazard, importance, behaviour_factor, A)
+
+
+def empirical_period(height, structure='steel_frame'):
+    """ISIRI 2800 empirical fundamental period T = c·H^0.75 (s)"""
+    c = {'steel_frame': 0.08, 'concrete_frame': 0.07, 'other': 0.05}[structure]
+    return c * float(height) ** 0.75
+
+
+def seismic_forces(mass, period, soil_type, hazard, importance=1.0, behaviour_factor=1.0,
+                   damping=0.05, vertical_period=None, A=None, g=9.81):
+    """
+    Equivalent static seismic forces from the design spectrum.
+
+    Parameters:
+    -----------
+    mass : float
+        Seismic mass (kg)
+    period : float or array_like
+        Fundamental period(s) (s); the largest coefficient governs
+    vertical_period : float
+        Vertical mode period; defaults to the spectrum plateau (T0)
+    A : float
+        Design base acceleration ratio from a hazard map; None uses the
+        table value for ``hazard``
+
+    Returns:
+    --------
+    dict : {
+        'C': base shear coefficient, 'C_v': vertical coefficient,
+        'horizontal', 'vertical' (kN), 'period' (governing, s), 'spectrum'
+    }
+    """
+    key = (soil_type, hazard, float(importance), float(behaviour_factor))
+    # Same cache entry as a direct design_spectrum call when no mapped A is given
+    spec = design_spectrum(*key) if A is None else design_spectrum(*key, round(float(A), 4))
+    periods = np.atleast_1d(np.asarray(period, dtype=float))
+    C = spec.base_shear_coefficient(periods, damping)
+    i = int(np.argmax(C))
+    T_v = spec.T0 if vertical_period is None else vertical_period
+    C_v = VERTICAL_RATIO * float(spec.base_shear_coefficient(T_v, damping))
+    weight = mass * g / 1000.0
+    return {
+        'C': float(C[i]),
+        'C_v': C_v,
+        'horizontal': float(C[i]) * weight,
+        'vertical': C_v * weight,
+        'period': float(periods[i]),
+        'spectrum': spec,
+    }
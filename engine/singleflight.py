@@ -0,0 +1,59 @@
+"""Single-flight execution: concurrent identical calls share one computation."""
+import threading
+from concurrent.futures import CancelledError, Future
+
+
+class SingleFlight:
+    """
+    Run at most one computation per key at a time.
+
+    The first caller for a key (the leader) runs the function; callers
+    arriving with the same key while it runs wait on the leader's future
+    and receive the same result, or the same exception; if the leader was
+    cancelled, a waiter takes over the computation. Once the leader
+    finishes, the key is released, so later calls run again (or, behind a
+    cache, find the stored result).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key, func, *args, **kwargs):
+        """Result of ``func(*args, **kwargs)``, computed once across concurrent callers of ``key``"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.leaders += 1
+            else:
+                self.shared += 1
+        if not leader:
+            try:
+                return future.result()
+            except CancelledError:
+                # The leader's task was cancelled, not this caller's
+                return self.do(key, func, *args, **kwargs)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self):
+        """Number of keys being computed right now"""
+        with self._lock:
+            return len(self._calls)
+
+    def info(self):
+        with self._lock:
+            return {'leaders': self.leaders, 'shared': self.shared, 'in_flight': len(self._calls)}
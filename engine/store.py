@@ -0,0 +1,217 @@
+"""Persistent result cache in SQLite, shared by every server process on the host and kept across restarts."""
+import glob
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from functools import lru_cache, wraps
+
+from engine.memo import code_digest, freeze
+from engine.singleflight import SingleFlight
+
+ENGINE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.environ.get(
+    "FERRIS_WHEEL_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "ferris_wheel", "results.sqlite"))
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+# Content keys already name the function and version, so one table serves every decorated function
+_FLIGHT = SingleFlight()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY, name TEXT NOT NULL, version TEXT NOT NULL,
+    value BLOB NOT NULL, size INTEGER NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, hits INTEGER NOT NULL, misses INTEGER NOT NULL);
+"""
+
+
+@lru_cache(maxsize=1)
+def engine_version():
+    """Hash of the engine sources: results from older code are never returned"""
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(ENGINE_DIR, "*.py"))):
+        with open(path, 'rb') as f:
+            digest.update(os.path.basename(path).encode() + b"\0" + f.read())
+    return digest.hexdigest()[:16]
+
+
+def content_key(name, args=(), kwargs=None, version=None):
+    """SHA-256 of the function name, engine version and frozen arguments"""
+    payload = (name, version or engine_version(), freeze(args), freeze(kwargs or {}))
+    return hashlib.sha256(pickle.dumps(payload, protocol=4)).hexdigest()
+
+
+class ResultStore:
+    """
+    Size-bounded key → pickled result table in one SQLite file.
+
+    The database runs in WAL mode with a busy timeout, so several Streamlit
+    worker processes (and the threads inside each) can read and write it at
+    once; each thread of each process opens its own connection. When the
+    stored values exceed ``max_bytes`` the least recently read entries are
+    deleted. Hit/miss counts are kept per function in the file, so they
+    cover every process sharing it.
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES, timeout=30.0):
+        self.path = os.path.abspath(path or DEFAULT_PATH)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._db().executescript(_SCHEMA)
+
+    def _db(self):
+        # One connection per thread and process (connections must not cross a fork)
+        db = getattr(self._local, 'db', None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    def _connect(self):
+        return _Transaction(self._db())
+
+    def _count(self, db, name, hit):
+        db.execute("INSERT INTO stats (name, hits, misses) VALUES (?, ?, ?) "
+                   "ON CONFLICT(name) DO UPDATE SET hits = hits + excluded.hits, misses = misses + excluded.misses",
+                   (name, int(hit), int(not hit)))
+
+    def get(self, key, name=''):
+        """(True, value) for a stored key, (False, None) otherwise"""
+        with self._connect() as db:
+            row = db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                db.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._count(db, name, row is not None)
+        if row is None:
+            return False, None
+        try:
+            return True, pickle.loads(row[0])
+        except Exception:
+            # Written by an incompatible library version: treat as a miss
+            self.delete(key)
+            return False, None
+
+    def put(self, key, value, name='', version=None):
+        """Store a result, then evict least recently read entries beyond ``max_bytes``"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO results (key, name, version, value, size, created, accessed) "
+                       "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       (key, name, version or engine_version(), blob, len(blob), now, now))
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - int(0.9 * self.max_bytes)
+                for old_key, size in db.execute("SELECT key, size FROM results ORDER BY accessed").fetchall():
+                    if excess <= 0:
+                        break
+                    db.execute("DELETE FROM results WHERE key = ?", (old_key,))
+                    excess -= size
+
+    def delete(self, key):
+        with self._connect() as db:
+            db.execute("DELETE FROM results WHERE key = ?", (key,))
+
+    def clear(self):
+        """Drop every stored result and reset the statistics"""
+        with self._connect() as db:
+            db.execute("DELETE FROM results")
+            db.execute("DELETE FROM stats")
+
+    def stats(self):
+        """
+        Usage of the store.
+
+        Returns:
+        --------
+        dict : {'entries', 'bytes', 'max_bytes', 'stale' (entries from other
+            engine versions), 'functions': {name: {'hits', 'misses', 'entries', 'bytes'}}}
+        """
+        with self._connect() as db:
+            counts = {name: {'hits': hits, 'misses': misses, 'entries': 0, 'bytes': 0}
+                      for name, hits, misses in db.execute("SELECT name, hits, misses FROM stats")}
+            for name, entries, size in db.execute("SELECT name, COUNT(*), SUM(size) FROM results GROUP BY name"):
+                counts.setdefault(name, {'hits': 0, 'misses': 0}).update(entries=entries, bytes=size)
+            stale = db.execute("SELECT COUNT(*) FROM results WHERE version NOT LIKE ?", (engine_version() + '%',)).fetchone()[0]
+        return {
+            'entries': sum(c['entries'] for c in counts.values()),
+            'bytes': sum(c['bytes'] for c in counts.values()),
+            'max_bytes': self.max_bytes,
+            'stale': stale,
+            'functions': counts,
+        }
+
+
+class _Transaction:
+    """``with`` block running its statements as one immediate (write-locked) transaction"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, exc_type, exc, tb):
+        self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+@lru_cache(maxsize=1)
+def default_store():
+    """Store at ``$FERRIS_WHEEL_CACHE`` (or ~/.cache/ferris_wheel/results.sqlite), opened once per process"""
+    return ResultStore()
+
+
+def persistent(name=None, store=None):
+    """
+    Keep a pure function's results in the on-disk store.
+
+    The key is a content hash of the arguments, the engine version and the
+    function's own code, so a warm result survives server restarts and is
+    shared by every process using the same file, while any code change
+    misses. Identical calls made while one is running in this process wait
+    for it instead of computing again. If the store cannot be opened or
+    written (read-only disk, locked file), the function is simply computed.
+    """
+    def decorator(func):
+        label = name or f"{func.__module__}.{func.__qualname__}"
+        version = f"{engine_version()}-{code_digest(func)[:8]}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                target = store or default_store()
+                key = content_key(label, args, kwargs, version)
+            except Exception:
+                # Unhashable arguments or an unusable store: compute without caching
+                return func(*args, **kwargs)
+            return _FLIGHT.do(key, _load_or_compute, target, key, label, version, func, args, kwargs)
+
+        return wrapper
+    return decorator
+
+
+def _load_or_compute(store, key, label, version, func, args, kwargs):
+    try:
+        found, value = store.get(key, label)
+    except Exception:
+        found = False
+    if found:
+        return value
+    value = func(*args, **kwargs)
+    try:
+        store.put(key, value, label, version)
+    except Exception:
+        pass
+    return value
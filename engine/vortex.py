@@ -0,0 +1,156 @@
+"""Vortex-shedding lock-in screening of cylindrical members and cabins (EN 1991-1-4 Annex E)."""
+import numpy as np
+
+from engine.geometry import HORIZONTAL_CYLINDER, VERTICAL_CYLINDER, cabin_dimensions, geometry_code
+from engine.structure import E_STEEL, GROUPS
+
+STROUHAL_CYLINDER = 0.18       # EN 1991-1-4 Figure E.1, circular cross-sections
+LOCK_IN_BAND = 0.2             # |f_s / f_n - 1| within which shedding is taken to lock in
+AIR_DENSITY = 1.25             # kg/m³, as used for the Scruton number
+STEEL_LOG_DECREMENT = 0.02     # welded steel structures, EN 1991-1-4 Table F.2
+
+# β₁L of the first bending mode for a member fixed at both ends
+FIXED_FIXED_ROOT = 4.730
+
+
+def tube_diameter(section):
+    """Outer diameter of a circular hollow section from I and W = I / (d/2)"""
+    return 2.0 * section['I'] / section['W']
+
+
+def member_frequency(length, EI, mass_per_length, root=FIXED_FIXED_ROOT):
+    """First bending frequency f₁ = (β₁L)² / (2πL²) · √(EI/μ) (Hz)"""
+    length = np.asarray(length, dtype=float)
+    return root ** 2 / (2.0 * np.pi * length ** 2) * np.sqrt(EI / np.asarray(mass_per_length, dtype=float))
+
+
+def wheel_members(model, global_frequencies=(), groups=('spoke', 'rim', 'tower')):
+    """
+    Cylindrical members of a ``wheel_model`` as screening rows.
+
+    Each physical member (spoke, rim segment between cabins, tower leg) is
+    treated as fixed at both ends and screened on its own first bending
+    frequency, plus any ``global_frequencies`` given.
+
+    Returns:
+    --------
+    dict : {'names', 'diameter' (m), 'mass_per_length' (kg/m),
+            'frequencies' (n, k) Hz padded with NaN}
+    """
+    nodes, elements = model['nodes'], model['elements']
+    lengths = np.linalg.norm(nodes[elements[:, 1]] - nodes[elements[:, 0]], axis=1)
+    n_cab = len(model['cabin_nodes']) // 2
+    count = {'spoke': 2 * n_cab, 'rim': 2 * n_cab, 'tower': len(model['fixed']), 'cross': n_cab, 'axle': 1}
+    names, diameter, mu, local = [], [], [], []
+    for g in groups:
+        section = model['sections'][g]
+        span = lengths[model['group'] == GROUPS.index(g)].sum() / count[g]
+        names.append(g)
+        diameter.append(tube_diameter(section))
+        mu.append(model['line_mass'][g])
+        local.append(member_frequency(span, E_STEEL * section['I'], model['line_mass'][g]))
+    return screening_rows(names, diameter, mu, np.asarray(local)[:, None], global_frequencies)
+
+
+def cabin_cylinder(cabin_geometry, cabin_capacity, diameter, cabin_mass, global_frequencies=()):
+    """Screening row for a cylindrical cabin (registry dimensions), or None for other shapes"""
+    code = geometry_code(cabin_geometry)
+    if code not in (VERTICAL_CYLINDER, HORIZONTAL_CYLINDER):
+        return None
+    dims = cabin_dimensions(code, cabin_capacity, diameter)
+    d, length = float(dims['width']), float(dims['length'])
+    return screening_rows(['cabin'], [d], [cabin_mass / length], np.empty((1, 0)), global_frequencies)
+
+
+def screening_rows(names, diameter, mass_per_length, local_frequencies, global_frequencies=()):
+    """Stack member data with the shared global frequencies into screening arrays"""
+    local = np.asarray(local_frequencies, dtype=float).reshape(len(names), -1)
+    shared = np.broadcast_to(np.asarray(global_frequencies, dtype=float), (len(names), len(global_frequencies)))
+    return {
+        'names': list(names),
+        'diameter': np.asarray(diameter, dtype=float),
+        'mass_per_length': np.asarray(mass_per_length, dtype=float),
+        'frequencies': np.hstack([local, shared]),
+    }
+
+
+def merge_rows(*rows):
+    """Concatenate screening rows, padding the frequency table with NaN"""
+    rows = [r for r in rows if r is not None]
+    k = max(r['frequencies'].shape[1] for r in rows)
+    pad = [np.pad(r['frequencies'], ((0, 0), (0, k - r['frequencies'].shape[1])), constant_values=np.nan)
+           for r in rows]
+    return {
+        'names': sum((r['names'] for r in rows), []),
+        'diameter': np.concatenate([r['diameter'] for r in rows]),
+        'mass_per_length': np.concatenate([r['mass_per_length'] for r in rows]),
+        'frequencies': np.vstack(pad),
+    }
+
+
+def critical_speed(frequency, diameter, strouhal=STROUHAL_CYLINDER):
+    """Wind speed at which the shedding frequency equals ``frequency``: v = f·d / St (m/s)"""
+    return np.asarray(frequency, dtype=float) * np.asarray(diameter, dtype=float) / strouhal
+
+
+def scruton_number(mass_per_length, diameter, log_decrement=STEEL_LOG_DECREMENT, rho=AIR_DENSITY):
+    """Sc = 2·δ_s·m_e / (ρ·d²)"""
+    return 2.0 * log_decrement * np.asarray(mass_per_length) / (rho * np.asarray(diameter) ** 2)
+
+
+def _runs(mask, speeds):
+    """Contiguous True runs of a 1-D mask as (v_start, v_end) pairs"""
+    edges = np.diff(np.concatenate([[False], mask, [False]]).astype(np.int8))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+    return [(float(speeds[a]), float(speeds[b])) for a, b in zip(starts, ends)]
+
+
+def screen(rows, max_speed, speeds=None, strouhal=STROUHAL_CYLINDER, band=LOCK_IN_BAND,
+           log_decrement=STEEL_LOG_DECREMENT):
+    """
+    Lock-in map of members × wind speeds.
+
+    The shedding frequency f_s = St·v/d of every member is compared with
+    each of its natural frequencies at every speed in one broadcast
+    (members × frequencies × speeds). A member passes outright when every
+    critical speed exceeds 1.25·``max_speed`` (EN 1991-1-4 E.1.3.1);
+    otherwise the Scruton number grades the risk.
+
+    Parameters:
+    -----------
+    rows : dict
+        From ``wheel_members`` / ``cabin_cylinder`` / ``merge_rows``
+    max_speed : float
+        Design mean wind speed (m/s)
+
+    Returns:
+    --------
+    dict : {
+        'names', 'diameter', 'speeds' (s,), 'lock_in' (n, s) bool, 'critical_speed' (n,) lowest (m/s),
+        'frequency' (n,) of that mode (Hz), 'scruton' (n,),
+        'ranges': lock-in speed ranges per member, 'status': 'pass' | 'low' | 'high'
+    }
+    """
+    speeds = np.linspace(0.0, 1.25 * max_speed, 251) if speeds is None else np.asarray(speeds, dtype=float)
+    d = rows['diameter']
+    f = rows['frequencies']
+    fs = strouhal * speeds[None, :] / d[:, None]                        # (n, s)
+    ratio = fs[:, None, :] / f[:, :, None]                              # (n, k, s); NaN for padding
+    lock_in = (np.abs(ratio - 1.0) <= band).any(axis=1)
+
+    v_crit = np.where(np.isnan(f), np.inf, critical_speed(f, d[:, None], strouhal))
+    lowest = np.argmin(v_crit, axis=1)
+    v_min = v_crit[np.arange(len(d)), lowest]
+    Sc = scruton_number(rows['mass_per_length'], d, log_decrement)
+    status = np.where(v_min > 1.25 * max_speed, 'pass', np.where(Sc >= 15.0, 'low', 'high'))
+    return {
+        'names': rows['names'],
+        'diameter': d,
+        'speeds': speeds,
+        'lock_in': lock_in,
+        'critical_speed': v_min,
+        'frequency': f[np.arange(len(d)), lowest],
+        'scruton': Sc,
+        'ranges': [_runs(row, speeds) for row in lock_in],
+        'status': status,
+    }
@@ -0,0 +1,216 @@
+"""EN 1991-1-4 wind profile and cabin-by-cabin wind loads around the rim."""
+import numpy as np
+
+RHO_SEA_LEVEL = 1.225  # kg/m³
+
+
+def air_density(altitude, temperature=None):
+    """
+    Air density (kg/m³) at ``altitude`` (m) from the ISA barometric formula.
+
+    When ``temperature`` (°C) is given the ideal gas law is used with the
+    ISA pressure at that altitude instead of the standard temperature.
+    """
+    altitude = np.asarray(altitude, dtype=float)
+    pressure = 101325.0 * (1.0 - 2.25577e-5 * altitude) ** 5.25588
+    if temperature is None:
+        return RHO_SEA_LEVEL * (1.0 - 2.25577e-5 * altitude) ** 4.25588
+    return pressure / (287.05 * (np.asarray(temperature, dtype=float) + 273.15))
+
+
+def roughness_factor(z, z0, zmin, z0_ref=0.05):
+    """Roughness factor c_r(z) = k_r ln(z / z0) with k_r = 0.19 (z0 / z0,II)^0.07"""
+    kr = 0.19 * (z0 / z0_ref) ** 0.07
+    z = np.maximum(np.asarray(z, dtype=float), zmin)
+    return kr * np.log(z / z0)
+
+
+def turbulence_intensity(z, z0, zmin, kI=1.0, c0=1.0):
+    """Turbulence intensity I_v(z) = k_I / (c_0 ln(z / z0))"""
+    z = np.maximum(np.asarray(z, dtype=float), zmin)
+    return kI / (c0 * np.log(z / z0))
+
+
+def wind_profile(z, terrain, speed, altitude=0.0, reference='gust', c0=1.0):
+    """
+    Mean wind speed and peak velocity pressure at heights ``z``.
+
+    Parameters:
+    -----------
+    z : array_like
+        Heights above ground (m)
+    terrain : dict
+        TERRAIN_CATEGORIES entry with 'z0' and 'zmin'
+    speed : float
+        Reference wind speed (m/s)
+    altitude : float
+        Site altitude (m) for air density
+    reference : str
+        'gust' - ``speed`` is a peak gust at 10 m on the site (Step 5 wind_max);
+        'basic' - ``speed`` is the EN 1991-1-4 basic wind speed v_b
+
+    Returns:
+    --------
+    dict : {'z', 'v_m' (m/s), 'I_v', 'q_p' (N/m²), 'rho'}
+    """
+    z0, zmin = terrain['z0'], terrain['zmin']
+    rho = float(air_density(altitude))
+    cr = roughness_factor(z, z0, zmin)
+    Iv = turbulence_intensity(z, z0, zmin, c0=c0)
+    if reference == 'gust':
+        # Anchor the profile so q_p(10 m) equals the dynamic pressure of the gust
+        vm10 = speed / np.sqrt(1.0 + 7.0 * turbulence_intensity(10.0, z0, zmin, c0=c0))
+        vm = vm10 * cr / roughness_factor(10.0, z0, zmin)
+    elif reference == 'basic':
+        vm = cr * c0 * speed
+    else:
+        raise ValueError(f"Unknown wind speed reference '{reference}'")
+    qp = (1.0 + 7.0 * Iv) * 0.5 * rho * vm ** 2
+    return {'z': np.asarray(z, dtype=float), 'v_m': vm, 'I_v': Iv, 'q_p': qp, 'rho': rho}
+
+
+def basic_to_gust(speed, terrain, c0=1.0):
+    """
+    Peak gust at 10 m on the site equivalent to a basic wind speed v_b.
+
+    The gust gives the same peak velocity pressure (and so the same profile)
+    with ``reference='gust'`` as ``speed`` does with ``reference='basic'``,
+    so a mapped v_b can be entered where the Step 5 maximum gust is used.
+    """
+    z0, zmin = terrain['z0'], terrain['zmin']
+    vm10 = roughness_factor(10.0, z0, zmin) * c0 * np.asarray(speed, dtype=float)
+    return vm10 * np.sqrt(1.0 + 7.0 * turbulence_intensity(10.0, z0, zmin, c0=c0))
+
+
+def wheel_wind_loads(diameter, hub_height, num_cabins, cabin_area, terrain, speed,
+                     altitude=0.0, cabin_cf=1.3, structure_area=None, structure_cf=1.6,
+                     shielding=0.3, orientations=None, wheel_angles=None, reference='gust'):
+    """
+    Wind force and overturning moment for every wheel orientation and angle.
+
+    Cabin heights around the rim are evaluated for all orientations (angle
+    between wind and wheel-plane normal) and wheel rotation angles in a
+    single broadcast of shape (orientation, angle, cabin).
+
+    Parameters:
+    -----------
+    diameter, hub_height : float
+        Wheel diameter and hub height (m)
+    num_cabins : int
+        Number of cabins on the rim
+    cabin_area : float
+        Projected area of one cabin (m²)
+    terrain : dict
+        TERRAIN_CATEGORIES entry
+    speed : float
+        Design wind speed (m/s), see ``wind_profile``
+    structure_area : float
+        Face-on projected area of rim and spokes (m²); default 10% solidity
+        of the wheel disc. Edge-on exposure is taken as 20% of it.
+    shielding : float
+        Force reduction on cabins in the wake of the upwind half when the
+        wind runs along the wheel plane (scaled by |sin(orientation)|)
+    orientations, wheel_angles : array_like
+        Angles in degrees; defaults 0-90° by 1° and 0-360° by 1°
+
+    Returns:
+    --------
+    dict : {
+        'orientation_deg', 'wheel_angle_deg',
+        'force': total horizontal force (n_orient, n_angle) in N,
+        'out_of_plane': force component normal to the wheel plane (N),
+        'moment': overturning moment at ground (N·m),
+        'worst': {'orientation_deg', 'wheel_angle_deg', 'force', 'moment'},
+        'profile': wind_profile at the cabin height range
+    }
+    """
+    radius = diameter / 2.0
+    psi = np.radians(np.arange(0.0, 90.1, 1.0) if orientations is None else np.asarray(orientations, float))
+    theta = np.radians(np.arange(0.0, 360.0, 1.0) if wheel_angles is None else np.asarray(wheel_angles, float))
+    phi = 2.0 * np.pi * np.arange(num_cabins) / num_cabins
+
+    ang = theta[:, None] + phi[None, :]                      # (angle, cabin)
+    z_cab = hub_height + radius * np.sin(ang)
+    x_cab = radius * np.cos(ang)
+    qp_cab = wind_profile(z_cab, terrain, speed, altitude, reference)['q_p']
+
+    # Cabins downwind along the wheel plane are partly shielded by the upwind ones
+    along = np.sin(psi)[:, None, None]                        # (orient, 1, 1)
+    downwind = (x_cab[None, :, :] * np.sign(along)) > 0
+    factor = np.where(downwind, 1.0 - shielding * np.abs(along), 1.0)
+    f_cab = cabin_cf * cabin_area * qp_cab[None, :, :] * factor  # (orient, angle, cabin)
+
+    force_cab = f_cab.sum(axis=-1)
+    moment_cab = (f_cab * z_cab[None, :, :]).sum(axis=-1)
+
+    if structure_area is None:
+        structure_area = 0.1 * np.pi * radius ** 2
+    qp_hub = wind_profile(hub_height, terrain, speed, altitude, reference)['q_p']
+    exposure = np.abs(np.cos(psi)) + 0.2 * np.abs(np.sin(psi))
+    f_struct = (structure_cf * structure_area * qp_hub * exposure)[:, None]
+
+    force = force_cab + f_struct
+    moment = moment_cab + f_struct * hub_height
+    out_of_plane = force * np.abs(np.cos(psi))[:, None]
+
+    i, j = np.unravel_index(np.argmax(moment), moment.shape)
+    heights = np.linspace(max(hub_height - radius, 0.5), hub_height + radius, 50)
+    return {
+        'orientation_deg': np.degrees(psi),
+        'wheel_angle_deg': np.degrees(theta),
+        'force': force,
+        'out_of_plane': out_of_plane,
+        'moment': moment,
+        'worst': {
+            'orientation_deg': float(np.degrees(psi[i])),
+            'wheel_angle_deg': float(np.degrees(theta[j])),
+            'force': float(force[i, j]),
+            'moment': float(moment[i, j]),
+        },
+        'profile': wind_profile(heights, terrain, speed, altitude, reference),
+    }
+
+
+def structural_factor(frequency, height, breadth, terrain, speed, altitude=0.0,
+                      log_decrement=0.05, reference='gust', duration=600.0):
+    """
+    Structural factor c_s·c_d (EN 1991-1-4 Annex B, procedure 1).
+
+    Parameters:
+    -----------
+    frequency : float
+        Fundamental frequency n₁ in the wind direction (Hz), e.g. from modal analysis
+    height, breadth : float
+        Height and breadth of the structure (m)
+    terrain : dict
+        TERRAIN_CATEGORIES entry
+    speed : float
+        Reference wind speed (m/s), see ``wind_profile``
+    log_decrement : float
+        Total logarithmic decrement of damping δ (0.05 for welded steel)
+
+    Returns:
+    --------
+    dict : {'cs_cd', 'B2' background, 'R2' resonant, 'kp' peak factor, 'z_s'}
+    """
+    z0, zmin = terrain['z0'], terrain['zmin']
+    z_s = max(0.6 * height, zmin)
+    prof = wind_profile(z_s, terrain, speed, altitude, reference)
+    vm, Iv = float(prof['v_m']), float(prof['I_v'])
+    alpha = 0.67 + 0.05 * np.log(z0)
+    L = 300.0 * (z_s / 200.0) ** alpha
+    fL = frequency * L / vm
+    SL = 6.8 * fL / (1.0 + 10.2 * fL) ** (5.0 / 3.0)
+    B2 = 1.0 / (1.0 + 0.9 * ((breadth + height) / L) ** 0.63)
+
+    def admittance(eta):
+        return 1.0 if eta <= 0 else 1.0 / eta - (1.0 - np.exp(-2.0 * eta)) / (2.0 * eta ** 2)
+
+    Rh = admittance(4.6 * height * fL / L)
+    Rb = admittance(4.6 * breadth * fL / L)
+    R2 = np.pi ** 2 / (2.0 * log_decrement) * SL * Rh * Rb
+    nu = max(frequency * np.sqrt(R2 / (B2 + R2)), 0.08)
+    root = np.sqrt(2.0 * np.log(nu * duration))
+    kp = max(root + 0.6 / root, 3.0)
+    cs_cd = (1.0 + 2.0 * kp * Iv * np.sqrt(B2 + R2)) / (1.0 + 7.0 * Iv)
+    return {'cs_cd': float(cs_cd), 'B2': float(B2), 'R2': float(R2), 'kp': float(kp), 'z_s': z_s}
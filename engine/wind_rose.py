@@ -0,0 +1,208 @@
+"""Streaming ingestion of wind station records into direction × speed histograms."""
+import numpy as np
+import pandas as pd
+
+COMPASS_8 = ['North', 'Northeast', 'East', 'Southeast', 'South', 'Southwest', 'West', 'Northwest']
+DEFAULT_SPEED_EDGES = (0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 15.0, 20.0, 25.0, np.inf)  # m/s
+
+SPEED_UNITS = {'m/s': 1.0, 'km/h': 1.0 / 3.6, 'knots': 0.514444, 'mph': 0.44704}
+
+DIRECTION_COLUMNS = ('direction', 'wind_direction', 'dir', 'wd', 'wdir', 'drct')
+SPEED_COLUMNS = ('speed', 'wind_speed', 'ws', 'wspd', 'sknt', 'ff')
+TIME_COLUMNS = ('timestamp', 'time', 'datetime', 'date', 'valid')
+
+
+def _pick_column(columns, candidates, explicit=None):
+    if explicit:
+        return explicit
+    lower = {c.strip().lower(): c for c in columns}
+    for name in candidates:
+        if name in lower:
+            return lower[name]
+    return None
+
+
+def read_station_records(source, chunksize=500_000, direction_col=None, speed_col=None,
+                         time_col=None, compression='infer'):
+    """
+    Read station records in chunks without loading the whole file.
+
+    Parameters:
+    -----------
+    source : str or file-like
+        CSV path or open file; .gz/.bz2/.zip/.xz paths are decompressed on the fly
+    chunksize : int
+        Rows per chunk
+    direction_col, speed_col, time_col : str
+        Column names; detected from common station formats when omitted
+    compression : str
+        Passed to pandas; give it explicitly for compressed file-like sources
+
+    Yields:
+    -------
+    dict : {'direction', 'speed', 'time'} arrays for each chunk ('time' may be None)
+    """
+    if _source_name(source).endswith('.npy'):
+        yield from read_station_array(source, chunksize)
+        return
+    header = pd.read_csv(source, nrows=0, compression=compression)
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    d_col = _pick_column(header.columns, DIRECTION_COLUMNS, direction_col)
+    s_col = _pick_column(header.columns, SPEED_COLUMNS, speed_col)
+    t_col = _pick_column(header.columns, TIME_COLUMNS, time_col)
+    if d_col is None or s_col is None:
+        raise ValueError("Could not find wind direction and speed columns in the station file")
+    usecols = [c for c in (d_col, s_col, t_col) if c is not None]
+
+    reader = pd.read_csv(source, usecols=usecols, chunksize=chunksize, compression=compression,
+                         dtype={d_col: 'float64', s_col: 'float64'})
+    for chunk in reader:
+        yield {
+            'direction': chunk[d_col].to_numpy(),
+            'speed': chunk[s_col].to_numpy(),
+            'time': chunk[t_col].to_numpy() if t_col else None,
+        }
+
+
+def _source_name(source):
+    return str(getattr(source, 'name', source) or '').lower()
+
+
+def read_station_array(source, chunksize=500_000):
+    """
+    Read a binary station file through a memory map.
+
+    The file is a 2-D ``.npy`` array with columns (time as Unix seconds,
+    direction in degrees, speed). Only the slice being processed is paged
+    in, so files larger than memory can be streamed. File-like sources are
+    loaded normally since they cannot be mapped.
+
+    Yields:
+    -------
+    dict : {'direction', 'speed', 'time'} arrays for each chunk
+    """
+    if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+        data = np.load(source, mmap_mode='r')
+    else:
+        data = np.load(source)
+    if data.ndim != 2 or data.shape[1] < 3:
+        raise ValueError("Station array must have columns (time, direction, speed)")
+    for start in range(0, data.shape[0], chunksize):
+        block = np.asarray(data[start:start + chunksize], dtype=float)
+        yield {
+            'direction': block[:, 1],
+            'speed': block[:, 2],
+            'time': block[:, 0].astype('int64').astype('datetime64[s]'),
+        }
+
+
+class WindRoseHistogram:
+    """
+    Accumulates a direction × speed count table one chunk at a time.
+
+    Direction sectors are centred on north, so with 16 sectors sector 0
+    spans 348.75°-11.25°. Records below ``calm_speed`` are counted as calms
+    and records with missing, negative or variable (>360°) values are
+    skipped. Memory use is just the count table.
+    """
+
+    def __init__(self, n_directions=16, speed_edges=DEFAULT_SPEED_EDGES, calm_speed=0.5):
+        self.n_directions = int(n_directions)
+        self.sector = 360.0 / self.n_directions
+        self.speed_edges = np.asarray(speed_edges, dtype=float)
+        self.calm_speed = float(calm_speed)
+        self.counts = np.zeros((self.n_directions, len(self.speed_edges) - 1), dtype=np.int64)
+        self.speed_sum = np.zeros(self.n_directions)
+        self.speed_sq_sum = np.zeros(self.n_directions)
+        self.calm = 0
+        self.invalid = 0
+        self.first_time = None
+        self.last_time = None
+
+    def add(self, direction, speed, time=None, speed_factor=1.0):
+        direction = np.asarray(direction, dtype=float)
+        speed = np.asarray(speed, dtype=float) * speed_factor
+        valid = np.isfinite(direction) & np.isfinite(speed) & (speed >= 0) & (direction >= 0) & (direction <= 360)
+        self.invalid += int(direction.size - valid.sum())
+        direction, speed = direction[valid], speed[valid]
+
+        calm = speed < self.calm_speed
+        self.calm += int(calm.sum())
+        direction, speed = direction[~calm], speed[~calm]
+
+        d_idx = (((direction + self.sector / 2.0) % 360.0) // self.sector).astype(np.int64)
+        s_idx = np.clip(np.searchsorted(self.speed_edges, speed, side='right') - 1, 0, self.counts.shape[1] - 1)
+        n_s = self.counts.shape[1]
+        self.counts += np.bincount(d_idx * n_s + s_idx, minlength=self.counts.size).reshape(self.counts.shape)
+        self.speed_sum += np.bincount(d_idx, weights=speed, minlength=self.n_directions)
+        self.speed_sq_sum += np.bincount(d_idx, weights=speed ** 2, minlength=self.n_directions)
+
+        if time is not None and len(time):
+            if self.first_time is None:
+                self.first_time = str(time[0])
+            self.last_time = str(time[-1])
+        return self
+
+    def result(self):
+        """
+        Summary of the accumulated records.
+
+        Returns:
+        --------
+        dict : {
+            'direction_centers' (deg), 'speed_edges' (m/s), 'counts',
+            'frequency': counts / all valid records,
+            'calm_frequency', 'records', 'invalid',
+            'mean_speed': per direction (m/s),
+            'load_weight': Σ f·v² per direction, normalised,
+            'prevailing_direction': 8-point name of the most frequent sector,
+            'dominant_load_direction': 8-point name of the largest Σ f·v² sector,
+            'period': (first, last) timestamps as text
+        }
+        """
+        per_dir = self.counts.sum(axis=1)
+        records = int(per_dir.sum() + self.calm)
+        total = max(records, 1)
+        centers = np.arange(self.n_directions) * self.sector
+        load = self.speed_sq_sum / total
+        load_weight = load / load.sum() if load.sum() > 0 else load
+        return {
+            'direction_centers': centers,
+            'speed_edges': self.speed_edges,
+            'counts': self.counts.copy(),
+            'frequency': self.counts / total,
+            'calm_frequency': self.calm / total,
+            'records': records,
+            'invalid': self.invalid,
+            'mean_speed': np.divide(self.speed_sum, per_dir, out=np.zeros(self.n_directions), where=per_dir > 0),
+            'load_weight': load_weight,
+            'prevailing_direction': compass_name(centers[int(np.argmax(per_dir))]),
+            'dominant_load_direction': compass_name(centers[int(np.argmax(load))]),
+            'period': (self.first_time, self.last_time),
+        }
+
+
+def compass_name(angle_deg):
+    """Nearest 8-point compass name for a bearing in degrees (0 = North, clockwise)"""
+    return COMPASS_8[int(np.round((angle_deg % 360.0) / 45.0)) % 8]
+
+
+def wind_rose_from_csv(source, speed_unit='m/s', n_directions=16, speed_edges=DEFAULT_SPEED_EDGES,
+                       calm_speed=0.5, chunksize=500_000, **read_kwargs):
+    """Stream a station CSV (plain or compressed) into a wind rose summary"""
+    if speed_unit not in SPEED_UNITS:
+        raise ValueError(f"Unknown speed unit '{speed_unit}'")
+    hist = WindRoseHistogram(n_directions, speed_edges, calm_speed)
+    for chunk in read_station_records(source, chunksize=chunksize, **read_kwargs):
+        hist.add(chunk['direction'], chunk['speed'], chunk['time'], SPEED_UNITS[speed_unit])
+    return hist.result()
+
+
+def compression_from_name(filename):
+    """pandas compression argument for an uploaded file name"""
+    name = (filename or '').lower()
+    for ext, comp in (('.gz', 'gzip'), ('.bz2', 'bz2'), ('.zip', 'zip'), ('.xz', 'xz')):
+        if name.endswith(ext):
+            return comp
+    return None
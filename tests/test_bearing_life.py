@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from engine.bearing_life import (
+    ROLLER_EXPONENT, build_spindle_load_spectrum, equivalent_dynamic_load, life_modification_factor,
+    lightest_for_life, spectrum_life,
+)
+from engine.bearings import BearingCatalogue, load_bearing_catalogue
+
+
+@pytest.mark.parametrize("roller, k, x, y", [
+    (True, 1.5859 - 1.2348, 0.4, -9.185),
+    (False, 2.5671 - 1.9987, 0.83, -1.0 / 3.0),
+])
+def test_life_modification_factor_iso281(roller, k, x, y):
+    # kappa = 1: ISO 281 closed form with eC*Cu/P = 0.05
+    P, Cu, ec = 100.0, 10.0, 0.5
+    expected = 0.1 * (1.0 - k * (ec * Cu / P) ** x) ** y
+    assert life_modification_factor(P, Cu, kappa=1.0, ec=ec, roller=roller) == pytest.approx(expected)
+
+
+def test_life_modification_factor_bounds():
+    # Larger fatigue margin never shortens life, and a_ISO is capped at 50
+    ratios = np.linspace(0.01, 2.0, 50)
+    for roller in (True, False):
+        a = life_modification_factor(1.0 / ratios, 1.0, ec=1.0, roller=roller)
+        assert np.all(np.diff(a) >= 0)
+        assert a.max() <= 50.0
+
+
+def test_equivalent_dynamic_load_regimes():
+    P = equivalent_dynamic_load([100.0, 100.0], [10.0, 50.0])
+    assert P.tolist() == pytest.approx([100.0 + 2.8 * 10.0, 0.67 * 100.0 + 4.2 * 50.0])
+
+
+def test_single_case_life_is_basic_rating_life():
+    life = spectrum_life([1000.0], [1500.0], radial=[100e3], axial=[0.0], fraction=[1.0], rpm=[1.0])
+    assert life["L10"][0] == pytest.approx(10.0 ** ROLLER_EXPONENT)
+    assert life["L10h"][0] == pytest.approx(life["L10"][0] * 1e6 / 60.0)
+
+
+def test_spectrum_is_miner_sum_over_revolutions():
+    C = [1000.0]
+    life = spectrum_life(C, [1500.0], radial=[100e3, 200e3], axial=[0.0, 0.0], fraction=[0.5, 0.5], rpm=[1.0, 1.0])
+    L1, L2 = 10.0 ** ROLLER_EXPONENT, 5.0 ** ROLLER_EXPONENT
+    assert life["L10"][0] == pytest.approx(1.0 / (0.5 / L1 + 0.5 / L2))
+
+
+def test_lightest_for_life_meets_target():
+    catalogue = load_bearing_catalogue()
+    spectrum = build_spindle_load_spectrum(200e3, 20e3, [(0.0, 0.5), (1.0, 0.5)], [], rpm=1.0)
+    row, table = lightest_for_life(spectrum, 50000, catalogue=catalogue)
+    assert row >= 0
+    hours = dict(zip(table["rows"], table["Lnmh"]))
+    assert hours[row] >= 50000
+    lighter = [r for r in table["rows"] if catalogue.column("D")[r] < catalogue.column("D")[row]]
+    assert all(hours[r] < 50000 for r in lighter)
+
+
+def test_lightest_for_life_empty_catalogue():
+    empty = BearingCatalogue(load_bearing_catalogue().frame.iloc[:0])
+    spectrum = build_spindle_load_spectrum(200e3, 20e3, [(1.0, 1.0)], [], rpm=1.0)
+    row, table = lightest_for_life(spectrum, 50000, catalogue=empty)
+    assert row == -1 and len(table["rows"]) == 0
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.bearings import (BearingCatalogue, CABIN_SERIES, SPINDLE_SERIES, calculate_bearing_loads, load_bearing_catalogue,
+                             select_bearing)
+
+
+def small_catalogue():
+    return BearingCatalogue(pd.DataFrame({
+        "manufacturer": ["SKF"] * 5,
+        "series": ["A", "A", "A", "B", "B"],
+        "designation": ["A1", "A2", "A3", "B1", "B2"],
+        "d": [10, 20, 30, 40, 50],
+        "D": [20, 40, 60, 80, 100],
+        "C": [5.0, 10.0, 10.0, 50.0, 80.0],
+        "C0": [6.0, 12.0, 14.0, 60.0, 90.0],
+    }))
+
+
+def test_select_smallest_above_requirement():
+    cat = small_catalogue()
+    assert cat.record(cat.select("C", 6.0, series="A"))["designation"] == "A2"
+    assert cat.record(cat.select("C", 60.0, series="B"))["designation"] == "B2"
+
+
+def test_select_strict_and_tie_keeps_catalogue_order():
+    cat = small_catalogue()
+    # Strict: exactly 10 kN is not enough, non-strict accepts it and the first of the tie wins
+    assert cat.select("C", 10.0, series="A") == -1
+    assert cat.record(cat.select("C", 10.0, series="A", strict=False))["designation"] == "A2"
+
+
+def test_select_vectorised_and_none_large_enough():
+    cat = small_catalogue()
+    rows = cat.select("C", np.array([1.0, 7.0, 100.0]), series="A")
+    assert rows.tolist() == [0, 1, -1]
+    assert cat.record(-1) is None
+
+
+def test_empty_catalogue_is_not_replaced_by_default():
+    empty = BearingCatalogue(small_catalogue().frame.iloc[:0])
+    assert len(empty) == 0
+    assert select_bearing(1.0, "C", SPINDLE_SERIES, catalogue=empty) is None
+
+
+def test_missing_columns_rejected():
+    with pytest.raises(ValueError):
+        BearingCatalogue(pd.DataFrame({"series": ["A"], "C": [1.0]}))
+
+
+def test_shipped_catalogue_series():
+    cat = load_bearing_catalogue()
+    assert {CABIN_SERIES, SPINDLE_SERIES} <= set(cat.series)
+    assert select_bearing(1.0, "C0", CABIN_SERIES) is not None
+
+
+def test_bearing_loads_broadcast():
+    wind = np.array([0.0, 100e3])
+    loads = calculate_bearing_loads(100e3, 1000.0, wind_force=wind)
+    single = calculate_bearing_loads(100e3, 1000.0, wind_force=100e3)
+    assert loads['required_C'][1] == pytest.approx(single['required_C'])
+    radial = 100e3 * 9.81
+    assert loads['required_C'][0] == pytest.approx(1.5 * (radial + 1.5 * 0.1 * radial) / 1000.0)
+    assert single['required_C0'] == pytest.approx(1000.0 * 9.81 * 1.5 * 1.2 / 1000.0)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from engine.combinations import ACTIONS, combine, generate_combinations, load_partial_factors, wheel_action_effects
+from engine.frame import FrameSolver
+from engine.structure import wheel_model
+
+
+def test_combination_counts_and_factors():
+    factors = load_partial_factors()
+    combos = generate_combinations(factors)
+    names = combos['names']
+    # 3 leading variables × 4 accompanying subsets × (Gsup, Ginf) + SLS 3×4 + seismic 2³
+    assert combos['factors'].shape == (24 + 12 + 8, len(ACTIONS))
+    row = combos['factors'][names.index("ULS W+Q Gsup")]
+    assert row.tolist() == pytest.approx([1.35, 1.5 * 0.7, 0.0, 1.5, 0.0])
+    assert combos['factors'][names.index("SEIS E+Q")].tolist() == pytest.approx([1.0, 0.3, 0.0, 0.0, 1.0])
+    assert len(generate_combinations(factors, seismic=False, sls=False)['names']) == 24
+
+
+def test_combine_matches_full_tensor():
+    rng = np.random.default_rng(0)
+    factors = generate_combinations()['factors']
+    effects = rng.standard_normal((len(ACTIONS), 5, 4, 3))
+    result = combine(factors, effects, chunk=7, keep=True)
+    full = np.einsum('ck,kadq->cadq', factors, effects)
+    np.testing.assert_allclose(result['tensor'], full)
+    for q in range(3):
+        assert result[q]['max'] == pytest.approx(full[..., q].max())
+        assert full[result[q]['argmin'] + (q,)] == pytest.approx(full[..., q].min())
+
+
+def test_wheel_action_effects_shapes_and_linearity():
+    frame = FrameSolver(wheel_model(30.0, 12, 18.0, {'mass_structure': 40e3, 'mass_axis': 5e3,
+                                                       'mass_cabins': 18e3}, refine=1))
+    patterns = {'Full': np.ones(12), 'Empty': np.zeros(12)}
+    loads = {'snow': 1e4, 'wind': 2e4}
+    a = wheel_action_effects(frame, loads, patterns, 480.0, directions_deg=[0.0, 90.0])
+    b = wheel_action_effects(frame, {'snow': 2e4, 'wind': 2e4}, patterns, 480.0, directions_deg=[0.0, 90.0])
+    assert a['effects'].shape[:3] == (len(ACTIONS), 24, 2)
+    assert len(a['cases']) == 24 and len(a['outputs']) == a['effects'].shape[3]
+    S = ACTIONS.index('S')
+    np.testing.assert_allclose(b['effects'][S], 2.0 * a['effects'][S])
+    # Empty wheel: no passenger effects
+    np.testing.assert_allclose(a['effects'][ACTIONS.index('Q'), 12:], 0.0, atol=1e-6)
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from engine.extreme_wind import (
+    annual_maxima, bootstrap_return_level, daily_maxima, design_wind_speed, fit_extremes,
+    peaks_over_threshold, return_level,
+)
+from engine.scheduler import Cancelled, Scheduler, current_task
+
+
+def station_csv(tmp_path, years=20, seed=1):
+    rng = np.random.default_rng(seed)
+    time = pd.date_range("2000-01-01", periods=int(years * 365.25 * 4), freq="6h")
+    speed = rng.gumbel(8.0, 2.5, time.size)
+    path = tmp_path / "station.csv"
+    pd.DataFrame({"time": time, "direction": 270.0, "speed": speed}).to_csv(path, index=False)
+    return path, pd.Series(speed, index=time)
+
+
+def test_daily_maxima_streamed_in_chunks(tmp_path):
+    path, series = station_csv(tmp_path, years=2)
+    daily = daily_maxima(str(path), chunksize=777)
+    expected = series.groupby(series.index.floor("D")).max()
+    np.testing.assert_allclose(daily.to_numpy(), expected.to_numpy())
+
+
+def test_gumbel_return_level_closed_form():
+    loc, scale = 25.0, 3.0
+    level = return_level((loc, scale), 50.0)
+    assert level == pytest.approx(loc - scale * np.log(-np.log(1.0 - 1.0 / 50.0)))
+
+
+def test_pot_exponential_return_level():
+    # Exponential excesses with scale 2 above 20 m/s, 3 storms a year
+    assert return_level((0.0, 0.0, 2.0), 50.0, method='pot', threshold=20.0, rate=3.0) == \
+        pytest.approx(20.0 + 2.0 * np.log(150.0))
+
+
+def test_peaks_declustered():
+    index = pd.date_range("2000-01-01", periods=10, freq="D")
+    daily = pd.Series([1, 9, 8, 1, 1, 1, 7, 1, 1, 1.0], index=index)
+    peaks, threshold, _ = peaks_over_threshold(daily, threshold=5.0, run_days=2)
+    assert peaks.tolist() == [9.0, 7.0]
+
+
+def test_annual_maxima_drop_short_years():
+    index = pd.date_range("2000-01-01", "2001-03-01", freq="D")
+    daily = pd.Series(np.arange(index.size, dtype=float), index=index)
+    assert annual_maxima(daily).index.tolist() == [2000]
+
+
+def test_bootstrap_reproducible():
+    sample = stats.gumbel_r.rvs(20, 3, size=40, random_state=0)
+    a = bootstrap_return_level(sample, 50.0, n_boot=50, batch=7, seed=4)
+    b = bootstrap_return_level(sample, 50.0, n_boot=50, batch=7, seed=4)
+    np.testing.assert_array_equal(a, b)
+
+
+@pytest.mark.parametrize("method", ["annual", "pot"])
+def test_vectorised_gumbel_bootstrap_matches_scipy_fits(method):
+    sample = stats.gumbel_r.rvs(20, 3, size=40, random_state=0)
+    threshold = 15.0 if method == "pot" else 0.0
+    if method == "pot":
+        sample = sample[sample > threshold]
+    levels = bootstrap_return_level(sample, 50.0, method, threshold=threshold, rate=2.0, n_boot=30, seed=1)
+    # The same resamples fitted one at a time with scipy
+    rng = np.random.default_rng(1)
+    resamples = sample[rng.integers(0, sample.size, size=(30, sample.size))]
+    expected = [return_level(fit_extremes(r, method, threshold=threshold), 50.0, method, threshold=threshold, rate=2.0)
+                for r in resamples]
+    np.testing.assert_allclose(levels, expected, rtol=1e-8)
+
+
+def test_bootstrap_stops_when_cancelled():
+    def cancelled_fit():
+        current_task().cancel_requested.set()
+        return bootstrap_return_level(np.arange(10.0), 50.0, n_boot=100)
+
+    task = Scheduler(workers=1).submit(cancelled_fit)
+    with pytest.raises(Cancelled):
+        task.result(timeout=5)
+
+
+def test_design_wind_speed_recovers_fit(tmp_path):
+    path, _ = station_csv(tmp_path)
+    result = design_wind_speed(str(path), n_boot=40)
+    assert result['ci'][0] <= result['return_level'] <= result['ci'][1]
+    params = fit_extremes(result['sample'])
+    assert result['return_level'] == pytest.approx(return_level(params, 50.0))
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from engine.fatigue import (
+    RainflowCounter, cycles_to_failure, en1993_sn_curve, fatigue_assessment, miner_damage,
+    operating_history_chunks, rim_member_stress,
+)
+
+
+def test_rainflow_astm_e1049_example():
+    # ASTM E1049-85 Fig. 6: ranges 3, 4, 6, 8, 9 with 0.5, 1.5, 0.5, 1.0, 0.5 cycles
+    result = RainflowCounter(bin_width=1.0).feed([-2, 1, -3, 5, -1, 3, -4, 4, -2]).finish()
+    counts = dict(enumerate(result['counts']))
+    assert {k: v for k, v in counts.items() if v} == {3: 0.5, 4: 1.5, 6: 0.5, 8: 1.0, 9: 0.5}
+    assert result['cycles'] == 4.0
+    assert result['max_range'] == 9.0
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 333, 10_000])
+def test_rainflow_chunked_matches_single_pass(chunk):
+    rng = np.random.default_rng(3)
+    signal = np.cumsum(rng.standard_normal(10_000)) * 5.0
+    curves = {'71': en1993_sn_curve(71)}
+    whole = RainflowCounter(0.5, curves=curves).feed(signal).finish()
+    streamed = RainflowCounter(0.5, curves=curves)
+    for start in range(0, signal.size, chunk):
+        streamed.feed(signal[start:start + chunk])
+    streamed = streamed.finish()
+    np.testing.assert_allclose(streamed['counts'], whole['counts'])
+    assert streamed['damage']['71'] == pytest.approx(whole['damage']['71'])
+    assert streamed['samples'] == signal.size
+
+
+def test_rainflow_ignores_flat_steps_and_small_reversals():
+    result = RainflowCounter(resolution=1.0).feed([0, 0, 10, 10.2, 10, 0]).finish()
+    assert result['cycles'] == 1.0  # two half cycles 0→10→0
+    assert result['max_range'] == 10.0
+
+
+def test_sn_curve_knee_points():
+    curve = en1993_sn_curve(71, gamma_Mf=1.0)
+    assert cycles_to_failure(curve['delta_sigma_C'], curve) == pytest.approx(2e6)
+    assert cycles_to_failure(curve['delta_sigma_D'], curve) == pytest.approx(5e6)
+    assert cycles_to_failure(curve['delta_sigma_L'] * (1 + 1e-12), curve) == pytest.approx(1e8)
+    assert np.isinf(cycles_to_failure(0.99 * curve['delta_sigma_L'], curve))
+    assert curve['delta_sigma_D'] == pytest.approx(0.737 * 71, rel=1e-3)
+
+
+def test_sn_curve_partial_factors():
+    curve = en1993_sn_curve(90, gamma_Mf=1.35, gamma_Ff=1.1)
+    assert curve['delta_sigma_C'] == pytest.approx(90 / 1.35)
+    # γFf scales the applied range: Δσ_C / γFf reaches N = 2e6
+    assert cycles_to_failure(curve['delta_sigma_C'] / 1.1, curve) == pytest.approx(2e6)
+
+
+def test_miner_damage_sum():
+    curve = en1993_sn_curve(71, gamma_Mf=1.0)
+    assert miner_damage([71.0, 71.0], [1e6, 5e5], curve) == pytest.approx(0.75)
+
+
+def test_fatigue_assessment_scales_to_design_life():
+    curves = {'71': en1993_sn_curve(71)}
+    args = dict(years=0.01, rpm=1.0, base_mass=1e5, passenger_mass=1e4, occupancy=[(0.0, 0.5), (1.0, 0.5)],
+                wind_mean_ms=5.0, wind_area=500.0, chunk_size=5000)
+    member = {'rim': lambda c: rim_member_stress(c, 0.0, 4e-3, 0.1, 0.1)}
+    seen = []
+    base = fatigue_assessment(operating_history_chunks(**args), member, curves,
+                              progress=lambda samples, damage: seen.append(samples))
+    scaled = fatigue_assessment(operating_history_chunks(**args), member, curves,
+                                design_years=25, simulated_years=0.01)
+    assert scaled['rim']['damage']['71'] == pytest.approx(base['rim']['damage']['71'] * 2500)
+    assert seen == sorted(seen) and seen[-1] == base['rim']['samples']
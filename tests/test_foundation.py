@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from engine.foundation import (
+    CONCRETE_WEIGHT, SOIL_PROPERTIES, extreme_load_sets, footing_checks, overturning_check, size_footing,
+)
+
+
+def random_loads(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    V = rng.uniform(1.5e6, 3e6, n)
+    H = rng.normal(0.0, 1.5e5, (n, 2))
+    M = rng.normal(0.0, 1e7, (n, 2))
+    return np.column_stack([V, H, M])
+
+
+def test_concentric_load_bearing_utilisation():
+    load = np.array([[2e6, 0.0, 0.0, 0.0, 0.0]])
+    checks = footing_checks(load, 10.0, 8.0, 2.0, 'Type II')
+    N = 2e6 + CONCRETE_WEIGHT * 10.0 * 8.0 * 2.0
+    assert checks['bearing'][0] == pytest.approx(N / 1000.0 / (80.0 * SOIL_PROPERTIES['Type II']['bearing']))
+    assert checks['overturning'][0] == 0.0 and checks['sliding'][0] == 0.0
+
+
+def test_uplift_fails_every_check():
+    checks = footing_checks(np.array([[-1e7, 0.0, 0.0, 0.0, 0.0]]), 2.0, 2.0, 1.0)
+    assert np.isinf(checks['governing'][0])
+
+
+def test_size_footing_is_minimal_and_passes_all_load_sets():
+    loads = random_loads()
+    result = size_footing(loads, (12.0, 8.0), tolerance=0.005)
+    assert result['feasible']
+    assert result['utilisation']['governing'] <= 1.0
+    assert result['n_load_sets'] < len(loads)
+    # Shrinking the chosen plan by a few centimetres breaks at least one check
+    shrunk = footing_checks(loads, result['length'] - 0.05, result['width'] - 0.05, result['depth'])
+    assert shrunk['governing'][0] > 1.0
+
+
+def test_extreme_load_sets_include_axis_extremes():
+    loads = random_loads(500)
+    subset = extreme_load_sets(loads)
+    assert len(subset) < len(loads)
+    assert subset[:, 0].max() == loads[:, 0].max()
+    assert subset[:, 4].min() == loads[:, 4].min()
+
+
+def test_overturning_about_governing_edge():
+    loads = np.array([[1e6, 0.0, 0.0, 0.0, 2e6], [1e6, 0.0, 0.0, 3e6, 0.0]])
+    result = overturning_check(loads, (10.0, 8.0))
+    assert result['factor'] == pytest.approx(1e6 * 4.0 / 3e6)
+    assert not result['passes']
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from engine.frame import FrameSolver, basis_loads, group_envelope, passenger_loads, wheel_frame
+from engine.structure import DOF_PER_NODE, wheel_model
+
+GEOMETRY = (30.0, 12, 18.0)
+MASSES = {'mass_structure': 40e3, 'mass_axis': 5e3, 'mass_cabins': 18e3}
+
+
+@pytest.fixture(scope='module')
+def frame():
+    return FrameSolver(wheel_model(*GEOMETRY, MASSES, refine=1))
+
+
+def test_solve_combinations_matches_direct_solves(frame):
+    basis = basis_loads(frame.model)
+    B = np.column_stack([basis['self_weight'], basis['snow'], basis['wind_y']])
+    coefficients = np.array([[1.35, 1.0, 1.0], [1.5e4, 0.0, 7.5e3], [0.0, 2e4, 3e4]])
+    combined = frame.solve_combinations(B, coefficients)
+    direct = frame.solve(B @ coefficients)
+    np.testing.assert_allclose(combined, direct, rtol=1e-9, atol=1e-12)
+
+
+def test_solve_single_vector_and_supports(frame):
+    load = basis_loads(frame.model)['self_weight']
+    U = frame.solve(load)
+    assert U.shape == (frame.n_dof,)
+    fixed = (frame.model['fixed'][:, None] * DOF_PER_NODE + np.arange(DOF_PER_NODE)).ravel()
+    assert np.all(U[fixed] == 0.0)
+
+
+def test_equilibrium_of_reactions(frame):
+    F = basis_loads(frame.model)['self_weight']
+    U = frame.solve(F)
+    fixed = frame.model['fixed'] * DOF_PER_NODE + 2
+    reactions = frame.K[fixed] @ U - F[fixed]
+    # Vertical support reactions carry the whole self-weight, including the leg bases' own share
+    assert reactions.sum() == pytest.approx(-F.reshape(-1, DOF_PER_NODE)[:, 2].sum(), rel=1e-6)
+
+
+def test_passenger_pattern_rotates_with_wheel(frame):
+    occ = np.zeros(12)
+    occ[0] = 1.0
+    loads = passenger_loads(frame.model, occ, [0, 3], passenger_mass=480.0)
+    z = loads.reshape(-1, DOF_PER_NODE, 2)[:, 2]
+    cabins = frame.model['cabin_nodes'].reshape(12, 2)
+    assert z[cabins[0], 0].sum() == pytest.approx(-9.81 * 480.0)
+    assert z[cabins[3], 1].sum() == pytest.approx(-9.81 * 480.0)
+    assert loads.sum() == pytest.approx(2 * -9.81 * 480.0)
+
+
+def test_group_envelope_locates_peak(frame):
+    forces = frame.member_forces(frame.solve(np.column_stack([
+        basis_loads(frame.model)['self_weight'], 2.0 * basis_loads(frame.model)['self_weight']])))
+    envelope = group_envelope(frame.model, forces, ['G', '2G'])
+    assert set(envelope) == {'rim', 'spoke', 'cross', 'axle', 'tower'}
+    assert all(v['case'] == '2G' for v in envelope.values())
+
+
+def test_cached_frame_shared():
+    assert wheel_frame(*GEOMETRY, 40e3, 5e3, 18e3, refine=1) is wheel_frame(*GEOMETRY, 40e3, 5e3, 18e3, refine=1)
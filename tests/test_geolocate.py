@@ -0,0 +1,85 @@
+import csv
+import io
+
+import numpy as np
+import pytest
+
+from engine.geolocate import EARTH_RADIUS_KM, city_tree, nearest_cities, nearest_city, read_sites, unit_vectors
+
+
+def write_csv(path, header, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    write_csv(tmp_path / "provinces.csv",
+              ['province', 'province_fa', 'category', 'z0', 'zmin', 'hazard', 'desc', 'desc_fa'],
+              [['Alpha', 'آلفا', 'II', '0.05', '2', 'Moderate', '', ''],
+               ['Beta', 'بتا', 'III', '0.3', '5', 'High', '', '']])
+    write_csv(tmp_path / "cities.csv", ['province', 'city', 'city_fa', 'hazard', 'lat', 'lon'],
+              [['Alpha', 'West', 'غرب', 'Low', '35.0', '50.0'],
+               ['Alpha', 'Unplaced', '', 'Low', '', ''],
+               ['Beta', 'East', 'شرق', '', '35.0', '52.0'],
+               ['Beta', 'Dateline', '', 'High', '0.0', '179.9']])
+    write_csv(tmp_path / "soil_types.csv", ['soil_type', 'importance_group', 'group_factor', 'desc_en', 'desc_fa'],
+              [['Type I', 'Group 1', '1.4', '', '']])
+    return str(tmp_path)
+
+
+def test_unit_vectors_on_sphere():
+    v = unit_vectors([0.0, 90.0, 35.0], [0.0, 0.0, 51.0])
+    assert np.linalg.norm(v, axis=-1) == pytest.approx(1.0)
+    assert v[0] == pytest.approx([1.0, 0.0, 0.0])
+    assert v[1] == pytest.approx([0.0, 0.0, 1.0], abs=1e-12)
+
+
+def test_tree_skips_cities_without_coordinates(gazetteer):
+    index = city_tree(gazetteer)
+    assert sorted(index['city'].tolist()) == ['Dateline', 'East', 'West']
+    # Missing city hazard falls back to the province level
+    assert index['hazard'][index['city'].tolist().index('East')] == 'High'
+
+
+def test_batch_matches_single_lookups(gazetteer):
+    lat = np.array([35.1, 34.9, 1.0])
+    lon = np.array([50.2, 51.9, -179.9])
+    batch = nearest_cities(lat, lon, gazetteer)
+    assert batch['city'].tolist() == ['West', 'East', 'Dateline']
+    assert batch['terrain_category'].tolist() == ['II', 'III', 'III']
+    for i in range(3):
+        single = nearest_city(lat[i], lon[i], gazetteer)
+        assert single['city'] == batch['city'][i]
+        assert single['distance_km'] == pytest.approx(batch['distance_km'][i])
+
+
+def test_great_circle_distance(gazetteer):
+    # One degree of longitude at 35°N
+    found = nearest_city(35.0, 51.0, gazetteer)
+    expected = EARTH_RADIUS_KM * np.arccos(np.sin(np.radians(35.0)) ** 2
+                                           + np.cos(np.radians(35.0)) ** 2 * np.cos(np.radians(1.0)))
+    assert found['distance_km'] == pytest.approx(expected, rel=1e-6)
+    # Across the antimeridian the neighbour is still found by chord distance
+    assert nearest_city(0.0, -179.95, gazetteer)['distance_km'] < 20.0
+
+
+def test_read_sites_detects_columns():
+    sites = read_sites(io.StringIO("Name,Latitude,Longitude\nA,35.7,51.4\nB,29.6,52.5\n"))
+    assert sites['name'].tolist() == ['A', 'B']
+    assert sites['lat'] == pytest.approx([35.7, 29.6])
+    unnamed = read_sites(io.StringIO("y,x\n1,2\n3,4\n"))
+    assert unnamed['name'].tolist() == ['1', '2']
+    assert unnamed['lon'] == pytest.approx([2.0, 4.0])
+    with pytest.raises(ValueError):
+        read_sites(io.StringIO("a,b\n1,2\n"))
+
+
+def test_read_sites_skips_invalid_coordinates():
+    sites = read_sites(io.StringIO("name,lat,lon\nA,35.7,51.4\nB,,52.5\nC,29.6,n/a\nD,95,50\nE,29.6,52.5\n"))
+    assert sites['name'].tolist() == ['A', 'E'] and sites['skipped'] == 3
+    assert np.isfinite(nearest_cities(sites['lat'], sites['lon'])['distance_km']).all()
+    with pytest.raises(ValueError):
+        read_sites(io.StringIO("lat,lon\n,\n"))
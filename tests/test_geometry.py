@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from engine.geometry import (
+    CABIN_GEOMETRIES, SEAT_MASS, SPHERICAL, SQUARE, SURFACE_AREA_LIMITS, VERTICAL_CYLINDER, cabin_dimensions,
+    cabin_mass, cabin_surface_area, geometry_code, geometry_name,
+)
+
+
+def test_codes_from_either_language():
+    for code, geometry in CABIN_GEOMETRIES.items():
+        english, persian = geometry['names']
+        assert geometry_code(english) == geometry_code(persian) == geometry_code(english.upper()) == code
+        assert geometry_name(code, persian=True) == persian
+    assert geometry_code('Triangle') == SQUARE
+    assert geometry_code(None, default=SPHERICAL) == SPHERICAL
+
+
+def test_cabin_mass_broadcasts():
+    masses = cabin_mass(np.array([SQUARE, SPHERICAL]), 6)
+    assert masses.tolist() == pytest.approx([CABIN_GEOMETRIES[SQUARE]['mass'] + 6 * SEAT_MASS,
+                                             CABIN_GEOMETRIES[SPHERICAL]['mass'] + 6 * SEAT_MASS])
+
+
+def test_dimensions_limited_by_wheel_diameter():
+    small = cabin_dimensions(VERTICAL_CYLINDER, 40, 16.0)
+    assert small['width'] == pytest.approx(16.0 / 8.0)
+    square = cabin_dimensions(SQUARE, 6, 60.0)
+    assert square['width'] == pytest.approx(np.sqrt(6 * 0.6))
+
+
+def test_surface_area_clipped():
+    areas = cabin_surface_area(np.array(list(CABIN_GEOMETRIES)), 6, 50.0)
+    assert np.all((areas >= SURFACE_AREA_LIMITS[0]) & (areas <= SURFACE_AREA_LIMITS[1]))
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from engine.hazard_maps import HAZARD_LAYERS, available_layers, open_raster, sample, site_hazards, write_raster
+from engine.i18n import TEXTS
+from engine.seismic import design_spectrum, seismic_forces
+
+
+@pytest.fixture
+def hazard_dir(tmp_path):
+    # PGA grows 0.01 g per degree north and 0.1 g per degree east; cells at 30–33°N, 50–53°E
+    lat, lon = np.meshgrid(np.arange(4.0), np.arange(4.0), indexing='ij')
+    pga = 0.2 + 0.01 * lat + 0.1 * lon
+    pga[3, 3] = np.nan
+    write_raster(tmp_path / HAZARD_LAYERS['pga']['file'], pga, 30.0, 50.0, 1.0, 1.0)
+    write_raster(tmp_path / HAZARD_LAYERS['wind']['file'], np.full((2, 2), 27.0), 30.0, 50.0, 3.0, 3.0)
+    return str(tmp_path)
+
+
+def test_bilinear_sampling_is_exact_for_planes(hazard_dir):
+    raster = open_raster(f"{hazard_dir}/{HAZARD_LAYERS['pga']['file']}")
+    values = sample(raster, [30.0, 30.5, 31.25], [50.0, 51.5, 50.75])
+    assert values == pytest.approx([0.2, 0.355, 0.2875], abs=1e-6)
+
+
+def test_outside_and_no_data_give_nan(hazard_dir):
+    raster = open_raster(f"{hazard_dir}/{HAZARD_LAYERS['pga']['file']}")
+    values = sample(raster, [29.0, 31.0, 32.5], [51.0, 54.0, 52.5])
+    assert np.isnan(values).all()
+
+
+def test_site_hazards_skips_missing_layers(hazard_dir):
+    assert available_layers(hazard_dir) == ['pga', 'wind']
+    found = site_hazards(np.array([31.0, 32.0]), np.array([51.0, 52.0]), hazard_dir=hazard_dir)
+    assert set(found) == {'pga', 'wind'}
+    assert found['wind'] == pytest.approx([27.0, 27.0])
+    assert site_hazards(31.0, 51.0, layers=['snow'], hazard_dir=hazard_dir) == {}
+
+
+def test_raster_rejects_bad_input(tmp_path):
+    with pytest.raises(ValueError):
+        write_raster(tmp_path / "bad.grid", np.zeros((1, 4)), 0.0, 0.0, 1.0, 1.0)
+    (tmp_path / "junk.grid").write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        open_raster(str(tmp_path / "junk.grid"))
+
+
+def test_layer_names_in_catalogue():
+    for layer in HAZARD_LAYERS.values():
+        assert layer['text_key'] in TEXTS
+
+
+def test_mapped_pga_overrides_table():
+    table = design_spectrum('Type II', 'Moderate', 1.0, 1.0)
+    mapped = design_spectrum('Type II', 'Moderate', A=0.32)
+    assert table.A == pytest.approx(0.25)
+    # A ≥ 0.30 switches to the high-hazard spectrum parameters as well
+    assert mapped.A == pytest.approx(0.32) and mapped.high and not table.high
+    fallback = seismic_forces(1e5, 0.5, 'Type II', 'Moderate', A=None)
+    assert fallback['spectrum'] is table
+    forces = seismic_forces(1e5, 0.5, 'Type II', 'Moderate', A=0.32)
+    assert forces['C'] == pytest.approx(0.32 / 0.25 * fallback['C'] * mapped.long_period_factor(0.5)
+                                        / table.long_period_factor(0.5))
@@ -0,0 +1,57 @@
+import re
+import string
+
+import pytest
+
+from engine.i18n import MESSAGES, TEXTS, get_text, load_catalogue, translate
+from engine.structure import GROUPS
+from engine.wind_rose import COMPASS_8
+
+
+def fields(text):
+    return sorted(name for _, name, _, _ in string.Formatter().parse(text) if name is not None)
+
+
+def test_catalogue_is_read_only():
+    texts, messages = load_catalogue()
+    assert texts is TEXTS and messages is MESSAGES
+    with pytest.raises(TypeError):
+        texts['new'] = ('a', 'b')
+
+
+def test_lookup_falls_back_to_source_text():
+    assert get_text('no_such_key', persian=True) == 'no_such_key'
+    assert translate('No such message', persian=True) == 'No such message'
+    assert translate('North', persian=False) == 'North'
+    assert translate('North', persian=True) != 'North'
+
+
+def test_format_fields_match_in_both_languages():
+    for key, (en, fa) in TEXTS.items():
+        assert fields(en) == fields(fa), key
+    for en, fa in MESSAGES.items():
+        assert fields(en) == fields(fa), en
+
+
+@pytest.mark.parametrize('key', [f'member_{g}' for g in GROUPS + ('cabin', 'tension', 'compression')]
+                         + [f'lockin_{s}' for s in ('pass', 'low', 'high')]
+                         + [f'quantity_{q}' for q in ('bearing_radial', 'bearing_axial', 'bearing_static',
+                                                      'foundation_V', 'foundation_H', 'foundation_M',
+                                                      'leg_reaction', 'leg_uplift')]
+                         + ['north_south', 'east_west', 'northeast_southwest', 'southeast_northwest'])
+def test_ui_keys_translated(key):
+    en, fa = TEXTS[key]
+    assert en and fa and en != fa
+    assert re.search('[؀-ۿ]', fa)
+
+
+def test_member_force_label():
+    label = get_text('member_tension', persian=True).format(member=get_text('member_rim', persian=True))
+    assert get_text('member_rim', persian=True) in label
+    assert get_text('member_compression').format(member='Rim') == 'Rim compression'
+
+
+# Step 5 offers these names and the wind rose reports its dominant direction with them
+@pytest.mark.parametrize('direction', COMPASS_8)
+def test_wind_directions_translated(direction):
+    assert direction in MESSAGES
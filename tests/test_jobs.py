@@ -0,0 +1,99 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from engine import jobs
+from engine.jobs import CANCELLED, DONE, FAILED, INTERRUPTED, JobManager, report
+from engine.scheduler import Scheduler
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return JobManager(scheduler=Scheduler(workers=2), jobs_dir=str(tmp_path))
+
+
+def finished(manager, job_id):
+    wait_for(lambda: manager.status(job_id)['state'] in jobs.FINISHED)
+    return manager.status(job_id)
+
+
+def counting(n):
+    for i in range(n):
+        report(i / n, partial={'done': i}, message=f"{i}/{n}")
+    return n * 2
+
+
+def test_job_runs_to_result(manager):
+    job_id = manager.submit(counting, 5, kind='test', owner='a')
+    state = finished(manager, job_id)
+    assert state['state'] == DONE and state['result'] == 10
+    assert state['kind'] == 'test' and state['progress'] == 1.0
+
+
+def test_failure_is_recorded(manager):
+    job_id = manager.submit(lambda: int('x'))
+    state = finished(manager, job_id)
+    assert state['state'] == FAILED and state['error'].startswith("ValueError")
+    assert state['result'] is None
+
+
+def test_cancel_stops_running_job(manager):
+    started = threading.Event()
+
+    def endless():
+        started.set()
+        while True:
+            report()
+            time.sleep(0.005)
+
+    job_id = manager.submit(endless, owner='a')
+    started.wait(5)
+    assert manager.cancel(job_id)
+    assert finished(manager, job_id)['state'] == CANCELLED
+    assert not manager.cancel(job_id)
+
+
+def test_unknown_or_malformed_id(manager):
+    assert manager.status('0' * 32) is None
+    assert manager.status('../etc') is None
+    assert not manager.cancel('not-a-job')
+
+
+def orphan(manager, **fields):
+    """Record of a 'running' job written by another process"""
+    job_id = 'f' * 32
+    os.makedirs(os.path.join(manager.jobs_dir, job_id))
+    state = dict(id=job_id, kind='test', state='running', progress=0.5, message='', submitted=time.time(),
+                 updated=time.time(), **fields)
+    with open(os.path.join(manager.jobs_dir, job_id, 'state.json'), 'w') as f:
+        json.dump(state, f)
+    return job_id
+
+
+def test_job_of_dead_process_is_interrupted(manager):
+    job_id = orphan(manager, pid=2 ** 22 + 1)
+    assert manager.status(job_id)['state'] == INTERRUPTED
+
+
+def test_reused_pid_is_not_mistaken_for_owner(manager):
+    if jobs._PROCESS is None:
+        pytest.skip("process start time not available on this platform")
+    # A live pid (this process) but a different process start: the writer is gone
+    job_id = orphan(manager, pid=os.getpid(), process=jobs._PROCESS + "0")
+    assert manager.status(job_id)['state'] == INTERRUPTED
+
+
+def test_live_owner_keeps_job_running(manager):
+    job_id = orphan(manager, pid=os.getpid(), process=jobs._PROCESS)
+    assert manager.status(job_id)['state'] == 'running'
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from engine.bearings import SPINDLE_SERIES, load_bearing_catalogue
+from engine.geometry import CABIN_COST, SQUARE
+from engine.mass import CONNECTION_ALLOWANCE, EQUIPMENT_PER_METRE, cost_estimate, wheel_masses
+from engine.structure import GROUPS, STEEL_DENSITY, default_sections, member_lengths
+
+
+def test_calibrated_against_reference_wheels():
+    mid = wheel_masses(60.0, 24, 6)
+    # Earlier 800·D^1.5 estimate of the whole structure at 60 m
+    assert float(mid['mass_structure'] + mid['mass_axis']) < 800.0 * 60.0 ** 1.5
+    assert 120e3 < float(mid['mass_wheel']) < 250e3
+    # Published rim, spoke and hub mass of 135 m observation wheels is about 2,100 t
+    large = wheel_masses(135.0, 32, 25)
+    assert float(large['mass_wheel']) == pytest.approx(2.1e6, rel=0.15)
+
+
+def test_groups_match_frame_sections():
+    m = wheel_masses(50.0, 20, 6)
+    sections = default_sections(50.0)
+    lengths = member_lengths(50.0, 20, 30.0)
+    for g in GROUPS:
+        expected = STEEL_DENSITY * sections[g]['A'] * lengths[g] * (1.0 + CONNECTION_ALLOWANCE)
+        assert float(m['groups'][g]) == pytest.approx(float(expected))
+    assert float(m['mass_equipment']) == pytest.approx(EQUIPMENT_PER_METRE * 50.0)
+    assert float(m['steel']) == pytest.approx(sum(float(v) for v in m['groups'].values()))
+    assert float(m['mass_wheel'] + m['mass_tower']) == pytest.approx(float(m['mass_structure'] + m['mass_axis']))
+
+
+def test_sweep_broadcasts():
+    diameters = np.array([30.0, 45.0, 60.0, 80.0])
+    sweep = wheel_masses(diameters, 24, 6)
+    for i, d in enumerate(diameters):
+        single = wheel_masses(d, 24, 6)
+        assert float(sweep['mass_wheel'][i]) == pytest.approx(float(single['mass_wheel']))
+    assert np.all(np.diff(sweep['mass_wheel']) > 0)
+
+
+def test_spindle_bearing_available_across_ui_range():
+    # Weight of the loaded wheel with 15 % horizontal seismic must stay within the spindle series
+    catalogue = load_bearing_catalogue()
+    largest = catalogue.column('C')[catalogue.rows(SPINDLE_SERIES)].max()
+    for diameter, cabins in ((30.0, 12), (60.0, 24), (80.0, 32)):
+        m = wheel_masses(diameter, cabins, 6)
+        rotating = float(m['mass_wheel'] + m['mass_cabins']) + cabins * 6 * 80.0
+        radial = rotating * 9.81
+        equivalent = np.hypot(radial, 0.15 * radial) + 1.5 * 0.2 * radial
+        assert 1.5 * equivalent / 1000.0 < largest
+
+
+def test_cost_total_is_sum_of_items():
+    m = wheel_masses(60.0, 24, 6)
+    cost = cost_estimate(m, 24, SQUARE, rated_power=100.0, concrete_volume=50.0)
+    parts = sum(cost['steel'].values()) + cost['equipment'] + cost['cabins'] + cost['drive'] + cost['foundation']
+    assert float(cost['total']) == pytest.approx(float(parts))
+    assert float(cost['cabins']) == pytest.approx(CABIN_COST[SQUARE] * 24)
@@ -0,0 +1,80 @@
+import numpy as np
+
+from engine.memo import LRUCache, cache_stats, code_digest, freeze, memoize
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1          # 'a' is now the most recent
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.info() == {'hits': 3, 'misses': 1, 'size': 2, 'maxsize': 2, 'shared': 0}
+    cache.clear()
+    assert cache.info()['size'] == 0 and cache.info()['hits'] == 0
+
+
+def test_put_refreshes_existing_key():
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('a', 10)
+    cache.put('c', 3)
+    assert cache.get('a') == 10 and cache.get('b') is None
+
+
+def test_freeze_equal_inputs_equal_keys():
+    assert freeze(np.float64(2.5)) == 2.5 and type(freeze(np.int64(3))) is int
+    assert freeze(np.arange(3)) == freeze(np.arange(3))
+    assert freeze(np.arange(3)) != freeze(np.arange(3, dtype=np.int32))
+    assert freeze(np.zeros((2, 3))) != freeze(np.zeros((3, 2)))
+    assert freeze({'b': [1, 2], 'a': 1}) == freeze({'a': 1, 'b': (1, 2)})
+    assert hash(freeze({'x': [np.arange(2), {1, 2}]})) is not None
+
+
+def test_memoize_computes_once_per_key():
+    calls = []
+
+    @memoize(maxsize=4)
+    def square(x, scale=1.0):
+        calls.append(x)
+        return np.asarray(x) ** 2 * scale
+
+    square.cache_clear()
+    assert square(np.array([1, 2])).tolist() == [1, 4]
+    assert square(np.array([1, 2])).tolist() == [1, 4]
+    assert square([1, 2], scale=2.0).tolist() == [2, 8]
+    assert len(calls) == 2
+    assert square.cache_info()['hits'] == 1
+    assert f"{__name__}.test_memoize_computes_once_per_key.<locals>.square" in cache_stats()
+
+
+def make(offset):
+    @memoize()
+    def shifted(x):
+        return x + offset
+    return shifted
+
+
+def test_redefinition_keeps_cache_until_code_changes():
+    first, again = make(1), make(1)
+    first.cache_clear()
+    first(1)
+    # Same definition (a Streamlit rerun): the cache is shared
+    assert again.cache is first.cache and again.cache_info()['size'] == 1
+
+
+def test_code_digest_tracks_body():
+    def a(x):
+        return x + 1
+
+    def b(x):
+        return x + 2
+
+    def c(x):
+        return x + 1
+
+    assert code_digest(a) == code_digest(c)
+    assert code_digest(a) != code_digest(b)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from engine.modal import add_cabin_mass, modal_analysis, modes_from_breakdown, wheel_modes
+from engine.store import ResultStore
+from engine.structure import wheel_model
+
+GEOMETRY = (30.0, 12, 18.0)
+MASSES = {'mass_structure': 40e3, 'mass_axis': 5e3, 'mass_cabins': 12 * 1500.0}
+
+
+@pytest.fixture(autouse=True)
+def isolated_store(tmp_path, monkeypatch):
+    # Keep solved modes out of the user's result cache
+    monkeypatch.setattr('engine.store.default_store', lambda: ResultStore(str(tmp_path / "results.sqlite")))
+    wheel_modes.cache_clear()
+
+
+def test_modes_are_sorted_and_mass_fractions_bounded():
+    modes = modal_analysis(wheel_model(*GEOMETRY, MASSES, refine=1), n_modes=12)
+    assert np.all(np.diff(modes['frequencies']) >= 0)
+    assert np.all(modes['mass_fraction'] >= 0)
+    assert np.all(modes['mass_fraction'].sum(axis=0) <= 1.0 + 1e-9)
+    # Mass lumped at the fixed leg bases does not take part
+    assert 0.95 * sum(MASSES.values()) < modes['total_mass'] < sum(MASSES.values())
+
+
+def test_added_cabin_mass_matches_full_solve():
+    passengers = 12 * 6 * 80.0
+    empty = modal_analysis(wheel_model(*GEOMETRY, MASSES, refine=1), n_modes=12)
+    empty['model'] = wheel_model(*GEOMETRY, MASSES, refine=1)
+    corrected = add_cabin_mass(empty, passengers)
+    full = modal_analysis(wheel_model(*GEOMETRY, dict(MASSES, mass_passengers=passengers), refine=1), n_modes=12)
+    np.testing.assert_allclose(corrected['frequencies'][:6], full['frequencies'][:6], rtol=5e-3)
+    assert corrected['total_mass'] == pytest.approx(full['total_mass'])
+    # The cached result is not modified
+    assert corrected['frequencies'][0] < empty['frequencies'][0]
+
+
+def test_occupancy_does_not_start_a_new_solve():
+    breakdown = {'mass_structure': 40e3, 'mass_axis': 5e3, 'mass_cabins': 18e3, 'mass_passengers': 0.0}
+    modes_from_breakdown(*GEOMETRY, breakdown, refine=1, n_modes=8)
+    modes_from_breakdown(*GEOMETRY, dict(breakdown, mass_passengers=5760.0), refine=1, n_modes=8)
+    info = wheel_modes.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from engine.orientation import (
+    footprint_fits, nearest_axis, optimise_orientation, single_direction_distribution, speed_bin_centers,
+)
+
+# Face-on wind (ψ = 0) loads the wheel five times more than wind along its plane
+RESPONSE_DEG = np.array([0.0, 90.0])
+RESPONSE = np.array([1.0, 0.2])
+
+
+def test_plane_aligns_with_single_wind_direction():
+    d, s, f = single_direction_distribution('Northeast', 20.0)
+    result = optimise_orientation(d, s, f, RESPONSE_DEG, RESPONSE, 1000.0, 1000.0, 50.0)
+    assert result['optimal_angle'] == pytest.approx(45.0)
+    assert result['axis_key'] == 'NE_SW'
+    assert result['cost'].min() == pytest.approx(1.0)
+
+
+def test_land_constraint_restricts_bearing():
+    d, s, f = single_direction_distribution('North', 20.0)
+    # A long east-west plot only fits the wheel along the EW axis
+    result = optimise_orientation(d, s, f, RESPONSE_DEG, RESPONSE, 100.0, 20.0, 50.0)
+    assert result['any_feasible']
+    assert result['axis_key'] == 'EW'
+
+
+def test_footprint_fits_rotation():
+    fits = footprint_fits([0.0, 90.0], 50.0, 10.0, land_length=60.0, land_width=20.0)
+    assert fits.tolist() == [False, True]
+
+
+def test_speed_bin_centers_open_top_band():
+    assert speed_bin_centers([0.0, 2.0, 4.0, np.inf]).tolist() == [1.0, 3.0, 5.0]
+
+
+def test_nearest_axis_wraps_at_180():
+    assert nearest_axis(170.0) == 'NS'
+    assert nearest_axis(120.0) == 'SE_NW'
@@ -0,0 +1,72 @@
+import csv
+
+import pytest
+
+from engine.reference import (CITIES_DATA, DEFAULT_HAZARD, PROVINCE_FA, SOIL_TYPES, TERRAIN_CATEGORIES,
+                              city_location, city_name, load_reference, province_name, seismic_hazard)
+
+
+def write_csv(path, header, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def small_reference(tmp_path):
+    write_csv(tmp_path / "provinces.csv",
+              ['province', 'province_fa', 'category', 'z0', 'zmin', 'hazard', 'desc', 'desc_fa'],
+              [['Alpha', 'آلفا', 'II', '0.05', '2', '', 'Farmland', 'زمین کشاورزی'],
+               ['Beta', 'بتا', 'III', '0.3', '5', 'High', 'Suburbs', 'حومه']])
+    write_csv(tmp_path / "cities.csv", ['province', 'city', 'city_fa', 'hazard', 'lat', 'lon'],
+              [['Alpha', 'One', 'یک', 'Low', '35.5', '51.25'],
+               ['Alpha', 'Two', '', 'Very High', '', ''],
+               ['Beta', 'Three', 'سه', 'High', '30', '50']])
+    write_csv(tmp_path / "soil_types.csv", ['soil_type', 'importance_group', 'group_factor', 'desc_en', 'desc_fa'],
+              [['Type I', 'Group 1', '1.4', 'Rock', 'سنگ']])
+    return load_reference(str(tmp_path))
+
+
+def test_parses_and_indexes(small_reference):
+    ref = small_reference
+    assert ref['terrain']['Alpha']['zmin'] == 2 and isinstance(ref['terrain']['Alpha']['zmin'], int)
+    assert ref['terrain']['Beta']['z0'] == pytest.approx(0.3)
+    # Empty province hazard falls back to the default
+    assert ref['province_hazard'] == {'Alpha': DEFAULT_HAZARD, 'Beta': 'High'}
+    assert [c['city'] for c in ref['cities']['Alpha']] == ['One', 'Two']
+    two = ref['city_index'][('Alpha', 'Two')]
+    assert two['city_fa'] == 'Two' and two['lat'] is None
+    assert ref['city_index'][('Alpha', 'One')]['lon'] == pytest.approx(51.25)
+    assert ref['soil_types']['Type I']['group_factor'] == pytest.approx(1.4)
+
+
+def test_indexes_are_read_only(small_reference):
+    with pytest.raises(TypeError):
+        small_reference['terrain']['Gamma'] = {}
+    with pytest.raises(TypeError):
+        small_reference['city_index'][('Alpha', 'One')]['hazard'] = 'High'
+    assert isinstance(small_reference['cities']['Alpha'], tuple)
+
+
+def test_loaded_once_per_directory(small_reference, tmp_path):
+    assert load_reference(str(tmp_path)) is small_reference
+
+
+def test_shipped_data_is_consistent():
+    assert set(CITIES_DATA) <= set(TERRAIN_CATEGORIES)
+    assert set(PROVINCE_FA) == set(TERRAIN_CATEGORIES)
+    assert {'Type I', 'Type II', 'Type III', 'Type IV'} <= set(SOIL_TYPES)
+
+
+def test_lookups_fall_back():
+    province = next(iter(CITIES_DATA))
+    city = CITIES_DATA[province][0]
+    assert seismic_hazard(province, city['city']) == city['hazard']
+    assert seismic_hazard(province, 'Nowhere') == load_reference()['province_hazard'][province]
+    assert seismic_hazard('Nowhere', 'Nowhere') == DEFAULT_HAZARD
+    assert city_name(province, city['city'], persian=True) == city['city_fa']
+    assert city_name(province, 'Typed In', persian=True) == 'Typed In'
+    assert province_name(province, persian=True) == PROVINCE_FA[province]
+    assert province_name(province) == province
+    assert city_location('Nowhere', 'Nowhere') is None
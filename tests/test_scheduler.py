@@ -0,0 +1,109 @@
+import threading
+import time
+
+import pytest
+
+from engine.scheduler import BATCH, Cancelled, Scheduler, checkpoint
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+def blocker(release):
+    """Task that holds its worker until ``release`` is set, checking for cancellation"""
+    def run():
+        while not release.wait(0.005):
+            checkpoint()
+        return 'done'
+    return run
+
+
+def test_session_quota_leaves_workers_for_others():
+    pool = Scheduler(workers=3, session_quota=2)
+    release = threading.Event()
+    busy = [pool.submit(blocker(release), session='a') for _ in range(3)]
+    wait_for(lambda: pool.metrics()['sessions'].get('a') == 2)
+    # 'a' is at its quota, so the third worker serves 'b' first
+    assert pool.submit(lambda: 'b', session='b').result(timeout=5) == 'b'
+    assert not busy[2].running() and not busy[2].done()
+    release.set()
+    assert [t.result(timeout=5) for t in busy] == ['done'] * 3
+
+
+def test_detached_jobs_do_not_use_the_step_quota():
+    pool = Scheduler(workers=3, session_quota=1, detached_quota=1)
+    release = threading.Event()
+    job = pool.submit(blocker(release), session='a', priority=BATCH, detached=True)
+    second_job = pool.submit(blocker(release), session='a', priority=BATCH, detached=True)
+    wait_for(lambda: pool.metrics()['detached'] == 1)
+    # A running job leaves the session's interactive quota free
+    assert pool.run(lambda: 'step', session='a') == 'step'
+    assert not second_job.running()
+    release.set()
+    assert job.result(timeout=5) == second_job.result(timeout=5) == 'done'
+    assert pool.metrics()['detached'] == 0
+
+
+def test_detached_jobs_leave_a_worker_for_interactive_work():
+    pool = Scheduler(workers=2, detached_quota=2)
+    release = threading.Event()
+    jobs = [pool.submit(blocker(release), session=s, priority=BATCH, detached=True) for s in 'abc']
+    wait_for(lambda: pool.metrics()['detached'] == 1)
+    assert pool.run(lambda: 'step', session='d') == 'step'
+    assert pool.metrics()['detached'] == 1
+    release.set()
+    assert [j.result(timeout=5) for j in jobs] == ['done'] * 3
+
+
+def test_cancel_running_task_stops_at_checkpoint():
+    pool = Scheduler(workers=1)
+    task = pool.submit(blocker(threading.Event()), session='a')
+    wait_for(task.running)
+    task.cancel_requested.set()
+    with pytest.raises(Cancelled):
+        task.result(timeout=5)
+    wait_for(lambda: pool.metrics()['cancelled'] == 1)
+
+
+def test_run_raises_cancelled_for_queued_task():
+    pool = Scheduler(workers=1)
+    release = threading.Event()
+    pool.submit(blocker(release), session='a')
+    wait_for(lambda: pool.metrics()['running'] == 1)
+    cancel = threading.Timer(0.05, lambda: pool.cancel_session('b'))
+    cancel.start()
+    with pytest.raises(Cancelled):
+        pool.run(lambda: 'never', session='b')
+    release.set()
+
+
+def test_cancel_session_keeps_detached_and_current_step():
+    pool = Scheduler(workers=1)
+    release = threading.Event()
+    pool.submit(blocker(release), session='other')
+    wait_for(lambda: pool.metrics()['running'] == 1)
+    old = pool.submit(lambda: 'old', session='a', step=3)
+    current = pool.submit(lambda: 'current', session='a', step=4)
+    job = pool.submit(lambda: 'job', session='a', step=3, priority=BATCH, detached=True)
+    assert pool.cancel_session('a', keep_step=4) == 1
+    release.set()
+    assert old.cancelled()
+    assert current.result(timeout=5) == 'current' and job.result(timeout=5) == 'job'
+
+
+def test_ended_session_is_not_started():
+    alive = {'a': True}
+    pool = Scheduler(workers=1, session_alive=lambda s: alive.get(s, False))
+    release = threading.Event()
+    pool.submit(blocker(release), session='a')
+    wait_for(lambda: pool.metrics()['running'] == 1)
+    step = pool.submit(lambda: 'step', session='gone')
+    job = pool.submit(lambda: 'job', session='gone', priority=BATCH, detached=True)
+    release.set()
+    assert job.result(timeout=5) == 'job'
+    assert step.cancelled()
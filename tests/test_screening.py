@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from engine.bearings import BearingCatalogue, SPINDLE_SERIES, calculate_bearing_loads, load_bearing_catalogue
+from engine.hazard_maps import HAZARD_LAYERS, write_raster
+from engine.reference import load_reference
+from engine.screening import province_summary, reference_sites, screen_sites
+from engine.seismic import seismic_forces
+from engine.wind import basic_to_gust
+
+DESIGN = {
+    'diameter': 60.0, 'hub_height': 36.0, 'num_cabins': 24, 'cabin_area': 4.0, 'cabin_cf': 1.0,
+    'wind_speed': 30.0, 'altitude': 0.0, 'snow_pressure': 0.2, 'frequency': 1.0, 'periods': [0.8, 1.2],
+    'seismic_mass': 300e3, 'rotating_mass': 200e3, 'soil_type': 'Type II', 'importance': 1.0,
+    'behaviour_factor': 3.0,
+}
+
+
+@pytest.fixture(scope='module')
+def result(tmp_path_factory):
+    # An empty hazard directory keeps the design wind and snow at every site
+    return screen_sites(DESIGN, hazard_dir=str(tmp_path_factory.mktemp('hazard')))
+
+
+def test_every_city_screened(result):
+    sites = reference_sites()
+    assert len(result['city']) == len(sites['city'])
+    assert sorted(result['rank'].tolist()) == list(range(1, len(sites['city']) + 1))
+    assert np.all(result['wind_speed'] == DESIGN['wind_speed'])
+
+
+def test_bearing_by_the_step_11_rule(result):
+    loads = calculate_bearing_loads(DESIGN['rotating_mass'], 0.0, result['snow_force'] * 1000.0,
+                                    result['wind_force'] * 1000.0, result['seismic_h'] * 1000.0,
+                                    result['seismic_v'] * 1000.0)
+    assert result['required_C'] == pytest.approx(loads['required_C'])
+    catalogue = load_bearing_catalogue()
+    for i in np.flatnonzero(result['rank'] <= 5):
+        record = catalogue.record(catalogue.select('C', result['required_C'][i], series=SPINDLE_SERIES))
+        assert result['bearing'][i] == (record['designation'] if record else '')
+
+
+def test_rank_follows_required_rating(result):
+    order = np.argsort(result['rank'])
+    assert np.all(np.diff(result['required_C'][order]) <= 1e-9)
+
+
+def test_seismic_shared_per_hazard_level(result):
+    for level in np.unique(result['hazard']):
+        at_level = result['seismic_h'][result['hazard'] == level]
+        assert np.ptp(at_level) == 0.0
+
+
+def write_layer(directory, layer, value):
+    """Uniform raster over every located city; returns the located-site mask"""
+    sites = reference_sites()
+    located = np.isfinite(sites['lat'])
+    if not located.any():
+        pytest.skip("no located cities in the gazetteer")
+    lat, lon = sites['lat'][located], sites['lon'][located]
+    write_raster(directory / HAZARD_LAYERS[layer]['file'], np.full((2, 2), value),
+                 lat.min() - 1.0, lon.min() - 1.0, lat.max() - lat.min() + 2.0, lon.max() - lon.min() + 2.0)
+    return sites, located
+
+
+def test_mapped_wind_enters_as_gust(tmp_path):
+    sites, located = write_layer(tmp_path, 'wind', DESIGN['wind_speed'])
+    base = screen_sites(DESIGN, hazard_dir=str(tmp_path / 'none'))
+    mapped = screen_sites(DESIGN, hazard_dir=str(tmp_path))
+    terrain = load_reference()['terrain']
+    gust = np.array([basic_to_gust(DESIGN['wind_speed'], terrain[p]) for p in sites['province'][located]])
+    assert mapped['wind_speed'][located] == pytest.approx(gust)
+    scale = (gust / DESIGN['wind_speed']) ** 2
+    assert mapped['wind_force'][located] == pytest.approx(scale * base['wind_force'][located])
+    assert mapped['wind_force'][~located] == pytest.approx(base['wind_force'][~located])
+
+
+def test_mapped_pga_replaces_hazard_level(tmp_path):
+    sites, located = write_layer(tmp_path, 'pga', 0.42)
+    result = screen_sites(DESIGN, hazard_dir=str(tmp_path))
+    for i in (np.flatnonzero(located)[0], *np.flatnonzero(~located)[:1]):
+        A = 0.42 if located[i] else None
+        expected = seismic_forces(DESIGN['seismic_mass'], DESIGN['periods'], DESIGN['soil_type'], sites['hazard'][i],
+                                  DESIGN['importance'], DESIGN['behaviour_factor'], A=A)
+        assert result['seismic_h'][i] == pytest.approx(expected['horizontal'])
+    assert np.ptp(result['seismic_h'][located]) == 0.0
+
+
+def test_empty_catalogue_selects_nothing(tmp_path):
+    empty = BearingCatalogue(load_bearing_catalogue().frame.iloc[:0])
+    result = screen_sites(DESIGN, hazard_dir=str(tmp_path), catalogue=empty)
+    assert set(result['bearing'].tolist()) == {''}
+
+
+def test_province_summary_takes_governing_city(result):
+    summary = province_summary(result)
+    assert sorted(summary['province'].tolist()) == sorted(set(result['province'].tolist()))
+    for p, c in zip(summary['province'], summary['required_C']):
+        assert c == pytest.approx(result['required_C'][result['province'] == p].max())
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from engine.seismic import DesignSpectrum, damping_correction, design_spectrum, empirical_period, seismic_forces
+
+
+def test_plateau_and_long_period_factor():
+    spec = DesignSpectrum('Type II', 'High')
+    # A = 0.30, S = 1.5: plateau B1 = S + 1 and N = 1 between T0 and Ts
+    assert spec.spectral_acceleration(0.3) == pytest.approx(0.30 * 2.5)
+    assert spec.long_period_factor(4.0) == pytest.approx(1.7)
+    assert DesignSpectrum('Type II', 'Low').long_period_factor(4.0) == pytest.approx(1.4)
+
+
+def test_reflection_branches_are_continuous():
+    spec = DesignSpectrum('Type III', 'Very High')
+    eps = 1e-9
+    for T in (spec.T0, spec.Ts):
+        assert spec.reflection(T - eps) == pytest.approx(spec.reflection(T + eps), rel=1e-6)
+    assert spec.reflection(0.0) == pytest.approx(spec.S0)
+
+
+def test_damping_grid_shape_and_correction():
+    spec = DesignSpectrum('Type I', 'Moderate')
+    sa = spec.spectral_acceleration(np.linspace(0, 4, 9), np.array([0.02, 0.05, 0.10]))
+    assert sa.shape == (9, 3)
+    assert damping_correction(0.05) == pytest.approx(1.0)
+    assert np.all(np.diff(sa, axis=1) <= 0)
+
+
+def test_unknown_hazard_falls_back_and_soil_rejected():
+    assert DesignSpectrum('Type I', 'Unknown').hazard == 'Moderate'
+    with pytest.raises(ValueError):
+        DesignSpectrum('Type IX', 'High')
+
+
+def test_seismic_forces_use_governing_period():
+    result = seismic_forces(100e3, [0.3, 2.0], 'Type II', 'High', importance=1.2, behaviour_factor=3.0)
+    assert result['period'] == 0.3
+    assert result['C'] == pytest.approx(0.30 * 2.5 * 1.2 / 3.0)
+    assert result['horizontal'] == pytest.approx(result['C'] * 100e3 * 9.81 / 1000.0)
+    assert design_spectrum('Type II', 'High', 1.2, 3.0) is result['spectrum']
+
+
+def test_empirical_period():
+    assert empirical_period(16.0) == pytest.approx(0.08 * 8.0)
@@ -0,0 +1,104 @@
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+import pytest
+
+from engine.singleflight import SingleFlight
+
+N = 8
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+def run_concurrently(flight, func):
+    """N calls on one key, all finished on return"""
+    with ThreadPoolExecutor(N) as pool:
+        futures = [pool.submit(flight.do, 'key', func) for _ in range(N)]
+        return futures
+
+
+def test_concurrent_callers_share_one_run():
+    flight = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(threading.get_ident())
+        wait_for(lambda: flight.shared == N - 1)
+        return object()
+
+    futures = run_concurrently(flight, compute)
+    results = [f.result() for f in futures]
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.info() == {'leaders': 1, 'shared': N - 1, 'in_flight': 0}
+
+
+def test_leader_exception_reaches_every_waiter():
+    flight = SingleFlight()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        wait_for(lambda: flight.shared == N - 1)
+        raise ValueError("boom")
+
+    futures = run_concurrently(flight, fail)
+    errors = []
+    for f in futures:
+        with pytest.raises(ValueError, match="boom") as info:
+            f.result()
+        errors.append(info.value)
+    assert len(calls) == 1
+    assert all(e is errors[0] for e in errors)
+    assert flight.in_flight() == 0
+
+
+def test_key_released_after_completion():
+    flight = SingleFlight()
+    counter = iter(range(10))
+    assert flight.do('key', lambda: next(counter)) == 0
+    assert flight.do('key', lambda: next(counter)) == 1
+    with pytest.raises(ValueError):
+        flight.do('key', lambda: int('x'))
+    assert flight.do('key', lambda: next(counter)) == 2
+    assert flight.info() == {'leaders': 4, 'shared': 0, 'in_flight': 0}
+
+
+def test_waiter_takes_over_when_leader_cancelled():
+    flight = SingleFlight()
+    leader_started = threading.Event()
+
+    def cancelled():
+        leader_started.set()
+        wait_for(lambda: flight.shared == 1)
+        raise CancelledError()
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, 'key', cancelled)
+        leader_started.wait()
+        waiter = pool.submit(flight.do, 'key', lambda: 'recomputed')
+        with pytest.raises(CancelledError):
+            leader.result()
+        assert waiter.result() == 'recomputed'
+    assert flight.info()['leaders'] == 2
+
+
+def test_different_keys_run_independently():
+    flight = SingleFlight()
+    both = threading.Barrier(2, timeout=5.0)
+
+    def meet(value):
+        both.wait()
+        return value
+
+    with ThreadPoolExecutor(2) as pool:
+        a = pool.submit(flight.do, 'a', meet, 1)
+        b = pool.submit(flight.do, 'b', meet, 2)
+        assert (a.result(), b.result()) == (1, 2)
@@ -0,0 +1,117 @@
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from engine.memo import code_digest
+from engine.store import ResultStore, content_key, engine_version, persistent
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = textwrap.dedent('''
+    def analysis(x):
+        kinds = {'rim', 'spoke', 'axle'}
+
+        def scaled(v):
+            return v * 2.0
+
+        return [scaled(v) for v in x if v in kinds], (lambda y: y + 1)(len(x))
+''')
+
+
+def digest_in_subprocess(module_dir, seed):
+    env = dict(os.environ, PYTHONHASHSEED=str(seed), PYTHONPATH=os.pathsep.join([ROOT, str(module_dir)]))
+    out = subprocess.run(
+        [sys.executable, "-c", "import sample; from engine.memo import code_digest; print(code_digest(sample.analysis))"],
+        env=env, capture_output=True, text=True, check=True)
+    return out.stdout.strip()
+
+
+def test_code_digest_stable_across_processes(tmp_path):
+    (tmp_path / "sample.py").write_text(SAMPLE)
+    first = digest_in_subprocess(tmp_path, 1)
+    second = digest_in_subprocess(tmp_path, 2)
+    assert first and first == second
+
+
+def test_code_digest_sees_nested_changes():
+    namespace = {}
+    exec(SAMPLE, namespace)
+    exec(SAMPLE.replace("v * 2.0", "v * 3.0").replace("def analysis", "def edited"), namespace)
+    assert code_digest(namespace['analysis']) != code_digest(namespace['edited'])
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResultStore(str(tmp_path / "results.sqlite"))
+
+
+def test_round_trip_and_stats(store):
+    assert store.get('k', 'f') == (False, None)
+    store.put('k', {'a': np.arange(3)}, 'f')
+    found, value = store.get('k', 'f')
+    assert found and value['a'].tolist() == [0, 1, 2]
+    stats = store.stats()
+    assert stats['entries'] == 1 and stats['stale'] == 0
+    assert stats['functions']['f']['hits'] == 1 and stats['functions']['f']['misses'] == 1
+    store.clear()
+    assert store.stats()['entries'] == 0
+
+
+def test_evicts_least_recently_read(tmp_path):
+    store = ResultStore(str(tmp_path / "small.sqlite"), max_bytes=3000)
+    blob = b"x" * 900
+    for key in ('a', 'b', 'c'):
+        store.put(key, blob)
+        time.sleep(0.01)
+    store.get('a')
+    store.put('d', blob)
+    assert store.get('a')[0] and store.get('d')[0]
+    assert not store.get('b')[0]
+
+
+def test_content_key_depends_on_arguments_and_version():
+    base = content_key('f', (np.arange(3),), {'k': 1}, 'v1')
+    assert base == content_key('f', (np.arange(3),), {'k': 1}, 'v1')
+    assert base != content_key('f', (np.arange(4),), {'k': 1}, 'v1')
+    assert base != content_key('f', (np.arange(3),), {'k': 1}, 'v2')
+    assert len(engine_version()) == 16
+
+
+def test_persistent_computes_once(store):
+    calls = []
+
+    @persistent(name='tests.slow', store=store)
+    def slow(x):
+        calls.append(x)
+        time.sleep(0.05)
+        return x * 2
+
+    threads = [threading.Thread(target=slow, args=(3,)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert slow(3) == 6
+    assert calls == [3]
+    assert store.stats()['functions']['tests.slow']['entries'] == 1
+
+
+def test_persistent_falls_back_without_store(tmp_path):
+    class Broken:
+        def get(self, *args):
+            raise OSError("locked")
+
+        def put(self, *args):
+            raise OSError("read-only")
+
+    @persistent(store=Broken())
+    def double(x):
+        return 2 * x
+
+    assert double(4) == 8
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from engine.structure import wheel_model
+from engine.vortex import (
+    cabin_cylinder, critical_speed, member_frequency, merge_rows, screen, screening_rows, scruton_number,
+    wheel_members,
+)
+
+
+def test_critical_speed_and_scruton():
+    assert critical_speed(2.0, 0.3) == pytest.approx(2.0 * 0.3 / 0.18)
+    assert scruton_number(50.0, 0.3) == pytest.approx(2.0 * 0.02 * 50.0 / (1.25 * 0.09))
+
+
+def test_member_frequency_scales_with_length():
+    f1, f2 = member_frequency([5.0, 10.0], 1e6, 20.0)
+    assert f1 == pytest.approx(4.0 * f2)
+
+
+def test_screen_lock_in_range_around_critical_speed():
+    rows = screening_rows(['tube'], [0.18], [10.0], [[2.0]])
+    result = screen(rows, max_speed=5.0, speeds=np.linspace(0.0, 5.0, 501))
+    (start, end), = result['ranges'][0]
+    # f_s = St·v/d equals 2 Hz at v = 2 m/s; lock-in within ±20 %
+    assert result['critical_speed'][0] == pytest.approx(2.0)
+    assert start == pytest.approx(1.6, abs=0.02) and end == pytest.approx(2.4, abs=0.02)
+    assert result['status'][0] == 'high'
+
+
+def test_stiff_member_passes():
+    rows = screening_rows(['tube'], [0.3], [200.0], [[50.0]])
+    assert screen(rows, max_speed=25.0)['status'][0] == 'pass'
+
+
+def test_wheel_and_cabin_rows_merge():
+    model = wheel_model(30.0, 12, 18.0, {'mass_structure': 40e3, 'mass_axis': 5e3, 'mass_cabins': 18e3})
+    members = wheel_members(model, global_frequencies=[0.8, 1.5])
+    assert members['names'] == ['spoke', 'rim', 'tower']
+    assert members['frequencies'].shape == (3, 3)
+    cabin = cabin_cylinder('Vertical Cylinder', 6, 30.0, 1500.0, global_frequencies=[0.8])
+    merged = merge_rows(members, cabin, None)
+    assert merged['names'][-1] == 'cabin'
+    assert np.isnan(merged['frequencies'][-1, -1])
+    assert cabin_cylinder('Square', 6, 30.0, 1500.0) is None
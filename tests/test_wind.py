@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from engine.wind import air_density, basic_to_gust, roughness_factor, structural_factor, wheel_wind_loads, wind_profile
+
+TERRAIN_II = {'z0': 0.05, 'zmin': 2.0}
+
+
+def test_air_density_sea_level_and_altitude():
+    assert air_density(0.0) == pytest.approx(1.225)
+    assert air_density(1500.0) == pytest.approx(1.058, rel=1e-3)
+
+
+def test_roughness_factor_category_ii():
+    # EN 1991-1-4: k_r = 0.19 for z0 = z0,II, and c_r is constant below z_min
+    assert roughness_factor(10.0, 0.05, 2.0) == pytest.approx(0.19 * np.log(200.0))
+    assert roughness_factor(1.0, 0.05, 2.0) == roughness_factor(2.0, 0.05, 2.0)
+
+
+def test_gust_reference_matches_dynamic_pressure_at_10m():
+    prof = wind_profile(10.0, TERRAIN_II, 30.0)
+    assert prof['q_p'] == pytest.approx(0.5 * 1.225 * 30.0 ** 2)
+
+
+def test_profile_increases_with_height():
+    prof = wind_profile([5.0, 20.0, 60.0], TERRAIN_II, 25.0, reference='basic')
+    assert np.all(np.diff(prof['q_p']) > 0)
+    with pytest.raises(ValueError):
+        wind_profile(10.0, TERRAIN_II, 25.0, reference='mean')
+
+
+@pytest.mark.parametrize("terrain", [TERRAIN_II, {'z0': 0.3, 'zmin': 5.0}])
+def test_basic_speed_as_gust_gives_same_profile(terrain):
+    heights = [2.0, 10.0, 45.0]
+    gust = basic_to_gust(24.0, terrain)
+    np.testing.assert_allclose(wind_profile(heights, terrain, gust)['q_p'],
+                               wind_profile(heights, terrain, 24.0, reference='basic')['q_p'])
+    # Category II at 10 m: v_m = c_r v_b with c_r = 0.19 ln(200), gust = v_m √(1 + 7 I_v)
+    expected = 24.0 * 0.19 * np.log(200.0) * np.sqrt(1.0 + 7.0 / np.log(200.0))
+    assert basic_to_gust(24.0, TERRAIN_II) == pytest.approx(expected)
+
+
+def test_wheel_loads_face_on_governs():
+    loads = wheel_wind_loads(40.0, 25.0, 16, 6.0, TERRAIN_II, 30.0, orientations=[0.0, 90.0],
+                             wheel_angles=[0.0, 11.25])
+    assert loads['force'].shape == (2, 2)
+    assert loads['worst']['orientation_deg'] == 0.0
+    # Edge-on: out-of-plane component vanishes
+    np.testing.assert_allclose(loads['out_of_plane'][1], 0.0, atol=1e-6)
+
+
+def test_structural_factor_stiff_structure_close_to_one():
+    stiff = structural_factor(10.0, 30.0, 30.0, TERRAIN_II, 30.0)
+    flexible = structural_factor(0.3, 30.0, 30.0, TERRAIN_II, 30.0)
+    assert stiff['cs_cd'] < 1.0
+    assert flexible['R2'] > stiff['R2']
@@ -0,0 +1,50 @@
+import io
+
+import numpy as np
+import pytest
+
+from engine.wind_rose import WindRoseHistogram, compass_name, read_station_array, wind_rose_from_csv
+
+CSV = """timestamp,wd,ws
+2020-01-01 00:00,0,5
+2020-01-01 01:00,355,7
+2020-01-01 02:00,90,3
+2020-01-01 03:00,90,0.2
+2020-01-01 04:00,999,4
+2020-01-01 05:00,180,
+"""
+
+
+def test_sectors_centred_on_north_and_calms():
+    result = WindRoseHistogram(n_directions=16).add([0, 355, 11.0, 11.5, 90], [5, 7, 3, 3, 0.1]).result()
+    assert result['counts'][0].sum() == 3
+    assert result['counts'][1].sum() == 1
+    assert result['calm_frequency'] == pytest.approx(0.2)
+
+
+def test_csv_stream_matches_single_chunk():
+    whole = wind_rose_from_csv(io.StringIO(CSV))
+    chunked = wind_rose_from_csv(io.StringIO(CSV), chunksize=2)
+    np.testing.assert_array_equal(whole['counts'], chunked['counts'])
+    assert whole['records'] == 4 and whole['invalid'] == 2
+    assert whole['prevailing_direction'] == 'North'
+    assert whole['period'] == ('2020-01-01 00:00', '2020-01-01 05:00')
+
+
+def test_speed_units_converted():
+    rose = wind_rose_from_csv(io.StringIO("dir,speed\n270,36\n"), speed_unit='km/h')
+    assert rose['mean_speed'][12] == pytest.approx(10.0)
+    with pytest.raises(ValueError):
+        wind_rose_from_csv(io.StringIO("dir,speed\n270,36\n"), speed_unit='bft')
+
+
+def test_station_array_memory_mapped(tmp_path):
+    path = tmp_path / "station.npy"
+    np.save(path, np.array([[0, 45.0, 5.0], [3600, 225.0, 6.0], [7200, 225.0, 8.0]]))
+    chunks = list(read_station_array(str(path), chunksize=2))
+    assert [c['speed'].tolist() for c in chunks] == [[5.0, 6.0], [8.0]]
+    assert wind_rose_from_csv(str(path))['dominant_load_direction'] == 'Southwest'
+
+
+def test_compass_name():
+    assert [compass_name(a) for a in (0, 44, 100, 350)] == ['North', 'Northeast', 'East', 'North']